@@ -0,0 +1,169 @@
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from typing import Callable
+
+from leeger.enum.FixtureMode import FixtureMode
+from leeger.league_loader import (
+    AsyncRequestPool,
+    ESPNLeagueLoader,
+    FleaflickerLeagueLoader,
+    RequestFixtures,
+    RequestScheduler,
+    SleeperLeagueLoader,
+)
+from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.util.CustomLogger import CustomLogger
+
+"""
+League Loader Benchmark
+
+    - "record" loads a League from the live API once, saving every platform response into a fixture directory with RequestFixtures.
+    - "replay" loads the same League from the fixture directory without sending any requests, and reports:
+        - build: the time to build the League from the responses, without any time spent on requests
+        - sync: the time for loadLeague(), with each request taking the given latency
+        - async: the time for loadLeagueAsync(), with each request taking the given latency
+    - Only platforms that can load public Leagues without credentials are supported (ESPN, Fleaflicker and Sleeper).
+
+Run from the root of the repo:
+    python -m benchmark.league_loader_benchmark record sleeper 12345678 2022 2023 --fixtures fixtures/sleeper
+    python -m benchmark.league_loader_benchmark replay fixtures/sleeper
+    python -m benchmark.league_loader_benchmark replay fixtures/sleeper --latency 0.1 --repeat 10 --max-concurrent-requests 4
+
+"""
+
+LEAGUE_LOADERS = {
+    "espn": ESPNLeagueLoader,
+    "fleaflicker": FleaflickerLeagueLoader,
+    "sleeper": SleeperLeagueLoader,
+}
+# saved next to the fixtures, so replaying only needs the fixture directory
+__LOADER_FILE_NAME = "loader.json"
+
+
+def record(platform: str, leagueId: str, years: list[int], fixturePath: str) -> None:
+    """
+    Loads the given League from the live API, saving every response in the given fixture directory.
+    """
+    requestFixtures = RequestFixtures(fixturePath, FixtureMode.RECORD)
+    LeagueLoader.requestScheduler = RequestScheduler(fixtures=requestFixtures)
+    league = LEAGUE_LOADERS[platform](leagueId, years).loadLeague()
+    with open(os.path.join(fixturePath, __LOADER_FILE_NAME), "w") as file:
+        json.dump({"platform": platform, "leagueId": leagueId, "years": years}, file)
+    print(
+        f"Recorded {requestFixtures.numberOfRecordedResponses} responses for '{league.name}' in '{fixturePath}'"
+    )
+
+
+def timeRuns(function: Callable[[], float], repeat: int) -> dict:
+    """
+    Calls the given function, which returns how long the part being timed took, the given number of times.
+
+    Example response:
+        {
+            "medianSeconds": 0.0123,
+            "minSeconds": 0.0118
+        }
+    """
+    seconds = [function() for _ in range(repeat)]
+    return {"medianSeconds": statistics.median(seconds), "minSeconds": min(seconds)}
+
+
+def replay(
+    fixturePath: str, *, latencySeconds: float, repeat: int, maxConcurrentRequests: int
+) -> dict:
+    """
+    Times loading the League recorded in the given fixture directory, without sending any requests.
+    """
+    with open(os.path.join(fixturePath, __LOADER_FILE_NAME)) as file:
+        loaderArguments = json.load(file)
+    leagueLoaderClass = LEAGUE_LOADERS[loaderArguments["platform"]]
+
+    def getLeagueLoader() -> LeagueLoader:
+        return leagueLoaderClass(loaderArguments["leagueId"], loaderArguments["years"])
+
+    def useFixtures(latencySeconds: float) -> None:
+        # replayed requests aren't rate limited
+        LeagueLoader.requestScheduler = RequestScheduler(
+            dict(),
+            fixtures=RequestFixtures(
+                fixturePath, FixtureMode.REPLAY, latencySeconds=latencySeconds
+            ),
+        )
+
+    def timeBuild() -> float:
+        leagueLoader = getLeagueLoader()
+        platformData = leagueLoader._sendRequests(leagueLoader._iterRequests())
+        start = time.perf_counter()
+        leagueLoader._buildLeague(platformData)
+        return time.perf_counter() - start
+
+    def timeLoad() -> float:
+        start = time.perf_counter()
+        getLeagueLoader().loadLeague()
+        return time.perf_counter() - start
+
+    def timeLoadAsync() -> float:
+        leagueLoader = getLeagueLoader()
+        start = time.perf_counter()
+        asyncio.run(
+            LeagueLoader.loadLeaguesAsync(
+                [leagueLoader], maxConcurrentRequests=maxConcurrentRequests
+            )
+        )
+        return time.perf_counter() - start
+
+    useFixtures(0.0)
+    results = {"build": timeRuns(timeBuild, repeat)}
+    useFixtures(latencySeconds)
+    results["sync"] = timeRuns(timeLoad, repeat)
+    results["async"] = timeRuns(timeLoadAsync, repeat)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark League Loaders offline with recorded platform responses."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    recordParser = subparsers.add_parser("record")
+    recordParser.add_argument("platform", choices=sorted(LEAGUE_LOADERS))
+    recordParser.add_argument("leagueId")
+    recordParser.add_argument("years", type=int, nargs="+")
+    recordParser.add_argument("--fixtures", required=True)
+    replayParser = subparsers.add_parser("replay")
+    replayParser.add_argument("fixtures")
+    replayParser.add_argument("--latency", type=float, default=0.05)
+    replayParser.add_argument("--repeat", type=int, default=5)
+    replayParser.add_argument(
+        "--max-concurrent-requests",
+        type=int,
+        default=AsyncRequestPool.DEFAULT_MAX_CONCURRENT_REQUESTS,
+    )
+    args = parser.parse_args()
+
+    CustomLogger.setEnabled(False)
+    if args.command == "record":
+        record(args.platform, args.leagueId, args.years, args.fixtures)
+        return
+    results = replay(
+        args.fixtures,
+        latencySeconds=args.latency,
+        repeat=args.repeat,
+        maxConcurrentRequests=args.max_concurrent_requests,
+    )
+    print(
+        f"{args.repeat} runs, {args.latency * 1000:.0f}ms per request, {args.max_concurrent_requests} concurrent requests"
+    )
+    print(f"{'':<8}{'median ms':>12}{'min ms':>12}")
+    for name, timing in results.items():
+        print(
+            f"{name:<8}{timing['medianSeconds'] * 1000:>12.2f}{timing['minSeconds'] * 1000:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+import argparse
+import inspect
+import json
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from leeger.calculator import all_time_calculator, year_calculator
+from leeger.model.league.League import League
+from leeger.util.CustomLogger import CustomLogger
+from leeger.util.excel import leagueToExcel
+from leeger.util.league_generator import generateLeague
+from leeger.util.stat_sheet import leagueStatSheet, yearStatSheet
+from leeger.validate import leagueValidation, yearValidation
+
+"""
+Benchmarks
+
+    - Times calculators, stat sheets, validation, JSON, combining Leagues and Excel export on generated Leagues of a few sizes.
+    - Reports the time per call at each size, and the scaling exponent of each benchmark (time ~ matchups ^ exponent).
+    - Compares against a saved baseline and exits with status 1 if any benchmark got slower than the allowed tolerance.
+
+Run from the root of the repo:
+    python -m benchmark.run                                # run everything and compare against the baseline
+    python -m benchmark.run --save-baseline                # run everything and save the results as the new baseline
+    python -m benchmark.run --filter AWAL --sizes small,medium
+
+Baselines depend on the machine they were made on, so benchmark/baseline.json is not committed (it is in .gitignore).
+Make one on your machine before making changes, then compare on the same machine:
+    git stash                                              # or check out the commit to compare against
+    python -m benchmark.run --save-baseline
+    git stash pop
+    python -m benchmark.run
+
+"""
+
+# kwargs given to generateLeague() for each size
+SIZES = {
+    "small": {"numberOfYears": 1, "numberOfTeams": 4},
+    "medium": {"numberOfYears": 3, "numberOfTeams": 8},
+    "large": {"numberOfYears": 6, "numberOfTeams": 12, "numberOfPlayoffTeams": 8},
+}
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+__DEFAULT_TOLERANCE = 0.25
+__DEFAULT_MIN_TIME = 0.2
+__DEFAULT_MAX_CALLS = 100
+# changes smaller than this are noise, no matter how large they are relative to the baseline
+__NOISE_FLOOR_SECONDS = 0.0005
+
+
+@dataclass(kw_only=True, frozen=True)
+class Benchmark:
+    name: str
+    # whether this benchmark runs on the most recent Year ("year") or the whole League ("league")
+    level: str
+    # takes the League and returns the function to time
+    setup: Callable[[League], Callable[[], Any]]
+    # called before each timed call, but not timed
+    beforeEach: Optional[Callable[[], None]] = None
+
+
+def getBenchmarks() -> list[Benchmark]:
+    """
+    Returns every benchmark.
+    Calculator benchmarks are found by looking at the public methods of every calculator, so new methods are picked up on their own.
+    """
+    benchmarks = list()
+    for level, calculatorModule in (
+        ("year", year_calculator),
+        ("league", all_time_calculator),
+    ):
+        for calculatorName in calculatorModule.__all__:
+            calculator = getattr(calculatorModule, calculatorName)
+            for methodName, method in inspect.getmembers(calculator, inspect.ismethod):
+                # skip private methods and methods inherited from the parent calculators
+                if methodName.startswith("_") or methodName not in vars(calculator):
+                    continue
+                benchmarks.append(
+                    Benchmark(
+                        name=f"{calculatorName}.{methodName}",
+                        level=level,
+                        setup=_calculatorSetup(method, level),
+                    )
+                )
+
+    def clearValidationCaches() -> None:
+        leagueValidation.runAllChecks.cache_clear()
+        yearValidation.runAllChecks.cache_clear()
+
+    def combineSetup(league: League) -> Callable[[], Any]:
+        # a League with the same owners whose Years come right after the given League's Years
+        otherLeague = generateLeague(
+            seed=1,
+            startYearNumber=league.years[-1].yearNumber + 1,
+            numberOfYears=len(league.years),
+            numberOfTeams=len(league.owners),
+        )
+        return lambda: league + otherLeague
+
+    def leagueToExcelSetup(league: League) -> Callable[[], Any]:
+        filePath = os.path.join(tempfile.mkdtemp(), "benchmark.xlsx")
+        return lambda: leagueToExcel(league, filePath, overwrite=True)
+
+    benchmarks += [
+        Benchmark(
+            name="yearStatSheet",
+            level="year",
+            setup=lambda league: lambda: yearStatSheet(league.years[-1]),
+        ),
+        Benchmark(
+            name="leagueStatSheet",
+            level="league",
+            setup=lambda league: lambda: leagueStatSheet(league),
+        ),
+        Benchmark(
+            name="leagueValidation.runAllChecks",
+            level="league",
+            setup=lambda league: lambda: leagueValidation.runAllChecks(league),
+            beforeEach=clearValidationCaches,
+        ),
+        Benchmark(
+            name="League.toJson",
+            level="league",
+            setup=lambda league: league.toJson,
+        ),
+        Benchmark(
+            name="League.fromJson",
+            level="league",
+            setup=lambda league: (
+                lambda leagueJson: lambda: League.fromJson(leagueJson)
+            )(league.toJson()),
+        ),
+        Benchmark(
+            name="League.__add__",
+            level="league",
+            setup=combineSetup,
+            beforeEach=clearValidationCaches,
+        ),
+        Benchmark(name="leagueToExcel", level="league", setup=leagueToExcelSetup),
+    ]
+    return benchmarks
+
+
+def _calculatorSetup(
+    method: Callable, level: str
+) -> Callable[[League], Callable[[], Any]]:
+    if level == "year":
+        return lambda league: lambda: method(league.years[-1])
+    return lambda league: lambda: method(league)
+
+
+def getNumberOfMatchups(league: League, level: str) -> int:
+    years = [league.years[-1]] if level == "year" else league.years
+    return sum(len(week.matchups) for year in years for week in year.weeks)
+
+
+def timePerCall(
+    function: Callable[[], Any],
+    *,
+    beforeEach: Optional[Callable[[], None]] = None,
+    minTime: float = __DEFAULT_MIN_TIME,
+    maxCalls: int = __DEFAULT_MAX_CALLS,
+) -> float:
+    """
+    Returns the fastest time in seconds of a single call to the given function.
+    The fastest call is the one least affected by other work on the machine, so it is the most repeatable.
+    The function is called once to warm up, then until it has run for at least minTime seconds or maxCalls times (and at least once).
+    """
+    if beforeEach is not None:
+        beforeEach()
+    function()
+    times = list()
+    while not times or (len(times) < maxCalls and sum(times) < minTime):
+        if beforeEach is not None:
+            beforeEach()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def getScalingExponent(sizes: list[int], times: list[float]) -> Optional[float]:
+    """
+    Returns the slope of the least squares fit of log(time) against log(size).
+    An exponent of 1 means time grows linearly with size, 2 means quadratically, and so on.
+    """
+    points = [(math.log(size), math.log(t)) for size, t in zip(sizes, times) if t > 0]
+    if len(points) < 2:
+        return None
+    meanX = statistics.fmean(x for x, _ in points)
+    meanY = statistics.fmean(y for _, y in points)
+    denominator = sum((x - meanX) ** 2 for x, _ in points)
+    if denominator == 0:
+        return None
+    return sum((x - meanX) * (y - meanY) for x, y in points) / denominator
+
+
+def runBenchmarks(
+    benchmarks: list[Benchmark],
+    sizeNames: list[str],
+    *,
+    minTime: float = __DEFAULT_MIN_TIME,
+    maxCalls: int = __DEFAULT_MAX_CALLS,
+) -> dict:
+    """
+    Runs the given benchmarks at the given sizes.
+
+    Example response:
+        {
+            "sizes": {"small": {"numberOfYears": 1, "numberOfTeams": 4}},
+            "results": {
+                "AWALYearCalculator.getAWAL": {
+                    "secondsPerCall": {"small": 0.0012},
+                    "matchups": {"small": 30},
+                    "scalingExponent": None
+                },
+                ...
+            }
+        }
+    """
+    leagues = {
+        sizeName: generateLeague(seed=0, **SIZES[sizeName]) for sizeName in sizeNames
+    }
+    results = dict()
+    for benchmark in benchmarks:
+        secondsPerCall = dict()
+        matchups = dict()
+        for sizeName, league in leagues.items():
+            secondsPerCall[sizeName] = timePerCall(
+                benchmark.setup(league),
+                beforeEach=benchmark.beforeEach,
+                minTime=minTime,
+                maxCalls=maxCalls,
+            )
+            matchups[sizeName] = getNumberOfMatchups(league, benchmark.level)
+        results[benchmark.name] = {
+            "secondsPerCall": secondsPerCall,
+            "matchups": matchups,
+            "scalingExponent": getScalingExponent(
+                list(matchups.values()), list(secondsPerCall.values())
+            ),
+        }
+        print(_formatResult(benchmark.name, results[benchmark.name]), flush=True)
+    return {
+        "sizes": {sizeName: SIZES[sizeName] for sizeName in sizeNames},
+        "results": results,
+    }
+
+
+def compareToBaseline(
+    run: dict, baseline: dict, *, tolerance: float = __DEFAULT_TOLERANCE
+) -> list[str]:
+    """
+    Returns a description of each benchmark that got slower than the baseline by more than the given tolerance.
+    Only sizes that were generated with the same arguments in both runs are compared.
+    """
+    regressions = list()
+    for name, result in run["results"].items():
+        baselineResult = baseline["results"].get(name)
+        if baselineResult is None:
+            continue
+        for sizeName, seconds in result["secondsPerCall"].items():
+            baselineSeconds = baselineResult["secondsPerCall"].get(sizeName)
+            if (
+                baselineSeconds is None
+                or baseline["sizes"].get(sizeName) != run["sizes"][sizeName]
+            ):
+                continue
+            if (
+                seconds > baselineSeconds * (1 + tolerance)
+                and seconds - baselineSeconds > __NOISE_FLOOR_SECONDS
+            ):
+                regressions.append(
+                    f"{name} [{sizeName}]: {_formatSeconds(baselineSeconds)} -> {_formatSeconds(seconds)} ({seconds / baselineSeconds:.2f}x)"
+                )
+    return regressions
+
+
+def _formatSeconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 0.001:
+        return f"{seconds * 1_000:.2f}ms"
+    return f"{seconds * 1_000_000:.1f}us"
+
+
+def _formatResult(name: str, result: dict) -> str:
+    times = "  ".join(
+        f"{sizeName}={_formatSeconds(seconds)}"
+        for sizeName, seconds in result["secondsPerCall"].items()
+    )
+    exponent = result["scalingExponent"]
+    exponentStr = "" if exponent is None else f"  exponent={exponent:.2f}"
+    return f"{name:<60} {times}{exponentStr}"
+
+
+def main(args: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the leeger benchmarks.")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(SIZES),
+        help=f"comma-separated sizes to run (from: {', '.join(SIZES)})",
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run benchmarks with this in their name"
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="save the results as the new baseline instead of comparing against it",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=__DEFAULT_TOLERANCE,
+        help="allowed slowdown before a benchmark counts as a regression (0.25 = 25%%)",
+    )
+    parser.add_argument("--min-time", type=float, default=__DEFAULT_MIN_TIME)
+    parser.add_argument("--max-calls", type=int, default=__DEFAULT_MAX_CALLS)
+    parsedArgs = parser.parse_args(args)
+    # logs (e.g. from combining Leagues) would drown out the results
+    CustomLogger.setEnabled(False)
+
+    sizeNames = [sizeName for sizeName in parsedArgs.sizes.split(",") if sizeName]
+    for sizeName in sizeNames:
+        if sizeName not in SIZES:
+            parser.error(f"Unknown size '{sizeName}'.")
+    benchmarks = [
+        benchmark
+        for benchmark in getBenchmarks()
+        if parsedArgs.filter in benchmark.name
+    ]
+
+    run = runBenchmarks(
+        benchmarks,
+        sizeNames,
+        minTime=parsedArgs.min_time,
+        maxCalls=parsedArgs.max_calls,
+    )
+
+    if parsedArgs.save_baseline:
+        baseline = {"sizes": dict(), "results": dict()}
+        if os.path.exists(parsedArgs.baseline):
+            # keep results for benchmarks that were not run this time
+            with open(parsedArgs.baseline) as f:
+                baseline = json.load(f)
+        baseline["sizes"].update(run["sizes"])
+        for name, result in run["results"].items():
+            baselineResult = baseline["results"].setdefault(name, dict())
+            for key in ("secondsPerCall", "matchups"):
+                baselineResult.setdefault(key, dict()).update(result[key])
+            baselineResult["scalingExponent"] = result["scalingExponent"]
+        with open(parsedArgs.baseline, "w") as f:
+            json.dump(baseline, f, indent=4)
+        print(f"Saved baseline to '{parsedArgs.baseline}'.")
+        return 0
+
+    if not os.path.exists(parsedArgs.baseline):
+        print(
+            f"No baseline at '{parsedArgs.baseline}'. Run with --save-baseline to make one."
+        )
+        return 0
+    with open(parsedArgs.baseline) as f:
+        baseline = json.load(f)
+    regressions = compareToBaseline(run, baseline, tolerance=parsedArgs.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regression(s) against '{parsedArgs.baseline}':")
+        for regression in regressions:
+            print(f"    {regression}")
+        return 1
+    print(f"No regressions against '{parsedArgs.baseline}'.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+import argparse
+import http.client
+import random
+import statistics
+import threading
+import time
+
+from leeger.server import StatsServer, StatsService
+from leeger.util.CustomLogger import CustomLogger
+from leeger.util.league_generator import generateLeague
+
+"""
+Stats Server Load Test
+
+    - Starts a StatsServer on a free local port and sends it requests from many client threads, each keeping its connection open.
+    - Requests are picked at random from a fixed set of endpoints and filters, so repeated requests are answered from the cache.
+    - Runs with caching off (every request is computed), then twice with caching on (starting from an empty cache, then a full one), and reports the throughput and latency of each.
+
+Run from the root of the repo:
+    python -m benchmark.server_load_test
+    python -m benchmark.server_load_test --clients 16 --duration 10 --years 6 --teams 12
+
+"""
+
+
+def getTargets(leagueId: str, yearNumbers: list[int]) -> list[str]:
+    """
+    Returns the request targets the load test picks from.
+    """
+    targets = [
+        f"/leagues/{leagueId}/stats",
+        f"/leagues/{leagueId}/stats?onlyRegularSeason=true",
+        f"/leagues/{leagueId}/matchups",
+        f"/leagues/{leagueId}/calculators/AWALAllTimeCalculator/getAWAL",
+        f"/leagues/{leagueId}/calculators/SmartWinsAllTimeCalculator/getSmartWins?onlyPostSeason=true",
+    ]
+    for yearNumber in yearNumbers:
+        targets += [
+            f"/leagues/{leagueId}/years/{yearNumber}/stats",
+            f"/leagues/{leagueId}/years/{yearNumber}/stats?weekNumberEnd=5",
+            f"/leagues/{leagueId}/years/{yearNumber}/matchups?onlyRegularSeason=true",
+            f"/leagues/{leagueId}/years/{yearNumber}/calculators/GameOutcomeYearCalculator/getWinPercentage",
+        ]
+    return targets
+
+
+def runLoadTest(
+    statsService: StatsService, targets: list[str], *, clients: int, duration: float
+) -> dict:
+    """
+    Sends requests to a StatsServer for the given StatsService from the given number of client threads for the given number of seconds.
+
+    Example response:
+        {
+            "requests": 1234,
+            "errors": 0,
+            "requestsPerSecond": 246.8,
+            "p50Milliseconds": 3.1,
+            "p99Milliseconds": 48.7
+        }
+    """
+    latencies: list[float] = list()
+    errors = [0]
+    lock = threading.Lock()
+
+    with StatsServer(statsService, port=0) as statsServer:
+        serverThread = threading.Thread(target=statsServer.serve_forever)
+        serverThread.start()
+        stopTime = time.perf_counter() + duration
+
+        def runClient(seed: int) -> None:
+            rng = random.Random(seed)
+            connection = http.client.HTTPConnection(
+                "127.0.0.1", statsServer.server_port
+            )
+            clientLatencies = list()
+            clientErrors = 0
+            while time.perf_counter() < stopTime:
+                start = time.perf_counter()
+                connection.request("GET", rng.choice(targets))
+                response = connection.getresponse()
+                response.read()
+                clientLatencies.append(time.perf_counter() - start)
+                if response.status != 200:
+                    clientErrors += 1
+            connection.close()
+            with lock:
+                latencies.extend(clientLatencies)
+                errors[0] += clientErrors
+
+        start = time.perf_counter()
+        clientThreads = [
+            threading.Thread(target=runClient, args=(seed,)) for seed in range(clients)
+        ]
+        for clientThread in clientThreads:
+            clientThread.start()
+        for clientThread in clientThreads:
+            clientThread.join()
+        elapsed = time.perf_counter() - start
+        statsServer.shutdown()
+        serverThread.join()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "requestsPerSecond": len(latencies) / elapsed,
+        "p50Milliseconds": quantiles[49] * 1000,
+        "p99Milliseconds": quantiles[98] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the stats server.")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--teams", type=int, default=10)
+    args = parser.parse_args()
+
+    CustomLogger.setEnabled(False)
+    league = generateLeague(numberOfYears=args.years, numberOfTeams=args.teams)
+    targets = getTargets(league.id, [year.yearNumber for year in league.years])
+    print(
+        f"{args.years} Years of {args.teams} Teams, {len(targets)} distinct requests, {args.clients} clients for {args.duration}s each"
+    )
+    print(
+        f"{'':<10}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}"
+    )
+    uncachedStatsService = StatsService([league], cacheSize=0)
+    cachedStatsService = StatsService([league])
+    # the second cached run starts with every response already cached
+    for name, statsService in (
+        ("uncached", uncachedStatsService),
+        ("cold", cachedStatsService),
+        ("warm", cachedStatsService),
+    ):
+        results = runLoadTest(
+            statsService, targets, clients=args.clients, duration=args.duration
+        )
+        print(
+            f"{name:<10}{results['requests']:>10}{results['errors']:>8}{results['requestsPerSecond']:>10.1f}{results['p50Milliseconds']:>10.2f}{results['p99Milliseconds']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
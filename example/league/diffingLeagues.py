@@ -0,0 +1,39 @@
+import json
+
+from leeger.league_loader import ESPNLeagueLoader
+from leeger.model.league import League
+from leeger.model.patch import LeaguePatch
+from leeger.util.league_diff import applyPatch, diffLeagues
+
+if __name__ == "__main__":
+    # Get the League we saved yesterday.
+    with open("C:\\myLeague.json") as f:
+        storedLeague = League.fromJson(json.load(f))
+
+    # Load the League again to pick up any stat corrections from the platform.
+    espnLeagueLoader = ESPNLeagueLoader("12345678", [2019, 2020, 2021, 2022])
+    league: League = espnLeagueLoader.loadLeague()
+
+    # Find what changed.
+    # Models are matched by owner names, year numbers and week numbers, so the new IDs from the load do not matter.
+    leaguePatch = diffLeagues(storedLeague, league)
+    for operation in leaguePatch.operations:
+        print(
+            operation.operationType.name,
+            operation.yearNumber,
+            operation.weekNumber,
+            operation.key,
+            operation.previousValue,
+            "->",
+            operation.value,
+        )
+
+    # Patches can be saved as JSON.
+    with open("C:\\myLeaguePatch.json", "w") as f:
+        json.dump(leaguePatch.toJson(), f)
+    with open("C:\\myLeaguePatch.json") as f:
+        leaguePatch = LeaguePatch.fromJson(json.load(f))
+
+    # Bring the stored League up to date.
+    # This returns a new League that keeps the IDs of the stored League.
+    updatedLeague = applyPatch(storedLeague, leaguePatch)
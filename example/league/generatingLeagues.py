@@ -0,0 +1,22 @@
+from leeger.util.league_generator import generateLeague
+from leeger.util.stat_sheet import leagueStatSheet
+
+if __name__ == "__main__":
+    # Generate a small League.
+    # The same seed always gives the same League, so generated Leagues can be used as repeatable test inputs.
+    league = generateLeague(seed=1)
+
+    # Generate a large League with divisions, an 8-team playoff and a 2-week championship.
+    largeLeague = generateLeague(
+        seed=1,
+        numberOfYears=100,
+        numberOfTeams=32,
+        numberOfRegularSeasonWeeks=14,
+        numberOfPlayoffTeams=8,
+        numberOfChampionshipWeeks=2,
+        numberOfDivisions=4,
+        leagueMedianGames=True,
+    )
+
+    # Generated Leagues work anywhere a loaded League does.
+    allTimeStatSheet = leagueStatSheet(league)
@@ -0,0 +1,26 @@
+from leeger.league_loader import ESPNLeagueLoader
+from leeger.model.league import League
+from leeger.util.json_stream import iterLeaguesJson, writeLeagueJson, writeLeaguesJson
+
+if __name__ == "__main__":
+    # League objects can be saved to and loaded from JSON files one Year at a time.
+    # This keeps memory low when working with very large leagues or archives of many leagues.
+
+    # Get a dummy League object
+    espnLeagueLoader = ESPNLeagueLoader("12345678", [2019, 2020, 2021, 2022])
+    league: League = espnLeagueLoader.loadLeague()
+
+    # Save a single League to a JSON file
+    with open("C:\\myLeague.json", "w") as f:
+        writeLeagueJson(league, f)
+
+    # Save many Leagues to a single JSON file
+    # Any iterable works here, including a generator that loads each League as it is needed
+    with open("C:\\myLeagues.json", "w") as f:
+        writeLeaguesJson([league, league], f)
+
+    # Load Leagues back one at a time
+    # This works for files with a single League or with many Leagues
+    with open("C:\\myLeagues.json", "r") as f:
+        for loadedLeague in iterLeaguesJson(f):
+            print(loadedLeague.name)
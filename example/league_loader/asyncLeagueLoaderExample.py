@@ -0,0 +1,37 @@
+import asyncio
+
+from leeger.league_loader import (
+    AsyncLeagueLoader,
+    AsyncRequestPool,
+    ESPNLeagueLoader,
+    SleeperLeagueLoader,
+)
+from leeger.model.league import League
+
+
+async def main() -> None:
+    # Load a League, sending the requests for each year to the platform at the same time.
+    sleeperLeagueLoader = SleeperLeagueLoader("12345678", [2021, 2022, 2023])
+    league: League = await sleeperLeagueLoader.loadLeagueAsync()
+
+    # Load many Leagues at the same time, with at most 16 requests in flight across all of them.
+    leagueLoaders = [
+        SleeperLeagueLoader("12345678", [2021, 2022, 2023]),
+        ESPNLeagueLoader("12345678", [2021, 2022, 2023]),
+    ]
+    leagues: list[League] = await AsyncLeagueLoader.loadLeaguesAsync(
+        leagueLoaders, maxConcurrentRequests=16
+    )
+
+    # Or share an AsyncRequestPool to control how each League is loaded.
+    with AsyncRequestPool(4) as requestPool:
+        leagues = await asyncio.gather(
+            *(
+                leagueLoader.loadLeagueAsync(validate=False, requestPool=requestPool)
+                for leagueLoader in leagueLoaders
+            )
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
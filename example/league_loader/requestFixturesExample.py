@@ -0,0 +1,28 @@
+import asyncio
+
+from leeger.enum import FixtureMode
+from leeger.league_loader import (
+    RequestFixtures,
+    RequestScheduler,
+    SleeperLeagueLoader,
+)
+from leeger.league_loader.LeagueLoader import LeagueLoader
+
+if __name__ == "__main__":
+    # Record every response from the live API into a fixture directory while loading a League.
+    LeagueLoader.requestScheduler = RequestScheduler(
+        fixtures=RequestFixtures("fixtures/myLeague", FixtureMode.RECORD)
+    )
+    league = SleeperLeagueLoader("12345678", [2022, 2023]).loadLeague()
+
+    # Load the same League again offline, with no rate limits and each request taking 100ms.
+    LeagueLoader.requestScheduler = RequestScheduler(
+        dict(),
+        fixtures=RequestFixtures(
+            "fixtures/myLeague", FixtureMode.REPLAY, latencySeconds=0.1
+        ),
+    )
+    replayedLeague = asyncio.run(
+        SleeperLeagueLoader("12345678", [2022, 2023]).loadLeagueAsync()
+    )
+    print(league.equals(replayedLeague, ignoreBaseIds=True, ignoreIds=True))
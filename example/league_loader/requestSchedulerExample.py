@@ -0,0 +1,34 @@
+import asyncio
+
+from leeger.enum import Platform
+from leeger.league_loader import (
+    AsyncLeagueLoader,
+    RequestScheduler,
+    SleeperLeagueLoader,
+)
+from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.model.league_loader import RateLimit, RetryPolicy
+
+if __name__ == "__main__":
+    # Every League Loader sends its requests through LeagueLoader.requestScheduler.
+    # Replace it to change the rate limit for each platform and how failed requests are retried.
+    LeagueLoader.requestScheduler = RequestScheduler(
+        {Platform.SLEEPER: RateLimit(requestsPerSecond=8, burst=50)},
+        retryPolicy=RetryPolicy(maxRetries=5, baseDelaySeconds=1, maxDelaySeconds=60),
+    )
+
+    # Load many Sleeper Leagues, identical requests in flight at the same time are only sent once.
+    leagueLoaders = [
+        SleeperLeagueLoader(leagueId, [2022, 2023])
+        for leagueId in ("12345678", "23456789", "34567890")
+    ]
+    leagues = asyncio.run(AsyncLeagueLoader.loadLeaguesAsync(leagueLoaders))
+
+    # See how many requests were retried and how long was spent waiting.
+    metrics = LeagueLoader.requestScheduler.getMetrics(Platform.SLEEPER)
+    print(
+        f"{metrics.requestsSent} requests sent, {metrics.retries} retries, {metrics.coalescedRequests} coalesced"
+    )
+    print(
+        f"waited {metrics.rateLimitWaitSeconds:.1f}s for rate limits and {metrics.retryWaitSeconds:.1f}s between retries"
+    )
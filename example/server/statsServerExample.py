@@ -0,0 +1,30 @@
+import json
+import threading
+import urllib.request
+
+from leeger.server import StatsServer, StatsService
+from leeger.util.league_generator import generateLeague
+
+if __name__ == "__main__":
+    # Leagues saved as League JSON can be served from the command line instead:
+    #   python -m leeger.server league.json --port 8000
+    league = generateLeague(seed=1, numberOfYears=3, numberOfTeams=8)
+    statsService = StatsService([league], cacheSize=512)
+
+    # Requests can be answered without a server, e.g. from a web framework.
+    status, body = statsService.handle(
+        f"/leagues/{league.id}/years/2001/stats?onlyRegularSeason=true"
+    )
+    print(status, list(json.loads(body).keys())[:5])
+
+    # Or served over HTTP, only reachable from this machine.
+    with StatsServer(statsService, port=8000) as statsServer:
+        threading.Thread(target=statsServer.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:8000/leagues/{league.id}/calculators/AWALAllTimeCalculator/getAWAL"
+        with urllib.request.urlopen(url) as response:
+            print(json.loads(response.read()))
+        # the same request again is answered from the cache
+        with urllib.request.urlopen(url) as response:
+            response.read()
+        print(f"cache hits: {statsService.cache.hits}")
+        statsServer.shutdown()
@@ -0,0 +1,22 @@
+from leeger.util.batch import computeStatSheets
+from leeger.util.league_generator import generateLeague
+
+if __name__ == "__main__":
+    # Any iterable of Leagues works, it is consumed lazily.
+    leagues = (generateLeague(seed=i, numberOfYears=3) for i in range(100))
+
+    # Compute the all-time stat sheet for every League in a pool of 4 processes.
+    # Any kwargs are passed along to leagueStatSheet() for every League.
+    batch = computeStatSheets(leagues, maxWorkers=4, onlyRegularSeason=True)
+
+    # Results come back as soon as they are done, use result.index to match them to the given Leagues.
+    for result in batch:
+        if result.succeeded:
+            print(result.leagueName, result.statSheet.wins)
+        else:
+            # A League that can't be computed doesn't stop the rest of the batch.
+            print(f"{result.leagueId} failed with {result.errorType}: {result.error}")
+
+    print(
+        f"{batch.numberOfLeaguesCompleted} Leagues at {batch.leaguesPerSecond:.1f} Leagues/s"
+    )
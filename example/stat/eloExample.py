@@ -0,0 +1,24 @@
+from leeger.util.elo import EloTracker, getEloRatings
+from leeger.util.league_generator import generateLeague
+
+if __name__ == "__main__":
+    league = generateLeague(seed=1, numberOfYears=5, numberOfTeams=10)
+    ownerIdToName = {owner.id: owner.name for owner in league.owners}
+
+    # Power rankings from Elo ratings over every Year, pulled 1/3 of the way back to 1500 at the start of each Year.
+    ratingHistory = getEloRatings(league, kFactor=24, yearRegression=1 / 3)
+    currentRatings = ratingHistory.getCurrentRatings()
+    for rank, ownerId in enumerate(ratingHistory.getRankings(), start=1):
+        print(f"{rank}. {ownerIdToName[ownerId]}: {currentRatings[ownerId]:.1f}")
+
+    # The rating of each Owner after each Week, as a (Weeks, Owners) array.
+    print(ratingHistory.ratings.shape)
+
+    # Keep ratings up to date as each new Week is played.
+    eloTracker = EloTracker(kFactor=24)
+    for year in league.years[:-1]:
+        eloTracker.addYear(year)
+    currentYear = league.years[-1]
+    for week in currentYear.weeks:
+        eloTracker.addWeek(currentYear, week.weekNumber)
+    print(eloTracker.getRatingHistory().getRankings())
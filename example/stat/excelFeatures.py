@@ -12,3 +12,11 @@ if __name__ == "__main__":
 
     # Overwrite an existing file by using the 'overwrite' keyword argument
     leagueToExcel(league, "C:\\myLeagueStats.xlsx", overwrite=True)
+
+    # Stream large Leagues straight to disk with a write-only workbook
+    # NOTE: 'filePath' is required and the returned workbook cannot be read back
+    leagueToExcel(league, "C:\\myLeagueStats.xlsx", overwrite=True, writeOnly=True)
+
+    # Stats for each Year are computed in parallel across all CPUs by default
+    # Use 'maxWorkers' to limit the number of processes used (1 computes everything in this process)
+    leagueToExcel(league, "C:\\myLeagueStats.xlsx", overwrite=True, maxWorkers=2)
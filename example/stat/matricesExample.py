@@ -0,0 +1,24 @@
+from leeger.util.league_generator import generateLeague
+from leeger.util.matrix import (
+    getLeagueAllPlayMatrix,
+    getLeagueHeadToHeadMatrix,
+    getYearAllPlayMatrix,
+)
+
+if __name__ == "__main__":
+    league = generateLeague(seed=1, numberOfYears=5, numberOfTeams=8)
+    owner1, owner2 = league.owners[0], league.owners[1]
+
+    # All-time Owner vs Owner records, as NumPy arrays.
+    headToHeadMatrix = getLeagueHeadToHeadMatrix(league)
+    wins, losses, ties = headToHeadMatrix.getRecord(owner1.id, owner2.id)
+    print(f"{owner1.name} is {wins}-{losses}-{ties} against {owner2.name}")
+    print(headToHeadMatrix.wins)
+
+    # How every score would have done against every other score in its Week.
+    allPlayMatrix = getLeagueAllPlayMatrix(league, onlyRegularSeason=True)
+    print(allPlayMatrix.getAWAL())
+
+    # Year matrices are cached, so getting them again is free.
+    yearAllPlayMatrix = getYearAllPlayMatrix(league.years[0])
+    print(yearAllPlayMatrix.getSmartWins())
@@ -0,0 +1,29 @@
+from leeger.calculator.year_calculator import (
+    GameOutcomeYearCalculator,
+    PointsScoredYearCalculator,
+)
+from leeger.util.league_generator import generateLeague
+from leeger.util.multi_filter import computeMany
+
+if __name__ == "__main__":
+    year = generateLeague(seed=1).years[0]
+
+    # Each set of filters holds the kwargs that would be given to a calculator.
+    filterSets = [
+        dict(),
+        {"onlyRegularSeason": True},
+        {"onlyPostSeason": True},
+        {"weekNumberStart": 1, "weekNumberEnd": 4},
+        {"weekNumberStart": 5, "weekNumberEnd": 8},
+    ]
+    stats = [
+        GameOutcomeYearCalculator.getWins,
+        PointsScoredYearCalculator.getPointsScored,
+    ]
+
+    # The Year is scanned once for all sets of filters.
+    results = computeMany(year, stats, filterSets)
+
+    # Results are in the same order as the sets of filters, keyed by stat.
+    for filterSet, result in zip(filterSets, results):
+        print(filterSet, result[GameOutcomeYearCalculator.getWins])
@@ -0,0 +1,29 @@
+import leeger
+from leeger.model.profile import CallRecord
+from leeger.util.league_generator import generateLeague
+from leeger.util.profiling import ProfileSink
+from leeger.util.stat_sheet import leagueStatSheet
+
+if __name__ == "__main__":
+    league = generateLeague(seed=1, numberOfYears=3, numberOfTeams=10)
+
+    # Every calculator, validation, navigator and League Loader call made inside the block is timed.
+    with leeger.profile() as p:
+        leagueStatSheet(league)
+
+    # Print the 10 functions that took the most time themselves.
+    print(p.report(limit=10))
+
+    # Get the stats for a single function, in total and for a single Year.
+    awalStats = p.stats["AWALYearCalculator.getAWAL"]
+    print(awalStats.calls, awalStats.totalTime, awalStats.selfTime)
+    print(awalStats.years[2000].totalTime)
+
+    # Send each call somewhere else (e.g. a metrics system) with a ProfileSink.
+    class PrintSink(ProfileSink):
+        def record(self, callRecord: CallRecord) -> None:
+            if callRecord.totalTime > 0.01:
+                print(f"slow call: {callRecord.name} ({callRecord.totalTime:.3f}s)")
+
+    with leeger.profile(sink=PrintSink()):
+        leagueStatSheet(league)
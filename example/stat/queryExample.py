@@ -0,0 +1,35 @@
+from leeger.enum import MatchupType
+from leeger.util.league_generator import generateLeague
+from leeger.util.query import LeagueIndex
+
+if __name__ == "__main__":
+    league = generateLeague(seed=1, numberOfYears=8, numberOfTeams=10)
+    owner = league.owners[0]
+
+    # Build the index once, then run as many queries against it as needed.
+    leagueIndex = LeagueIndex(league)
+
+    # Points scored by an Owner in playoff games since 2003 against each opponent.
+    print(
+        leagueIndex.query()
+        .where(
+            ownerIds=[owner.id],
+            matchupTypes=[MatchupType.PLAYOFF, MatchupType.CHAMPIONSHIP],
+            yearNumberStart=2003,
+        )
+        .groupBy("opponent")
+        .aggregate(points="sum(pointsFor)", games="count()", winPct="winPercentage()")
+    )
+
+    # Queries can be reused as the start of other queries.
+    regularSeason = leagueIndex.query().where(matchupTypes=[MatchupType.REGULAR_SEASON])
+    print(
+        regularSeason.groupBy("year").aggregate(
+            highScore="max(pointsFor)", biggestBlowout="max(margin)"
+        )
+    )
+    print(
+        regularSeason.where(weekNumberEnd=4)
+        .groupBy("owner")
+        .aggregate(average="mean(pointsFor)")
+    )
@@ -0,0 +1,24 @@
+from leeger.util.league_generator import generateLeague
+from leeger.util.records import RecordsTracker, getRecords
+
+if __name__ == "__main__":
+    league = generateLeague(seed=1, numberOfYears=5, numberOfTeams=10)
+
+    # The top 5 records over every Year.
+    report = getRecords(league, topK=5)
+    for record in report.highestScores:
+        print(f"{record.yearNumber} Week {record.weekNumber}: {record.pointsFor}")
+    for streak in report.longestOwnerWinStreaks:
+        print(f"{streak.ownerId}: {streak.length} wins in a row")
+
+    # Records can also be filtered, the same as the All-Time calculators.
+    print(getRecords(league, onlyRegularSeason=True, yearNumberStart=2002).toJson())
+
+    # Keep records up to date as each new Week is played.
+    tracker = RecordsTracker(topK=5)
+    for year in league.years[:-1]:
+        tracker.addYear(year)
+    currentYear = league.years[-1]
+    for week in currentYear.weeks:
+        tracker.addWeek(currentYear, week.weekNumber)
+        print(tracker.getReport().currentOwnerStreaks)
@@ -0,0 +1,29 @@
+from leeger.calculator.all_time_calculator import ScheduleLuckAllTimeCalculator
+from leeger.calculator.year_calculator import ScheduleLuckYearCalculator
+from leeger.util.league_generator import generateLeague
+
+if __name__ == "__main__":
+    league = generateLeague(seed=1, numberOfYears=3, numberOfTeams=10)
+    year = league.years[0]
+
+    # The WAL each team would have had with each team's schedule.
+    walBySchedule = ScheduleLuckYearCalculator.getWALBySchedule(
+        year, onlyRegularSeason=True
+    )
+    team1, team2 = year.teams[0], year.teams[1]
+    print(
+        f"{team1.name} with {team2.name}'s schedule: {walBySchedule[team1.id][team2.id]} WAL"
+    )
+
+    # How many more WAL each team got from their schedule than from an average schedule.
+    print(ScheduleLuckYearCalculator.getScheduleLuck(year, onlyRegularSeason=True))
+
+    # 10 teams can be shuffled into the schedule too many ways to try every one, so 10,000 random shuffles are used.
+    print(
+        ScheduleLuckYearCalculator.getScheduleLuckPercentile(
+            year, numberOfSchedules=10_000, seed=1, onlyRegularSeason=True
+        )
+    )
+
+    # All-time Schedule Luck for each Owner.
+    print(ScheduleLuckAllTimeCalculator.getScheduleLuck(league, onlyRegularSeason=True))
@@ -0,0 +1,34 @@
+from leeger.model.league.Year import Year
+from leeger.util.league_generator import generateLeague
+from leeger.util.simulation import simulateYear
+
+if __name__ == "__main__":
+    league = generateLeague(seed=1, numberOfTeams=8, numberOfRegularSeasonWeeks=13)
+    fullYear = league.years[0]
+
+    # The Year as it stands after 9 Weeks, with the rest of the regular season still to play.
+    year = Year(
+        yearNumber=fullYear.yearNumber,
+        teams=fullYear.teams,
+        weeks=fullYear.weeks[:9],
+        yearSettings=fullYear.yearSettings,
+    )
+    remainingSchedule = [
+        [(matchup.teamAId, matchup.teamBId) for matchup in week.matchups]
+        for week in fullYear.weeks[9:13]
+    ]
+
+    simulation = simulateYear(
+        year,
+        remainingSchedule,
+        numberOfPlayoffTeams=4,
+        numberOfSimulations=100_000,
+        seed=42,
+    )
+    for team in year.teams:
+        print(
+            f"{team.name}: "
+            f"1st seed {simulation.getSeedProbability(team.id, 1):.1%}, "
+            f"playoffs {simulation.playoffProbabilities[team.id]:.1%}, "
+            f"champion {simulation.championshipProbabilities[team.id]:.1%}"
+        )
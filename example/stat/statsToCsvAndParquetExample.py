@@ -0,0 +1,21 @@
+from leeger.league_loader import ESPNLeagueLoader
+from leeger.model.league import League
+from leeger.util.table_export import leaguesToCsv, leagueToCsv, leagueToParquet
+
+if __name__ == "__main__":
+    # Get a League object.
+    # There are many ways to get a League object, here we will just grab one using the ESPN League Loader.
+    espnLeagueLoader = ESPNLeagueLoader("12345678", [2019, 2020, 2021, 2022])
+    league: League = espnLeagueLoader.loadLeague()
+
+    # Save league stats to CSV files in a directory.
+    # This writes yearTeams.csv, yearMatchups.csv, allTimeOwners.csv and allTimeMatchups.csv
+    leagueToCsv(league, "C:\\myLeagueStats")
+
+    # Save league stats to typed, columnar Parquet files in a directory.
+    # NOTE: This requires the 'pyarrow' package to be installed.
+    leagueToParquet(league, "C:\\myLeagueStats", overwrite=True)
+
+    # Save stats for many leagues to the same files.
+    # Any iterable works here, including a generator that loads each League as it is needed.
+    leaguesToCsv([league, league], "C:\\allLeagueStats", overwrite=True)
@@ -0,0 +1,27 @@
+from leeger.enum import TimeSeriesStat
+from leeger.util.league_generator import generateLeague
+from leeger.util.time_series import getLeagueTimeSeries, getYearTimeSeries
+
+if __name__ == "__main__":
+    league = generateLeague(seed=1, numberOfYears=3, numberOfTeams=10)
+    year = league.years[0]
+
+    # Week-by-week stats for each Team in a Year, with a 3 Week window for rolling stats.
+    timeSeries = getYearTimeSeries(
+        year,
+        [TimeSeriesStat.MOVING_AVERAGE_POINTS, TimeSeriesStat.CUMULATIVE_AWAL],
+        window=3,
+        onlyRegularSeason=True,
+    )
+    team = year.teams[0]
+    print(
+        f"{team.name} 3 week average points: {timeSeries.getSeries(TimeSeriesStat.MOVING_AVERAGE_POINTS, team.id)}"
+    )
+    print(
+        f"{team.name} AWAL so far: {timeSeries.getSeries(TimeSeriesStat.CUMULATIVE_AWAL, team.id)}"
+    )
+
+    # Week-by-week stats for each Owner over every Year, each stat is a (Weeks, Owners) array.
+    leagueTimeSeries = getLeagueTimeSeries(league, window=5)
+    print(leagueTimeSeries.weeks)
+    print(leagueTimeSeries.values[TimeSeriesStat.ROLLING_WIN_PERCENTAGE])
@@ -1 +1,2 @@
 from ._version import __version__  # noqa
+from .util.profiling import profile  # noqa
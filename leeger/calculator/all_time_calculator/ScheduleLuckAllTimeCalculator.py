@@ -0,0 +1,95 @@
+import functools
+from typing import Optional
+
+from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.calculator.year_calculator.ScheduleLuckYearCalculator import (
+    ScheduleLuckYearCalculator,
+)
+from leeger.decorator.validators import validateLeague
+from leeger.model.league.League import League
+from leeger.util.Deci import Deci
+from leeger.util.navigator.LeagueNavigator import LeagueNavigator
+
+
+class ScheduleLuckAllTimeCalculator(AllTimeCalculator):
+    """
+    Used to calculate all schedule luck stats.
+    """
+
+    __DEFAULT_NUMBER_OF_SCHEDULES = 10_000
+
+    @classmethod
+    @validateLeague
+    def getScheduleLuck(cls, league: League, **kwargs) -> dict[str, Optional[Deci]]:
+        """
+        Schedule Luck is how many more WAL a team got from their schedule than they would have with an average schedule.
+        A positive Schedule Luck means a team had an easier schedule than the rest of the league.
+
+        Returns the sum of each Year's Schedule Luck for each Owner in the given League.
+        Returns None for an Owner if they have no games played in the range.
+
+        Example response:
+            {
+            "someOwnerId": Deci("3.25"),
+            "someOtherOwnerId": Deci("-1.5"),
+            "yetAnotherOwnerId": Deci("0.75"),
+            ...
+            }
+        """
+        return cls._addAndCombineResults(
+            league, ScheduleLuckYearCalculator.getScheduleLuck, **kwargs
+        )
+
+    @classmethod
+    @validateLeague
+    def getScheduleLuckPercentile(
+        cls,
+        league: League,
+        *,
+        numberOfSchedules: int = __DEFAULT_NUMBER_OF_SCHEDULES,
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Schedule Luck Percentile is the share of possible schedules a team would have had fewer WAL with than with their own schedule.
+        See ScheduleLuckYearCalculator.getScheduleLuckPercentile() for how possible schedules are found.
+
+        Returns the average of each Year's Schedule Luck Percentile (0-1) for each Owner in the given League.
+        Returns None for an Owner if they have no games played in the range.
+
+        Example response:
+            {
+            "someOwnerId": Deci("0.6125"),
+            "someOtherOwnerId": Deci("0.4"),
+            "yetAnotherOwnerId": Deci("0.55"),
+            ...
+            }
+        """
+        allResultDicts = cls._getAllResultDictsByYear(
+            league,
+            functools.partial(
+                ScheduleLuckYearCalculator.getScheduleLuckPercentile,
+                numberOfSchedules=numberOfSchedules,
+                seed=seed,
+            ),
+            **kwargs,
+        )
+
+        ownerIdAndPercentiles: dict[str, list[Deci]] = {
+            ownerId: list() for ownerId in LeagueNavigator.getAllOwnerIds(league)
+        }
+        for resultDict in allResultDicts.values():
+            for teamId, percentile in resultDict.items():
+                if percentile is not None:
+                    ownerId = LeagueNavigator.getTeamById(league, teamId).ownerId
+                    ownerIdAndPercentiles[ownerId].append(percentile)
+
+        ownerIdAndScheduleLuckPercentile = dict()
+        for ownerId, percentiles in ownerIdAndPercentiles.items():
+            if percentiles:
+                ownerIdAndScheduleLuckPercentile[ownerId] = sum(percentiles) / Deci(
+                    len(percentiles)
+                )
+            else:
+                ownerIdAndScheduleLuckPercentile[ownerId] = None
+        return ownerIdAndScheduleLuckPercentile
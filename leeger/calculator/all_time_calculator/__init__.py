@@ -1,12 +1,35 @@
-from .AWALAllTimeCalculator import AWALAllTimeCalculator
-from .GameOutcomeAllTimeCalculator import GameOutcomeAllTimeCalculator
-from .PlusMinusAllTimeCalculator import PlusMinusAllTimeCalculator
-from .PointsScoredAllTimeCalculator import PointsScoredAllTimeCalculator
-from .ScoringShareAllTimeCalculator import ScoringShareAllTimeCalculator
-from .ScoringStandardDeviationAllTimeCalculator import (
-    ScoringStandardDeviationAllTimeCalculator,
-)
-from .SingleScoreAllTimeCalculator import SingleScoreAllTimeCalculator
-from .SmartWinsAllTimeCalculator import SmartWinsAllTimeCalculator
-from .SSLAllTimeCalculator import SSLAllTimeCalculator
-from .TeamSummaryAllTimeCalculator import TeamSummaryAllTimeCalculator
+from typing import TYPE_CHECKING
+
+from leeger.util.lazy_import import lazyAttributes
+
+if TYPE_CHECKING:
+    from .AWALAllTimeCalculator import AWALAllTimeCalculator
+    from .GameOutcomeAllTimeCalculator import GameOutcomeAllTimeCalculator
+    from .PlusMinusAllTimeCalculator import PlusMinusAllTimeCalculator
+    from .PointsScoredAllTimeCalculator import PointsScoredAllTimeCalculator
+    from .ScheduleLuckAllTimeCalculator import ScheduleLuckAllTimeCalculator
+    from .ScoringShareAllTimeCalculator import ScoringShareAllTimeCalculator
+    from .ScoringStandardDeviationAllTimeCalculator import (
+        ScoringStandardDeviationAllTimeCalculator,
+    )
+    from .SingleScoreAllTimeCalculator import SingleScoreAllTimeCalculator
+    from .SmartWinsAllTimeCalculator import SmartWinsAllTimeCalculator
+    from .SSLAllTimeCalculator import SSLAllTimeCalculator
+    from .TeamSummaryAllTimeCalculator import TeamSummaryAllTimeCalculator
+
+# each calculator is only imported the first time it is used
+__all__ = [
+    "AWALAllTimeCalculator",
+    "GameOutcomeAllTimeCalculator",
+    "PlusMinusAllTimeCalculator",
+    "PointsScoredAllTimeCalculator",
+    "ScheduleLuckAllTimeCalculator",
+    "ScoringShareAllTimeCalculator",
+    "ScoringStandardDeviationAllTimeCalculator",
+    "SingleScoreAllTimeCalculator",
+    "SmartWinsAllTimeCalculator",
+    "SSLAllTimeCalculator",
+    "TeamSummaryAllTimeCalculator",
+]
+
+__getattr__, __dir__ = lazyAttributes(__name__, __all__)
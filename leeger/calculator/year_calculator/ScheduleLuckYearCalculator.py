@@ -0,0 +1,262 @@
+import itertools
+import math
+from typing import Optional
+
+import numpy
+
+from leeger.calculator.parent.YearCalculator import YearCalculator
+from leeger.decorator.validators import validateYear
+from leeger.model.filter import YearFilters
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.navigator.YearNavigator import YearNavigator
+
+
+class ScheduleLuckYearCalculator(YearCalculator):
+    """
+    Used to calculate all schedule luck stats.
+    These answer "what if a team had played another team's schedule?".
+    Every Week is its own game (multi-week matchups are compared Week by Week) and league median games are not included, as they don't depend on the schedule.
+    """
+
+    __DEFAULT_NUMBER_OF_SCHEDULES = 10_000
+
+    @classmethod
+    @validateYear
+    def getWALBySchedule(
+        cls, year: Year, **kwargs
+    ) -> dict[str, Optional[dict[str, Optional[Deci]]]]:
+        """
+        Returns the WAL each team would have had with each team's schedule in the given Year.
+        A team with another team's schedule plays that team's opponent each Week, or that team itself if the opponent is them.
+        Returns None for a Team if they have no games played in the range, and None for a schedule with no games played in the range.
+
+        Example response:
+            {
+            "someTeamId": {"someTeamId": Deci("8"), "someOtherTeamId": Deci("9.5"), ...},
+            "someOtherTeamId": {"someTeamId": Deci("6"), "someOtherTeamId": Deci("7"), ...},
+            ...
+            }
+        """
+        filters = YearFilters.getForYear(year, **kwargs)
+        teamIds, scores, opponents = cls._getScoreAndOpponentMatrices(year, filters)
+        walBySchedule, _ = cls.__getWALBySchedule(scores, opponents)
+        gamesBySchedule = (opponents >= 0).sum(axis=0)
+
+        teamIdAndWALBySchedule = dict()
+        for i, teamId in enumerate(teamIds):
+            teamIdAndWALBySchedule[teamId] = {
+                scheduleTeamId: Deci(float(walBySchedule[i, j]))
+                if gamesBySchedule[j] > 0
+                else None
+                for j, scheduleTeamId in enumerate(teamIds)
+            }
+
+        cls._setToNoneIfNoGamesPlayed(teamIdAndWALBySchedule, year, filters, **kwargs)
+        return teamIdAndWALBySchedule
+
+    @classmethod
+    @validateYear
+    def getScheduleLuck(cls, year: Year, **kwargs) -> dict[str, Optional[Deci]]:
+        """
+        Schedule Luck is how many more WAL a team got from their schedule than they would have with an average schedule.
+        A positive Schedule Luck means a team had an easier schedule than the rest of the league.
+        WAL per game is compared, so that Weeks a team has no score in (e.g. byes) don't count against another team's schedule.
+
+        Schedule Luck = G * ((W / G) - (Σ(S / g) / N))
+        WHERE:
+        W = WAL with their own schedule
+        G = Games played with their own schedule
+        S = WAL with another team's schedule
+        g = Games played with that team's schedule
+        N = Number of other teams' schedules with games played
+
+        Returns the Schedule Luck for each team in the given Year.
+        Returns None for a Team if they have no games played in the range.
+
+        Example response:
+            {
+            "someTeamId": Deci("1.5"),
+            "someOtherTeamId": Deci("-0.25"),
+            "yetAnotherTeamId": Deci("0"),
+            ...
+            }
+        """
+        filters = YearFilters.getForYear(year, **kwargs)
+        teamIds, scores, opponents = cls._getScoreAndOpponentMatrices(year, filters)
+        walBySchedule, gamesBySchedule = cls.__getWALBySchedule(scores, opponents)
+
+        teamIdAndScheduleLuck = dict()
+        for i, teamId in enumerate(teamIds):
+            ownGames = Deci(int(gamesBySchedule[i, i]))
+            # other schedules' WAL scaled to the number of games played with their own schedule
+            otherScaledWALs = [
+                Deci(float(walBySchedule[i, j]))
+                * ownGames
+                / Deci(int(gamesBySchedule[i, j]))
+                for j in range(len(teamIds))
+                if j != i and gamesBySchedule[i, j] > 0
+            ]
+            if ownGames > 0 and otherScaledWALs:
+                teamIdAndScheduleLuck[teamId] = Deci(float(walBySchedule[i, i])) - (
+                    sum(otherScaledWALs) / Deci(len(otherScaledWALs))
+                )
+            else:
+                teamIdAndScheduleLuck[teamId] = Deci(0)
+
+        cls._setToNoneIfNoGamesPlayed(teamIdAndScheduleLuck, year, filters, **kwargs)
+        return teamIdAndScheduleLuck
+
+    @classmethod
+    @validateYear
+    def getScheduleLuckPercentile(
+        cls,
+        year: Year,
+        *,
+        numberOfSchedules: int = __DEFAULT_NUMBER_OF_SCHEDULES,
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> dict[str, Optional[Deci]]:
+        """
+        Schedule Luck Percentile is the share of possible schedules a team would have had a lower WAL per game with than with their own schedule.
+        Possible schedules come from shuffling which team plays in each team's place in the real schedule.
+        WAL per game is used so that Weeks a team has no score in (e.g. byes) don't count against a schedule.
+        If there are no more than numberOfSchedules ways to shuffle the teams, every one is used.
+        Otherwise, numberOfSchedules random shuffles are used, the same seed always gives the same result.
+        Schedules a team would have had the same WAL per game with count as half.
+
+        Returns the Schedule Luck Percentile (0-1) for each team in the given Year.
+        Returns None for a Team if they have no games played in the range.
+
+        Example response:
+            {
+            "someTeamId": Deci("0.9125"),
+            "someOtherTeamId": Deci("0.4"),
+            "yetAnotherTeamId": Deci("0.05"),
+            ...
+            }
+        """
+        if numberOfSchedules < 1:
+            raise ValueError("'numberOfSchedules' must be at least 1.")
+        filters = YearFilters.getForYear(year, **kwargs)
+        teamIds, scores, opponents = cls._getScoreAndOpponentMatrices(year, filters)
+        numberOfTeams = len(teamIds)
+
+        if math.factorial(numberOfTeams) <= numberOfSchedules:
+            shuffles = numpy.array(
+                list(itertools.permutations(range(numberOfTeams))), dtype=numpy.int64
+            )
+        else:
+            rng = numpy.random.default_rng(seed)
+            shuffles = rng.permuted(
+                numpy.tile(numpy.arange(numberOfTeams), (numberOfSchedules, 1)), axis=1
+            )
+        # WAL per game of the team in each place, for each shuffle
+        ownWALPerGame = cls.__getWALPerGameForShuffles(
+            scores, opponents, numpy.arange(numberOfTeams)[None, :]
+        )[0]
+        walPerGameByPlace = cls.__getWALPerGameForShuffles(scores, opponents, shuffles)
+        walPerGame = numpy.empty_like(walPerGameByPlace)
+        numpy.put_along_axis(walPerGame, shuffles, walPerGameByPlace, axis=1)
+        fewer = (walPerGame < ownWALPerGame[None, :]).sum(axis=0)
+        # a schedule with no games counts the same as their own
+        same = ((walPerGame == ownWALPerGame[None, :]) | numpy.isnan(walPerGame)).sum(
+            axis=0
+        )
+
+        teamIdAndScheduleLuckPercentile = dict()
+        for i, teamId in enumerate(teamIds):
+            teamIdAndScheduleLuckPercentile[teamId] = (
+                Deci(int(fewer[i])) + Deci(int(same[i])) * Deci("0.5")
+            ) / Deci(len(shuffles))
+
+        cls._setToNoneIfNoGamesPlayed(
+            teamIdAndScheduleLuckPercentile, year, filters, **kwargs
+        )
+        return teamIdAndScheduleLuckPercentile
+
+    @classmethod
+    def _getScoreAndOpponentMatrices(
+        cls, year: Year, yearFilters: YearFilters
+    ) -> tuple[list[str], numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the Team IDs, the score of each team in each Week (NaN if they didn't play)
+        and the index of each team's opponent in each Week (-1 if they didn't play).
+        Rows are Weeks in the filtered range, columns are teams in the same order as the Team IDs.
+        """
+        teamIds = YearNavigator.getAllTeamIds(year)
+        teamIdToIndex = {teamId: i for i, teamId in enumerate(teamIds)}
+        weekIndexes = range(yearFilters.weekNumberStart - 1, yearFilters.weekNumberEnd)
+        scores = numpy.full((len(weekIndexes), len(teamIds)), numpy.nan)
+        opponents = numpy.full((len(weekIndexes), len(teamIds)), -1, dtype=numpy.int64)
+        for row, weekIndex in enumerate(weekIndexes):
+            for matchup in year.weeks[weekIndex].matchups:
+                if matchup.matchupType not in yearFilters.includeMatchupTypes or (
+                    not yearFilters.includeMultiWeekMatchups
+                    and matchup.multiWeekMatchupId is not None
+                ):
+                    continue
+                a, b = teamIdToIndex[matchup.teamAId], teamIdToIndex[matchup.teamBId]
+                scores[row, a] = matchup.teamAScore
+                scores[row, b] = matchup.teamBScore
+                opponents[row, a] = b
+                opponents[row, b] = a
+        return teamIds, scores, opponents
+
+    @staticmethod
+    def __getWALBySchedule(
+        scores: numpy.ndarray, opponents: numpy.ndarray
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the WAL and the number of games of every team (rows) with every team's schedule (columns).
+        A team can't play in a Week they have no score for, even if the schedule they have does.
+        """
+        numberOfTeams = scores.shape[1]
+        teams = numpy.arange(numberOfTeams)
+        # opponent of team x with team y's schedule, shape (Weeks, x, y)
+        scheduleOpponents = numpy.broadcast_to(
+            opponents[:, None, :], (len(scores), numberOfTeams, numberOfTeams)
+        )
+        # a team that would play themselves plays the team whose schedule it is instead
+        scheduleOpponents = numpy.where(
+            scheduleOpponents == teams[None, :, None],
+            teams[None, None, :],
+            scheduleOpponents,
+        )
+        teamScores = numpy.broadcast_to(scores[:, :, None], scheduleOpponents.shape)
+        opponentScores = numpy.take_along_axis(
+            scores, numpy.maximum(scheduleOpponents, 0).reshape(len(scores), -1), axis=1
+        ).reshape(scheduleOpponents.shape)
+        played = (scheduleOpponents >= 0) & ~numpy.isnan(teamScores)
+        wal = numpy.where(
+            played,
+            (teamScores > opponentScores) + 0.5 * (teamScores == opponentScores),
+            0.0,
+        ).sum(axis=0)
+        return wal, played.sum(axis=0)
+
+    @staticmethod
+    def __getWALPerGameForShuffles(
+        scores: numpy.ndarray, opponents: numpy.ndarray, shuffles: numpy.ndarray
+    ) -> numpy.ndarray:
+        """
+        Returns the WAL per game of the team in each place of the real schedule, for each shuffle of teams into places.
+        shuffles[k, p] is the team that plays in team p's place in shuffle k.
+        A team with no games in a shuffle has NaN.
+        """
+        # shape (Shuffles, Weeks, places)
+        teamScores = scores[:, shuffles].transpose(1, 0, 2)
+        opponentPlaces = numpy.maximum(opponents, 0)
+        opponentTeams = shuffles[:, opponentPlaces]
+        opponentScores = scores[numpy.arange(len(scores))[None, :, None], opponentTeams]
+        # a team can't play in a Week they have no score for, even if the place they are in does
+        played = (opponents >= 0)[None, :, :] & ~numpy.isnan(teamScores)
+        played &= ~numpy.isnan(opponentScores)
+        wal = numpy.where(
+            played,
+            (teamScores > opponentScores) + 0.5 * (teamScores == opponentScores),
+            0.0,
+        ).sum(axis=1)
+        games = played.sum(axis=1)
+        with numpy.errstate(invalid="ignore"):
+            return wal / games
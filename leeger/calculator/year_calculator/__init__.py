@@ -1,12 +1,35 @@
-from .AWALYearCalculator import AWALYearCalculator
-from .GameOutcomeYearCalculator import GameOutcomeYearCalculator
-from .PlusMinusYearCalculator import PlusMinusYearCalculator
-from .PointsScoredYearCalculator import PointsScoredYearCalculator
-from .ScoringShareYearCalculator import ScoringShareYearCalculator
-from .ScoringStandardDeviationYearCalculator import (
-    ScoringStandardDeviationYearCalculator,
-)
-from .SingleScoreYearCalculator import SingleScoreYearCalculator
-from .SmartWinsYearCalculator import SmartWinsYearCalculator
-from .SSLYearCalculator import SSLYearCalculator
-from .TeamSummaryYearCalculator import TeamSummaryYearCalculator
+from typing import TYPE_CHECKING
+
+from leeger.util.lazy_import import lazyAttributes
+
+if TYPE_CHECKING:
+    from .AWALYearCalculator import AWALYearCalculator
+    from .GameOutcomeYearCalculator import GameOutcomeYearCalculator
+    from .PlusMinusYearCalculator import PlusMinusYearCalculator
+    from .PointsScoredYearCalculator import PointsScoredYearCalculator
+    from .ScheduleLuckYearCalculator import ScheduleLuckYearCalculator
+    from .ScoringShareYearCalculator import ScoringShareYearCalculator
+    from .ScoringStandardDeviationYearCalculator import (
+        ScoringStandardDeviationYearCalculator,
+    )
+    from .SingleScoreYearCalculator import SingleScoreYearCalculator
+    from .SmartWinsYearCalculator import SmartWinsYearCalculator
+    from .SSLYearCalculator import SSLYearCalculator
+    from .TeamSummaryYearCalculator import TeamSummaryYearCalculator
+
+# each calculator is only imported the first time it is used
+__all__ = [
+    "AWALYearCalculator",
+    "GameOutcomeYearCalculator",
+    "PlusMinusYearCalculator",
+    "PointsScoredYearCalculator",
+    "ScheduleLuckYearCalculator",
+    "ScoringShareYearCalculator",
+    "ScoringStandardDeviationYearCalculator",
+    "SingleScoreYearCalculator",
+    "SmartWinsYearCalculator",
+    "SSLYearCalculator",
+    "TeamSummaryYearCalculator",
+]
+
+__getattr__, __dir__ = lazyAttributes(__name__, __all__)
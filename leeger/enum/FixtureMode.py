@@ -0,0 +1,11 @@
+from enum import Enum, unique
+
+
+@unique
+class FixtureMode(Enum):
+    """
+    Used to hold whether RequestFixtures record platform responses or replay them.
+    """
+
+    RECORD = "RECORD"
+    REPLAY = "REPLAY"
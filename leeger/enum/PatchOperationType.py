@@ -0,0 +1,25 @@
+from enum import Enum, unique
+
+
+@unique
+class PatchOperationType(Enum):
+    """
+    Used to hold the different types of operations in a LeaguePatch.
+    """
+
+    SET_LEAGUE_NAME = "SET_LEAGUE_NAME"
+    ADD_OWNER = "ADD_OWNER"
+    REMOVE_OWNER = "REMOVE_OWNER"
+    ADD_YEAR = "ADD_YEAR"
+    REMOVE_YEAR = "REMOVE_YEAR"
+    UPDATE_YEAR_SETTINGS = "UPDATE_YEAR_SETTINGS"
+    ADD_DIVISION = "ADD_DIVISION"
+    REMOVE_DIVISION = "REMOVE_DIVISION"
+    ADD_TEAM = "ADD_TEAM"
+    REMOVE_TEAM = "REMOVE_TEAM"
+    UPDATE_TEAM = "UPDATE_TEAM"
+    ADD_WEEK = "ADD_WEEK"
+    REMOVE_WEEK = "REMOVE_WEEK"
+    ADD_MATCHUP = "ADD_MATCHUP"
+    REMOVE_MATCHUP = "REMOVE_MATCHUP"
+    UPDATE_MATCHUP = "UPDATE_MATCHUP"
@@ -0,0 +1,14 @@
+from enum import Enum, unique
+
+
+@unique
+class Platform(Enum):
+    """
+    Used to hold the different platforms a League can be loaded from.
+    """
+
+    ESPN = "ESPN"
+    FLEAFLICKER = "FLEAFLICKER"
+    MY_FANTASY_LEAGUE = "MY_FANTASY_LEAGUE"
+    SLEEPER = "SLEEPER"
+    YAHOO = "YAHOO"
@@ -0,0 +1,21 @@
+from enum import Enum, unique
+
+
+@unique
+class TimeSeriesStat(Enum):
+    """
+    Used to hold the different stats a TimeSeries can have.
+    """
+
+    # average score over the last few Weeks
+    MOVING_AVERAGE_POINTS = "MOVING_AVERAGE_POINTS"
+    # win percentage over the games finished in the last few Weeks
+    ROLLING_WIN_PERCENTAGE = "ROLLING_WIN_PERCENTAGE"
+    # points scored so far
+    CUMULATIVE_POINTS = "CUMULATIVE_POINTS"
+    # WAL so far
+    CUMULATIVE_WAL = "CUMULATIVE_WAL"
+    # AWAL so far
+    CUMULATIVE_AWAL = "CUMULATIVE_AWAL"
+    # Smart Wins so far
+    CUMULATIVE_SMART_WINS = "CUMULATIVE_SMART_WINS"
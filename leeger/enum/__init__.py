@@ -1 +1,5 @@
+from .FixtureMode import FixtureMode
 from .MatchupType import MatchupType
+from .PatchOperationType import PatchOperationType
+from .Platform import Platform
+from .TimeSeriesStat import TimeSeriesStat
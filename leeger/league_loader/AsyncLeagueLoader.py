@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+from abc import abstractmethod
+from typing import Iterable, Optional
+
+from leeger.league_loader.AsyncRequestPool import AsyncRequestPool
+from leeger.model.league.League import League
+
+
+class AsyncLeagueLoader:
+    """
+    League Loaders that can be awaited should inherit this.
+    Requests to the platform are sent concurrently on threads, while the League is built from the responses synchronously.
+    """
+
+    @abstractmethod
+    async def loadLeagueAsync(
+        self,
+        validate: bool = True,
+        *,
+        requestPool: Optional[AsyncRequestPool] = None,
+    ) -> League: ...
+
+    @staticmethod
+    async def loadLeaguesAsync(
+        leagueLoaders: Iterable[AsyncLeagueLoader],
+        *,
+        validate: bool = True,
+        maxConcurrentRequests: int = AsyncRequestPool.DEFAULT_MAX_CONCURRENT_REQUESTS,
+    ) -> list[League]:
+        """
+        Loads the Leagues for the given League Loaders concurrently, with at most maxConcurrentRequests requests in flight across all of them.
+        Leagues are returned in the same order as the given League Loaders.
+        """
+        with AsyncRequestPool(maxConcurrentRequests) as requestPool:
+            return list(
+                await asyncio.gather(
+                    *(
+                        leagueLoader.loadLeagueAsync(validate, requestPool=requestPool)
+                        for leagueLoader in leagueLoaders
+                    )
+                )
+            )
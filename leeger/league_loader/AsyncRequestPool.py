@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
+
+
+class AsyncRequestPool:
+    """
+    Sends blocking platform requests on a pool of threads, with at most maxConcurrentRequests in flight at once.
+    Share one between League Loaders to limit the requests sent by all of them.
+    A pool must only be used from a single event loop.
+
+    Example:
+        with AsyncRequestPool(16) as requestPool:
+            league = await leagueLoader.loadLeagueAsync(requestPool=requestPool)
+    """
+
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
+    def __init__(self, maxConcurrentRequests: int = DEFAULT_MAX_CONCURRENT_REQUESTS):
+        if maxConcurrentRequests < 1:
+            raise ValueError("'maxConcurrentRequests' must be at least 1.")
+        self.__semaphore = asyncio.Semaphore(maxConcurrentRequests)
+        self.__executor = ThreadPoolExecutor(
+            max_workers=maxConcurrentRequests, thread_name_prefix="leeger-request"
+        )
+
+    def __enter__(self) -> AsyncRequestPool:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def send(self, request: PlatformRequest) -> Any:
+        """
+        Sends the given request on a thread once there is room for it, and returns the response.
+        """
+        async with self.__semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.__executor, request.send
+            )
+
+    def close(self) -> None:
+        """
+        Stops the threads without waiting, requests that haven't started are cancelled.
+        """
+        self.__executor.shutdown(wait=False, cancel_futures=True)
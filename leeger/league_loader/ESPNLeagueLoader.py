@@ -5,7 +5,8 @@ from espn_api.football import League as ESPNLeague
 from espn_api.football import Team as ESPNTeam
 
 from leeger.enum.MatchupType import MatchupType
-from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.enum.Platform import Platform
+from leeger.league_loader.LeagueLoader import LeagueLoader, RequestBatches
 from leeger.model.league.Division import Division
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
@@ -13,7 +14,7 @@ from leeger.model.league.Owner import Owner
 from leeger.model.league.Team import Team
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
-from leeger.validate import leagueValidation
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
 
 
 class ESPNLeagueLoader(LeagueLoader):
@@ -22,6 +23,8 @@ class ESPNLeagueLoader(LeagueLoader):
     https://www.espn.com/fantasy/football/
     """
 
+    _PLATFORM = Platform.ESPN
+
     __ESPN_WIN_OUTCOME: str = "W"
     __ESPN_LOSS_OUTCOME: str = "L"
     __ESPN_BYE_OUTCOME: str = "U"
@@ -63,39 +66,33 @@ class ESPNLeagueLoader(LeagueLoader):
             dict()
         )  # holds the division info for ONLY the current year
 
-    def __getAllLeagues(self) -> list[ESPNLeague]:
-        espnLeagueYears = list()
-        for year in self._years:
-            espnLeagueYears.append(
-                espn.League(
+    def _iterRequests(self) -> RequestBatches[list[ESPNLeague]]:
+        # each ESPN League makes all of its requests when it is created, so each Year is a single request
+        espnLeagueYears = yield [
+            PlatformRequest(
+                function=espn.League,
+                kwargs=dict(
                     league_id=int(self._leagueId),
                     year=year,
                     espn_s2=self.__espnS2,
                     swid=self.__swid,
-                )
+                ),
             )
+            for year in self._years
+        ]
         self._validateRetrievedLeagues(espnLeagueYears)
         return espnLeagueYears
 
     def getOwnerNames(self) -> dict[int, list[str]]:
         yearToOwnerNamesMap: dict[int, list[str]] = dict()
-        espnLeagueYears = self.__getAllLeagues()
+        espnLeagueYears = self._sendRequests(self._iterRequests())
         for espnLeagueYear in espnLeagueYears:
             yearToOwnerNamesMap[espnLeagueYear.year] = list()
             for espnTeam in espnLeagueYear.teams:
                 yearToOwnerNamesMap[espnLeagueYear.year].append(espnTeam.owner)
         return yearToOwnerNamesMap
 
-    def loadLeague(self, validate: bool = True) -> League:
-        espnLeagueYears = self.__getAllLeagues()
-        league = self.__buildLeague(espnLeagueYears)
-        if validate:
-            # validate new league
-            leagueValidation.runAllChecks(league)
-        self._warnForUnusedOwnerNames(league)
-        return league
-
-    def __buildLeague(self, espnLeagues: list[ESPNLeague]) -> League:
+    def _buildLeague(self, espnLeagues: list[ESPNLeague]) -> League:
         years = list()
         for espnLeague in espnLeagues:
             # save league name for each year
@@ -6,7 +6,8 @@ from fleaflicker.enum.Sport import Sport
 from sleeper.enum import Sport
 
 from leeger.enum.MatchupType import MatchupType
-from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.enum.Platform import Platform
+from leeger.league_loader.LeagueLoader import LeagueLoader, RequestBatches
 from leeger.model.league.Division import Division
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
@@ -14,7 +15,7 @@ from leeger.model.league.Owner import Owner
 from leeger.model.league.Team import Team
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
-from leeger.validate import leagueValidation
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
 
 
 class FleaflickerLeagueLoader(LeagueLoader):
@@ -23,6 +24,8 @@ class FleaflickerLeagueLoader(LeagueLoader):
     https://www.fleaflicker.com/
     """
 
+    _PLATFORM = Platform.FLEAFLICKER
+
     def __init__(
         self,
         leagueId: str,
@@ -49,21 +52,63 @@ class FleaflickerLeagueLoader(LeagueLoader):
             dict()
         )  # holds the division info for ONLY the current year
 
-    def __getAllLeagues(self) -> list[dict]:
+    def __iterLeagueRequests(self) -> RequestBatches[list[dict]]:
         # return a list of all leagues
-        fleaflickerLeagues = list()
-        for year in self._years:
-            fleaflickerLeagues.append(
-                LeagueInfoAPIClient.get_league_standings(
+        fleaflickerLeagues = yield [
+            PlatformRequest(
+                function=LeagueInfoAPIClient.get_league_standings,
+                kwargs=dict(
                     sport=Sport.NFL, league_id=int(self._leagueId), season=year
-                )
+                ),
             )
+            for year in self._years
+        ]
         self._validateRetrievedLeagues(fleaflickerLeagues)
         return fleaflickerLeagues
 
+    def _iterRequests(self) -> RequestBatches[list[tuple[dict, list[dict]]]]:
+        fleaflickerLeagues = yield from self.__iterLeagueRequests()
+        # scoreboards for each Year can be requested at the same time as other Years
+        fleaflickerScoreboards = yield [
+            self.__iterScoreboardRequests(fleaflickerLeague)
+            for fleaflickerLeague in fleaflickerLeagues
+        ]
+        return list(zip(fleaflickerLeagues, fleaflickerScoreboards))
+
+    def __iterScoreboardRequests(
+        self, fleaflickerLeague: dict
+    ) -> RequestBatches[list[dict]]:
+        """
+        Returns the scoreboard for each scoring period in the given league.
+        """
+        scoreboardKwargs = dict(
+            sport=Sport.NFL,
+            league_id=fleaflickerLeague["league"]["id"],
+            season=fleaflickerLeague["season"],
+        )
+        # get all weeks
+        (fleaflicker_league_scoreboard,) = yield [
+            PlatformRequest(
+                function=ScoringAPIClient.get_league_scoreboard,
+                kwargs=scoreboardKwargs,
+            )
+        ]
+        number_of_scoring_periods = (
+            len(fleaflicker_league_scoreboard["eligibleSchedulePeriods"]) + 1
+        )
+        # get all games for each week
+        fleaflickerScoreboards = yield [
+            PlatformRequest(
+                function=ScoringAPIClient.get_league_scoreboard,
+                kwargs=scoreboardKwargs | dict(scoring_period=scoring_period),
+            )
+            for scoring_period in range(1, number_of_scoring_periods)
+        ]
+        return fleaflickerScoreboards
+
     def getOwnerNames(self) -> dict[int, list[str]]:
         yearToOwnerNamesMap: dict[int, list[str]] = dict()
-        fleaflickerLeagues = self.__getAllLeagues()
+        fleaflickerLeagues = self._sendRequests(self.__iterLeagueRequests())
         for fleaflickerLeague in fleaflickerLeagues:
             yearToOwnerNamesMap[int(fleaflickerLeague["season"])] = list()
             for division in fleaflickerLeague["divisions"]:
@@ -72,37 +117,40 @@ class FleaflickerLeagueLoader(LeagueLoader):
                     yearToOwnerNamesMap[self._years[0]].append(ownerName)
         return yearToOwnerNamesMap
 
-    def loadLeague(self, validate: bool = True) -> League:
-        fleaflickerLeagues = self.__getAllLeagues()
-        league = self.__buildLeague(fleaflickerLeagues)
-        if validate:
-            # validate new league
-            leagueValidation.runAllChecks(league)
-        self._warnForUnusedOwnerNames(league)
-        return league
-
-    def __buildLeague(self, fleaflickerLeagues: list[dict]) -> League:
+    def _buildLeague(
+        self, fleaflickerLeaguesAndScoreboards: list[tuple[dict, list[dict]]]
+    ) -> League:
         years = list()
-        self.__loadOwners(fleaflickerLeagues)
+        self.__loadOwners(
+            [
+                fleaflickerLeague
+                for fleaflickerLeague, _ in fleaflickerLeaguesAndScoreboards
+            ]
+        )
         owners = list(self.__fleaflickerTeamIdToOwnerMap.values())
-        for fleaflickerLeague in fleaflickerLeagues:
+        for (
+            fleaflickerLeague,
+            fleaflickerScoreboards,
+        ) in fleaflickerLeaguesAndScoreboards:
             # save league name for each year
             self._leagueNameByYear[fleaflickerLeague["season"]] = fleaflickerLeague[
                 "league"
             ]["name"]
-            years.append(self.__buildYear(fleaflickerLeague))
+            years.append(self.__buildYear(fleaflickerLeague, fleaflickerScoreboards))
         return League(
             name=self._getLeagueName(), owners=owners, years=self._getValidYears(years)
         )
 
-    def __buildYear(self, fleaflickerLeague: dict) -> Year:
+    def __buildYear(
+        self, fleaflickerLeague: dict, fleaflickerScoreboards: list[dict]
+    ) -> Year:
         # save division info
         for fleaflickerDivision in fleaflickerLeague["divisions"]:
             self.__fleaflickerDivisionIdToDivisionMap[fleaflickerDivision["id"]] = (
                 Division(name=fleaflickerDivision["name"])
             )
         teams = self.__buildTeams(fleaflickerLeague)
-        weeks = self.__buildWeeks(fleaflickerLeague)
+        weeks = self.__buildWeeks(fleaflickerScoreboards)
         year = Year(
             yearNumber=int(fleaflickerLeague["season"]),
             teams=teams,
@@ -113,26 +161,12 @@ class FleaflickerLeagueLoader(LeagueLoader):
         self.__fleaflickerDivisionIdToDivisionMap = dict()
         return year
 
-    def __buildWeeks(self, fleaflickerLeague: dict) -> list[Week]:
+    def __buildWeeks(self, fleaflickerScoreboards: list[dict]) -> list[Week]:
         weeks = list()
-        # get all weeks
-        fleaflicker_league_scoreboard = ScoringAPIClient.get_league_scoreboard(
-            sport=Sport.NFL,
-            league_id=fleaflickerLeague["league"]["id"],
-            season=fleaflickerLeague["season"],
-        )
-        number_of_scoring_periods = (
-            len(fleaflicker_league_scoreboard["eligibleSchedulePeriods"]) + 1
-        )
-        for scoring_period in range(1, number_of_scoring_periods):
+        for scoring_period, current_scoreboard in enumerate(
+            fleaflickerScoreboards, start=1
+        ):
             matchups = list()
-            # get all games for this week
-            current_scoreboard = ScoringAPIClient.get_league_scoreboard(
-                sport=Sport.NFL,
-                league_id=fleaflickerLeague["league"]["id"],
-                season=fleaflickerLeague["season"],
-                scoring_period=scoring_period,
-            )
             for game in current_scoreboard.get("games", list()):
                 # team A
                 teamAFleaflicker: dict = game["away"]
@@ -1,20 +1,42 @@
+import asyncio
 from abc import abstractmethod
-from typing import Optional
+from typing import Any, Generator, Optional, TypeVar
 
+from leeger.enum.Platform import Platform
 from leeger.exception.DoesNotExistException import DoesNotExistException
 from leeger.exception.LeagueLoaderException import LeagueLoaderException
+from leeger.league_loader.AsyncLeagueLoader import AsyncLeagueLoader
+from leeger.league_loader.AsyncRequestPool import AsyncRequestPool
+from leeger.league_loader.RequestScheduler import RequestScheduler
 from leeger.model.league.League import League
 from leeger.model.league.Owner import Owner
 from leeger.model.league.Year import Year
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
 from leeger.util.CustomLogger import CustomLogger
+from leeger.validate import leagueValidation
 
+T = TypeVar("T")
+# yields batches of requests that don't depend on each other, is sent the responses to each batch in the same order and returns what it was built to get.
+# a batch can also hold other RequestBatches generators, the response for those is what they return.
+RequestBatches = Generator[list[PlatformRequest | Generator], list[Any], T]
 
-class LeagueLoader:
+
+class LeagueLoader(AsyncLeagueLoader):
     """
     League Loader classes should inherit this.
     The point of a league loader is to load a League object from different Fantasy Football sources.
+
+    Loading is split in 2 steps, so the same League Loader can be used with or without asyncio:
+        - _iterRequests() yields every request to the platform, in batches of requests that can be sent at the same time.
+        - _buildLeague() builds the League from the responses, without sending any requests.
+
+    Every request is sent through requestScheduler, which is shared by all League Loaders.
     """
 
+    # the platform this League Loader loads from, used to pick the rate limit for its requests
+    _PLATFORM: Optional[Platform] = None
+    requestScheduler: RequestScheduler = RequestScheduler()
+
     def __init__(
         self,
         leagueId: str,
@@ -23,7 +45,7 @@ class LeagueLoader:
         ownerNamesAndAliases: Optional[dict] = None,
         leagueName: Optional[str] = None,
     ):
-        self._LOGGER = CustomLogger().getLogger()
+        self._LOGGER = CustomLogger.getLogger(type(self).__module__)
         # validation
         if len(years) == 0:
             raise ValueError(f"No years given to load league with ID '{leagueId}'.")
@@ -68,7 +90,7 @@ class LeagueLoader:
                 validYears.append(year)
             else:
                 self._LOGGER.warning(
-                    f"Year '{year.yearNumber}' discarded for not having any weeks."
+                    "Year '%s' discarded for not having any weeks.", year.yearNumber
                 )
         return validYears
 
@@ -113,11 +135,108 @@ class LeagueLoader:
                     unusedOwnerNames.append(ownerName)
             if unusedOwnerNames:
                 self._LOGGER.warning(
-                    f"Some owner names were given but not assigned to the loaded League: {unusedOwnerNames}"
+                    "Some owner names were given but not assigned to the loaded League: %s",
+                    unusedOwnerNames,
+                )
+
+    def loadLeague(self, validate: bool = True) -> League:
+        """
+        Loads the League, sending requests to the platform one at a time.
+        """
+        return self.__finishLeague(
+            self._sendRequests(self._iterRequests()), validate=validate
+        )
+
+    async def loadLeagueAsync(
+        self,
+        validate: bool = True,
+        *,
+        requestPool: Optional[AsyncRequestPool] = None,
+    ) -> League:
+        """
+        Loads the League, sending requests that don't depend on each other concurrently.
+        Requests are sent on the threads of the given AsyncRequestPool, or a new pool for this League if none is given.
+        """
+        if requestPool is None:
+            with AsyncRequestPool() as ownRequestPool:
+                platformData = await self._sendRequestsAsync(
+                    self._iterRequests(), ownRequestPool
+                )
+        else:
+            platformData = await self._sendRequestsAsync(
+                self._iterRequests(), requestPool
+            )
+        return self.__finishLeague(platformData, validate=validate)
+
+    def __finishLeague(self, platformData: Any, *, validate: bool) -> League:
+        league = self._buildLeague(platformData)
+        if validate:
+            # validate new league
+            leagueValidation.runAllChecks(league)
+        self._warnForUnusedOwnerNames(league)
+        return league
+
+    @classmethod
+    def _sendRequests(cls, requestBatches: RequestBatches[T]) -> T:
+        """
+        Sends every request yielded by the given generator one at a time, in the order they are yielded.
+        Generators in a batch are run to the end before the next item in the batch.
+        """
+        try:
+            batch = next(requestBatches)
+            while True:
+                batch = requestBatches.send([cls.__send(item) for item in batch])
+        except StopIteration as e:
+            return e.value
+
+    @classmethod
+    def __send(cls, item: PlatformRequest | Generator) -> Any:
+        if isinstance(item, PlatformRequest):
+            return cls.requestScheduler.send(item, cls._PLATFORM)
+        return cls._sendRequests(item)
+
+    @classmethod
+    async def _sendRequestsAsync(
+        cls, requestBatches: RequestBatches[T], requestPool: AsyncRequestPool
+    ) -> T:
+        """
+        Sends the requests in each batch yielded by the given generator concurrently with the given AsyncRequestPool.
+        Generators in a batch are run concurrently with the rest of the batch.
+        """
+        try:
+            batch = next(requestBatches)
+            while True:
+                responses = await asyncio.gather(
+                    *(cls.__sendAsync(item, requestPool) for item in batch)
                 )
+                batch = requestBatches.send(list(responses))
+        except StopIteration as e:
+            return e.value
+
+    @classmethod
+    async def __sendAsync(
+        cls, item: PlatformRequest | Generator, requestPool: AsyncRequestPool
+    ) -> Any:
+        if isinstance(item, PlatformRequest):
+            return await cls.requestScheduler.sendAsync(
+                item, requestPool, cls._PLATFORM
+            )
+        return await cls._sendRequestsAsync(item, requestPool)
+
+    @abstractmethod
+    def _iterRequests(self) -> RequestBatches[Any]:
+        """
+        Yields batches of requests for everything needed to build the League and returns the responses in whatever form _buildLeague() takes.
+        Must not change the state of the League Loader, so it can be run for many loads at the same time.
+        """
+        ...
 
     @abstractmethod
-    def loadLeague(self, validate: bool = True, *args, **kwargs) -> League: ...
+    def _buildLeague(self, platformData: Any) -> League:
+        """
+        Builds the League from what _iterRequests() returned, without sending any requests.
+        """
+        ...
 
     @abstractmethod
     def getOwnerNames(self, *args, **kwargs) -> dict[int, list[str]]: ...
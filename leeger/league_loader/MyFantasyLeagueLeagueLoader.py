@@ -1,10 +1,12 @@
+from dataclasses import dataclass
 from typing import Optional
 
 from pymfl.api import CommonLeagueInfoAPIClient
 from pymfl.api.config import APIConfig
 
 from leeger.enum.MatchupType import MatchupType
-from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.enum.Platform import Platform
+from leeger.league_loader.LeagueLoader import LeagueLoader, RequestBatches
 from leeger.model.league.Division import Division
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
@@ -12,7 +14,19 @@ from leeger.model.league.Owner import Owner
 from leeger.model.league.Team import Team
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
-from leeger.validate import leagueValidation
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
+
+
+@dataclass(kw_only=True, frozen=True)
+class _MyFantasyLeagueYearData:
+    """
+    Everything requested from MyFantasyLeague to build a single Year.
+    """
+
+    yearNumber: int
+    mflLeague: dict
+    schedule: dict
+    playoffBracket: dict
 
 
 class MyFantasyLeagueLeagueLoader(LeagueLoader):
@@ -21,6 +35,8 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
     http://home.myfantasyleague.com/
     """
 
+    _PLATFORM = Platform.MY_FANTASY_LEAGUE
+
     def __init__(
         self,
         leagueId: str,
@@ -43,17 +59,15 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
         self.__mflPassword = mflPassword
         self.__mflUserAgentName = mflUserAgentName
 
-        self.__mflLeagueIdToYearMap: dict[str, int] = dict()
         self.__mflFranchiseIdToOwnerMap: dict[str, Owner] = dict()
         self.__mflFranchiseIdToTeamMap: dict[int, Team] = dict()
         self.__mflDivisionIdToDivisionMap: dict[str, Division] = (
             dict()
         )  # holds the division info for ONLY the current year
 
-    def __getAllLeagues(self) -> list[dict]:
-        mflLeagues: list[dict] = list()
-
+    def __iterLeagueRequests(self) -> RequestBatches[list[dict]]:
         for year in self._years:
+            # this only saves the login for each year locally, no request is sent
             APIConfig.add_config_for_year_and_league_id(
                 year=year,
                 league_id=self._leagueId,
@@ -62,60 +76,82 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
                 user_agent_name=self.__mflUserAgentName,
             )
 
-            mflLeague = CommonLeagueInfoAPIClient.get_league(
-                year=year, league_id=self._leagueId
-            )["league"]
-            self.__mflLeagueIdToYearMap[mflLeague["id"]] = year
-            mflLeagues.append(mflLeague)
+        mflLeagueResponses = yield [
+            PlatformRequest(
+                function=CommonLeagueInfoAPIClient.get_league,
+                kwargs=dict(year=year, league_id=self._leagueId),
+            )
+            for year in self._years
+        ]
+        mflLeagues: list[dict] = [
+            mflLeagueResponse["league"] for mflLeagueResponse in mflLeagueResponses
+        ]
         self._validateRetrievedLeagues(mflLeagues)
         return mflLeagues
 
     def getOwnerNames(self) -> dict[int, list[str]]:
         yearToOwnerNamesMap: dict[int, list[str]] = dict()
-        mflLeagues = self.__getAllLeagues()
-        for mflLeague in mflLeagues:
-            yearNumber = self.__mflLeagueIdToYearMap[mflLeague["id"]]
+        mflLeagues = self._sendRequests(self.__iterLeagueRequests())
+        for yearNumber, mflLeague in zip(self._years, mflLeagues):
             yearToOwnerNamesMap[yearNumber] = list()
             for franchise in mflLeague["franchises"]["franchise"]:
                 ownerName = franchise["owner_name"]
                 yearToOwnerNamesMap[yearNumber].append(ownerName)
         return yearToOwnerNamesMap
 
-    def loadLeague(self, validate: bool = True) -> League:
-        mflLeagues = self.__getAllLeagues()
-        league = self.__buildLeague(mflLeagues)
-        if validate:
-            # validate new league
-            leagueValidation.runAllChecks(league)
-        self._warnForUnusedOwnerNames(league)
-        return league
+    def _iterRequests(self) -> RequestBatches[list[_MyFantasyLeagueYearData]]:
+        mflLeagues = yield from self.__iterLeagueRequests()
+        responses = yield [
+            PlatformRequest(
+                function=CommonLeagueInfoAPIClient.get_schedule,
+                kwargs=dict(year=yearNumber, league_id=mflLeague["id"]),
+            )
+            for yearNumber, mflLeague in zip(self._years, mflLeagues)
+        ] + [
+            PlatformRequest(
+                function=CommonLeagueInfoAPIClient.get_playoff_bracket,
+                kwargs=dict(year=yearNumber, league_id=mflLeague["id"], bracket_id="1"),
+            )
+            for yearNumber, mflLeague in zip(self._years, mflLeagues)
+        ]
+        scheduleResponses = responses[: len(mflLeagues)]
+        playoffBracketResponses = responses[len(mflLeagues) :]
+        return [
+            _MyFantasyLeagueYearData(
+                yearNumber=yearNumber,
+                mflLeague=mflLeague,
+                schedule=scheduleResponse["schedule"],
+                playoffBracket=playoffBracketResponse["playoffBracket"],
+            )
+            for yearNumber, mflLeague, scheduleResponse, playoffBracketResponse in zip(
+                self._years, mflLeagues, scheduleResponses, playoffBracketResponses
+            )
+        ]
 
-    def __buildLeague(self, mflLeagues: list[dict]) -> League:
+    def _buildLeague(self, mflYearData: list[_MyFantasyLeagueYearData]) -> League:
         years = list()
-        self.__loadOwners(mflLeagues)
+        self.__loadOwners([yearData.mflLeague for yearData in mflYearData])
         owners = list(self.__mflFranchiseIdToOwnerMap.values())
-        for mflLeague in mflLeagues:
+        for yearData in mflYearData:
             # save league name for each year
-            self._leagueNameByYear[self.__mflLeagueIdToYearMap[mflLeague["id"]]] = (
-                mflLeague["name"]
-            )
-            years.append(self.__buildYear(mflLeague))
+            self._leagueNameByYear[yearData.yearNumber] = yearData.mflLeague["name"]
+            years.append(self.__buildYear(yearData))
         return League(
             name=self._getLeagueName(), owners=owners, years=self._getValidYears(years)
         )
 
-    def __buildYear(self, mflLeague: dict) -> Year:
+    def __buildYear(self, yearData: _MyFantasyLeagueYearData) -> Year:
+        mflLeague = yearData.mflLeague
         # save division info
         for division in mflLeague["divisions"]["division"]:
             self.__mflDivisionIdToDivisionMap[division["id"]] = Division(
                 name=division["name"]
             )
-        yearNumber = self.__mflLeagueIdToYearMap[mflLeague["id"]]
         teams = self.__buildTeams(mflLeague)
-        weeks = self.__buildWeeks(mflLeague)
+        weeks = self.__buildWeeks(yearData)
         # TODO: see if there are cases where MFL leagues do NOT have divisions
         year = Year(
-            yearNumber=yearNumber,
+            yearNumber=yearData.yearNumber,
             teams=teams,
             weeks=weeks,
             divisions=list(self.__mflDivisionIdToDivisionMap.values()),
@@ -124,16 +160,11 @@ class MyFantasyLeagueLeagueLoader(LeagueLoader):
         self.__mflDivisionIdToDivisionMap = dict()
         return year
 
-    def __buildWeeks(self, mflLeague: dict) -> list[Week]:
-        yearNumber = self.__mflLeagueIdToYearMap[mflLeague["id"]]
+    def __buildWeeks(self, yearData: _MyFantasyLeagueYearData) -> list[Week]:
+        mflLeague = yearData.mflLeague
         weeks = list()
-        schedule: dict = CommonLeagueInfoAPIClient.get_schedule(
-            year=yearNumber, league_id=mflLeague["id"]
-        )["schedule"]
-        # get playoff brackets
-        playoffBracket: dict = CommonLeagueInfoAPIClient.get_playoff_bracket(
-            year=yearNumber, league_id=mflLeague["id"], bracket_id="1"
-        )["playoffBracket"]
+        schedule = yearData.schedule
+        playoffBracket = yearData.playoffBracket
 
         # we will assume that the "true" playoff bracket (i.e. the bracket where the winner of it is the league champion)
         # will always be the playoff bracket with id "1".
@@ -0,0 +1,253 @@
+import copyreg
+import io
+import json
+import os
+import pickle
+import threading
+import time
+import types
+from enum import Enum
+from typing import Any, Optional
+
+from leeger.enum.FixtureMode import FixtureMode
+from leeger.enum.Platform import Platform
+from leeger.exception.LeagueLoaderException import LeagueLoaderException
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
+
+"""
+Request Fixtures
+
+    - Records the response to every platform request a League Loader sends into a fixture directory, or replays them from it without sending anything.
+    - Replayed requests can wait a given number of seconds (in the AsyncRequestPool when loading asynchronously), to benchmark and test loading without the live APIs.
+    - Each request is found by its platform, SDK function and arguments.
+      Objects from an earlier response (e.g. Yahoo's League a request is sent with) are known by their ID, so requests for different Leagues don't get each other's responses.
+      Objects without an ID are only known by their type, so those requests are replayed in the order they were recorded.
+    - Each replay returns a new copy of the response, so a League Loader changing a response doesn't change what is replayed next.
+    - Credentials are never saved: credential arguments are hidden in the keys, and credential attributes of responses
+      (e.g. the tokens in Yahoo's Context, which every Yahoo League keeps, and ESPN's cookies) are saved as None.
+      Replayed responses can't be used to send requests, which replaying never does.
+
+Fixture directory:
+    index.jsonl     # one line for each recorded response: {"key": "SLEEPER sleeper.api.LeagueAPIClient.get_league(league_id='123')", "file": "00000.pickle"}
+    00000.pickle    # the response, as the platform SDK returned it
+    ...
+
+"""
+
+
+# the attributes platform SDK objects keep their ID in, checked in this order
+__ID_ATTRIBUTE_NAMES = ("league_key", "league_id", "id")
+# the names of arguments and attributes that hold credentials, these are never saved in fixtures
+__CREDENTIAL_NAMES = frozenset(
+    {
+        "_access_token",
+        "_client_secret",
+        "_refresh_token",
+        "cookies",
+        "espn_s2",
+        "swid",
+    }
+)
+
+
+def _isCredential(name: str) -> bool:
+    return name in __CREDENTIAL_NAMES
+
+
+class _FixturePickler(pickle.Pickler):
+    """
+    Pickles responses, leaving out the credentials kept in any object in them.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        state = getattr(obj, "__dict__", None)
+        if (
+            isinstance(obj, type)
+            or not isinstance(state, dict)
+            or not any(_isCredential(name) for name in state)
+        ):
+            return NotImplemented
+        # rebuild it the same way pickle rebuilds any other object, without the credentials
+        return (
+            copyreg.__newobj__,
+            (type(obj),),
+            {
+                name: None if _isCredential(name) else value
+                for name, value in state.items()
+            },
+        )
+
+
+def _describeArgument(value: Any) -> str:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return repr(value)
+    if isinstance(value, Enum):
+        return f"{type(value).__name__}.{value.name}"
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(_describeArgument(item) for item in value)}]"
+    # the repr of other objects changes from run to run, their ID doesn't
+    for attributeName in __ID_ATTRIBUTE_NAMES:
+        objectId = getattr(value, attributeName, None)
+        if isinstance(objectId, (str, int)) and not isinstance(objectId, bool):
+            return f"<{type(value).__name__} {attributeName}={objectId!r}>"
+    return f"<{type(value).__name__}>"
+
+
+def getFixtureKey(request: PlatformRequest, platform: Optional[Platform] = None) -> str:
+    """
+    Returns the key the response to the given request is saved under.
+
+    Example response:
+        "SLEEPER sleeper.api.LeagueAPIClient.get_league(league_id='123')"
+        "YAHOO yahoofantasy.resources.league.League.teams(self=<League id='423.l.12345'>)"
+    """
+    function = request.function
+    functionName = getattr(function, "__qualname__", None)
+    if functionName is None:
+        functionName = repr(function)
+    else:
+        functionName = f"{function.__module__}.{functionName}"
+    argumentDescriptions = [
+        f"{name}=<hidden>"
+        if _isCredential(name) and value is not None
+        else f"{name}={_describeArgument(value)}"
+        for name, value in sorted(request.kwargs.items())
+    ]
+    # methods of objects from an earlier response (e.g. Yahoo's League.teams) are sent for that object
+    functionOwner = getattr(function, "__self__", None)
+    if functionOwner is not None and not isinstance(
+        functionOwner, (type, types.ModuleType)
+    ):
+        argumentDescriptions.insert(0, f"self={_describeArgument(functionOwner)}")
+    arguments = ", ".join(argumentDescriptions)
+    platformName = "NONE" if platform is None else platform.name
+    return f"{platformName} {functionName}({arguments})"
+
+
+class RequestFixtures:
+    """
+    Records or replays the responses to platform requests, used by giving them to the RequestScheduler.
+    Responses are saved with pickle, so only replay fixtures from a source you trust.
+    Credentials are left out of what is saved (see the module docstring), so fixtures of private Leagues can be shared.
+
+    Example:
+        # record while loading from the live API
+        LeagueLoader.requestScheduler = RequestScheduler(
+            fixtures=RequestFixtures("fixtures/myLeague", FixtureMode.RECORD)
+        )
+        SleeperLeagueLoader("12345678", [2022, 2023]).loadLeague()
+
+        # replay offline, without rate limits and with 50ms per request
+        LeagueLoader.requestScheduler = RequestScheduler(
+            dict(),
+            fixtures=RequestFixtures("fixtures/myLeague", FixtureMode.REPLAY, latencySeconds=0.05),
+        )
+        SleeperLeagueLoader("12345678", [2022, 2023]).loadLeague()
+    """
+
+    INDEX_FILE_NAME = "index.jsonl"
+
+    def __init__(
+        self, directoryPath: str, mode: FixtureMode, *, latencySeconds: float = 0.0
+    ):
+        """
+        directoryPath: The fixture directory. When recording it must not have fixtures in it already.
+        mode: Whether to record responses or replay them.
+        latencySeconds: How long each replayed request takes.
+        """
+        if latencySeconds < 0:
+            raise ValueError("'latencySeconds' must be at least 0.")
+        self.__directoryPath = directoryPath
+        self.__mode = mode
+        self.__latencySeconds = latencySeconds
+        self.__indexPath = os.path.join(directoryPath, self.INDEX_FILE_NAME)
+        self.__lock = threading.Lock()
+        # key -> the pickled responses recorded for it, in the order they were recorded
+        self.__responses: dict[str, list[bytes]] = dict()
+        # key -> how many times it has been replayed
+        self.__replayCounts: dict[str, int] = dict()
+        self.__numberOfRecordedResponses = 0
+        if mode == FixtureMode.RECORD:
+            if os.path.exists(self.__indexPath):
+                raise FileExistsError(
+                    f"Fixtures were already recorded in '{directoryPath}'."
+                )
+            os.makedirs(directoryPath, exist_ok=True)
+        else:
+            self.__loadResponses()
+
+    @property
+    def mode(self) -> FixtureMode:
+        return self.__mode
+
+    @property
+    def numberOfRecordedResponses(self) -> int:
+        """
+        The number of responses recorded, or loaded to be replayed.
+        """
+        return self.__numberOfRecordedResponses
+
+    def getRequest(
+        self, request: PlatformRequest, platform: Optional[Platform] = None
+    ) -> PlatformRequest:
+        """
+        Returns the request to send in place of the given one.
+        When recording it sends the given request and saves the response, when replaying it returns the saved response.
+        """
+        key = getFixtureKey(request, platform)
+        if self.__mode == FixtureMode.RECORD:
+            return PlatformRequest(
+                function=self.__record, kwargs=dict(request=request, key=key)
+            )
+        with self.__lock:
+            responses = self.__responses.get(key)
+            if responses is None:
+                raise LeagueLoaderException(
+                    f"No fixture recorded in '{self.__directoryPath}' for request: {key}"
+                )
+            replayCount = self.__replayCounts.get(key, 0)
+            self.__replayCounts[key] = replayCount + 1
+        # loading the same League again starts over from the first response
+        return PlatformRequest(
+            function=self.__replay,
+            kwargs=dict(data=responses[replayCount % len(responses)]),
+        )
+
+    def __record(self, request: PlatformRequest, key: str) -> Any:
+        response = request.send()
+        buffer = io.BytesIO()
+        try:
+            _FixturePickler(buffer).dump(response)
+            data = buffer.getvalue()
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise LeagueLoaderException(
+                f"Response can't be saved as a fixture for request: {key}"
+            ) from e
+        with self.__lock:
+            fileName = f"{self.__numberOfRecordedResponses:05d}.pickle"
+            self.__numberOfRecordedResponses += 1
+            with open(os.path.join(self.__directoryPath, fileName), "wb") as file:
+                file.write(data)
+            # the index is written as we go, so a load that fails partway still leaves usable fixtures
+            with open(self.__indexPath, "a", encoding="utf-8") as indexFile:
+                indexFile.write(json.dumps({"key": key, "file": fileName}) + "\n")
+        return response
+
+    def __replay(self, data: bytes) -> Any:
+        if self.__latencySeconds > 0:
+            time.sleep(self.__latencySeconds)
+        return pickle.loads(data)
+
+    def __loadResponses(self) -> None:
+        with open(self.__indexPath, encoding="utf-8") as indexFile:
+            for line in indexFile:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                with open(
+                    os.path.join(self.__directoryPath, entry["file"]), "rb"
+                ) as file:
+                    self.__responses.setdefault(entry["key"], list()).append(
+                        file.read()
+                    )
+                self.__numberOfRecordedResponses += 1
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import random
+import re
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Optional
+
+from leeger.enum.Platform import Platform
+from leeger.league_loader.AsyncRequestPool import AsyncRequestPool
+from leeger.league_loader.RequestFixtures import RequestFixtures
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
+from leeger.model.league_loader.RateLimit import RateLimit
+from leeger.model.league_loader.RequestMetrics import RequestMetrics
+from leeger.model.league_loader.RetryPolicy import RetryPolicy
+from leeger.util.CustomLogger import CustomLogger
+
+"""
+Request Scheduler
+
+    - Every request a League Loader sends to a platform goes through a RequestScheduler.
+    - Requests to each platform are limited with a token bucket, so bulk loads don't get throttled.
+    - Requests that fail with a transient error are retried with exponential backoff and jitter, instead of failing the whole load.
+    - A request that is the same as one already in flight (e.g. Sleeper's sport state from many loaders at once) waits for that request instead of being sent again.
+    - Responses can be recorded to or replayed from a fixture directory with RequestFixtures, to load Leagues offline.
+
+"""
+
+# HTTP statuses that usually mean "try again later"
+__TRANSIENT_HTTP_STATUSES = frozenset((408, 425, 429, 500, 502, 503, 504))
+# names of the connection and timeout errors from requests, which every platform SDK uses
+__TRANSIENT_ERROR_NAMES = frozenset(("ConnectionError", "Timeout"))
+
+
+def _getHttpStatus(e: Exception) -> Optional[int]:
+    statusCode = getattr(getattr(e, "response", None), "status_code", None)
+    if isinstance(statusCode, int):
+        return statusCode
+    # some SDKs only give the status in the message (e.g. espn_api's "ESPN returned an HTTP 429")
+    match = re.search(r"\bHTTP (\d{3})\b", str(e))
+    return int(match.group(1)) if match else None
+
+
+def _getRetryAfterSeconds(e: Exception) -> Optional[float]:
+    headers = getattr(getattr(e, "response", None), "headers", None)
+    try:
+        return float(headers.get("Retry-After"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def isTransientError(e: Exception) -> bool:
+    """
+    Returns True if the given error from a platform SDK will likely go away if the request is sent again.
+    """
+    if any(
+        errorType.__name__ in __TRANSIENT_ERROR_NAMES for errorType in type(e).__mro__
+    ):
+        return True
+    return _getHttpStatus(e) in __TRANSIENT_HTTP_STATUSES
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket.
+    Requests reserve a token when they are scheduled, so requests waiting at the same time are spread out instead of all being sent when a token is free.
+    """
+
+    def __init__(self, rateLimit: RateLimit):
+        self.__rate = rateLimit.requestsPerSecond
+        self.__capacity = float(rateLimit.burst)
+        self.__tokens = self.__capacity
+        self.__updatedAt = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns how many seconds to wait before sending the request it is for.
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(
+                self.__capacity, self.__tokens + (now - self.__updatedAt) * self.__rate
+            )
+            self.__updatedAt = now
+            self.__tokens -= 1
+            return max(0.0, -self.__tokens / self.__rate)
+
+
+class RequestScheduler:
+    """
+    Sends platform requests with rate limits, retries and coalescing of identical in-flight requests.
+    One RequestScheduler is shared by every League Loader (LeagueLoader.requestScheduler), so it can be used from many threads and event loops at once.
+
+    Example:
+        LeagueLoader.requestScheduler = RequestScheduler(
+            {Platform.SLEEPER: RateLimit(requestsPerSecond=5, burst=10)},
+            retryPolicy=RetryPolicy(maxRetries=5),
+        )
+        ...
+        metrics = LeagueLoader.requestScheduler.getMetrics(Platform.SLEEPER)
+    """
+
+    __LOGGER = CustomLogger.getLogger(__name__)
+    # bursts are big enough to load a single League without waiting, bulk loads are held to the rate after that
+    DEFAULT_RATE_LIMITS = {
+        Platform.ESPN: RateLimit(requestsPerSecond=10, burst=100),
+        Platform.FLEAFLICKER: RateLimit(requestsPerSecond=10, burst=100),
+        Platform.MY_FANTASY_LEAGUE: RateLimit(requestsPerSecond=5, burst=50),
+        # Sleeper asks to stay under 1000 requests per minute
+        Platform.SLEEPER: RateLimit(requestsPerSecond=16, burst=200),
+        Platform.YAHOO: RateLimit(requestsPerSecond=5, burst=50),
+    }
+
+    def __init__(
+        self,
+        rateLimits: Optional[dict[Platform, RateLimit]] = None,
+        *,
+        retryPolicy: Optional[RetryPolicy] = None,
+        retryOn: Callable[[Exception], bool] = isTransientError,
+        coalesceRequests: bool = True,
+        seed: Optional[int] = None,
+        fixtures: Optional[RequestFixtures] = None,
+    ):
+        """
+        rateLimits: The rate limit for each platform, platforms not given are not limited. Defaults to DEFAULT_RATE_LIMITS.
+        retryPolicy: How to retry failed requests. Defaults to RetryPolicy(), use RetryPolicy(maxRetries=0) to never retry.
+        retryOn: Returns True for errors that should be retried.
+        coalesceRequests: Whether a request that is the same as one already in flight should wait for it instead of being sent.
+        seed: Seed for the retry jitter.
+        fixtures: Records every response to a fixture directory, or replays responses from it instead of sending requests.
+        """
+        rateLimits = self.DEFAULT_RATE_LIMITS if rateLimits is None else rateLimits
+        self.__tokenBuckets = {
+            platform: _TokenBucket(rateLimit)
+            for platform, rateLimit in rateLimits.items()
+        }
+        self.__retryPolicy = RetryPolicy() if retryPolicy is None else retryPolicy
+        self.__retryOn = retryOn
+        self.__coalesceRequests = coalesceRequests
+        self.__random = random.Random(seed)
+        self.__fixtures = fixtures
+        self.__metrics: dict[Optional[Platform], RequestMetrics] = dict()
+        self.__metricsLock = threading.Lock()
+        # coalescing key -> the response of the request in flight for it
+        self.__inFlightRequests: dict[Hashable, Future] = dict()
+        self.__inFlightRequestsLock = threading.Lock()
+
+    def send(
+        self, request: PlatformRequest, platform: Optional[Platform] = None
+    ) -> Any:
+        """
+        Sends the given request on this thread and returns the response, waiting for the platform's rate limit and between retries.
+        """
+        key = self.__getCoalescingKey(request, platform)
+        if key is None:
+            return self.__sendWithRetries(request, platform)
+        future, isFirst = self.__getInFlightRequest(key, platform)
+        if not isFirst:
+            return future.result()
+        try:
+            response = self.__sendWithRetries(request, platform)
+        except BaseException as e:
+            self.__completeInFlightRequest(key, future, exception=e)
+            raise
+        self.__completeInFlightRequest(key, future, response=response)
+        return response
+
+    async def sendAsync(
+        self,
+        request: PlatformRequest,
+        requestPool: AsyncRequestPool,
+        platform: Optional[Platform] = None,
+    ) -> Any:
+        """
+        Sends the given request with the given AsyncRequestPool and returns the response.
+        Waiting for the rate limit and between retries doesn't hold a thread or a spot in the pool.
+        """
+        key = self.__getCoalescingKey(request, platform)
+        if key is None:
+            return await self.__sendWithRetriesAsync(request, requestPool, platform)
+        future, isFirst = self.__getInFlightRequest(key, platform)
+        if not isFirst:
+            return await asyncio.wrap_future(future)
+        try:
+            response = await self.__sendWithRetriesAsync(request, requestPool, platform)
+        except BaseException as e:
+            self.__completeInFlightRequest(key, future, exception=e)
+            raise
+        self.__completeInFlightRequest(key, future, response=response)
+        return response
+
+    def getMetrics(self, platform: Optional[Platform] = None) -> RequestMetrics:
+        """
+        Returns the metrics for requests to the given platform, or for every request if no platform is given.
+        """
+        with self.__metricsLock:
+            if platform is None:
+                return sum(self.__metrics.values(), RequestMetrics())
+            return dataclasses.replace(self.__metrics.get(platform, RequestMetrics()))
+
+    def resetMetrics(self) -> None:
+        with self.__metricsLock:
+            self.__metrics.clear()
+
+    def __sendWithRetries(
+        self, request: PlatformRequest, platform: Optional[Platform]
+    ) -> Any:
+        if self.__fixtures is not None:
+            request = self.__fixtures.getRequest(request, platform)
+        retryNumber = 0
+        while True:
+            waitSeconds = self.__reserve(platform)
+            if waitSeconds > 0:
+                time.sleep(waitSeconds)
+            try:
+                return request.send()
+            except Exception as e:
+                retryNumber += 1
+                retryDelaySeconds = self.__getRetryDelaySeconds(
+                    e, retryNumber, request, platform
+                )
+                if retryDelaySeconds is None:
+                    raise
+                time.sleep(retryDelaySeconds)
+
+    async def __sendWithRetriesAsync(
+        self,
+        request: PlatformRequest,
+        requestPool: AsyncRequestPool,
+        platform: Optional[Platform],
+    ) -> Any:
+        if self.__fixtures is not None:
+            request = self.__fixtures.getRequest(request, platform)
+        retryNumber = 0
+        while True:
+            waitSeconds = self.__reserve(platform)
+            if waitSeconds > 0:
+                await asyncio.sleep(waitSeconds)
+            try:
+                return await requestPool.send(request)
+            except Exception as e:
+                retryNumber += 1
+                retryDelaySeconds = self.__getRetryDelaySeconds(
+                    e, retryNumber, request, platform
+                )
+                if retryDelaySeconds is None:
+                    raise
+                await asyncio.sleep(retryDelaySeconds)
+
+    def __reserve(self, platform: Optional[Platform]) -> float:
+        """
+        Reserves a spot for a request to the given platform and returns how long to wait before sending it.
+        """
+        tokenBucket = self.__tokenBuckets.get(platform)
+        waitSeconds = 0.0 if tokenBucket is None else tokenBucket.reserve()
+        self.__addMetrics(platform, requestsSent=1, rateLimitWaitSeconds=waitSeconds)
+        return waitSeconds
+
+    def __getRetryDelaySeconds(
+        self,
+        e: Exception,
+        retryNumber: int,
+        request: PlatformRequest,
+        platform: Optional[Platform],
+    ) -> Optional[float]:
+        """
+        Returns how long to wait before retrying after the given error, or None if the request should not be retried.
+        """
+        if retryNumber > self.__retryPolicy.maxRetries or not self.__retryOn(e):
+            self.__addMetrics(platform, failedRequests=1)
+            return None
+        delaySeconds = self.__retryPolicy.getDelaySeconds(retryNumber, self.__random)
+        retryAfterSeconds = _getRetryAfterSeconds(e)
+        if retryAfterSeconds is not None:
+            # the platform said how long to wait
+            delaySeconds = max(
+                delaySeconds, min(retryAfterSeconds, self.__retryPolicy.maxDelaySeconds)
+            )
+        self.__addMetrics(platform, retries=1, retryWaitSeconds=delaySeconds)
+        self.__LOGGER.warning(
+            "Retry %s of %s for %s in %.2fs after error: %r",
+            retryNumber,
+            self.__retryPolicy.maxRetries,
+            getattr(request.function, "__qualname__", request.function),
+            delaySeconds,
+            e,
+        )
+        return delaySeconds
+
+    def __addMetrics(self, platform: Optional[Platform], **amounts) -> None:
+        with self.__metricsLock:
+            metrics = self.__metrics.setdefault(platform, RequestMetrics())
+            for name, amount in amounts.items():
+                setattr(metrics, name, getattr(metrics, name) + amount)
+
+    def __getCoalescingKey(
+        self, request: PlatformRequest, platform: Optional[Platform]
+    ) -> Optional[Hashable]:
+        if not self.__coalesceRequests:
+            return None
+        key = (platform, request.function, tuple(sorted(request.kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            # requests with arguments that can't be hashed are never coalesced
+            return None
+        return key
+
+    def __getInFlightRequest(
+        self, key: Hashable, platform: Optional[Platform]
+    ) -> tuple[Future, bool]:
+        """
+        Returns the response of the request in flight for the given key, and whether it was just added (so the caller must send the request).
+        """
+        with self.__inFlightRequestsLock:
+            future = self.__inFlightRequests.get(key)
+            if future is None:
+                future = Future()
+                self.__inFlightRequests[key] = future
+                return future, True
+        self.__addMetrics(platform, coalescedRequests=1)
+        return future, False
+
+    def __completeInFlightRequest(
+        self,
+        key: Hashable,
+        future: Future,
+        *,
+        response: Any = None,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Gives the response (or error) to every request waiting for it, later requests with the same key are sent again.
+        """
+        with self.__inFlightRequestsLock:
+            del self.__inFlightRequests[key]
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(response)
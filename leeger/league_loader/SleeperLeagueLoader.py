@@ -1,4 +1,5 @@
 import itertools
+from dataclasses import dataclass
 from typing import Optional
 
 from sleeper.api import LeagueAPIClient
@@ -8,13 +9,15 @@ from sleeper.enum import Sport as SleeperSport
 from sleeper.model import League as SleeperLeague
 from sleeper.model import Matchup as SleeperMatchup
 from sleeper.model import PlayoffMatchup as SleeperPlayoffMatchup
+from sleeper.model import Roster as SleeperRoster
 from sleeper.model import SportState as SleeperSportState
 from sleeper.model import User as SleeperUser
 
 from leeger.enum.MatchupType import MatchupType
+from leeger.enum.Platform import Platform
 from leeger.exception.DoesNotExistException import DoesNotExistException
 from leeger.exception.LeagueLoaderException import LeagueLoaderException
-from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.league_loader.LeagueLoader import LeagueLoader, RequestBatches
 from leeger.model.league import YearSettings
 from leeger.model.league.Division import Division
 from leeger.model.league.League import League
@@ -23,7 +26,21 @@ from leeger.model.league.Owner import Owner
 from leeger.model.league.Team import Team
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
-from leeger.validate import leagueValidation
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
+
+
+@dataclass(kw_only=True, frozen=True)
+class _SleeperYearData:
+    """
+    Everything requested from Sleeper to build a single Year.
+    """
+
+    sleeperLeague: SleeperLeague
+    sleeperUsers: list[SleeperUser]
+    sleeperRosters: list[SleeperRoster]
+    sleeperPlayoffMatchups: list[SleeperPlayoffMatchup]
+    sleeperMatchupsByWeekNumber: dict[int, list[SleeperMatchup]]
+    sleeperSportState: SleeperSportState
 
 
 class SleeperLeagueLoader(LeagueLoader):
@@ -32,6 +49,8 @@ class SleeperLeagueLoader(LeagueLoader):
     https://sleeper.com/
     """
 
+    _PLATFORM = Platform.SLEEPER
+
     __INVALID_SLEEPER_LEAGUE_IDS = [None, "0"]
 
     def __init__(
@@ -51,46 +70,25 @@ class SleeperLeagueLoader(LeagueLoader):
 
         self.__sleeperUserIdToOwnerMap: dict[str, Owner] = dict()
         self.__sleeperRosterIdToTeamMap: dict[int, Team] = dict()
-        self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE = (
-            dict()
-        )  # functions as a cache for Sleeper Users
-        self.__SLEEPER_SPORT_STATE_CACHE: SleeperSportState = (
-            None  # functions as a cache for Sleeper SportState
-        )
         self.__sleeperDivisionIdToDivisionMap: dict[int, Division] = (
             dict()
         )  # holds the division info for ONLY the current year
 
-    def __resetCaches(self) -> None:
-        self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE = dict()
-        self.__SLEEPER_SPORT_STATE_CACHE = None
-
-    def __getSleeperUsers(self, leagueId: str) -> list[SleeperUser]:
-        if leagueId not in self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE:
-            # don't have these users loaded yet
-            sleeperUsers = LeagueAPIClient.get_users_in_league(league_id=leagueId)
-            self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE[leagueId] = sleeperUsers
-            return sleeperUsers
-        # do have these users loaded
-        return self.__SLEEPER_USERS_BY_LEAGUE_ID_CACHE[leagueId]
-
-    def __getSleeperSportState(self):
-        if self.__SLEEPER_SPORT_STATE_CACHE is None:
-            self.__SLEEPER_SPORT_STATE_CACHE = LeagueAPIClient.get_sport_state(
-                sport=SleeperSport.NFL
-            )
-        return self.__SLEEPER_SPORT_STATE_CACHE
-
-    def __getAllLeagues(self) -> list[SleeperLeague]:
+    def __iterLeagueRequests(self) -> RequestBatches[list[SleeperLeague]]:
         sleeperLeagues = list()
         years = self._years.copy()
         currentLeagueId = self._leagueId
         while (
             len(years) > 0 and currentLeagueId not in self.__INVALID_SLEEPER_LEAGUE_IDS
         ):
-            currentLeague: SleeperLeague = LeagueAPIClient.get_league(
-                league_id=currentLeagueId
-            )
+            # the ID of each league comes from the league after it, so these are requested one at a time
+            currentLeague: SleeperLeague
+            (currentLeague,) = yield [
+                PlatformRequest(
+                    function=LeagueAPIClient.get_league,
+                    kwargs=dict(league_id=currentLeagueId),
+                )
+            ]
             if int(currentLeague.season) in years:
                 # we only want to add valid seasons
                 # NOTE: Not sure if we should include SleeperSeasonStatus.POSTPONED here or not
@@ -111,48 +109,119 @@ class SleeperLeagueLoader(LeagueLoader):
         self._validateRetrievedLeagues(sleeperLeagues)
         return sleeperLeagues
 
+    @staticmethod
+    def __iterUserRequests(
+        sleeperLeagues: list[SleeperLeague],
+    ) -> RequestBatches[list[list[SleeperUser]]]:
+        allSleeperUsers = yield [
+            PlatformRequest(
+                function=LeagueAPIClient.get_users_in_league,
+                kwargs=dict(league_id=sleeperLeague.league_id),
+            )
+            for sleeperLeague in sleeperLeagues
+        ]
+        return allSleeperUsers
+
     def getOwnerNames(self) -> dict[int, list[str]]:
         yearToOwnerNamesMap: dict[int, list[str]] = dict()
-        sleeperLeagues = self.__getAllLeagues()
-        for sleeperLeague in sleeperLeagues:
+        sleeperLeagues = self._sendRequests(self.__iterLeagueRequests())
+        allSleeperUsers = self._sendRequests(self.__iterUserRequests(sleeperLeagues))
+        for sleeperLeague, sleeperUsers in zip(sleeperLeagues, allSleeperUsers):
             yearToOwnerNamesMap[int(sleeperLeague.season)] = list()
-            sleeperUsers = self.__getSleeperUsers(sleeperLeague.league_id)
             for sleeperUser in sleeperUsers:
                 ownerName = sleeperUser.display_name
                 yearToOwnerNamesMap[int(sleeperLeague.season)].append(ownerName)
         return yearToOwnerNamesMap
 
-    def loadLeague(self, validate: bool = True) -> League:
-        sleeperLeagues = self.__getAllLeagues()
-        league = self.__buildLeague(sleeperLeagues)
-        if validate:
-            # validate new league
-            leagueValidation.runAllChecks(league)
-        self.__resetCaches()
-        self._warnForUnusedOwnerNames(league)
-        return league
-
-    def __buildLeague(self, sleeperLeagues: list[SleeperLeague]) -> League:
+    def _iterRequests(self) -> RequestBatches[list[_SleeperYearData]]:
+        sleeperLeagues = yield from self.__iterLeagueRequests()
+        sleeperSportState, allSleeperUsers = yield [
+            PlatformRequest(
+                function=LeagueAPIClient.get_sport_state,
+                kwargs=dict(sport=SleeperSport.NFL),
+            ),
+            self.__iterUserRequests(sleeperLeagues),
+        ]
+        sleeperYearData = yield [
+            self.__iterYearRequests(sleeperLeague, sleeperUsers, sleeperSportState)
+            for sleeperLeague, sleeperUsers in zip(sleeperLeagues, allSleeperUsers)
+        ]
+        return sleeperYearData
+
+    def __iterYearRequests(
+        self,
+        sleeperLeague: SleeperLeague,
+        sleeperUsers: list[SleeperUser],
+        sleeperSportState: SleeperSportState,
+    ) -> RequestBatches[_SleeperYearData]:
+        sleeperRosters, sleeperPlayoffMatchups = yield [
+            PlatformRequest(
+                function=LeagueAPIClient.get_rosters,
+                kwargs=dict(league_id=sleeperLeague.league_id),
+            ),
+            # NOTE: bye weeks will not be returned here. That's ok because we don't want those anyways
+            PlatformRequest(
+                function=LeagueAPIClient.get_winners_bracket,
+                kwargs=dict(league_id=sleeperLeague.league_id),
+            ),
+        ]
+        # get regular season weeks
+        # once we have found an incomplete week, all weeks after will also be incomplete
+        weekNumbers = list(
+            itertools.takewhile(
+                lambda weekNumber: self.__isCompletedWeek(
+                    weekNumber, sleeperLeague, sleeperSportState
+                ),
+                range(1, sleeperLeague.settings.playoff_week_start),
+            )
+        )
+        # get playoff weeks
+        weekNumbers += [
+            weekNumber
+            for weekNumber, _ in self.__getPlayoffWeekRoundList(
+                sleeperLeague, sleeperPlayoffMatchups
+            )
+        ]
+        allSleeperMatchups = yield [
+            PlatformRequest(
+                function=LeagueAPIClient.get_matchups_for_week,
+                kwargs=dict(league_id=sleeperLeague.league_id, week=weekNumber),
+            )
+            for weekNumber in weekNumbers
+        ]
+        return _SleeperYearData(
+            sleeperLeague=sleeperLeague,
+            sleeperUsers=sleeperUsers,
+            sleeperRosters=sleeperRosters,
+            sleeperPlayoffMatchups=sleeperPlayoffMatchups,
+            sleeperMatchupsByWeekNumber=dict(zip(weekNumbers, allSleeperMatchups)),
+            sleeperSportState=sleeperSportState,
+        )
+
+    def _buildLeague(self, sleeperYearData: list[_SleeperYearData]) -> League:
         years = list()
-        self.__loadOwners(sleeperLeagues)
+        self.__loadOwners(sleeperYearData)
         owners = list(self.__sleeperUserIdToOwnerMap.values())
-        for sleeperLeague in sleeperLeagues:
+        for yearData in sleeperYearData:
             # save league name for each year
-            self._leagueNameByYear[int(sleeperLeague.season)] = sleeperLeague.name
-            years.append(self.__buildYear(sleeperLeague))
+            self._leagueNameByYear[int(yearData.sleeperLeague.season)] = (
+                yearData.sleeperLeague.name
+            )
+            years.append(self.__buildYear(yearData))
         return League(
             name=self._getLeagueName(), owners=owners, years=self._getValidYears(years)
         )
 
-    def __buildYear(self, sleeperLeague: SleeperLeague) -> Year:
+    def __buildYear(self, yearData: _SleeperYearData) -> Year:
+        sleeperLeague = yearData.sleeperLeague
         # save division info if applicable
         if self.__yearHasDivisions(sleeperLeague):
             for divisionNumber in range(1, sleeperLeague.settings.divisions + 1):
                 self.__sleeperDivisionIdToDivisionMap[divisionNumber] = Division(
                     name=getattr(sleeperLeague.metadata, f"division_{divisionNumber}")
                 )
-        teams = self.__buildTeams(sleeperLeague)
-        weeks = self.__buildWeeks(sleeperLeague)
+        teams = self.__buildTeams(yearData)
+        weeks = self.__buildWeeks(yearData)
         # add YearSettings
         yearSettings = YearSettings()
         if sleeperLeague.settings.league_average_match == 1:
@@ -171,20 +240,18 @@ class SleeperLeagueLoader(LeagueLoader):
         self.__sleeperDivisionIdToDivisionMap = dict()
         return year
 
-    def __buildWeeks(self, sleeperLeague: SleeperLeague) -> list[Week]:
+    def __buildWeeks(self, yearData: _SleeperYearData) -> list[Week]:
+        sleeperLeague = yearData.sleeperLeague
         weeks = list()
         # get regular season weeks
-        # once we have found an incomplete week, all weeks after will also be incomplete
-        foundIncompleteWeek = False
         for weekNumber in range(1, sleeperLeague.settings.playoff_week_start):
-            if not foundIncompleteWeek and self.__isCompletedWeek(
-                weekNumber, sleeperLeague
-            ):
+            # only completed weeks were requested
+            if weekNumber in yearData.sleeperMatchupsByWeekNumber:
                 # get each teams matchup for that week
                 matchups = list()
-                sleeperMatchupsForThisWeek = LeagueAPIClient.get_matchups_for_week(
-                    league_id=sleeperLeague.league_id, week=weekNumber
-                )
+                sleeperMatchupsForThisWeek = yearData.sleeperMatchupsByWeekNumber[
+                    weekNumber
+                ]
                 sleeperMatchupIdToSleeperMatchupMap: dict[int, list[SleeperMatchup]] = (
                     dict()
                 )
@@ -228,13 +295,8 @@ class SleeperLeagueLoader(LeagueLoader):
                         )
                     )
                 weeks.append(Week(weekNumber=weekNumber, matchups=matchups))
-            else:
-                foundIncompleteWeek = True
         # get playoff weeks
-        # NOTE: bye weeks will not be returned here. That's ok because we don't want those anyways
-        allSleeperPlayoffMatchups = LeagueAPIClient.get_winners_bracket(
-            league_id=sleeperLeague.league_id
-        )
+        allSleeperPlayoffMatchups = yearData.sleeperPlayoffMatchups
         if len(allSleeperPlayoffMatchups) > 0:
             # sort sleeperPlayoffMatchups by round into a dict
             playoffRoundAndSleeperPlayoffMatchups: dict[
@@ -252,27 +314,15 @@ class SleeperLeagueLoader(LeagueLoader):
                     playoffRoundAndSleeperPlayoffMatchups[
                         sleeperPlayoffMatchup.round
                     ] = [sleeperPlayoffMatchup]
-            numberOfPlayoffRounds = max(
-                [playoffMatchup.round for playoffMatchup in allSleeperPlayoffMatchups]
-            )  # don't know a better way to determine this
-            numberOfPlayoffWeeks = self.__calculate_number_of_playoff_weeks(
+            playoffWeekRoundList = self.__getPlayoffWeekRoundList(
                 sleeperLeague, allSleeperPlayoffMatchups
             )
-            playoffWeeks = list(
-                range(
-                    sleeperLeague.settings.playoff_week_start,
-                    sleeperLeague.settings.playoff_week_start + numberOfPlayoffWeeks,
-                )
-            )
-            playoffWeekRoundList = self.__create_playoff_week_round_list(
-                sleeperLeague, playoffWeeks, numberOfPlayoffRounds
-            )
             for weekNumber, roundNumber in playoffWeekRoundList:
                 # get each teams matchup for that week
                 matchups = list()
-                sleeperMatchupsForThisWeek = LeagueAPIClient.get_matchups_for_week(
-                    league_id=sleeperLeague.league_id, week=weekNumber
-                )
+                sleeperMatchupsForThisWeek = yearData.sleeperMatchupsByWeekNumber[
+                    weekNumber
+                ]
                 # remove matchups that don't have a matchup id
                 sleeperMatchupsForThisWeek = [
                     sleeperMatchup
@@ -284,7 +334,9 @@ class SleeperLeagueLoader(LeagueLoader):
                     sleeperMatchup.matchup_id
                     for sleeperMatchup in sleeperMatchupsForThisWeek
                 }
-                if self.__isCompletedWeek(weekNumber, sleeperLeague):
+                if self.__isCompletedWeek(
+                    weekNumber, sleeperLeague, yearData.sleeperSportState
+                ):
                     # sort matchups by roster IDs
                     rosterIdToSleeperMatchupMap: dict[int, SleeperMatchup] = dict()
                     for sleeperMatchup in sleeperMatchupsForThisWeek:
@@ -355,20 +407,22 @@ class SleeperLeagueLoader(LeagueLoader):
     def __yearHasDivisions(self, sleeperLeague: SleeperLeague) -> bool:
         return sleeperLeague.settings.divisions not in [None, 0]
 
-    def __isCompletedWeek(self, weekNumber: int, sleeperLeague: SleeperLeague) -> bool:
+    @staticmethod
+    def __isCompletedWeek(
+        weekNumber: int, sleeperLeague: SleeperLeague, sportState: SleeperSportState
+    ) -> bool:
         # see if this is the current year/week of the NFL
-        sportState = self.__getSleeperSportState()
         return not (
             sportState.season == sleeperLeague.season
             and sportState.leg <= weekNumber
             and sleeperLeague.status != SleeperSeasonStatus.COMPLETE
         )
 
-    def __buildTeams(self, sleeperLeague: SleeperLeague) -> list[Team]:
+    def __buildTeams(self, yearData: _SleeperYearData) -> list[Team]:
         teams = list()
-        sleeperUsers = self.__getSleeperUsers(sleeperLeague.league_id)
-        sleeperRosters = LeagueAPIClient.get_rosters(league_id=sleeperLeague.league_id)
-        for sleeperUser in sleeperUsers:
+        sleeperLeague = yearData.sleeperLeague
+        sleeperRosters = yearData.sleeperRosters
+        for sleeperUser in yearData.sleeperUsers:
             # connect a sleeperUser to a sleeperRoster
             rosterId = None
             divisionId = None
@@ -397,10 +451,9 @@ class SleeperLeagueLoader(LeagueLoader):
             self.__sleeperRosterIdToTeamMap[rosterId] = team
         return teams
 
-    def __loadOwners(self, sleeperLeagues: list[SleeperLeague]) -> None:
-        for sleeperLeague in sleeperLeagues:
-            sleeperUsers = self.__getSleeperUsers(sleeperLeague.league_id)
-            for sleeperUser in sleeperUsers:
+    def __loadOwners(self, sleeperYearData: list[_SleeperYearData]) -> None:
+        for yearData in sleeperYearData:
+            for sleeperUser in yearData.sleeperUsers:
                 ownerName = sleeperUser.display_name
                 # get general owner name if there is one
                 generalOwnerName = self._getGeneralOwnerNameFromGivenOwnerName(
@@ -413,6 +466,33 @@ class SleeperLeagueLoader(LeagueLoader):
                     name=ownerName
                 )
 
+    @classmethod
+    def __getPlayoffWeekRoundList(
+        cls,
+        sleeperLeague: SleeperLeague,
+        sleeperPlayoffMatchups: list[SleeperPlayoffMatchup],
+    ) -> list[tuple[int, int]]:
+        """
+        Returns the week number and playoff round of each playoff week.
+        """
+        if len(sleeperPlayoffMatchups) == 0:
+            return list()
+        numberOfPlayoffRounds = max(
+            [playoffMatchup.round for playoffMatchup in sleeperPlayoffMatchups]
+        )  # don't know a better way to determine this
+        numberOfPlayoffWeeks = cls.__calculate_number_of_playoff_weeks(
+            sleeperLeague, sleeperPlayoffMatchups
+        )
+        playoffWeeks = list(
+            range(
+                sleeperLeague.settings.playoff_week_start,
+                sleeperLeague.settings.playoff_week_start + numberOfPlayoffWeeks,
+            )
+        )
+        return cls.__create_playoff_week_round_list(
+            sleeperLeague, playoffWeeks, numberOfPlayoffRounds
+        )
+
     @staticmethod
     def __calculate_number_of_playoff_weeks(
         sleeperLeague: SleeperLeague,
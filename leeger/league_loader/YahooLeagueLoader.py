@@ -1,5 +1,6 @@
 import multiprocessing
 import subprocess
+from dataclasses import dataclass
 from typing import Optional
 
 from yahoofantasy import Context as YahooContext
@@ -9,16 +10,28 @@ from yahoofantasy import Team as YahooTeam
 from yahoofantasy import Week as YahooWeek
 
 from leeger.enum.MatchupType import MatchupType
+from leeger.enum.Platform import Platform
 from leeger.exception.DoesNotExistException import DoesNotExistException
 from leeger.exception.LeagueLoaderException import LeagueLoaderException
-from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.league_loader.LeagueLoader import LeagueLoader, RequestBatches
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
 from leeger.model.league.Owner import Owner
 from leeger.model.league.Team import Team
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
-from leeger.validate import leagueValidation
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
+
+
+@dataclass(kw_only=True, frozen=True)
+class _YahooYearData:
+    """
+    Everything requested from Yahoo to build a single Year.
+    """
+
+    yahooLeague: YahooLeague
+    yahooTeams: list[YahooTeam]
+    yahooWeeks: list[YahooWeek]
 
 
 class YahooLeagueLoader(LeagueLoader):
@@ -27,6 +40,8 @@ class YahooLeagueLoader(LeagueLoader):
     https://football.fantasysports.yahoo.com/
     """
 
+    _PLATFORM = Platform.YAHOO
+
     __NFL = "nfl"
 
     def __init__(
@@ -78,7 +93,7 @@ class YahooLeagueLoader(LeagueLoader):
             ]
         )
 
-    def __getAllLeagues(self) -> list[YahooLeague]:
+    def __getYahooContext(self) -> YahooContext:
         loginProcess = multiprocessing.Process(
             target=self.login, args=(self.__clientId, self.__clientSecret)
         )
@@ -87,16 +102,25 @@ class YahooLeagueLoader(LeagueLoader):
         if loginProcess.is_alive():
             loginProcess.terminate()
             raise TimeoutError("Login to yahoofantasy timed out.")
-        yahooContext = YahooContext()
+        return YahooContext()
+
+    def __iterLeagueRequests(self) -> RequestBatches[list[YahooLeague]]:
+        (yahooContext,) = yield [PlatformRequest(function=self.__getYahooContext)]
         yahooLeagues = list()
         # years from most -> least recent
         remainingYears = sorted(self._years, reverse=True)
+        # get all leagues this user was in for each year
+        allLeagues = yield [
+            PlatformRequest(
+                function=yahooContext.get_leagues,
+                kwargs=dict(game=self.__NFL, season=year),
+            )
+            for year in remainingYears
+        ]
         currentLeagueId = self._leagueId
         previousLeagueId = None
-        for year in remainingYears:
+        for year, leagues in zip(remainingYears, allLeagues):
             foundLeagueForYear = False
-            # get all leagues this user was in for this year
-            leagues = yahooContext.get_leagues(self.__NFL, year)
             # find the league that we want (has a matching ID)
             for league in leagues:
                 if str(league.league_id) == currentLeagueId:
@@ -107,7 +131,7 @@ class YahooLeagueLoader(LeagueLoader):
                         # NOTE: and the league id is always at index 1
                         previousLeagueId = str(league.past_league_id[1])
                     except Exception as e:
-                        self._LOGGER.warning(f"could not get previous league id: {e}")
+                        self._LOGGER.warning("could not get previous league id: %s", e)
             if not foundLeagueForYear:
                 raise LeagueLoaderException(
                     f"Could not find league for year {year} with ID {currentLeagueId}."
@@ -117,51 +141,79 @@ class YahooLeagueLoader(LeagueLoader):
         self._validateRetrievedLeagues(yahooLeagues)
         return yahooLeagues
 
+    @staticmethod
+    def __iterTeamRequests(
+        yahooLeagues: list[YahooLeague],
+    ) -> RequestBatches[list[list[YahooTeam]]]:
+        allYahooTeams = yield [
+            PlatformRequest(function=yahooLeague.teams) for yahooLeague in yahooLeagues
+        ]
+        return allYahooTeams
+
+    @staticmethod
+    def __iterWeekRequests(
+        yahooLeagues: list[YahooLeague],
+    ) -> RequestBatches[list[list[YahooWeek]]]:
+        allYahooWeeks = yield [
+            PlatformRequest(function=yahooLeague.weeks) for yahooLeague in yahooLeagues
+        ]
+        return allYahooWeeks
+
     def getOwnerNames(self) -> dict[int, list[str]]:
         yearToOwnerNamesMap: dict[int, list[str]] = dict()
-        yahooLeagues = self.__getAllLeagues()
-        for yahooLeague in yahooLeagues:
+        yahooLeagues = self._sendRequests(self.__iterLeagueRequests())
+        allYahooTeams = self._sendRequests(self.__iterTeamRequests(yahooLeagues))
+        for yahooLeague, yahooTeams in zip(yahooLeagues, allYahooTeams):
             yearToOwnerNamesMap[yahooLeague.season] = list()
-            yahooTeams = yahooLeague.teams()
             for yahooTeam in yahooTeams:
                 ownerName = yahooTeam.manager.nickname
                 yearToOwnerNamesMap[yahooLeague.season].append(ownerName)
         return yearToOwnerNamesMap
 
-    def loadLeague(self, validate: bool = True) -> League:
-        yahooLeagues = self.__getAllLeagues()
-        league = self.__buildLeague(yahooLeagues)
-        if validate:
-            # validate new league
-            leagueValidation.runAllChecks(league)
-        self._warnForUnusedOwnerNames(league)
-        return league
+    def _iterRequests(self) -> RequestBatches[list[_YahooYearData]]:
+        yahooLeagues = yield from self.__iterLeagueRequests()
+        # each call to weeks() syncs every week of the league, so it is only called once per league
+        allYahooTeams, allYahooWeeks = yield [
+            self.__iterTeamRequests(yahooLeagues),
+            self.__iterWeekRequests(yahooLeagues),
+        ]
+        return [
+            _YahooYearData(
+                yahooLeague=yahooLeague, yahooTeams=yahooTeams, yahooWeeks=yahooWeeks
+            )
+            for yahooLeague, yahooTeams, yahooWeeks in zip(
+                yahooLeagues, allYahooTeams, allYahooWeeks
+            )
+        ]
 
-    def __buildLeague(self, yahooLeagues: list[YahooLeague]) -> League:
+    def _buildLeague(self, yahooYearData: list[_YahooYearData]) -> League:
         years = list()
-        for yahooLeague in yahooLeagues:
+        for yearData in yahooYearData:
             # save league name for each year
-            self._leagueNameByYear[yahooLeague.season] = yahooLeague.name
-            self.__loadOwners(yahooLeague.teams())
-            years.append(self.__buildYear(yahooLeague))
+            self._leagueNameByYear[yearData.yahooLeague.season] = (
+                yearData.yahooLeague.name
+            )
+            self.__loadOwners(yearData.yahooTeams)
+            years.append(self.__buildYear(yearData))
         return League(
             name=self._getLeagueName(),
             owners=list(self.__yahooManagerIdToOwnerMap.values()),
             years=self._getValidYears(years),
         )
 
-    def __buildYear(self, yahooLeague: YahooLeague) -> Year:
+    def __buildYear(self, yearData: _YahooYearData) -> Year:
+        yahooLeague = yearData.yahooLeague
         self.__yearToTeamIdHasLostInPlayoffs[yahooLeague.season] = dict()
-        teams = self.__buildTeams(yahooLeague.teams())
-        weeks = self.__buildWeeks(yahooLeague)
+        teams = self.__buildTeams(yearData.yahooTeams)
+        weeks = self.__buildWeeks(yearData)
         return Year(yearNumber=yahooLeague.season, teams=teams, weeks=weeks)
 
-    def __buildWeeks(self, yahooLeague: YahooLeague) -> list[Week]:
+    def __buildWeeks(self, yearData: _YahooYearData) -> list[Week]:
         weeks = list()
         for i in range(
-            yahooLeague.current_week
+            yearData.yahooLeague.current_week
         ):  # current week seems to be the last week in the league
-            yahooWeek: YahooWeek = yahooLeague.weeks()[i]
+            yahooWeek = yearData.yahooWeeks[i]
             # get each teams matchup for that week
             matchups = list()
             # only get matchups that are completed
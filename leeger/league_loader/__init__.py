@@ -1,4 +1,29 @@
-from .ESPNLeagueLoader import ESPNLeagueLoader
-from .MyFantasyLeagueLeagueLoader import MyFantasyLeagueLeagueLoader
-from .SleeperLeagueLoader import SleeperLeagueLoader
-from .YahooLeagueLoader import YahooLeagueLoader
+from typing import TYPE_CHECKING
+
+from leeger.util.lazy_import import lazyAttributes
+
+if TYPE_CHECKING:
+    from .AsyncLeagueLoader import AsyncLeagueLoader
+    from .AsyncRequestPool import AsyncRequestPool
+    from .ESPNLeagueLoader import ESPNLeagueLoader
+    from .FleaflickerLeagueLoader import FleaflickerLeagueLoader
+    from .MyFantasyLeagueLeagueLoader import MyFantasyLeagueLeagueLoader
+    from .RequestFixtures import RequestFixtures
+    from .RequestScheduler import RequestScheduler
+    from .SleeperLeagueLoader import SleeperLeagueLoader
+    from .YahooLeagueLoader import YahooLeagueLoader
+
+# each League Loader (and the platform SDK it uses) is only imported the first time it is used
+__all__ = [
+    "AsyncLeagueLoader",
+    "AsyncRequestPool",
+    "ESPNLeagueLoader",
+    "FleaflickerLeagueLoader",
+    "MyFantasyLeagueLeagueLoader",
+    "RequestFixtures",
+    "RequestScheduler",
+    "SleeperLeagueLoader",
+    "YahooLeagueLoader",
+]
+
+__getattr__, __dir__ = lazyAttributes(__name__, __all__)
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
+from leeger.util.equality import FINGERPRINT_CACHE_ATTRIBUTE, modelFingerprint
+
 
 @dataclass
 class EqualityCheck(ABC):
@@ -9,6 +11,12 @@ class EqualityCheck(ABC):
     Model classes should inherit this in order to have a .equals() method.
     """
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # any cached fingerprint is out of date now
+        if FINGERPRINT_CACHE_ATTRIBUTE in self.__dict__:
+            del self.__dict__[FINGERPRINT_CACHE_ATTRIBUTE]
+
     @abstractmethod
     def equals(
         self,
@@ -18,3 +26,10 @@ class EqualityCheck(ABC):
         ignoreBaseIds: bool = False,
         logDifferences: bool = False,
     ) -> bool: ...
+
+    def fingerprint(self) -> bytes:
+        """
+        Returns a structural hash of this instance and everything nested in it.
+        Instances with the same fingerprint are always equal.
+        """
+        return modelFingerprint(self)
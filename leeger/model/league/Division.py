@@ -12,7 +12,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 @dataclass(kw_only=True, eq=False)
 class Division(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
-    __LOGGER = CustomLogger.getLogger()
+    __LOGGER = CustomLogger.getLogger(__name__)
     name: str
 
     def equals(
@@ -38,7 +38,7 @@ class Division(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
         )
 
     def __eq__(self, otherDivision: Division) -> bool:
-        self.__LOGGER.info(
+        self.__LOGGER.debug(
             "Use .equals() for more options when comparing Division instances."
         )
         return self.equals(otherDivision=otherDivision)
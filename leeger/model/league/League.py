@@ -16,13 +16,13 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 @dataclass(kw_only=True, eq=False)
 class League(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
-    __LOGGER = CustomLogger.getLogger()
+    __LOGGER = CustomLogger.getLogger(__name__)
     name: str
     owners: list[Owner]
     years: list[Year]
 
     def __hash__(self):
-        return hash(str(self.toJson()))
+        return hash(self.fingerprint())
 
     def equals(
         self,
@@ -45,12 +45,10 @@ class League(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
         ) -> bool:
             if len(list1) != len(list2):
                 return False
-            equal = True
-            for item1, item2 in zip(list1, list2):
-                equal = equal and item1.equals(
-                    item2, ignoreIds=ignoreIds, ignoreBaseIds=ignoreBaseIds
-                )
-            return equal
+            return all(
+                item1.equals(item2, ignoreIds=ignoreIds, ignoreBaseIds=ignoreBaseIds)
+                for item1, item2 in zip(list1, list2)
+            )
 
         return modelEquals(
             objA=self,
@@ -60,6 +58,7 @@ class League(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
             ignoreIdFields=ignoreIds,
             ignoreBaseIdField=ignoreBaseIds,
             logDifferences=logDifferences,
+            useFingerprints=True,
             equalityFunctionMap={"owners": listsEqual, "years": listsEqual},
             equalityFunctionKwargsMap={
                 "owners": {"ignoreIds": ignoreIds, "ignoreBaseIds": ignoreBaseIds},
@@ -68,7 +67,7 @@ class League(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
         )
 
     def __eq__(self, otherLeague: League) -> bool:
-        self.__LOGGER.info(
+        self.__LOGGER.debug(
             "Use .equals() for more options when comparing League instances."
         )
         return self.equals(otherLeague=otherLeague)
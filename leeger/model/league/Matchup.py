@@ -17,7 +17,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 @dataclass(kw_only=True, eq=False)
 class Matchup(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
-    __LOGGER = CustomLogger.getLogger()
+    __LOGGER = CustomLogger.getLogger(__name__)
     teamAId: str
     teamBId: str
     teamAScore: float | int
@@ -71,7 +71,7 @@ class Matchup(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
         )
 
     def __eq__(self, otherMatchup: Matchup) -> bool:
-        self.__LOGGER.info(
+        self.__LOGGER.debug(
             "Use .equals() for more options when comparing Matchup instances."
         )
         return self.equals(otherMatchup=otherMatchup)
@@ -12,7 +12,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 @dataclass(kw_only=True, eq=False)
 class Owner(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
-    __LOGGER = CustomLogger.getLogger()
+    __LOGGER = CustomLogger.getLogger(__name__)
     name: str
 
     def equals(
@@ -38,7 +38,7 @@ class Owner(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
         )
 
     def __eq__(self, otherOwner: Owner) -> bool:
-        self.__LOGGER.info(
+        self.__LOGGER.debug(
             "Use .equals() for more options when comparing Owner instances."
         )
         return self.equals(otherOwner=otherOwner)
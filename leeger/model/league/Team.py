@@ -13,7 +13,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 @dataclass(kw_only=True, eq=False)
 class Team(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
-    __LOGGER = CustomLogger.getLogger()
+    __LOGGER = CustomLogger.getLogger(__name__)
     ownerId: str
     name: str
     divisionId: Optional[str] = None
@@ -42,7 +42,7 @@ class Team(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
         )
 
     def __eq__(self, otherTeam: Team) -> bool:
-        self.__LOGGER.info(
+        self.__LOGGER.debug(
             "Use .equals() for more options when comparing Team instances."
         )
         return self.equals(otherTeam=otherTeam)
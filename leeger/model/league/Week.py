@@ -15,7 +15,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 @dataclass(kw_only=True, eq=False)
 class Week(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
-    __LOGGER = CustomLogger.getLogger()
+    __LOGGER = CustomLogger.getLogger(__name__)
     weekNumber: int
     matchups: list[Matchup]
 
@@ -40,12 +40,12 @@ class Week(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
         ) -> bool:
             if len(matchupList1) != len(matchupList2):
                 return False
-            equal = True
-            for matchup1, matchup2 in zip(matchupList1, matchupList2):
-                equal = equal and matchup1.equals(
+            return all(
+                matchup1.equals(
                     matchup2, ignoreIds=ignoreIds, ignoreBaseIds=ignoreBaseIds
                 )
-            return equal
+                for matchup1, matchup2 in zip(matchupList1, matchupList2)
+            )
 
         return modelEquals(
             objA=self,
@@ -55,6 +55,7 @@ class Week(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
             ignoreIdFields=ignoreIds,
             ignoreBaseIdField=ignoreBaseIds,
             logDifferences=logDifferences,
+            useFingerprints=True,
             equalityFunctionMap={"matchups": matchupsEqual},
             equalityFunctionKwargsMap={
                 "matchups": {"ignoreIds": ignoreIds, "ignoreBaseIds": ignoreBaseIds}
@@ -62,7 +63,7 @@ class Week(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
         )
 
     def __eq__(self, otherWeek: Week) -> bool:
-        self.__LOGGER.info(
+        self.__LOGGER.debug(
             "Use .equals() for more options when comparing Week instances."
         )
         return self.equals(otherWeek=otherWeek)
@@ -18,7 +18,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 @dataclass(kw_only=True, eq=False)
 class Year(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
-    __LOGGER = CustomLogger.getLogger()
+    __LOGGER = CustomLogger.getLogger(__name__)
     yearNumber: int
     teams: list[Team]
     weeks: list[Week]
@@ -32,7 +32,7 @@ class Year(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
             self.yearSettings = YearSettings()
 
     def __hash__(self):
-        return hash(str(self.toJson()))
+        return hash(self.fingerprint())
 
     def equals(
         self,
@@ -55,12 +55,10 @@ class Year(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
         ) -> bool:
             if len(list1) != len(list2):
                 return False
-            equal = True
-            for item1, item2 in zip(list1, list2):
-                equal = equal and item1.equals(
-                    item2, ignoreIds=ignoreIds, ignoreBaseIds=ignoreBaseIds
-                )
-            return equal
+            return all(
+                item1.equals(item2, ignoreIds=ignoreIds, ignoreBaseIds=ignoreBaseIds)
+                for item1, item2 in zip(list1, list2)
+            )
 
         def yearSettingsEqual(
             yearSettings1: YearSettings,
@@ -81,6 +79,7 @@ class Year(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
             ignoreIdFields=ignoreIds,
             ignoreBaseIdField=ignoreBaseIds,
             logDifferences=logDifferences,
+            useFingerprints=True,
             equalityFunctionMap={
                 "teams": listsEqual,
                 "weeks": listsEqual,
@@ -99,7 +98,7 @@ class Year(UniqueId, EqualityCheck, JSONSerializable, JSONDeserializable):
         )
 
     def __eq__(self, otherYear: Year) -> bool:
-        self.__LOGGER.info(
+        self.__LOGGER.debug(
             "Use .equals() for more options when comparing Year instances."
         )
         return self.equals(otherYear=otherYear)
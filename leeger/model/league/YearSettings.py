@@ -12,7 +12,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 @dataclass(kw_only=True, eq=False)
 class YearSettings(EqualityCheck, JSONSerializable, JSONDeserializable):
-    __LOGGER = CustomLogger.getLogger()
+    __LOGGER = CustomLogger.getLogger(__name__)
     leagueMedianGames: Optional[bool] = False
 
     def __post_init__(self):
@@ -42,7 +42,7 @@ class YearSettings(EqualityCheck, JSONSerializable, JSONDeserializable):
         )
 
     def __eq__(self, otherYearSettings: YearSettings) -> bool:
-        self.__LOGGER.info(
+        self.__LOGGER.debug(
             "Use .equals() for more options when comparing YearSettings instances."
         )
         return self.equals(otherYearSettings=otherYearSettings)
@@ -14,7 +14,7 @@ from leeger.util.JSONSerializable import JSONSerializable
 
 @dataclass(kw_only=True, eq=False)
 class Performance(UniqueId, EqualityCheck, JSONSerializable):
-    __LOGGER = CustomLogger.getLogger()
+    __LOGGER = CustomLogger.getLogger(__name__)
     teamId: str
     teamScore: float | int
     hasTiebreaker: bool = False
@@ -46,7 +46,7 @@ class Performance(UniqueId, EqualityCheck, JSONSerializable):
         )
 
     def __eq__(self, otherPerformance: Performance) -> bool:
-        self.__LOGGER.info(
+        self.__LOGGER.debug(
             "Use .equals() for more options when comparing Performance instances."
         )
         return self.equals(otherPerformance=otherPerformance)
@@ -78,7 +78,8 @@ class Performance(UniqueId, EqualityCheck, JSONSerializable):
             )
         if tiebreakerInfoLost:
             self.__LOGGER.warning(
-                f"Combining performances caused loss of tiebreakers: {tiebreakerInfoLost}."
+                "Combining performances caused loss of tiebreakers: %s.",
+                tiebreakerInfoLost,
             )
         matchup = Matchup(
             teamAId=self.teamId,
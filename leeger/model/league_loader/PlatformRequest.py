@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class PlatformRequest:
+    """
+    A single blocking call a League Loader makes to a platform API (usually a call to the platform's SDK).
+    """
+
+    # the SDK function to call, like LeagueAPIClient.get_league
+    function: Callable[..., Any]
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def send(self) -> Any:
+        """
+        Makes the call and returns the response.
+        """
+        return self.function(**self.kwargs)
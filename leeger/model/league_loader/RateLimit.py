@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, frozen=True)
+class RateLimit:
+    """
+    The most requests that should be sent to a platform.
+    Up to 'burst' requests can be sent at once, after that requests are sent at 'requestsPerSecond'.
+    """
+
+    requestsPerSecond: float
+    burst: int = 1
+
+    def __post_init__(self):
+        if self.requestsPerSecond <= 0:
+            raise ValueError("'requestsPerSecond' must be greater than 0.")
+        if self.burst < 1:
+            raise ValueError("'burst' must be at least 1.")
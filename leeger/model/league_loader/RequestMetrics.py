@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True)
+class RequestMetrics:
+    """
+    Counts what a RequestScheduler did with the requests it was given.
+    """
+
+    # requests sent to the platform, including retries
+    requestsSent: int = 0
+    retries: int = 0
+    # requests that still failed after every retry, or failed with an error that isn't retried
+    failedRequests: int = 0
+    # requests that were not sent because the same request was already in flight
+    coalescedRequests: int = 0
+    rateLimitWaitSeconds: float = 0.0
+    retryWaitSeconds: float = 0.0
+
+    def __add__(self, other: RequestMetrics) -> RequestMetrics:
+        return RequestMetrics(
+            requestsSent=self.requestsSent + other.requestsSent,
+            retries=self.retries + other.retries,
+            failedRequests=self.failedRequests + other.failedRequests,
+            coalescedRequests=self.coalescedRequests + other.coalescedRequests,
+            rateLimitWaitSeconds=self.rateLimitWaitSeconds + other.rateLimitWaitSeconds,
+            retryWaitSeconds=self.retryWaitSeconds + other.retryWaitSeconds,
+        )
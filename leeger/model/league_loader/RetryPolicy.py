@@ -0,0 +1,28 @@
+import random
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, frozen=True)
+class RetryPolicy:
+    """
+    How a request that failed with a transient error (e.g. a timeout or an HTTP 429 or 503) is retried.
+    Retries wait with exponential backoff and full jitter, so many requests that failed together are not retried together.
+    """
+
+    maxRetries: int = 3
+    baseDelaySeconds: float = 0.5
+    maxDelaySeconds: float = 30.0
+
+    def __post_init__(self):
+        if self.maxRetries < 0:
+            raise ValueError("'maxRetries' cannot be less than 0.")
+        if self.baseDelaySeconds < 0 or self.maxDelaySeconds < 0:
+            raise ValueError("Retry delays cannot be less than 0.")
+
+    def getDelaySeconds(self, retryNumber: int, rng: random.Random) -> float:
+        """
+        Returns how long to wait before the given retry (starting at 1).
+        """
+        return rng.uniform(
+            0, min(self.maxDelaySeconds, self.baseDelaySeconds * 2 ** (retryNumber - 1))
+        )
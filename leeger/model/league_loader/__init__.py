@@ -0,0 +1,4 @@
+from .PlatformRequest import PlatformRequest
+from .RateLimit import RateLimit
+from .RequestMetrics import RequestMetrics
+from .RetryPolicy import RetryPolicy
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy
+
+from leeger.util.Deci import Deci
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class AllPlayMatrix:
+    """
+    Week vs Owner scores, and how each score would have done against every other score in its week.
+    Row i is the Week at weeks[i] (as (year number, week number)) and column j is the Owner at ownerIds[j].
+    Arrays are read-only, as matrices are cached and shared.
+    """
+
+    weeks: list[tuple[int, int]]
+    ownerIds: list[str]
+    scores: (
+        numpy.ndarray
+    )  # float, shape (Weeks, Owners), NaN where the Owner has no game in the Week
+    outscored: (
+        numpy.ndarray
+    )  # int, shape (Weeks, Owners), number of other scores in the Week beaten
+    tied: (
+        numpy.ndarray
+    )  # int, shape (Weeks, Owners), number of other scores in the Week tied
+    gameScores: numpy.ndarray  # float, shape (Weeks, Owners), score of the game ending in the Week (a multi-week matchup's scores added up in its last Week), NaN where the Owner has none
+    multiWeekGames: numpy.ndarray  # bool, shape (Weeks, Owners), True where the game in gameScores is a multi-week matchup
+
+    @property
+    def opponentsInWeek(self) -> numpy.ndarray:
+        """
+        The number of other scores in each Week.
+        """
+        return (~numpy.isnan(self.scores)).sum(axis=1) - 1
+
+    def getAWAL(self) -> dict[str, Optional[Deci]]:
+        """
+        Returns the Adjusted Wins Against the League for each Owner, or None for an Owner with no games.
+        This is the same as AWALYearCalculator.getAWAL() (or its all-time counterpart), without League Median Wins.
+
+        Example response:
+            {
+            "someOwnerId": Deci("8.7"),
+            "someOtherOwnerId": Deci("11.2"),
+            "yetAnotherOwnerId": None,
+            ...
+            }
+        """
+        hasGame = ~numpy.isnan(self.scores)
+        opponentsInWeek = self.opponentsInWeek
+        ownerIdAndAWAL = dict()
+        for j, ownerId in enumerate(self.ownerIds):
+            weekIndexes = numpy.flatnonzero(hasGame[:, j])
+            if len(weekIndexes) == 0:
+                ownerIdAndAWAL[ownerId] = None
+                continue
+            # summed by Year first, the same way the calculators add up Decis
+            yearNumberAndAWAL: dict[int, Deci] = dict()
+            for i in weekIndexes:
+                yearNumber = self.weeks[i][0]
+                opponents = Deci(int(opponentsInWeek[i]))
+                yearNumberAndAWAL[yearNumber] = yearNumberAndAWAL.get(
+                    yearNumber, Deci(0)
+                ) + (
+                    (Deci(int(self.outscored[i, j])) * (Deci(1) / opponents))
+                    + (Deci(int(self.tied[i, j])) * (Deci(0.5) / opponents))
+                )
+            ownerIdAndAWAL[ownerId] = sum(yearNumberAndAWAL.values(), Deci(0))
+        return ownerIdAndAWAL
+
+    def getSmartWins(self) -> dict[str, Optional[Deci]]:
+        """
+        Returns the Smart Wins for each Owner, or None for an Owner with no games.
+        Every game score in this matrix is played against every other game score in this matrix, so a multi-week matchup counts once with its scores added up.
+        With no filters, this is the same as SmartWinsYearCalculator.getSmartWins() (or its all-time counterpart).
+        With filters, the calculators still play each score against every score in the Year (or League), where this only plays it against the scores in this matrix.
+
+        Example response:
+            {
+            "someOwnerId": Deci("8.7"),
+            "someOtherOwnerId": Deci("11.2"),
+            "yetAnotherOwnerId": None,
+            ...
+            }
+        """
+        hasGame = ~numpy.isnan(self.gameScores)
+        allScores = numpy.sort(self.gameScores[hasGame])
+        # scores beat and tied for every score, found by binary search rather than comparing every pair of scores
+        scoresBeat = numpy.searchsorted(allScores, self.gameScores, side="left")
+        scoresTied = (
+            numpy.searchsorted(allScores, self.gameScores, side="right")
+            - scoresBeat
+            - 1
+        )
+        otherScores = len(allScores) - Deci("1")
+        ownerIdAndSmartWins = dict()
+        for j, ownerId in enumerate(self.ownerIds):
+            weekIndexes = numpy.flatnonzero(hasGame[:, j])
+            if len(weekIndexes) == 0:
+                ownerIdAndSmartWins[ownerId] = None
+                continue
+            # single-week games first and then multi-week matchups, the same order the calculators add up Decis in
+            weekIndexes = sorted(
+                weekIndexes, key=lambda i: bool(self.multiWeekGames[i, j])
+            )
+            smartWins = Deci(0)
+            for i in weekIndexes:
+                smartWins += (
+                    int(scoresBeat[i, j]) + (int(scoresTied[i, j]) / Deci("2"))
+                ) / otherScores
+            ownerIdAndSmartWins[ownerId] = smartWins
+        return ownerIdAndSmartWins
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy
+
+from leeger.util.Deci import Deci
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class HeadToHeadMatrix:
+    """
+    Owner vs Owner records.
+    Row i and column j hold how the Owner at ownerIds[i] did against the Owner at ownerIds[j].
+    Multi-week matchups count as a single game for wins, losses and ties.
+    Arrays are read-only, as matrices are cached and shared.
+    """
+
+    ownerIds: list[str]
+    wins: numpy.ndarray  # int, shape (Owners, Owners)
+    losses: numpy.ndarray  # int, shape (Owners, Owners)
+    ties: numpy.ndarray  # int, shape (Owners, Owners)
+    pointsFor: numpy.ndarray  # float, shape (Owners, Owners)
+
+    @property
+    def pointsAgainst(self) -> numpy.ndarray:
+        return self.pointsFor.T
+
+    @property
+    def gamesPlayed(self) -> numpy.ndarray:
+        return self.wins + self.losses + self.ties
+
+    def getIndex(self, ownerId: str) -> int:
+        return self.ownerIds.index(ownerId)
+
+    def getRecord(self, ownerId: str, opponentOwnerId: str) -> tuple[int, int, int]:
+        """
+        Returns the (wins, losses, ties) of the given Owner against the given opponent Owner.
+        """
+        i, j = self.getIndex(ownerId), self.getIndex(opponentOwnerId)
+        return int(self.wins[i, j]), int(self.losses[i, j]), int(self.ties[i, j])
+
+    def getWAL(self) -> dict[str, Optional[Deci]]:
+        """
+        Returns the Wins Against the League for each Owner, or None for an Owner with no games.
+        This is the same as GameOutcomeYearCalculator.getWAL() (or its all-time counterpart), without League Median Wins.
+
+        Example response:
+            {
+            "someOwnerId": Deci("8.5"),
+            "someOtherOwnerId": Deci("11"),
+            "yetAnotherOwnerId": None,
+            ...
+            }
+        """
+        wins = self.wins.sum(axis=1)
+        ties = self.ties.sum(axis=1)
+        gamesPlayed = self.gamesPlayed.sum(axis=1)
+        ownerIdAndWAL = dict()
+        for i, ownerId in enumerate(self.ownerIds):
+            if gamesPlayed[i] == 0:
+                ownerIdAndWAL[ownerId] = None
+            else:
+                ownerIdAndWAL[ownerId] = Deci(int(wins[i])) + (
+                    Deci("0.5") * Deci(int(ties[i]))
+                )
+        return ownerIdAndWAL
+
+    def __add__(self, otherMatrix: HeadToHeadMatrix) -> HeadToHeadMatrix:
+        """
+        Combines 2 matrices, Owners are matched up by ID.
+        """
+        ownerIds = list(self.ownerIds)
+        for ownerId in otherMatrix.ownerIds:
+            if ownerId not in ownerIds:
+                ownerIds.append(ownerId)
+        n = len(ownerIds)
+        selfIndexes = numpy.array(
+            [ownerIds.index(ownerId) for ownerId in self.ownerIds], dtype=int
+        )
+        otherIndexes = numpy.array(
+            [ownerIds.index(ownerId) for ownerId in otherMatrix.ownerIds], dtype=int
+        )
+        combined = dict()
+        for fieldName, dtype in (
+            ("wins", numpy.int64),
+            ("losses", numpy.int64),
+            ("ties", numpy.int64),
+            ("pointsFor", numpy.float64),
+        ):
+            array = numpy.zeros((n, n), dtype=dtype)
+            array[numpy.ix_(selfIndexes, selfIndexes)] += getattr(self, fieldName)
+            array[numpy.ix_(otherIndexes, otherIndexes)] += getattr(
+                otherMatrix, fieldName
+            )
+            array.flags.writeable = False
+            combined[fieldName] = array
+        return HeadToHeadMatrix(ownerIds=ownerIds, **combined)
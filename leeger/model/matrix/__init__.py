@@ -0,0 +1,2 @@
+from .AllPlayMatrix import AllPlayMatrix
+from .HeadToHeadMatrix import HeadToHeadMatrix
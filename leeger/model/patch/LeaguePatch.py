@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from leeger.model.patch.PatchOperation import PatchOperation
+from leeger.util.JSONDeserializable import JSONDeserializable
+from leeger.util.JSONSerializable import JSONSerializable
+
+
+@dataclass(kw_only=True, frozen=True)
+class LeaguePatch(JSONSerializable, JSONDeserializable):
+    """
+    The changes needed to turn one League snapshot into another.
+    Operations are in the order they should be applied.
+    """
+
+    operations: list[PatchOperation]
+
+    def isEmpty(self) -> bool:
+        return len(self.operations) == 0
+
+    def toJson(self) -> dict:
+        return {"operations": [operation.toJson() for operation in self.operations]}
+
+    @staticmethod
+    def fromJson(d: dict) -> LeaguePatch:
+        return LeaguePatch(
+            operations=[
+                PatchOperation.fromJson(operationDict)
+                for operationDict in d["operations"]
+            ]
+        )
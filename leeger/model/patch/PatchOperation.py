@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from leeger.enum.PatchOperationType import PatchOperationType
+from leeger.util.JSONDeserializable import JSONDeserializable
+from leeger.util.JSONSerializable import JSONSerializable
+
+
+@dataclass(kw_only=True, frozen=True)
+class PatchOperation(JSONSerializable, JSONDeserializable):
+    """
+    A single change between two League snapshots.
+
+    Models are found by their natural keys instead of their IDs, since IDs are different every time a League is loaded.
+        - Owners by name
+        - Years by year number
+        - Teams by the name of their owner
+        - Divisions by name
+        - Weeks by week number
+        - Matchups by the names of the owners of both teams, in sorted order
+    """
+
+    operationType: PatchOperationType
+    yearNumber: Optional[int] = None
+    weekNumber: Optional[int] = None
+    # the natural key of the model this operation is for
+    key: Optional[str | tuple[str, str]] = None
+    # the added model, the new name, or the changed fields with their new values
+    value: Any = None
+    # the changed fields with their old values
+    previousValue: Any = None
+
+    def toJson(self) -> dict:
+        d = {"operationType": self.operationType.name}
+        for fieldName in ("yearNumber", "weekNumber", "key", "value", "previousValue"):
+            fieldValue = getattr(self, fieldName)
+            if fieldValue is not None:
+                d[fieldName] = (
+                    list(fieldValue) if isinstance(fieldValue, tuple) else fieldValue
+                )
+        return d
+
+    @staticmethod
+    def fromJson(d: dict) -> PatchOperation:
+        key = d.get("key")
+        return PatchOperation(
+            operationType=PatchOperationType[d["operationType"]],
+            yearNumber=d.get("yearNumber"),
+            weekNumber=d.get("weekNumber"),
+            key=tuple(key) if isinstance(key, list) else key,
+            value=d.get("value"),
+            previousValue=d.get("previousValue"),
+        )
@@ -0,0 +1,2 @@
+from .LeaguePatch import LeaguePatch
+from .PatchOperation import PatchOperation
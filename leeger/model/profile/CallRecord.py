@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class CallRecord:
+    """
+    A single profiled call.
+    """
+
+    # the profiled function, like "AWALYearCalculator.getAWAL" or "yearValidation.runAllChecks"
+    name: str
+    # seconds from the start to the end of the call
+    totalTime: float
+    # seconds spent in the call, not counting time spent in other profiled calls it made
+    selfTime: float
+    # the year number of the first Year given to the call, if any
+    yearNumber: Optional[int] = None
+    # whether the call was answered from a cache, None if the function has no cache or other calls to it were made at the same time
+    cacheHit: Optional[bool] = None
+    # whether the call was made from inside another call to the same function
+    recursive: bool = False
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from leeger.model.profile.CallRecord import CallRecord
+from leeger.util.JSONSerializable import JSONSerializable
+
+
+@dataclass(kw_only=True)
+class FunctionStats(JSONSerializable):
+    """
+    The combined CallRecords of a single profiled function.
+    """
+
+    name: str
+    calls: int = 0
+    # total time does not count recursive calls, since their time is already in the call that made them
+    totalTime: float = 0.0
+    selfTime: float = 0.0
+    cacheHits: int = 0
+    # year number -> stats for the calls given that Year
+    years: dict[int, FunctionStats] = field(default_factory=dict)
+
+    def add(self, callRecord: CallRecord) -> None:
+        self.__addTotals(callRecord)
+        if callRecord.yearNumber is not None:
+            if callRecord.yearNumber not in self.years:
+                self.years[callRecord.yearNumber] = FunctionStats(name=self.name)
+            self.years[callRecord.yearNumber].__addTotals(callRecord)
+
+    def __addTotals(self, callRecord: CallRecord) -> None:
+        self.calls += 1
+        if not callRecord.recursive:
+            self.totalTime += callRecord.totalTime
+        self.selfTime += callRecord.selfTime
+        if callRecord.cacheHit:
+            self.cacheHits += 1
+
+    def toJson(self) -> dict:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "totalTime": self.totalTime,
+            "selfTime": self.selfTime,
+            "cacheHits": self.cacheHits,
+            "years": {
+                yearNumber: yearStats.toJson()
+                for yearNumber, yearStats in self.years.items()
+            },
+        }
@@ -0,0 +1,2 @@
+from .CallRecord import CallRecord
+from .FunctionStats import FunctionStats
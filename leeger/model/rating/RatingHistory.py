@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+import numpy
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class RatingHistory:
+    """
+    The rating of each Owner after each Week.
+    Row i is the Week at weeks[i] (as (year number, week number)) and column j is the Owner at ownerIds[j].
+    """
+
+    weeks: list[tuple[int, int]]
+    ownerIds: list[str]
+    # float, shape (Weeks, Owners), NaN until the Owner's first game
+    ratings: numpy.ndarray
+
+    def getCurrentRatings(self) -> dict[str, float]:
+        """
+        Returns the rating of each Owner after the last Week, leaving out Owners with no games.
+
+        Example response:
+            {
+            "someOwnerId": 1563.2,
+            "someOtherOwnerId": 1471.9,
+            ...
+            }
+        """
+        if len(self.weeks) == 0:
+            return dict()
+        return {
+            ownerId: float(rating)
+            for ownerId, rating in zip(self.ownerIds, self.ratings[-1])
+            if not numpy.isnan(rating)
+        }
+
+    def getRankings(self) -> list[str]:
+        """
+        Returns the IDs of the Owners with a rating, highest rating first.
+        """
+        currentRatings = self.getCurrentRatings()
+        return sorted(currentRatings, key=lambda ownerId: -currentRatings[ownerId])
+
+    def getRatingHistory(self, ownerId: str) -> list[float]:
+        """
+        Returns the rating of the given Owner after each Week.
+
+        Example response:
+            [nan, 1516.0, 1499.3, 1517.1, ...]
+        """
+        return self.ratings[:, self.ownerIds.index(ownerId)].tolist()
@@ -0,0 +1 @@
+from .RatingHistory import RatingHistory
@@ -0,0 +1,31 @@
+from dataclasses import asdict, dataclass
+
+from leeger.util.JSONSerializable import JSONSerializable
+
+
+@dataclass(kw_only=True, frozen=True)
+class MatchupRecord(JSONSerializable):
+    """
+    A single Matchup in a single Week, from one team's side.
+    """
+
+    yearNumber: int
+    weekNumber: int
+    matchupId: str
+    teamId: str
+    ownerId: str
+    opponentTeamId: str
+    opponentOwnerId: str
+    pointsFor: float | int
+    pointsAgainst: float | int
+
+    @property
+    def margin(self) -> float | int:
+        return self.pointsFor - self.pointsAgainst
+
+    @property
+    def combinedScore(self) -> float | int:
+        return self.pointsFor + self.pointsAgainst
+
+    def toJson(self) -> dict:
+        return asdict(self)
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+
+from leeger.model.records.MatchupRecord import MatchupRecord
+from leeger.model.records.StreakRecord import StreakRecord
+from leeger.util.JSONSerializable import JSONSerializable
+
+
+@dataclass(kw_only=True, frozen=True)
+class RecordsReport(JSONSerializable):
+    """
+    The top records over every Matchup seen, best first.
+    Records that are equal are in the order they happened.
+    """
+
+    highestScores: list[MatchupRecord]
+    lowestScores: list[MatchupRecord]
+    # from the winning team's side (or team A's side for a tie)
+    highestCombinedScores: list[MatchupRecord]
+    biggestBlowouts: list[MatchupRecord]
+    longestOwnerWinStreaks: list[StreakRecord]
+    longestOwnerLosingStreaks: list[StreakRecord]
+    longestTeamWinStreaks: list[StreakRecord]
+    longestTeamLosingStreaks: list[StreakRecord]
+    # ownerId -> their highest score
+    bestWeekByOwner: dict[str, MatchupRecord]
+    # ownerId -> the streak they are on, Owners whose last game was a tie have none
+    currentOwnerStreaks: dict[str, StreakRecord]
+
+    def toJson(self) -> dict:
+        return {
+            "highestScores": [r.toJson() for r in self.highestScores],
+            "lowestScores": [r.toJson() for r in self.lowestScores],
+            "highestCombinedScores": [r.toJson() for r in self.highestCombinedScores],
+            "biggestBlowouts": [r.toJson() for r in self.biggestBlowouts],
+            "longestOwnerWinStreaks": [r.toJson() for r in self.longestOwnerWinStreaks],
+            "longestOwnerLosingStreaks": [
+                r.toJson() for r in self.longestOwnerLosingStreaks
+            ],
+            "longestTeamWinStreaks": [r.toJson() for r in self.longestTeamWinStreaks],
+            "longestTeamLosingStreaks": [
+                r.toJson() for r in self.longestTeamLosingStreaks
+            ],
+            "bestWeekByOwner": {
+                ownerId: r.toJson() for ownerId, r in self.bestWeekByOwner.items()
+            },
+            "currentOwnerStreaks": {
+                ownerId: r.toJson() for ownerId, r in self.currentOwnerStreaks.items()
+            },
+        }
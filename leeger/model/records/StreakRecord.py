@@ -0,0 +1,26 @@
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from leeger.util.JSONSerializable import JSONSerializable
+
+
+@dataclass(kw_only=True, frozen=True)
+class StreakRecord(JSONSerializable):
+    """
+    A run of wins or losses in a row by an Owner (across Years) or a Team (within a Year).
+    """
+
+    ownerId: str
+    # only set for Team streaks
+    teamId: Optional[str]
+    isWinStreak: bool
+    length: int
+    startYearNumber: int
+    startWeekNumber: int
+    endYearNumber: int
+    endWeekNumber: int
+    # whether the streak was still going after the last Week added
+    isActive: bool
+
+    def toJson(self) -> dict:
+        return asdict(self)
@@ -0,0 +1,3 @@
+from .MatchupRecord import MatchupRecord
+from .RecordsReport import RecordsReport
+from .StreakRecord import StreakRecord
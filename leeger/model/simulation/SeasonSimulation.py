@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+from leeger.util.Deci import Deci
+
+
+@dataclass(kw_only=True, frozen=True)
+class SeasonSimulation:
+    """
+    The outcome of simulating the rest of a Year many times.
+    Probabilities are the share of simulated seasons each outcome happened in.
+    """
+
+    numberOfSimulations: int
+    # Team IDs in the same order as Year.teams
+    teamIds: list[str]
+    # teamId -> probability of finishing the regular season as each seed, index 0 is the 1st seed
+    seedProbabilities: dict[str, list[Deci]]
+    playoffProbabilities: dict[str, Deci]
+    championshipProbabilities: dict[str, Deci]
+    # teamId -> average regular season WAL, including the games already played
+    averageWAL: dict[str, Deci]
+
+    def getSeedProbability(self, teamId: str, seed: int) -> Deci:
+        """
+        Returns the probability of the given Team finishing as the given seed (starting at 1).
+        """
+        return self.seedProbabilities[teamId][seed - 1]
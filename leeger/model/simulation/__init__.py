@@ -0,0 +1 @@
+from .SeasonSimulation import SeasonSimulation
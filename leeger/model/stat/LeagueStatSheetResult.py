@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from leeger.model.stat.AllTimeStatSheet import AllTimeStatSheet
+
+
+@dataclass(kw_only=True, frozen=True)
+class LeagueStatSheetResult:
+    """
+    The result of computing the stat sheet for a single League in a batch.
+    Either statSheet is set or (if the League could not be read, was invalid or its stats could not be computed) error and errorType are.
+    """
+
+    # position of the League in the given Leagues
+    index: int
+    leagueId: Optional[str]
+    leagueName: Optional[str]
+    statSheet: Optional[AllTimeStatSheet] = None
+    error: Optional[str] = None
+    errorType: Optional[str] = None
+    # seconds taken to compute the stat sheet (or to fail)
+    computeTime: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
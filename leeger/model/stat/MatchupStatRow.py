@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class MatchupStatRow:
+    """
+    One side of a Matchup, as seen by the team the row is "for".
+    Each Matchup has 2 rows, one for team A and one for team B.
+    """
+
+    # the Matchup ID followed by "A" or "B" for the side of the Matchup this row is for
+    modifiedMatchupId: str
+    matchupId: str
+    yearNumber: int
+    weekNumber: int
+    teamForName: str
+    ownerForId: str
+    teamAgainstName: str
+    ownerAgainstId: str
+    matchupType: str
+    pointsFor: float | int
+    pointsAgainst: float | int
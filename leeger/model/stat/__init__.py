@@ -1,2 +1,4 @@
 from .AllTimeStatSheet import AllTimeStatSheet
+from .LeagueStatSheetResult import LeagueStatSheetResult
+from .MatchupStatRow import MatchupStatRow
 from .YearStatSheet import YearStatSheet
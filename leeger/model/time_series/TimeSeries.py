@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+import numpy
+
+from leeger.enum.TimeSeriesStat import TimeSeriesStat
+
+
+@dataclass(kw_only=True, frozen=True, eq=False)
+class TimeSeries:
+    """
+    Week-by-week values of stats for each Team (in a Year) or Owner (all-time).
+    Row i is the Week at weeks[i] (as (year number, week number)) and column j is the Team or Owner at ids[j].
+    """
+
+    weeks: list[tuple[int, int]]
+    # Team IDs for a Year, Owner IDs all-time
+    ids: list[str]
+    # number of Weeks in each rolling window
+    window: int
+    # float, shape (Weeks, ids), NaN where there is no value yet (or no games in the window)
+    values: dict[TimeSeriesStat, numpy.ndarray]
+
+    def getSeries(self, stat: TimeSeriesStat, id_: str) -> list[float]:
+        """
+        Returns the value of the given stat for the given Team or Owner in each Week.
+
+        Example response:
+            [nan, 101.2, 98.75, 110.4, ...]
+        """
+        if stat not in self.values:
+            raise ValueError(f"Stat '{stat.value}' is not in this TimeSeries.")
+        return self.values[stat][:, self.ids.index(id_)].tolist()
@@ -0,0 +1 @@
+from .TimeSeries import TimeSeries
@@ -0,0 +1,422 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Hashable, Iterable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from leeger.calculator import all_time_calculator, year_calculator
+from leeger.exception import DoesNotExistException, InvalidFilterException
+from leeger.model.league.League import League
+from leeger.model.league.Year import Year
+from leeger.util.CustomLogger import CustomLogger
+from leeger.util.excel_helper import iterAllTimeMatchupRows, iterYearMatchupRows
+from leeger.util.json_stream import iterLeaguesJson
+from leeger.util.stat_sheet import leagueStatSheet, yearStatSheet
+from leeger.validate import leagueValidation
+
+"""
+Stats Server
+
+    - Serves stats for Leagues as JSON over HTTP, using only the standard library.
+    - Leagues are loaded from League JSON (the format written by League.toJson() and writeLeagueJson()) and validated once, when they are added.
+    - Responses are cached by (League fingerprint, endpoint, filters), the least recently used response is evicted once the cache is full.
+    - Each request is handled in its own thread, concurrent requests for a response that isn't cached yet wait for a single computation of it.
+    - Binds to 127.0.0.1 by default, so nothing is reachable from outside the machine.
+
+Endpoints (filters are given as query parameters, e.g. ?onlyRegularSeason=true&weekNumberEnd=10):
+    GET /leagues
+    GET /leagues/<leagueId>/stats
+    GET /leagues/<leagueId>/matchups
+    GET /leagues/<leagueId>/calculators/<calculatorName>/<methodName>
+    GET /leagues/<leagueId>/years/<yearNumber>/stats
+    GET /leagues/<leagueId>/years/<yearNumber>/matchups
+    GET /leagues/<leagueId>/years/<yearNumber>/calculators/<calculatorName>/<methodName>
+
+Run from the command line:
+    python -m leeger.server league.json [otherLeague.json ...] --port 8000
+
+"""
+
+__LOGGER = CustomLogger.getLogger(__name__)
+
+__BOOL_FILTER_NAMES = ("onlyChampionship", "onlyPostSeason", "onlyRegularSeason")
+
+
+class _RequestError(Exception):
+    """
+    Raised while handling a request that can't be answered, holds the HTTP status to respond with.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _InFlightRequest:
+    def __init__(self):
+        self.done = threading.Event()
+        self.body: Optional[bytes] = None
+
+
+class ResultCache:
+    """
+    Thread-safe least recently used cache.
+    A maxSize of 0 turns caching off.
+    """
+
+    def __init__(self, maxSize: int = 256):
+        if maxSize < 0:
+            raise ValueError("'maxSize' cannot be less than 0.")
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self.__values: OrderedDict[Hashable, Any] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the value cached for the given key, or None if there isn't one.
+        """
+        with self.__lock:
+            value = self.__values.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.__values.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Caches the given value, evicting the least recently used value if the cache is full.
+        """
+        if self.maxSize == 0:
+            return
+        with self.__lock:
+            self.__values[key] = value
+            self.__values.move_to_end(key)
+            while len(self.__values) > self.maxSize:
+                self.__values.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__values.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class StatsService:
+    """
+    Answers stats requests for the Leagues added to it, independent of any HTTP server.
+
+    Example:
+        statsService = StatsService([league], cacheSize=512)
+        status, body = statsService.handle("/leagues/someLeagueId/years/2022/stats?onlyRegularSeason=true")
+    """
+
+    __LOGGER = CustomLogger.getLogger(__name__)
+    __YEAR_INT_FILTER_NAMES = ("weekNumberStart", "weekNumberEnd")
+    __ALL_TIME_INT_FILTER_NAMES = (
+        "yearNumberStart",
+        "weekNumberStart",
+        "yearNumberEnd",
+        "weekNumberEnd",
+    )
+
+    def __init__(self, leagues: Iterable[League] = (), *, cacheSize: int = 256):
+        self.cache = ResultCache(cacheSize)
+        # League ID -> (League, League fingerprint)
+        self.__leagues: dict[str, tuple[League, str]] = dict()
+        # cache key -> the request computing the response for it
+        self.__inFlightRequests: dict[tuple, _InFlightRequest] = dict()
+        self.__lock = threading.Lock()
+        for league in leagues:
+            self.addLeague(league)
+
+    def addLeague(self, league: League) -> None:
+        """
+        Validates and adds the given League, replacing any League with the same ID.
+        Cached responses for a replaced League are never used again, since the new League has a new fingerprint.
+        """
+        leagueValidation.runAllChecks(league)
+        fingerprint = league.fingerprint().hex()
+        with self.__lock:
+            self.__leagues[league.id] = (league, fingerprint)
+
+    def loadLeagues(self, filePath: str) -> list[League]:
+        """
+        Adds every League in the League JSON file at the given path.
+        Returns the Leagues that were added.
+        """
+        with open(filePath, "r", encoding="utf8") as f:
+            leagues = list(iterLeaguesJson(f))
+        for league in leagues:
+            self.addLeague(league)
+        return leagues
+
+    def handle(self, target: str) -> tuple[int, bytes]:
+        """
+        Returns the HTTP status and JSON body for the given request target (path and query string).
+        """
+        try:
+            return 200, self.__getResponseBody(target)
+        except _RequestError as e:
+            return e.status, _toJsonBytes({"error": str(e)})
+        except (InvalidFilterException, DoesNotExistException, ValueError) as e:
+            # filters that aren't valid for the League (e.g. a Year it doesn't have) or can't be used together
+            return 400, _toJsonBytes({"error": str(e)})
+        except Exception:
+            self.__LOGGER.exception("Error handling '%s'.", target)
+            return 500, _toJsonBytes({"error": "Internal server error."})
+
+    def __getResponseBody(self, target: str) -> bytes:
+        splitTarget = urlsplit(target)
+        parts = [part for part in splitTarget.path.split("/") if part != ""]
+        if len(parts) == 0 or parts[0] != "leagues":
+            raise _RequestError(404, f"No endpoint at '{splitTarget.path}'.")
+        if len(parts) == 1:
+            return _toJsonBytes(self.__getLeagueSummaries())
+
+        with self.__lock:
+            leagueAndFingerprint = self.__leagues.get(parts[1])
+        if leagueAndFingerprint is None:
+            raise _RequestError(404, f"No League with ID '{parts[1]}'.")
+        league, fingerprint = leagueAndFingerprint
+        endpoint = tuple(parts[2:])
+        if len(endpoint) >= 2 and endpoint[0] == "years":
+            model = self.__getYear(league, endpoint[1])
+            calculatorModule = year_calculator
+            filters = _parseFilters(splitTarget.query, self.__YEAR_INT_FILTER_NAMES)
+            endpointAction = endpoint[2:]
+        else:
+            model = league
+            calculatorModule = all_time_calculator
+            filters = _parseFilters(splitTarget.query, self.__ALL_TIME_INT_FILTER_NAMES)
+            endpointAction = endpoint
+
+        function = self.__getEndpointFunction(
+            endpointAction, calculatorModule, model is league
+        )
+        cacheKey = (fingerprint, endpoint, tuple(sorted(filters.items())))
+        body = self.cache.get(cacheKey)
+        if body is None:
+            # the League was validated when it was added
+            body = self.__computeOnce(
+                cacheKey,
+                lambda: _toJsonBytes(function(model, validate=False, **filters)),
+            )
+        return body
+
+    def __computeOnce(self, cacheKey: tuple, compute: Callable[[], bytes]) -> bytes:
+        """
+        Computes and caches the response for the given cache key.
+        Requests for a cache key that is already being computed wait for that response instead of computing it again.
+        """
+        with self.__lock:
+            inFlightRequest = self.__inFlightRequests.get(cacheKey)
+            isComputing = inFlightRequest is None
+            if isComputing:
+                inFlightRequest = _InFlightRequest()
+                self.__inFlightRequests[cacheKey] = inFlightRequest
+        if not isComputing:
+            inFlightRequest.done.wait()
+            if inFlightRequest.body is not None:
+                return inFlightRequest.body
+            # the request being waited on failed, so compute here to raise the same error
+            return compute()
+        try:
+            inFlightRequest.body = compute()
+            self.cache.put(cacheKey, inFlightRequest.body)
+            return inFlightRequest.body
+        finally:
+            with self.__lock:
+                del self.__inFlightRequests[cacheKey]
+            inFlightRequest.done.set()
+
+    def __getLeagueSummaries(self) -> list[dict]:
+        with self.__lock:
+            leagues = [league for league, _ in self.__leagues.values()]
+        return [
+            {
+                "id": league.id,
+                "name": league.name,
+                "yearNumbers": [year.yearNumber for year in league.years],
+            }
+            for league in leagues
+        ]
+
+    @staticmethod
+    def __getYear(league: League, yearNumberStr: str) -> Year:
+        for year in league.years:
+            if str(year.yearNumber) == yearNumberStr:
+                return year
+        raise _RequestError(404, f"League '{league.id}' has no Year '{yearNumberStr}'.")
+
+    @staticmethod
+    def __getEndpointFunction(
+        endpointAction: tuple[str, ...], calculatorModule: Any, isAllTime: bool
+    ) -> Callable[..., Any]:
+        if endpointAction == ("stats",):
+            return _allTimeStatSheetToDict if isAllTime else _yearStatSheetToDict
+        if endpointAction == ("matchups",):
+            return _allTimeMatchupRows if isAllTime else _yearMatchupRows
+        if len(endpointAction) == 3 and endpointAction[0] == "calculators":
+            calculatorName, methodName = endpointAction[1:]
+            if calculatorName not in calculatorModule.__all__:
+                raise _RequestError(404, f"No calculator named '{calculatorName}'.")
+            calculator = getattr(calculatorModule, calculatorName)
+            # only public methods of the calculator itself, not the ones inherited from the parent calculators
+            if methodName.startswith("_") or methodName not in vars(calculator):
+                raise _RequestError(
+                    404, f"'{calculatorName}' has no method named '{methodName}'."
+                )
+            return getattr(calculator, methodName)
+        raise _RequestError(404, f"No endpoint at '{'/'.join(endpointAction)}'.")
+
+
+class StatsServer(ThreadingHTTPServer):
+    """
+    HTTP server for a StatsService, each request is handled in its own thread.
+
+    Example:
+        statsServer = StatsServer(StatsService([league]), port=8000)
+        statsServer.serve_forever()
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, statsService: StatsService, *, host: str = "127.0.0.1", port: int = 8000
+    ):
+        self.statsService = statsService
+        super().__init__((host, port), _StatsRequestHandler)
+
+
+class _StatsRequestHandler(BaseHTTPRequestHandler):
+    __LOGGER = CustomLogger.getLogger(__name__)
+    # keep connections open so clients can send many requests over one connection
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, so don't let the body wait on the client's ACK of the headers
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        status, body = self.server.statsService.handle(self.path)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        self.__LOGGER.debug(format, *args)
+
+
+def serveStats(
+    filePaths: Iterable[str],
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    cacheSize: int = 256,
+) -> None:
+    """
+    Loads the Leagues in the given League JSON files and serves stats for them until interrupted.
+    """
+    statsService = StatsService(cacheSize=cacheSize)
+    for filePath in filePaths:
+        for league in statsService.loadLeagues(filePath):
+            __LOGGER.info("Loaded League '%s' (%s).", league.name, league.id)
+    with StatsServer(statsService, host=host, port=port) as statsServer:
+        __LOGGER.info("Serving stats at http://%s:%s", host, statsServer.server_port)
+        try:
+            statsServer.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def _parseFilters(query: str, intFilterNames: tuple[str, ...]) -> dict[str, Any]:
+    """
+    Returns the filters in the given query string as calculator kwargs.
+
+    Example response:
+        {
+            "onlyRegularSeason": True,
+            "weekNumberEnd": 10
+        }
+    """
+    filters = dict()
+    for name, values in parse_qs(query, keep_blank_values=True).items():
+        if len(values) > 1:
+            raise _RequestError(400, f"Filter '{name}' was given more than once.")
+        value = values[0]
+        if name in __BOOL_FILTER_NAMES:
+            if value not in ("true", "false"):
+                raise _RequestError(400, f"Filter '{name}' must be 'true' or 'false'.")
+            filters[name] = value == "true"
+        elif name in intFilterNames:
+            try:
+                filters[name] = int(value)
+            except ValueError:
+                raise _RequestError(400, f"Filter '{name}' must be an integer.")
+        else:
+            raise _RequestError(400, f"'{name}' is not a valid filter.")
+    return filters
+
+
+def _toJsonValue(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type '{type(value).__name__}' can't be made JSON.")
+
+
+def _toJsonBytes(value: Any) -> bytes:
+    return json.dumps(value, default=_toJsonValue).encode("utf8")
+
+
+def _statSheetToDict(statSheet: Any) -> dict[str, dict]:
+    # optional stats are None when the League or Year doesn't have them
+    return {
+        field.name: getattr(statSheet, field.name)
+        for field in dataclasses.fields(statSheet)
+        if getattr(statSheet, field.name) is not None
+    }
+
+
+def _yearStatSheetToDict(year: Year, **kwargs) -> dict[str, dict]:
+    return _statSheetToDict(yearStatSheet(year, **kwargs))
+
+
+def _allTimeStatSheetToDict(league: League, **kwargs) -> dict[str, dict]:
+    return _statSheetToDict(leagueStatSheet(league, **kwargs))
+
+
+def _yearMatchupRows(year: Year, **kwargs) -> list[dict]:
+    kwargs.pop("validate")
+    return [dataclasses.asdict(row) for row in iterYearMatchupRows(year, **kwargs)]
+
+
+def _allTimeMatchupRows(league: League, **kwargs) -> list[dict]:
+    kwargs.pop("validate")
+    return [dataclasses.asdict(row) for row in iterAllTimeMatchupRows(league, **kwargs)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serve stats for Leagues in League JSON files."
+    )
+    parser.add_argument("filePaths", nargs="+", help="League JSON files to load")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--cache-size", type=int, default=256)
+    args = parser.parse_args()
+    serveStats(
+        args.filePaths, host=args.host, port=args.port, cacheSize=args.cache_size
+    )
@@ -2,27 +2,75 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
 
-from sleeper.util.CustomFormatter import CustomFormatter
+from leeger.util.CustomFormatter import CustomFormatter
 
 
 class CustomLogger:
-    @staticmethod
-    def getLogger() -> logging.Logger:
+    """
+    All leeger loggers are children of the "leeger" logger, which is set up once the first time a logger is requested.
+    Any level or handler set on the "leeger" logger (or its children) by the user is kept.
+    A stdout handler is only added if neither the "leeger" logger nor the root logger have handlers.
+    """
+
+    __ROOT_LOGGER_NAME = "leeger"
+    # level used to silence all leeger logging, above CRITICAL so nothing is logged
+    __SILENCED_LEVEL = logging.CRITICAL + 1
+    __LOCK = threading.Lock()
+    __configured = False
+    # level of the "leeger" logger before logging was turned off
+    __levelBeforeDisabled = None
+
+    @classmethod
+    def getLogger(cls, name: str = __ROOT_LOGGER_NAME) -> logging.Logger:
+        """
+        Returns the logger with the given name.
+        Pass the module's __name__ (e.g. "leeger.model.league.Matchup") to get a logger in the "leeger" hierarchy.
+        """
+        if not cls.__configured:
+            cls.__configure()
+        return logging.getLogger(name)
+
+    @classmethod
+    def setEnabled(cls, enabled: bool) -> None:
+        """
+        Turns all leeger logging on or off.
+        Turning it off is useful for batch jobs, as log calls made while it is off return right away.
+        """
+        logger = cls.getLogger()
+        with cls.__LOCK:
+            if not enabled and cls.__levelBeforeDisabled is None:
+                cls.__levelBeforeDisabled = logger.level
+                logger.setLevel(cls.__SILENCED_LEVEL)
+            elif enabled and cls.__levelBeforeDisabled is not None:
+                logger.setLevel(cls.__levelBeforeDisabled)
+                cls.__levelBeforeDisabled = None
+
+    @classmethod
+    def isEnabled(cls) -> bool:
+        return cls.__levelBeforeDisabled is None
+
+    @classmethod
+    def __configure(cls) -> None:
         # set up logging
         # https://docs.python.org/3/howto/logging.html
-        logger = logging.getLogger("root")
-        logger.setLevel(logging.INFO)
-        if not logger.hasHandlers():
-            # set up handler
-            handler = logging.StreamHandler()
-            handler.setLevel(logging.INFO)
-            handler.setStream(sys.stdout)
-            # set up formatter
-            formatter = CustomFormatter(
-                "%(asctime)-8s %(levelname)-8s %(message)s", "%Y-%m-%d %H:%M:%S"
-            )
-            # set in each other
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        return logger
+        with cls.__LOCK:
+            if cls.__configured:
+                return
+            logger = logging.getLogger(cls.__ROOT_LOGGER_NAME)
+            if logger.level == logging.NOTSET:
+                logger.setLevel(logging.INFO)
+            # leave it to the application's handlers if it has set up logging
+            if not logger.handlers and not logging.getLogger().handlers:
+                # set up handler
+                handler = logging.StreamHandler()
+                handler.setStream(sys.stdout)
+                # set up formatter
+                formatter = CustomFormatter(
+                    "%(asctime)-8s %(levelname)-8s %(message)s", "%Y-%m-%d %H:%M:%S"
+                )
+                # set in each other
+                handler.setFormatter(formatter)
+                logger.addHandler(handler)
+            cls.__configured = True
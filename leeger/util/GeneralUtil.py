@@ -21,7 +21,7 @@ class GeneralUtil:
         Logs a warning for each present kwarg in the given dict.
         Will ignore kwargs with a key in excludeKeys.
         """
-        LOGGER = CustomLogger.getLogger()
+        LOGGER = CustomLogger.getLogger(__name__)
 
         excludeKeys = excludeKeys if excludeKeys is not None else list()
         # get the list of common kwargs that sometimes linger in kwargs to be passed down and used later.
@@ -32,7 +32,7 @@ class GeneralUtil:
 
         unused_kwargs = [kwarg for kwarg in kwargs.keys() if kwarg not in excludeKeys]
         for kwarg in unused_kwargs:
-            LOGGER.warning(f"Keyword argument '{kwarg}' unused.")
+            LOGGER.warning("Keyword argument '%s' unused.", kwarg)
 
     @staticmethod
     def safeSum(*numbers) -> Optional[Deci | int | float]:
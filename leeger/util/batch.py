@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from leeger.model.league.League import League
+from leeger.model.stat.LeagueStatSheetResult import LeagueStatSheetResult
+from leeger.util.CustomLogger import CustomLogger
+from leeger.util.stat_sheet import leagueStatSheet
+from leeger.validate import leagueValidation
+
+"""
+Batch
+
+    - Computes stat sheets for many independent Leagues in a process pool.
+    - Leagues are sent to workers as compact JSON strings in chunks, rather than as pickled object graphs.
+    - Results are yielded as soon as their chunk finishes, so they are NOT in the same order as the given Leagues.
+    - A League that can't be serialized or read, is invalid or fails to compute gives an error result, the rest of the batch carries on.
+
+"""
+
+__DEFAULT_CHUNK_SIZE = 8
+
+
+class StatSheetBatch:
+    """
+    Iterate over this to compute each League's stat sheet and get a LeagueStatSheetResult for it.
+    The throughput so far can be read at any time (and in full once iteration is done).
+    """
+
+    # chunks waiting in the pool per worker, so Leagues are only serialized shortly before they are needed
+    __CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+    def __init__(
+        self,
+        leagues: Iterable[League],
+        *,
+        maxWorkers: Optional[int],
+        chunkSize: int,
+        **kwargs,
+    ):
+        self.__leagues = leagues
+        self.__maxWorkers = (
+            maxWorkers if maxWorkers is not None else os.cpu_count() or 1
+        )
+        self.__chunkSize = chunkSize
+        self.__kwargs = kwargs
+        self.__started = False
+        self.__startTime: Optional[float] = None
+        self.__endTime: Optional[float] = None
+        self.numberOfLeaguesSucceeded = 0
+        self.numberOfLeaguesFailed = 0
+
+    @property
+    def numberOfLeaguesCompleted(self) -> int:
+        return self.numberOfLeaguesSucceeded + self.numberOfLeaguesFailed
+
+    @property
+    def elapsedTime(self) -> float:
+        """
+        Seconds since iteration started, up until it finished.
+        """
+        if self.__startTime is None:
+            return 0.0
+        endTime = self.__endTime if self.__endTime is not None else time.perf_counter()
+        return endTime - self.__startTime
+
+    @property
+    def leaguesPerSecond(self) -> float:
+        elapsedTime = self.elapsedTime
+        return self.numberOfLeaguesCompleted / elapsedTime if elapsedTime > 0 else 0.0
+
+    def __iter__(self) -> Iterator[LeagueStatSheetResult]:
+        if self.__started:
+            raise RuntimeError("A StatSheetBatch can only be iterated once.")
+        self.__started = True
+        self.__startTime = time.perf_counter()
+        if self.__maxWorkers <= 1:
+            results = self.__iterInProcess()
+        else:
+            results = self.__iterInPool()
+        for result in results:
+            if result.succeeded:
+                self.numberOfLeaguesSucceeded += 1
+            else:
+                self.numberOfLeaguesFailed += 1
+            yield result
+        self.__endTime = time.perf_counter()
+        CustomLogger.getLogger(__name__).info(
+            "Computed stat sheets for %d Leagues (%d failed) in %.2fs (%.2f Leagues/s).",
+            self.numberOfLeaguesCompleted,
+            self.numberOfLeaguesFailed,
+            self.elapsedTime,
+            self.leaguesPerSecond,
+        )
+
+    def __iterInProcess(self) -> Iterator[LeagueStatSheetResult]:
+        for index, league in enumerate(self.__leagues):
+            yield _computeStatSheet(index, league, self.__kwargs)
+
+    def __iterInPool(self) -> Iterator[LeagueStatSheetResult]:
+        chunks = _iterChunks(enumerate(self.__leagues), self.__chunkSize)
+        maxChunksInFlight = self.__maxWorkers * self.__CHUNKS_IN_FLIGHT_PER_WORKER
+        with ProcessPoolExecutor(max_workers=self.__maxWorkers) as executor:
+            inFlight: set[Future] = set()
+            for chunk, errorResults in islice(chunks, maxChunksInFlight):
+                yield from errorResults
+                if chunk:
+                    inFlight.add(
+                        executor.submit(
+                            _computeStatSheetsForChunk, chunk, self.__kwargs
+                        )
+                    )
+            while inFlight:
+                done, inFlight = wait(inFlight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # top up the pool before handing back results, so workers aren't idle while the caller works
+                    for chunk, errorResults in islice(chunks, 1):
+                        yield from errorResults
+                        if chunk:
+                            inFlight.add(
+                                executor.submit(
+                                    _computeStatSheetsForChunk, chunk, self.__kwargs
+                                )
+                            )
+                    yield from future.result()
+
+
+def computeStatSheets(
+    leagues: Iterable[League],
+    *,
+    maxWorkers: Optional[int] = None,
+    chunkSize: int = __DEFAULT_CHUNK_SIZE,
+    **kwargs,
+) -> StatSheetBatch:
+    """
+    Returns a StatSheetBatch that, when iterated, computes the all-time stat sheet for each of the given Leagues.
+    The given iterable is consumed lazily, so Leagues can be loaded or generated one at a time.
+    Any kwargs (e.g. filters like onlyRegularSeason) are passed to leagueStatSheet() for every League.
+
+    Leagues are computed in a process pool with up to maxWorkers processes (defaults to the number of CPUs),
+    chunkSize Leagues at a time. Give maxWorkers=1 to compute everything in the current process.
+
+    Example:
+        batch = computeStatSheets(leagues, maxWorkers=4, onlyRegularSeason=True)
+        for result in batch:
+            if result.succeeded:
+                save(result.leagueId, result.statSheet)
+            else:
+                print(f"League {result.leagueId} failed: {result.errorType}: {result.error}")
+        print(f"{batch.leaguesPerSecond:.1f} Leagues/s")
+    """
+    if chunkSize < 1:
+        raise ValueError("'chunkSize' must be at least 1.")
+    return StatSheetBatch(leagues, maxWorkers=maxWorkers, chunkSize=chunkSize, **kwargs)
+
+
+def _iterChunks(
+    indexedLeagues: Iterator[tuple[int, League]], chunkSize: int
+) -> Iterator[tuple[list[tuple[int, str]], list[LeagueStatSheetResult]]]:
+    """
+    Yields lists of (index, League JSON string), serializing each League only when its chunk is needed,
+    along with an error result for each League that couldn't be serialized.
+    Only the last chunk can be empty.
+    """
+    while True:
+        chunk = list()
+        errorResults = list()
+        for index, league in indexedLeagues:
+            startTime = time.perf_counter()
+            try:
+                chunk.append(
+                    (index, json.dumps(league.toJson(), separators=(",", ":")))
+                )
+            except Exception as e:
+                errorResults.append(
+                    LeagueStatSheetResult(
+                        index=index,
+                        leagueId=getattr(league, "id", None),
+                        leagueName=getattr(league, "name", None),
+                        error=str(e),
+                        errorType=type(e).__name__,
+                        computeTime=time.perf_counter() - startTime,
+                    )
+                )
+            if len(chunk) == chunkSize:
+                break
+        if not chunk and not errorResults:
+            return
+        yield chunk, errorResults
+
+
+def _computeStatSheetsForChunk(
+    chunk: list[tuple[int, str]], kwargs: dict
+) -> list[LeagueStatSheetResult]:
+    """
+    Runs in a worker process.
+    """
+    results = list()
+    for index, leagueJson in chunk:
+        startTime = time.perf_counter()
+        try:
+            league = League.fromJson(json.loads(leagueJson))
+        except Exception as e:
+            results.append(
+                LeagueStatSheetResult(
+                    index=index,
+                    leagueId=None,
+                    leagueName=None,
+                    error=str(e),
+                    errorType=type(e).__name__,
+                    computeTime=time.perf_counter() - startTime,
+                )
+            )
+            continue
+        results.append(_computeStatSheet(index, league, kwargs))
+    return results
+
+
+def _computeStatSheet(
+    index: int, league: League, kwargs: dict
+) -> LeagueStatSheetResult:
+    startTime = time.perf_counter()
+    kwargs = kwargs.copy()
+    try:
+        # validate once up front rather than in every calculator
+        if kwargs.pop("validate", True):
+            leagueValidation.runAllChecks(league)
+        statSheet = leagueStatSheet(league, validate=False, **kwargs)
+    except Exception as e:
+        return LeagueStatSheetResult(
+            index=index,
+            leagueId=league.id,
+            leagueName=league.name,
+            error=str(e),
+            errorType=type(e).__name__,
+            computeTime=time.perf_counter() - startTime,
+        )
+    return LeagueStatSheetResult(
+        index=index,
+        leagueId=league.id,
+        leagueName=league.name,
+        statSheet=statSheet,
+        computeTime=time.perf_counter() - startTime,
+    )
@@ -0,0 +1,185 @@
+from typing import Optional
+
+import numpy
+
+from leeger.decorator.validators import validateLeague
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.rating.RatingHistory import RatingHistory
+from leeger.util.navigator.MatchupNavigator import MatchupNavigator
+from leeger.util.week_tracker import WeekTracker
+
+"""
+Elo Ratings
+
+    - Rates each Owner with Elo, updated after every game in chronological order across every Year of a League.
+    - Use EloTracker to keep ratings up to date as new Weeks are played, or getEloRatings() to get them for a League at once.
+    - A multi-week matchup is simplified into a single game, which is rated once its last Week (in the Year, when added) is added (see WeekTracker).
+    - Tiebreakers decide the winner of a tied game, a tie with no tiebreaker counts as half a win for each Owner.
+    - Ratings can be pulled back towards the starting rating at the start of each Year with yearRegression.
+    - The rating of each Owner after each Week is kept in a single array that grows as Weeks and Owners are added.
+
+"""
+
+
+class EloTracker(WeekTracker):
+    """
+    Keeps Elo ratings up to date as Weeks are added, which must be in chronological order.
+
+    Example:
+        tracker = EloTracker(kFactor=24)
+        for year in league.years:
+            tracker.addYear(year)
+        ...
+        # once a new Week has been played
+        tracker.addWeek(currentYear, 7)
+        ratingHistory = tracker.getRatingHistory()
+    """
+
+    __DEFAULT_K_FACTOR = 32
+    __DEFAULT_INITIAL_RATING = 1500
+    __INITIAL_CAPACITY = 16
+
+    def __init__(
+        self,
+        *,
+        kFactor: float = __DEFAULT_K_FACTOR,
+        initialRating: float = __DEFAULT_INITIAL_RATING,
+        yearRegression: float = 0,
+    ):
+        if kFactor <= 0:
+            raise ValueError("'kFactor' must be greater than 0.")
+        if not 0 <= yearRegression <= 1:
+            raise ValueError("'yearRegression' must be between 0 and 1.")
+        super().__init__()
+        self.__kFactor = kFactor
+        self.__initialRating = initialRating
+        self.__yearRegression = yearRegression
+        self.__weeks: list[tuple[int, int]] = list()
+        self.__ownerIds: list[str] = list()
+        self.__ownerIdToIndex: dict[str, int] = dict()
+        # current rating of each Owner, NaN until their first game
+        self.__currentRatings = numpy.full(self.__INITIAL_CAPACITY, numpy.nan)
+        # rating of each Owner after each Week, rows and columns past the ones used are spare capacity
+        self.__ratings = numpy.full(
+            (self.__INITIAL_CAPACITY, self.__INITIAL_CAPACITY), numpy.nan
+        )
+
+    def getRatingHistory(self) -> RatingHistory:
+        """
+        Returns the rating of each Owner after every Week added so far.
+        """
+        return RatingHistory(
+            weeks=list(self.__weeks),
+            ownerIds=list(self.__ownerIds),
+            ratings=self.__ratings[: len(self.__weeks), : len(self.__ownerIds)].copy(),
+        )
+
+    def _getState(self) -> tuple[int, int, numpy.ndarray]:
+        # rows and columns added after this are cut off by _setState(), so only the current ratings need to be copied
+        return len(self.__weeks), len(self.__ownerIds), self.__currentRatings.copy()
+
+    def _setState(self, state: tuple[int, int, numpy.ndarray]) -> None:
+        numberOfWeeks, numberOfOwners, currentRatings = state
+        del self.__weeks[numberOfWeeks:]
+        for ownerId in self.__ownerIds[numberOfOwners:]:
+            del self.__ownerIdToIndex[ownerId]
+        del self.__ownerIds[numberOfOwners:]
+        # _endWeek() only fills in the columns of Owners added so far, so clear what later Weeks and Owners left behind
+        self.__ratings[numberOfWeeks:, :] = numpy.nan
+        self.__ratings[:, numberOfOwners:] = numpy.nan
+        self.__currentRatings = numpy.full(len(self.__currentRatings), numpy.nan)
+        self.__currentRatings[: len(currentRatings)] = currentRatings
+
+    def _startYear(self, year: Year) -> None:
+        # pull every rating part of the way back to the starting rating (NaN stays NaN)
+        self.__currentRatings = self.__initialRating + (
+            self.__currentRatings - self.__initialRating
+        ) * (1 - self.__yearRegression)
+
+    def _endWeek(self, year: Year, week: Week) -> None:
+        self.__growTo(len(self.__weeks) + 1, len(self.__ownerIds))
+        self.__ratings[len(self.__weeks), : len(self.__ownerIds)] = (
+            self.__currentRatings[: len(self.__ownerIds)]
+        )
+        self.__weeks.append((year.yearNumber, week.weekNumber))
+
+    def _addGame(
+        self, year: Year, week: Week, matchup: Matchup, teamIdToOwnerId: dict[str, str]
+    ) -> None:
+        a = self.__getOwnerIndex(teamIdToOwnerId[matchup.teamAId])
+        b = self.__getOwnerIndex(teamIdToOwnerId[matchup.teamBId])
+        for i in (a, b):
+            if numpy.isnan(self.__currentRatings[i]):
+                self.__currentRatings[i] = self.__initialRating
+        winnerTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(matchup)
+        if winnerTeamId is None:
+            teamAResult = 0.5
+        else:
+            teamAResult = 1.0 if winnerTeamId == matchup.teamAId else 0.0
+        teamAExpectedResult = 1 / (
+            1 + 10 ** ((self.__currentRatings[b] - self.__currentRatings[a]) / 400)
+        )
+        change = self.__kFactor * (teamAResult - teamAExpectedResult)
+        self.__currentRatings[a] += change
+        self.__currentRatings[b] -= change
+
+    def __getOwnerIndex(self, ownerId: str) -> int:
+        index = self.__ownerIdToIndex.get(ownerId)
+        if index is None:
+            index = len(self.__ownerIds)
+            self.__growTo(len(self.__weeks), index + 1)
+            self.__ownerIds.append(ownerId)
+            self.__ownerIdToIndex[ownerId] = index
+        return index
+
+    def __growTo(self, numberOfWeeks: int, numberOfOwners: int) -> None:
+        """
+        Makes sure there is room for the given number of Weeks and Owners, doubling the arrays when there isn't.
+        """
+        rowCapacity, columnCapacity = self.__ratings.shape
+        if numberOfWeeks <= rowCapacity and numberOfOwners <= columnCapacity:
+            return
+        while rowCapacity < numberOfWeeks:
+            rowCapacity *= 2
+        while columnCapacity < numberOfOwners:
+            columnCapacity *= 2
+        ratings = numpy.full((rowCapacity, columnCapacity), numpy.nan)
+        ratings[: self.__ratings.shape[0], : self.__ratings.shape[1]] = self.__ratings
+        self.__ratings = ratings
+        currentRatings = numpy.full(columnCapacity, numpy.nan)
+        currentRatings[: len(self.__currentRatings)] = self.__currentRatings
+        self.__currentRatings = currentRatings
+
+
+@validateLeague
+def getEloRatings(
+    league: League,
+    *,
+    kFactor: Optional[float] = None,
+    initialRating: Optional[float] = None,
+    yearRegression: float = 0,
+    **kwargs,
+) -> RatingHistory:
+    """
+    Returns the Elo rating of each Owner after each Week in the given League.
+    kFactor (32 by default) is the most a rating can change in a single game and initialRating (1500 by default) is every Owner's starting rating.
+    Filters are the same kwargs the All-Time calculators take.
+
+    Example response:
+        RatingHistory(
+            weeks=[(2022, 1), (2022, 2), ...],
+            ownerIds=["someOwnerId", "someOtherOwnerId", ...],
+            ratings=numpy.array([[1516.0, 1484.0, ...], [1531.3, 1499.3, ...], ...]),
+        )
+    """
+    eloTrackerKwargs = {
+        name: value
+        for name, value in (("kFactor", kFactor), ("initialRating", initialRating))
+        if value is not None
+    }
+    eloTracker = EloTracker(yearRegression=yearRegression, **eloTrackerKwargs)
+    eloTracker._addLeague(league, **kwargs)
+    return eloTracker.getRatingHistory()
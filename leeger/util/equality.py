@@ -1,8 +1,18 @@
+import dataclasses
+import hashlib
+import types
+import typing
 from typing import Any, Optional
 
 from leeger.util.CustomLogger import CustomLogger
 from leeger.util.GeneralUtil import GeneralUtil
 
+# the attribute that a model's cached fingerprint is saved under
+FINGERPRINT_CACHE_ATTRIBUTE = "_fingerprintCache"
+# model type -> (names of its fields that hold plain values, names of its fields that can hold nested models)
+__FIELD_NAMES_BY_TYPE: dict[type, tuple[tuple[str, ...], tuple[str, ...]]] = dict()
+__FIELD_SEPARATOR = "|"
+
 
 def modelEquals(
     *,
@@ -17,6 +27,7 @@ def modelEquals(
     toJsonMethodName: str = "toJson",
     equalityFunctionMap: Optional[dict[str, callable]] = None,
     equalityFunctionKwargsMap: Optional[dict[str, dict]] = None,
+    useFingerprints: bool = False,
 ) -> bool:
     """
     Checks if objA is the same as objB.
@@ -32,6 +43,7 @@ def modelEquals(
     toJsonMethodName: the name of the method to call on these objects that will return the JSON representation of it
     equalityFunctionMap: maps the names of fields to a custom equality function that should be called for them*
     equalityFunctionKwargsMap: maps the names of fields to the kwargs that should be passed into their equalityFunctionMap
+    useFingerprints: whether to return True right away if both objects have already been fingerprinted and have the same modelFingerprint()
 
     *
     - equality functions should take at least 2 parameters (1 parameter for each field value).
@@ -39,7 +51,18 @@ def modelEquals(
     - equality functions should take **kwargs as the 3rd parameter.
     - equality functions will be passed the kwargs from equalityFunctionKwargsMap that match the field name (if given)
     """
-    LOGGER = CustomLogger.getLogger()
+    # fast paths
+    if objA is objB:
+        return True
+    if (
+        useFingerprints
+        and type(objA) is type(objB)
+        # only worth it if both have been fingerprinted before, otherwise building the fingerprints costs more than comparing
+        and FINGERPRINT_CACHE_ATTRIBUTE in objA.__dict__
+        and FINGERPRINT_CACHE_ATTRIBUTE in objB.__dict__
+        and modelFingerprint(objA) == modelFingerprint(objB)
+    ):
+        return True
 
     equalityFunctionMap = dict() if equalityFunctionMap is None else equalityFunctionMap
     equalityFunctionKwargsMap = (
@@ -60,20 +83,26 @@ def modelEquals(
             )
         return getattr(objA, field) == getattr(objB, field)
 
-    equal = True
-    for field in baseFields:
-        equal = equal and isEqual(field, objA, objB)
+    def allFieldsEqual() -> bool:
+        # stop at the first field that is not equal
+        for field in baseFields:
+            if not isEqual(field, objA, objB):
+                return False
+
+        if not ignoreIdFields and idFields:
+            for field in idFields:
+                if not isEqual(field, objA, objB):
+                    return False
 
-    if not ignoreIdFields and idFields:
-        for field in idFields:
-            equal = equal and isEqual(field, objA, objB)
+        if not ignoreBaseIdField:
+            # weird case: one instance has an id field and the other doesn't
+            if hasattr(objA, "id") != hasattr(objB, "id"):
+                return False
+            if hasattr(objA, "id") and not isEqual("id", objA, objB):
+                return False
+        return True
 
-    if not ignoreBaseIdField:
-        if hasattr(objA, "id") and hasattr(objB, "id"):
-            equal = equal and isEqual("id", objA, objB)
-        # weird case: one instance has an id field and the other doesn't
-        if hasattr(objA, "id") != hasattr(objB, "id"):
-            equal = False
+    equal = allFieldsEqual()
 
     if not equal and logDifferences:
         ignoreKeyNames = list()
@@ -86,5 +115,135 @@ def modelEquals(
         differences = GeneralUtil.findDifferentFields(
             objAJson, objBJson, parentKey=parentKey, ignoreKeyNames=ignoreKeyNames
         )
-        LOGGER.info(f"Differences: {differences}")
+        CustomLogger.getLogger(__name__).info(f"Differences: {differences}")
     return equal
+
+
+def modelFingerprint(model: Any) -> bytes:
+    """
+    Returns a structural hash of the given model (dataclass) instance.
+    The hash is built from every dataclass field (including IDs), using the fingerprints of any nested models.
+    Two models with the same fingerprint are equal, no matter which IDs are ignored when comparing them.
+
+    Each model caches its fingerprint.
+    The cache is cleared when a field is set on the model (see EqualityCheck.__setattr__),
+    and the cache of a model with nested models is only used if it still holds the same nested models (by identity) with the same fingerprints.
+    This means an unchanged subtree is only walked, never hashed again.
+    """
+    cache = model.__dict__.get(FINGERPRINT_CACHE_ATTRIBUTE)
+    if cache is not None:
+        children, childFingerprints, fingerprint = cache
+        if children is None or _childrenUnchanged(model, children, childFingerprints):
+            return fingerprint
+
+    scalarFieldNames, childFieldNames = _getFieldNames(model)
+    children, childFingerprints = None, None
+    if childFieldNames:
+        children = _getChildren(model, childFieldNames)
+        childFingerprints = tuple(
+            modelFingerprint(child) if _isModel(child) else child for child in children
+        )
+    fingerprint = hashlib.blake2b(
+        repr(
+            (
+                type(model).__name__,
+                scalarFieldNames,
+                tuple(getattr(model, fieldName) for fieldName in scalarFieldNames),
+                childFieldNames,
+                childFingerprints,
+            )
+        ).encode(),
+        digest_size=16,
+    ).digest()
+    # set directly in __dict__ so this does not clear the cache or count as a model field
+    model.__dict__[FINGERPRINT_CACHE_ATTRIBUTE] = (
+        children,
+        childFingerprints,
+        fingerprint,
+    )
+    return fingerprint
+
+
+def _childrenUnchanged(model: Any, children: tuple, childFingerprints: tuple) -> bool:
+    """
+    Checks if the given model still holds exactly the given nested models, and that their fingerprints have not changed.
+    """
+    currentChildren = _getChildren(model, _getFieldNames(model)[1])
+    if len(currentChildren) != len(children):
+        return False
+    for currentChild, child, childFingerprint in zip(
+        currentChildren, children, childFingerprints
+    ):
+        if currentChild is not child:
+            return False
+        if not _isModel(currentChild):
+            continue
+        # inline the check for a nested model with no nested models of its own, since most nested models are like this
+        childCache = currentChild.__dict__.get(FINGERPRINT_CACHE_ATTRIBUTE)
+        if childCache is not None and childCache[0] is None:
+            if childCache[2] != childFingerprint:
+                return False
+        elif modelFingerprint(currentChild) != childFingerprint:
+            return False
+    return True
+
+
+def _getFieldNames(model: Any) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Returns the names of the fields of the given model that hold plain values and the names of the fields that can hold nested models.
+    These are worked out once per model type, from the field annotations (so not from the values of whichever instance is seen first).
+    """
+    modelType = type(model)
+    fieldNames = __FIELD_NAMES_BY_TYPE.get(modelType)
+    if fieldNames is None:
+        try:
+            fieldTypes = typing.get_type_hints(modelType)
+        except NameError:
+            # an annotation can't be resolved, so treat every field as one that can hold nested models
+            fieldTypes = dict()
+        scalarFieldNames = list()
+        childFieldNames = list()
+        for field in dataclasses.fields(model):
+            if _canHoldModels(fieldTypes.get(field.name, Any)):
+                childFieldNames.append(field.name)
+            else:
+                scalarFieldNames.append(field.name)
+        fieldNames = (tuple(scalarFieldNames), tuple(childFieldNames))
+        __FIELD_NAMES_BY_TYPE[modelType] = fieldNames
+    return fieldNames
+
+
+def _canHoldModels(fieldType: Any) -> bool:
+    """
+    Checks if a field with the given type annotation can hold nested models (or a list or tuple of them).
+    """
+    if fieldType is Any:
+        return True
+    origin = typing.get_origin(fieldType)
+    if origin in (typing.Union, types.UnionType):
+        return any(_canHoldModels(argument) for argument in typing.get_args(fieldType))
+    if origin is not None:
+        return issubclass(origin, (list, tuple))
+    return isinstance(fieldType, type) and (
+        issubclass(fieldType, (list, tuple)) or dataclasses.is_dataclass(fieldType)
+    )
+
+
+def _isModel(value: Any) -> bool:
+    return hasattr(type(value), "__dataclass_fields__")
+
+
+def _getChildren(model: Any, childFieldNames: tuple[str, ...]) -> tuple:
+    """
+    Returns everything held in the given fields of the given model, in field order.
+    A separator is added after each field, so moving a model from one field to another is seen as a change.
+    """
+    children = list()
+    for fieldName in childFieldNames:
+        value = getattr(model, fieldName)
+        if isinstance(value, (list, tuple)):
+            children.extend(value)
+        else:
+            children.append(value)
+        children.append(__FIELD_SEPARATOR)
+    return tuple(children)
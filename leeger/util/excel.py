@@ -2,14 +2,24 @@ from __future__ import annotations
 
 import os
 import random
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Any, Optional
 
 from openpyxl import Workbook
-from openpyxl.styles import Alignment, Border, Color, Font, PatternFill, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import (
+    Alignment,
+    Border,
+    Color,
+    Font,
+    NamedStyle,
+    PatternFill,
+    Side,
+)
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.dimensions import ColumnDimension, DimensionHolder
-from openpyxl.worksheet.table import Table
+from openpyxl.worksheet.table import Table, TableColumn
 from openpyxl.worksheet.worksheet import Worksheet
 
 from leeger.model.filter import AllTimeFilters, YearFilters
@@ -22,16 +32,81 @@ from leeger.util.excel_helper import (
 from leeger.util.navigator.YearNavigator import YearNavigator
 from leeger.util.stat_sheet import leagueStatSheet, yearStatSheet
 
+##########
+# Styles #
+##########
+
+# colors
+__BLACK = Color(rgb="000000")
+__LIGHT_GRAY = Color(rgb="B8B8B8")
+__MEDIUM_GRAY = Color(rgb="828282")
+
+# borders
+__THICK_SIDE = Side(border_style="thick", color=__BLACK)
+__THIN_SIDE = Side(border_style="thin", color=__BLACK)
+
+# named styles that are shared by every sheet in a workbook
+# each cell references one of these by name instead of getting its own Font/PatternFill/Alignment
+_HEADER_STYLE = NamedStyle(
+    name="leegerHeader",
+    font=Font(size=12, bold=True),
+    fill=PatternFill(patternType="solid", fgColor=__LIGHT_GRAY),
+    alignment=Alignment(horizontal="center"),
+)
+_LEGEND_TITLE_STYLE = NamedStyle(
+    name="leegerLegendTitle",
+    font=Font(bold=True),
+    fill=PatternFill(patternType="solid", fgColor=__MEDIUM_GRAY),
+    alignment=Alignment(horizontal="center"),
+    border=Border(
+        left=__THICK_SIDE, right=__THICK_SIDE, top=__THICK_SIDE, bottom=__THIN_SIDE
+    ),
+)
+_LEGEND_STYLE = NamedStyle(
+    name="leegerLegend",
+    fill=PatternFill(patternType="solid", fgColor=__MEDIUM_GRAY),
+    alignment=Alignment(horizontal="center"),
+    border=Border(left=__THICK_SIDE, right=__THICK_SIDE),
+)
+_LEGEND_LAST_STYLE = NamedStyle(
+    name="leegerLegendLast",
+    fill=PatternFill(patternType="solid", fgColor=__MEDIUM_GRAY),
+    alignment=Alignment(horizontal="center"),
+    border=Border(left=__THICK_SIDE, right=__THICK_SIDE, bottom=__THICK_SIDE),
+)
+
+# column width multipliers
+__TITLE_MULTIPLIER = 1.2
+__NAME_MULTIPLIER = 1.0
+__DATA_MULTIPLIER = 0.8
+__COLUMN_PADDING = 7
+
 
 def leagueToExcel(
-    league: League, filePath: Optional[str] = None, overwrite: bool = False, **kwargs
+    league: League,
+    filePath: Optional[str] = None,
+    overwrite: bool = False,
+    writeOnly: bool = False,
+    maxWorkers: Optional[int] = 1,
+    **kwargs,
 ) -> Workbook:
     """
     Saves the given League object to an Excel file.
+    The file is saved once, after every sheet has been written.
+
+    If writeOnly is True, the workbook is built with openpyxl's write-only mode.
+    This is much faster and uses much less memory for large leagues, but requires a filePath,
+    and the returned Workbook cannot be read from.
+
+    The stats for each Year are computed in the current process by default.
+    Give maxWorkers > 1 (or None for the number of CPUs) to compute them in a process pool with up to that many processes.
+    Where processes are started with "spawn" (e.g. Windows and macOS), the caller's script must then be guarded by if __name__ == "__main__".
     """
 
     if league is None:
         raise ValueError("'league' has not been set.")
+    if writeOnly and filePath is None:
+        raise ValueError("'filePath' must be given when 'writeOnly' is True.")
     if filePath is not None:
         if os.path.exists(filePath) and not overwrite:
             raise FileExistsError(
@@ -58,24 +133,30 @@ def leagueToExcel(
     for ownerId, seed in ownerIdToSeedMap.items():
         ownerIdToColorMap[ownerId] = _getRandomColor(0.5, seed)
 
+    workbook = Workbook(write_only=writeOnly)
+    if not writeOnly:
+        # remove default sheet
+        del workbook["Sheet"]
+
     # gather info for all time teams to be used later
+    # we want the sheets to be ordered: oldest year -> newest year -> all time teams -> all time matchups -> all time owners
     allTimeTeamIds: list[str] = list()
     teamIdToColorMap = dict()
-    workbook = None
-    for year in league.years:
+    sortedYears = sorted(league.years, key=lambda y: y.yearNumber)
+    # the stats for each year are computed in parallel, the sheets are then added in year order
+    yearSheetDataList = _getYearSheetDataForYears(
+        sortedYears, maxWorkers, **kwargs.copy()
+    )
+    for year, yearSheetData in zip(sortedYears, yearSheetDataList):
         for team in year.teams:
             allTimeTeamIds.append(team.id)
             teamIdToColorMap[team.id] = ownerIdToColorMap[team.ownerId]
 
         # add a sheet to the Excel document for this year
-        workbook = _yearToExcel(year, workbook, **kwargs.copy())
+        _addYearSheets(year, yearSheetData, workbook)
 
     # add All-Time teams stats sheet
-    # figure out index to put this sheet into
-    # we want the sheets to be ordered: oldest year -> newest year -> all time teams -> all time matchups -> all time owners
-    index = len(workbook.sheetnames)
-    workbook.create_sheet("All Time Teams", index=index)
-    worksheet = workbook["All Time Teams"]
+    worksheet = workbook.create_sheet("All Time Teams")
 
     allTimeTeamsStatSheet_ = allTimeTeamsStatSheet(league, **kwargs.copy())
 
@@ -97,15 +178,10 @@ def leagueToExcel(
         entityIdToColorMap=teamIdToColorMap,
         legendKeyValues=allTimeFilters,
         freezePanes=freezePanes,
-        saveToFilepath=filePath,
     )
 
     # add All-Time matchups stats sheet
-    # figure out index to put this sheet into
-    # we want the sheets to be ordered: oldest year -> newest year -> all time teams -> all time matchups -> all time owners
-    index = len(workbook.sheetnames)
-    workbook.create_sheet("All Time Matchups", index=index)
-    worksheet = workbook["All Time Matchups"]
+    worksheet = workbook.create_sheet("All Time Matchups")
 
     (allTimeMatchupsStatSheet_, modifiedMatchupIdToOwnerIdMap) = (
         allTimeMatchupsStatSheet(league, **kwargs.copy())
@@ -115,7 +191,6 @@ def leagueToExcel(
     for modifiedMatchupId, ownerId in modifiedMatchupIdToOwnerIdMap.items():
         modifiedMatchupIdToColorMap[modifiedMatchupId] = ownerIdToColorMap[ownerId]
 
-    allTimeFilters = AllTimeFilters.preferredOrderWithTitle(league, **kwargs.copy())
     _populateWorksheet(
         worksheet=worksheet,
         workbook=workbook,
@@ -125,23 +200,18 @@ def leagueToExcel(
         entityIdToColorMap=modifiedMatchupIdToColorMap,
         legendKeyValues=allTimeFilters,
         freezePanes="C2",
-        saveToFilepath=filePath,
         boldColumnNumbers=[1, 2],
     )
 
     # add All-Time owner stats sheet
-    # figure out index to put this sheet into
-    # we want the sheets to be ordered: oldest year -> newest year -> all time teams -> all time matchups -> all time owners
-    index = len(workbook.sheetnames)
-    workbook.create_sheet("All Time Owners", index=index)
-    worksheet = workbook["All Time Owners"]
+    worksheet = workbook.create_sheet("All Time Owners")
 
     allTimeOwnerStatsWithTitles = leagueStatSheet(
         league, **kwargs.copy()
     ).preferredOrderWithTitle()
     allTimeOwnerStatsWithTitles.insert(0, ("Owner", ownerIdToNameMap))
 
-    return _populateWorksheet(
+    _populateWorksheet(
         worksheet=worksheet,
         workbook=workbook,
         displayName="AllTimeOwnerStats",
@@ -150,57 +220,52 @@ def leagueToExcel(
         entityIdToColorMap=ownerIdToColorMap,
         legendKeyValues=allTimeFilters,
         freezePanes="B2",
-        saveToFilepath=filePath,
     )
 
+    # save once, after every sheet has been written
+    if filePath is not None:
+        workbook.save(filePath)
+    return workbook
+
 
 def _yearToExcel(year: Year, workbook: Optional[Workbook] = None, **kwargs) -> Workbook:
     """
-    Saves the given Year object to an Excel File.
-    If the given Excel file exists already, add a worksheet to it with this year.
-    If the given Excel file does not exist, create a new workbook and add a worksheet to it with this year.
+    Adds a "Teams" and "Matchups" worksheet for the given Year to the given Workbook.
+    If no Workbook is given, a new one is created.
+    Sheets are added after any existing sheets, so Years should be given from oldest -> newest.
     """
 
     if workbook is None:
-        # create workbook and sheet
         workbook = Workbook()
-        workbook.create_sheet(f"{year.yearNumber} Teams", index=0)
-        workbook.create_sheet(f"{year.yearNumber} Matchups", index=1)
         # remove default sheet
         del workbook["Sheet"]
-    else:
-        # figure out index to put this sheet into
-        # we want the years as sheets in order from oldest -> newest year
-        index = 0
-        for sheetname in workbook.sheetnames:
-            if year.yearNumber > int(sheetname[:5]):
-                index += 1
-        workbook.create_sheet(f"{year.yearNumber} Teams", index=index)
-        workbook.create_sheet(f"{year.yearNumber} Matchups", index=index + 1)
-    worksheet = workbook[f"{year.yearNumber} Teams"]
-
-    # get team names
-    # and
-    # make sure we have the same color for owners and their teams across sheets
-    ownerIdToSeedMap = dict()
+
+    _addYearSheets(year, _getYearSheetData(year, **kwargs), workbook)
+    return workbook
+
+
+def _getYearSheetData(year: Year, **kwargs) -> dict:
+    """
+    Computes all the stats needed for the "Teams" and "Matchups" worksheets of the given Year.
+    This does not touch any Workbook, so it can be run in a separate process.
+
+    Example response:
+        {
+            "yearFilters": [("Weeks", "1-13"), ...],
+            "yearStatsWithTitles": [("Team", {"someTeamId": "Team 1", ...}), ...],
+            "freezePanes": "B2",
+            "yearMatchupsWithTitles": [("Team For", {"someMatchupIdA": "Team 1", ...}), ...],
+            "modifiedMatchupIdToOwnerIdMap": {"someMatchupIdA": "someOwnerId", ...}
+        }
+    """
     teamIdToNameMap = dict()
     teamIdToDivisionNameMap = dict()
     for team in year.teams:
-        ownerIdToSeedMap[team.ownerId] = f"{team.ownerId}{datetime.now().date()}"
         teamIdToNameMap[team.id] = team.name
         if team.divisionId:
             teamIdToDivisionNameMap[team.id] = YearNavigator.getDivisionById(
                 year, team.divisionId
             ).name
-    ownerIdToColorMap = dict()
-    for ownerId, seed in ownerIdToSeedMap.items():
-        ownerIdToColorMap[ownerId] = _getRandomColor(0.5, seed)
-
-    teamIdToColorMap = dict()
-    teamIds = list()
-    for team in year.teams:
-        teamIdToColorMap[team.id] = ownerIdToColorMap[team.ownerId]
-        teamIds.append(team.id)
 
     yearFilters = YearFilters.preferredOrderWithTitle(year, **kwargs.copy())
 
@@ -211,37 +276,85 @@ def _yearToExcel(year: Year, workbook: Optional[Workbook] = None, **kwargs) -> W
     if len(year.divisions) > 0:
         yearStatsWithTitles.insert(1, ("Division", teamIdToDivisionNameMap))
         freezePanes = "C2"
+
+    (yearMatchupsWithTitles, modifiedMatchupIdToOwnerIdMap) = yearMatchupsStatSheet(
+        year, **kwargs.copy()
+    )
+
+    return {
+        "yearFilters": yearFilters,
+        "yearStatsWithTitles": yearStatsWithTitles,
+        "freezePanes": freezePanes,
+        "yearMatchupsWithTitles": yearMatchupsWithTitles,
+        "modifiedMatchupIdToOwnerIdMap": modifiedMatchupIdToOwnerIdMap,
+    }
+
+
+def _getYearSheetDataForYears(
+    years: list[Year], maxWorkers: Optional[int], **kwargs
+) -> list[dict]:
+    """
+    Computes the sheet data for each of the given Years, in the same order as the given Years.
+    Years are computed in a process pool unless only 1 worker would be used.
+    """
+    if maxWorkers is None:
+        maxWorkers = os.cpu_count() or 1
+    maxWorkers = min(maxWorkers, len(years))
+    if maxWorkers <= 1:
+        return [_getYearSheetData(year, **kwargs.copy()) for year in years]
+    with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+        futures = [
+            executor.submit(_getYearSheetData, year, **kwargs.copy()) for year in years
+        ]
+        return [future.result() for future in futures]
+
+
+def _addYearSheets(year: Year, yearSheetData: dict, workbook: Workbook) -> None:
+    """
+    Adds a "Teams" and "Matchups" worksheet for the given Year to the given Workbook using the given sheet data.
+    """
+    # make sure we have the same color for owners and their teams across sheets
+    ownerIdToColorMap = dict()
+    for team in year.teams:
+        ownerIdToColorMap[team.ownerId] = _getRandomColor(
+            0.5, f"{team.ownerId}{datetime.now().date()}"
+        )
+
+    teamIdToColorMap = dict()
+    teamIds = list()
+    for team in year.teams:
+        teamIdToColorMap[team.id] = ownerIdToColorMap[team.ownerId]
+        teamIds.append(team.id)
+
     # save Year teams to Excel sheet
+    worksheet = workbook.create_sheet(f"{year.yearNumber} Teams")
     _populateWorksheet(
         worksheet=worksheet,
         workbook=workbook,
         displayName=f"Teams{year.yearNumber}",
-        titlesAndStatDicts=yearStatsWithTitles,
+        titlesAndStatDicts=yearSheetData["yearStatsWithTitles"],
         entityIds=teamIds,
         entityIdToColorMap=teamIdToColorMap,
-        legendKeyValues=yearFilters,
-        freezePanes=freezePanes,
+        legendKeyValues=yearSheetData["yearFilters"],
+        freezePanes=yearSheetData["freezePanes"],
     )
 
-    (yearMatchupsWithTitles, modifiedMatchupIdToOwnerIdMap) = yearMatchupsStatSheet(
-        year, **kwargs.copy()
-    )
+    modifiedMatchupIdToOwnerIdMap = yearSheetData["modifiedMatchupIdToOwnerIdMap"]
     modifiedMatchupIdToColorMap: dict = dict()
     for modifiedMatchupId, ownerId in modifiedMatchupIdToOwnerIdMap.items():
         modifiedMatchupIdToColorMap[modifiedMatchupId] = ownerIdToColorMap[ownerId]
-    worksheet = workbook[f"{year.yearNumber} Matchups"]
     # save Year matchups to Excel sheet
+    worksheet = workbook.create_sheet(f"{year.yearNumber} Matchups")
     _populateWorksheet(
         worksheet=worksheet,
         workbook=workbook,
         displayName=f"Matchups{year.yearNumber}",
-        titlesAndStatDicts=yearMatchupsWithTitles,
+        titlesAndStatDicts=yearSheetData["yearMatchupsWithTitles"],
         entityIds=list(modifiedMatchupIdToOwnerIdMap.keys()),
         entityIdToColorMap=modifiedMatchupIdToColorMap,
-        legendKeyValues=yearFilters,
+        legendKeyValues=yearSheetData["yearFilters"],
         freezePanes="B2",
     )
-    return workbook
 
 
 def _getRandomColor(tint: float = 0, seed: str = None) -> Color:
@@ -255,11 +368,111 @@ def _getRandomColor(tint: float = 0, seed: str = None) -> Color:
     return Color(rgb=hexCode, tint=tint)
 
 
+def _getStyleName(workbook: Workbook, style: NamedStyle) -> str:
+    """
+    Registers the given NamedStyle with the given Workbook if it has not been registered yet.
+    Returns the name of the style.
+    """
+    if style.name not in workbook.named_styles:
+        workbook.add_named_style(style)
+    return style.name
+
+
+def _getRowStyleName(workbook: Workbook, color: Color, bold: bool) -> str:
+    """
+    Returns the name of the shared style for an entity row of the given color.
+    Creates and registers the style the first time a color is seen.
+    """
+    name = f"leegerRow{color.rgb}{color.tint}{'Bold' if bold else ''}"
+    if name not in workbook.named_styles:
+        workbook.add_named_style(
+            NamedStyle(
+                name=name,
+                font=Font(size=11, bold=True) if bold else Font(),
+                fill=PatternFill(patternType="solid", fgColor=color),
+            )
+        )
+    return name
+
+
+def _buildWorksheetRows(
+    *,
+    workbook: Workbook,
+    titlesAndStatDicts: list[tuple[str, dict]],
+    entityIds: list[str],
+    entityIdToColorMap: dict[str, Color],
+    legendKeyValues: list[tuple[str, Any]],
+    boldColumnNumbers: list[int],
+) -> tuple[list[list[tuple[Any, Optional[str]]]], list[float]]:
+    """
+    Builds every row for a worksheet as (value, styleName) pairs.
+    Column widths are tracked while the rows are built, so the finished rows never need to be scanned again.
+
+    Returns the rows and the width of each column.
+    """
+    columnWidths = [0.0] * max(len(titlesAndStatDicts), 1)
+
+    def trackWidth(columnIndex: int, value: Any, multiplier: float) -> None:
+        if value:
+            columnWidths[columnIndex] = max(
+                columnWidths[columnIndex], len(str(value)) * multiplier
+            )
+
+    rows: list[list[tuple[Any, Optional[str]]]] = list()
+
+    # add stat headers
+    headerStyleName = _getStyleName(workbook, _HEADER_STYLE)
+    headerRow = list()
+    for columnIndex, (title, _) in enumerate(titlesAndStatDicts):
+        headerRow.append((title, headerStyleName))
+        trackWidth(columnIndex, title, __TITLE_MULTIPLIER)
+    rows.append(headerRow)
+
+    # add all stats
+    for entityId in entityIds:
+        color = entityIdToColorMap[entityId]
+        rowStyleName = _getRowStyleName(workbook, color, bold=False)
+        boldRowStyleName = _getRowStyleName(workbook, color, bold=True)
+        row = list()
+        for columnIndex, (_, statDict) in enumerate(titlesAndStatDicts):
+            value = statDict[entityId] if entityId in statDict else "N/A"
+            styleName = (
+                boldRowStyleName
+                if columnIndex + 1 in boldColumnNumbers
+                else rowStyleName
+            )
+            row.append((value, styleName))
+            # first column has entity names, so use a different multiplier for them
+            trackWidth(
+                columnIndex,
+                value,
+                __NAME_MULTIPLIER if columnIndex == 0 else __DATA_MULTIPLIER,
+            )
+        rows.append(row)
+
+    # leave a gap between the table and the legend
+    rows.append(list())
+    rows.append(list())
+
+    # add legend for filters
+    legendTitle = "Filters Applied"
+    rows.append([(legendTitle, _getStyleName(workbook, _LEGEND_TITLE_STYLE))])
+    trackWidth(0, legendTitle, __NAME_MULTIPLIER)
+    legendStyleName = _getStyleName(workbook, _LEGEND_STYLE)
+    legendLastStyleName = _getStyleName(workbook, _LEGEND_LAST_STYLE)
+    for i, (kwargTitle, kwargValue) in enumerate(legendKeyValues):
+        value = f"{kwargTitle}: {kwargValue}"
+        isLast = i == len(legendKeyValues) - 1
+        rows.append([(value, legendLastStyleName if isLast else legendStyleName)])
+        trackWidth(0, value, __NAME_MULTIPLIER)
+
+    return rows, columnWidths
+
+
 def _populateWorksheet(
     *,
     worksheet: Worksheet,
     workbook: Workbook,
-    saveToFilepath: Optional[str] = None,
     displayName: str,
     titlesAndStatDicts: list[tuple[str, dict]],
     entityIds: list[str],
@@ -269,128 +482,64 @@ def _populateWorksheet(
     boldColumnNumbers: Optional[list] = None,
 ) -> Workbook:
     """
+    Writes a stats table and a filter legend into the given worksheet.
+    Works with both regular and write-only worksheets.
+
     boldColumnNumbers is a list of column numbers whose values will be bolded.
         - Column numbers will be 1-indexed.
         - Default is [1]
     """
     boldColumnNumbers = [1] if boldColumnNumbers is None else boldColumnNumbers
-    ####################
-    # Styles for table #
-    ####################
 
-    # fonts
-    HEADER_COLUMN_FONT = Font(size=12, bold=True)
-    ENTITY_NAME_FONT = Font(size=11, bold=True)
-
-    # colors
-    BLACK = Color(rgb="000000")
-    LIGHT_GRAY = Color(rgb="B8B8B8")
-    MEDIUM_GRAY = Color(rgb="828282")
-
-    # fills
-    HEADER_FILL = PatternFill(patternType="solid", fgColor=LIGHT_GRAY)
+    rows, columnWidths = _buildWorksheetRows(
+        workbook=workbook,
+        titlesAndStatDicts=titlesAndStatDicts,
+        entityIds=entityIds,
+        entityIdToColorMap=entityIdToColorMap,
+        legendKeyValues=legendKeyValues,
+        boldColumnNumbers=boldColumnNumbers,
+    )
 
-    #################
-    # Fill in table #
-    #################
+    # column widths and frozen panes must be set before any rows are written to a write-only worksheet
+    for columnIndex, width in enumerate(columnWidths):
+        worksheet.column_dimensions[get_column_letter(columnIndex + 1)].width = (
+            width + __COLUMN_PADDING
+        )
+    # freeze owner name column and header row
+    worksheet.freeze_panes = freezePanes
 
-    # add all stats
-    for rowNumber, entityId in enumerate(entityIds):
-        rowFill = PatternFill(patternType="solid", fgColor=entityIdToColorMap[entityId])
-        for columnNumber, (title, statDict) in enumerate(titlesAndStatDicts):
-            char = get_column_letter(columnNumber + 1)
-            if rowNumber == 1:
-                # add stat header
-                cell = f"{char}{rowNumber}"
-                worksheet[cell] = title
-                worksheet[cell].font = HEADER_COLUMN_FONT
-                worksheet[cell].fill = HEADER_FILL
-                worksheet[cell].alignment = Alignment(horizontal="center")
-            # add stat value
-            cell = f"{char}{rowNumber + 2}"
-            if entityId in statDict:
-                worksheet[cell] = statDict[entityId]
-            else:
-                worksheet[cell] = "N/A"
-            worksheet[cell].fill = rowFill
-            if columnNumber + 1 in boldColumnNumbers:
-                worksheet[cell].font = ENTITY_NAME_FONT
+    if workbook.write_only:
+        for row in rows:
+            cells = list()
+            for value, styleName in row:
+                cell = WriteOnlyCell(worksheet, value=value)
+                cell.style = styleName
+                cells.append(cell)
+            worksheet.append(cells)
+    else:
+        for rowNumber, row in enumerate(rows, start=1):
+            for columnNumber, (value, styleName) in enumerate(row, start=1):
+                cell = worksheet.cell(row=rowNumber, column=columnNumber, value=value)
+                cell.style = styleName
 
     # put stats into table
     table = Table(
         displayName=displayName,
-        ref="A1:" + get_column_letter(worksheet.max_column) + str(len(entityIds) + 1),
-    )
-    worksheet.add_table(table)
-    # freeze owner name column and header row
-    worksheet.freeze_panes = freezePanes
-
-    # add legend for filters
-    # define border to go around legend
-    topSideSolid = Side(border_style="thick", color=BLACK)
-    bottomSideSolid = Side(border_style="thick", color=BLACK)
-    bottomSideThin = Side(border_style="thin", color=BLACK)
-    leftSideSolid = Side(border_style="thick", color=BLACK)
-    rightSideSolid = Side(border_style="thick", color=BLACK)
-    # legend formatting
-    legendCellAlignment = Alignment(horizontal="center")
-
-    legendRowNumber = len(entityIds) + 4
-    legendColLetter = "A"
-    titleCell = f"A{legendRowNumber}"
-    worksheet[titleCell] = "Filters Applied"
-    worksheet[titleCell].fill = PatternFill(patternType="solid", fgColor=MEDIUM_GRAY)
-    worksheet[titleCell].font = Font(bold=True)
-    border = Border(
-        left=leftSideSolid,
-        right=rightSideSolid,
-        top=topSideSolid,
-        bottom=bottomSideThin,
+        ref="A1:"
+        + get_column_letter(max(len(titlesAndStatDicts), 1))
+        + str(len(entityIds) + 1),
     )
-    worksheet[titleCell].border = border
-    worksheet[titleCell].alignment = legendCellAlignment
-
-    for kwarg_title, kwarg_value in legendKeyValues:
-        legendRowNumber += 1
-        cell = f"{legendColLetter}{legendRowNumber}"
-        worksheet[cell] = f"{kwarg_title}: {kwarg_value}"
-        worksheet[cell].fill = PatternFill(patternType="solid", fgColor=MEDIUM_GRAY)
-        worksheet[cell].alignment = legendCellAlignment
-        border = Border(left=leftSideSolid, right=rightSideSolid)
-        worksheet[cell].border = border
-
-    # add border to last cell
-    border = Border(left=leftSideSolid, right=rightSideSolid, bottom=bottomSideSolid)
-    worksheet[f"{legendColLetter}{legendRowNumber}"].border = border
-
-    # set column widths
-    TITLE_MULTIPLIER = 1.2
-    NAME_MULTIPLIER = 1.0
-    DATA_MULTIPLIER = 0.8
-    dim_holder = DimensionHolder(worksheet=worksheet)
-
-    for columnNumber in range(worksheet.min_column, worksheet.max_column + 1):
-        # figure out the width we want this column to be
-        # first column has entity names, so use a different multiplier for them
-        isNameColumn = columnNumber == 1
-        maxWidth = 0
-        for rowNumber, cell in enumerate(worksheet[get_column_letter(columnNumber)]):
-            if cell.value:
-                # count title/name cell characters as more than a data cell
-                if rowNumber == 0:
-                    multiplier = TITLE_MULTIPLIER
-                elif isNameColumn:
-                    multiplier = NAME_MULTIPLIER
-                else:
-                    multiplier = DATA_MULTIPLIER
-                maxWidth = max((maxWidth, len(str(cell.value)) * multiplier))
-        dim_holder[get_column_letter(columnNumber)] = ColumnDimension(
-            worksheet, min=columnNumber, max=columnNumber, width=maxWidth + 7
-        )
-
-    worksheet.column_dimensions = dim_holder
+    if workbook.write_only:
+        # write-only worksheets cannot read the header cells back, so name the table columns here
+        table.tableColumns = [
+            TableColumn(id=i + 1, name=title)
+            for i, (title, _) in enumerate(titlesAndStatDicts)
+        ]
+        with warnings.catch_warnings():
+            # openpyxl always warns about table columns in write-only mode, even when they are set
+            warnings.simplefilter("ignore", UserWarning)
+            worksheet.add_table(table)
+    else:
+        worksheet.add_table(table)
 
-    # save
-    if saveToFilepath is not None:
-        workbook.save(saveToFilepath)
     return workbook
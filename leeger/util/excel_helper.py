@@ -1,5 +1,8 @@
+from typing import Iterator
+
 from leeger.model.filter import AllTimeFilters, YearFilters
 from leeger.model.league import League, Year
+from leeger.model.stat.MatchupStatRow import MatchupStatRow
 from leeger.util.navigator import LeagueNavigator, YearNavigator
 from leeger.util.stat_sheet import yearStatSheet
 
@@ -54,10 +57,77 @@ def allTimeTeamsStatSheet(league: League, **kwargs) -> list[tuple[str, dict]]:
     return condensedAllTimeTeamsStatsWithTitles
 
 
+def iterYearMatchupRows(year: Year, **kwargs) -> Iterator[MatchupStatRow]:
+    """
+    Lazily yields a MatchupStatRow for each side of each Matchup in the given Year that passes the given filters.
+    Rows are yielded in week order, with the "A" side of each Matchup before the "B" side.
+    """
+    yearFilters = YearFilters.getForYear(year, **kwargs)
+    # index teams once so each matchup is a constant time lookup
+    teamIdToTeamMap = {team.id: team for team in year.teams}
+
+    for week in year.weeks:
+        if yearFilters.weekNumberStart <= week.weekNumber <= yearFilters.weekNumberEnd:
+            for matchup in week.matchups:
+                if matchup.matchupType in yearFilters.includeMatchupTypes and (
+                    matchup.multiWeekMatchupId is None
+                    or yearFilters.includeMultiWeekMatchups is True
+                ):
+                    teamA = teamIdToTeamMap.get(matchup.teamAId)
+                    teamB = teamIdToTeamMap.get(matchup.teamBId)
+                    if teamA is None or teamB is None:
+                        # raise the same exception as the navigator
+                        YearNavigator.getTeamById(
+                            year, matchup.teamAId if teamA is None else matchup.teamBId
+                        )
+                    # add matchup for both teams
+                    yield MatchupStatRow(
+                        modifiedMatchupId=f"{matchup.id}A",
+                        matchupId=matchup.id,
+                        yearNumber=year.yearNumber,
+                        weekNumber=week.weekNumber,
+                        teamForName=teamA.name,
+                        ownerForId=teamA.ownerId,
+                        teamAgainstName=teamB.name,
+                        ownerAgainstId=teamB.ownerId,
+                        matchupType=matchup.matchupType.name,
+                        pointsFor=matchup.teamAScore,
+                        pointsAgainst=matchup.teamBScore,
+                    )
+                    yield MatchupStatRow(
+                        modifiedMatchupId=f"{matchup.id}B",
+                        matchupId=matchup.id,
+                        yearNumber=year.yearNumber,
+                        weekNumber=week.weekNumber,
+                        teamForName=teamB.name,
+                        ownerForId=teamB.ownerId,
+                        teamAgainstName=teamA.name,
+                        ownerAgainstId=teamA.ownerId,
+                        matchupType=matchup.matchupType.name,
+                        pointsFor=matchup.teamBScore,
+                        pointsAgainst=matchup.teamAScore,
+                    )
+
+
+def iterAllTimeMatchupRows(league: League, **kwargs) -> Iterator[MatchupStatRow]:
+    """
+    Lazily yields a MatchupStatRow for each side of each Matchup in the given League that passes the given filters.
+    Rows are yielded in year order.
+    """
+    allTimeFilters = AllTimeFilters.getForLeague(league, **kwargs.copy())
+
+    for year in league.years:
+        if (
+            allTimeFilters.yearNumberStart
+            <= year.yearNumber
+            <= allTimeFilters.yearNumberEnd
+        ):
+            yield from iterYearMatchupRows(year, **kwargs.copy())
+
+
 def yearMatchupsStatSheet(
     year: Year, includeOwnerIds: bool = False, includeYears: bool = False, **kwargs
 ) -> tuple[list[tuple[str, dict]], dict[str, str]]:
-    yearFilters = YearFilters.getForYear(year, **kwargs)
     modifiedMatchupIdToOwnerIdMap: dict = dict()
     teamForNames: dict[str, str] = dict()
     ownerForIds: dict[str, str] = dict()
@@ -69,40 +139,17 @@ def yearMatchupsStatSheet(
     yearNumbers: dict[str, int] = dict()
     weekNumbers: dict[str, int] = dict()
 
-    for week in year.weeks:
-        if yearFilters.weekNumberStart <= week.weekNumber <= yearFilters.weekNumberEnd:
-            for matchup in week.matchups:
-                if matchup.matchupType in yearFilters.includeMatchupTypes and (
-                    matchup.multiWeekMatchupId is None
-                    or yearFilters.includeMultiWeekMatchups is True
-                ):
-                    teamA = YearNavigator.getTeamById(year, matchup.teamAId)
-                    teamB = YearNavigator.getTeamById(year, matchup.teamBId)
-                    # add matchup for both teams
-                    # add for "A" team
-                    modifiedMatchupId = f"{matchup.id}A"
-                    modifiedMatchupIdToOwnerIdMap[modifiedMatchupId] = teamA.ownerId
-                    teamForNames[modifiedMatchupId] = teamA.name
-                    ownerForIds[modifiedMatchupId] = teamA.ownerId
-                    teamAgainstNames[modifiedMatchupId] = teamB.name
-                    ownerAgainstIds[modifiedMatchupId] = teamB.ownerId
-                    teamForScores[modifiedMatchupId] = matchup.teamAScore
-                    teamAgainstScores[modifiedMatchupId] = matchup.teamBScore
-                    matchupTypes[modifiedMatchupId] = matchup.matchupType.name
-                    yearNumbers[modifiedMatchupId] = year.yearNumber
-                    weekNumbers[modifiedMatchupId] = week.weekNumber
-                    # add for "B" team
-                    modifiedMatchupId = f"{matchup.id}B"
-                    modifiedMatchupIdToOwnerIdMap[modifiedMatchupId] = teamB.ownerId
-                    teamForNames[modifiedMatchupId] = teamB.name
-                    ownerForIds[modifiedMatchupId] = teamB.ownerId
-                    teamAgainstNames[modifiedMatchupId] = teamA.name
-                    ownerAgainstIds[modifiedMatchupId] = teamA.ownerId
-                    teamForScores[modifiedMatchupId] = matchup.teamBScore
-                    teamAgainstScores[modifiedMatchupId] = matchup.teamAScore
-                    matchupTypes[modifiedMatchupId] = matchup.matchupType.name
-                    yearNumbers[modifiedMatchupId] = year.yearNumber
-                    weekNumbers[modifiedMatchupId] = week.weekNumber
+    for row in iterYearMatchupRows(year, **kwargs):
+        modifiedMatchupIdToOwnerIdMap[row.modifiedMatchupId] = row.ownerForId
+        teamForNames[row.modifiedMatchupId] = row.teamForName
+        ownerForIds[row.modifiedMatchupId] = row.ownerForId
+        teamAgainstNames[row.modifiedMatchupId] = row.teamAgainstName
+        ownerAgainstIds[row.modifiedMatchupId] = row.ownerAgainstId
+        teamForScores[row.modifiedMatchupId] = row.pointsFor
+        teamAgainstScores[row.modifiedMatchupId] = row.pointsAgainst
+        matchupTypes[row.modifiedMatchupId] = row.matchupType
+        yearNumbers[row.modifiedMatchupId] = row.yearNumber
+        weekNumbers[row.modifiedMatchupId] = row.weekNumber
 
     titlesAndStatDicts = [
         ("Team For", teamForNames),
@@ -124,10 +171,10 @@ def yearMatchupsStatSheet(
 def allTimeMatchupsStatSheet(
     league: League, **kwargs
 ) -> tuple[list[tuple[str, dict]], dict[str, str]]:
-    allTimeFilters = AllTimeFilters.getForLeague(league, **kwargs.copy())
+    # index owners once so each row is a constant time lookup
+    ownerIdToNameMap = {owner.id: owner.name for owner in league.owners}
 
-    allYearMatchupStatSheets: list = list()
-    allModifiedMatchupIdToOwnerIdMaps: list = list()
+    modifiedMatchupIdToOwnerIdMap: dict = dict()
     teamForNames: dict[str, str] = dict()
     ownerForNames: dict[str, str] = dict()
     teamAgainstNames: dict[str, str] = dict()
@@ -138,58 +185,21 @@ def allTimeMatchupsStatSheet(
     weekNumbers: dict[str, int] = dict()
     yearNumbers: dict[str, int] = dict()
 
-    for year in league.years:
-        if (
-            allTimeFilters.yearNumberStart
-            <= year.yearNumber
-            <= allTimeFilters.yearNumberEnd
-        ):
-            (
-                currentYearMatchupStatSheet,
-                currentModifiedMatchupIdToOwnerIdMap,
-            ) = yearMatchupsStatSheet(
-                year, includeYears=True, includeOwnerIds=True, **kwargs.copy()
-            )
-            allYearMatchupStatSheets.append(currentYearMatchupStatSheet)
-            allModifiedMatchupIdToOwnerIdMaps.append(
-                currentModifiedMatchupIdToOwnerIdMap
-            )
-
-    # combine responses into 1 response
-    for yearMatchupStatSheet in allYearMatchupStatSheets:
-        for title, statDict in yearMatchupStatSheet:
-            if title == "Team For":
-                teamForNames.update(statDict)
-            elif title == "Team Against":
-                teamAgainstNames.update(statDict)
-            elif title == "Week Number":
-                weekNumbers.update(statDict)
-            elif title == "Matchup Type":
-                matchupTypes.update(statDict)
-            elif title == "Points For":
-                teamForScores.update(statDict)
-            elif title == "Points Against":
-                teamAgainstScores.update(statDict)
-            elif title == "Year":
-                yearNumbers.update(statDict)
-            elif title == "Owner ID For":
-                # turn owner IDs into owner names
-                currentOwnerForNames: dict[str, str] = dict()
-                for key, ownerId in statDict.items():
-                    owner = LeagueNavigator.getOwnerById(league, ownerId)
-                    currentOwnerForNames[key] = owner.name
-                ownerForNames.update(currentOwnerForNames)
-            elif title == "Owner ID Against":
-                # turn owner IDs into owner names
-                currentOwnerAgainstNames: dict[str, str] = dict()
-                for key, ownerId in statDict.items():
-                    owner = LeagueNavigator.getOwnerById(league, ownerId)
-                    currentOwnerAgainstNames[key] = owner.name
-                ownerAgainstNames.update(currentOwnerAgainstNames)
-
-    combinedModifiedMatchupIdToOwnerIdMap: dict = dict()
-    for modifiedMatchupIdToOwnerIdMap in allModifiedMatchupIdToOwnerIdMaps:
-        combinedModifiedMatchupIdToOwnerIdMap.update(modifiedMatchupIdToOwnerIdMap)
+    for row in iterAllTimeMatchupRows(league, **kwargs):
+        modifiedMatchupIdToOwnerIdMap[row.modifiedMatchupId] = row.ownerForId
+        teamForNames[row.modifiedMatchupId] = row.teamForName
+        ownerForNames[row.modifiedMatchupId] = _getOwnerName(
+            league, ownerIdToNameMap, row.ownerForId
+        )
+        teamAgainstNames[row.modifiedMatchupId] = row.teamAgainstName
+        ownerAgainstNames[row.modifiedMatchupId] = _getOwnerName(
+            league, ownerIdToNameMap, row.ownerAgainstId
+        )
+        teamForScores[row.modifiedMatchupId] = row.pointsFor
+        teamAgainstScores[row.modifiedMatchupId] = row.pointsAgainst
+        matchupTypes[row.modifiedMatchupId] = row.matchupType
+        weekNumbers[row.modifiedMatchupId] = row.weekNumber
+        yearNumbers[row.modifiedMatchupId] = row.yearNumber
 
     return [
         ("Team For", teamForNames),
@@ -201,4 +211,13 @@ def allTimeMatchupsStatSheet(
         ("Matchup Type", matchupTypes),
         ("Points For", teamForScores),
         ("Points Against", teamAgainstScores),
-    ], combinedModifiedMatchupIdToOwnerIdMap
+    ], modifiedMatchupIdToOwnerIdMap
+
+
+def _getOwnerName(
+    league: League, ownerIdToNameMap: dict[str, str], ownerId: str
+) -> str:
+    if ownerId not in ownerIdToNameMap:
+        # raise the same exception as the navigator
+        LeagueNavigator.getOwnerById(league, ownerId)
+    return ownerIdToNameMap[ownerId]
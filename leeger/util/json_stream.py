@@ -0,0 +1,202 @@
+import json
+from typing import IO, Any, Iterable, Iterator
+
+from leeger.model.league.League import League
+from leeger.model.league.Owner import Owner
+from leeger.model.league.Year import Year
+
+"""
+Streaming JSON
+
+    - Writes and reads League JSON one Year at a time.
+    - Output matches the format of League.toJson(), so files written here can be read with League.fromJson() and vice versa.
+    - Peak memory used for the JSON representation is bounded by the largest single Year.
+
+"""
+
+__DEFAULT_CHUNK_SIZE = 65_536
+
+
+def writeLeagueJson(league: League, fileObj: IO[str]) -> None:
+    """
+    Writes the given League to the given text file object as JSON.
+    Years are serialized and written one at a time, so the full League dict is never built in memory.
+    """
+    fileObj.write("{")
+    fileObj.write(f'"id": {json.dumps(league.id)}, ')
+    fileObj.write(f'"name": {json.dumps(league.name)}, ')
+    fileObj.write(
+        f'"owners": {json.dumps([owner.toJson() for owner in league.owners])}, '
+    )
+    fileObj.write('"years": [')
+    for i, year in enumerate(league.years):
+        if i > 0:
+            fileObj.write(", ")
+        json.dump(year.toJson(), fileObj)
+    fileObj.write("]}")
+
+
+def writeLeaguesJson(leagues: Iterable[League], fileObj: IO[str]) -> None:
+    """
+    Writes the given Leagues to the given text file object as a JSON array.
+    The given iterable is consumed lazily, so Leagues can be generated one at a time.
+    """
+    fileObj.write("[")
+    for i, league in enumerate(leagues):
+        if i > 0:
+            fileObj.write(", ")
+        writeLeagueJson(league, fileObj)
+    fileObj.write("]")
+
+
+def iterLeaguesJson(
+    fileObj: IO[str], *, chunkSize: int = __DEFAULT_CHUNK_SIZE
+) -> Iterator[League]:
+    """
+    Yields each League found in the given text file object.
+    The file can hold either a single League JSON object or a JSON array of League objects.
+    Each Year is parsed and turned into a Year model before the next one is read.
+    """
+    reader = _JSONStreamReader(fileObj, chunkSize=chunkSize)
+    firstChar = reader.peek()
+    if firstChar == "{":
+        yield _readLeague(reader)
+    elif firstChar == "[":
+        reader.expect("[")
+        if reader.peek() == "]":
+            reader.expect("]")
+        else:
+            while True:
+                yield _readLeague(reader)
+                if reader.peek() == ",":
+                    reader.expect(",")
+                else:
+                    reader.expect("]")
+                    break
+    else:
+        raise ValueError(f"Expected League JSON object or array, found '{firstChar}'.")
+    reader.expectEnd()
+
+
+def _readLeague(reader: "_JSONStreamReader") -> League:
+    """
+    Reads a single League object from the given reader.
+    """
+    leagueDict: dict[str, Any] = dict()
+    years: list[Year] = list()
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+    else:
+        while True:
+            key = reader.readValue()
+            reader.expect(":")
+            if key == "years" and reader.peek() == "[":
+                reader.expect("[")
+                if reader.peek() == "]":
+                    reader.expect("]")
+                else:
+                    while True:
+                        years.append(Year.fromJson(reader.readValue()))
+                        if reader.peek() == ",":
+                            reader.expect(",")
+                        else:
+                            reader.expect("]")
+                            break
+            else:
+                leagueDict[key] = reader.readValue()
+            if reader.peek() == ",":
+                reader.expect(",")
+            else:
+                reader.expect("}")
+                break
+
+    owners = [Owner.fromJson(ownerDict) for ownerDict in leagueDict["owners"]]
+    league = League(name=leagueDict["name"], owners=owners, years=years)
+    league.id = leagueDict["id"]
+    return league
+
+
+class _JSONStreamReader:
+    """
+    Reads JSON values from a text file object incrementally.
+    Only the structural characters of the outer containers are walked by hand, every other value is decoded with the standard json decoder.
+    """
+
+    __WHITESPACE = " \t\n\r"
+
+    def __init__(self, fileObj: IO[str], *, chunkSize: int):
+        self.__fileObj = fileObj
+        self.__chunkSize = chunkSize
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__position = 0
+        self.__exhausted = False
+
+    def __readMore(self, size: int) -> bool:
+        """
+        Reads more of the file into the buffer.
+        Returns whether anything was read.
+        """
+        if self.__exhausted:
+            return False
+        chunk = self.__fileObj.read(size)
+        if not chunk:
+            self.__exhausted = True
+            return False
+        # drop everything we have already consumed
+        self.__buffer = self.__buffer[self.__position :] + chunk
+        self.__position = 0
+        return True
+
+    def __skipWhitespace(self) -> None:
+        while True:
+            while (
+                self.__position < len(self.__buffer)
+                and self.__buffer[self.__position] in self.__WHITESPACE
+            ):
+                self.__position += 1
+            if self.__position < len(self.__buffer) or not self.__readMore(
+                self.__chunkSize
+            ):
+                return
+
+    def peek(self) -> str:
+        """
+        Returns the next non-whitespace character without consuming it.
+        Returns an empty string at the end of the file.
+        """
+        self.__skipWhitespace()
+        if self.__position < len(self.__buffer):
+            return self.__buffer[self.__position]
+        return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in League JSON, found '{found}'.")
+        self.__position += 1
+
+    def expectEnd(self) -> None:
+        found = self.peek()
+        if found != "":
+            raise ValueError(f"Expected end of League JSON, found '{found}'.")
+
+    def readValue(self) -> Any:
+        """
+        Decodes the next complete JSON value.
+        More of the file is read (doubling the read size each time) until the value can be decoded.
+        """
+        self.__skipWhitespace()
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__position)
+            except json.JSONDecodeError:
+                if not self.__readMore(max(self.__chunkSize, len(self.__buffer))):
+                    raise
+                continue
+            # a number at the very end of the buffer may continue in the next chunk
+            if end == len(self.__buffer) and self.__readMore(self.__chunkSize):
+                continue
+            self.__position = end
+            return value
@@ -0,0 +1,48 @@
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Callable
+
+
+class _LazyModule(ModuleType):
+    """
+    Module type used by packages that lazily import the classes they export.
+
+    Each exported class lives in a submodule with the same name as the class.
+    When one of those submodules is imported, Python sets it as an attribute on the package.
+    This swaps that attribute for the class, which matches the behavior of an eager 'from .Name import Name'.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if (
+            isinstance(value, ModuleType)
+            and name in self.__dict__.get("_LAZY_ATTRIBUTE_NAMES", ())
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def lazyAttributes(
+    moduleName: str, attributeNames: list[str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Sets up the module with the given name to lazily import the given attributes (PEP 562).
+    Each attribute must be a class with the same name as the submodule it is defined in.
+
+    Returns the module level __getattr__ and __dir__ functions that should be set in the module.
+    """
+    module = sys.modules[moduleName]
+    module.__class__ = _LazyModule
+    module._LAZY_ATTRIBUTE_NAMES = frozenset(attributeNames)
+
+    def __getattr__(name: str) -> Any:
+        if name in attributeNames:
+            # importing the submodule sets the class as an attribute of the package, so this only runs once per name
+            return getattr(importlib.import_module(f"{moduleName}.{name}"), name)
+        raise AttributeError(f"module '{moduleName}' has no attribute '{name}'")
+
+    def __dir__() -> list[str]:
+        return sorted(set(module.__dict__.keys()) | set(attributeNames))
+
+    return __getattr__, __dir__
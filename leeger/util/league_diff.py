@@ -0,0 +1,715 @@
+import copy
+import hashlib
+from typing import Any, Callable
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.enum.PatchOperationType import PatchOperationType
+from leeger.exception import DoesNotExistException
+from leeger.model.league.Division import Division
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Owner import Owner
+from leeger.model.league.Team import Team
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.league.YearSettings import YearSettings
+from leeger.model.patch.LeaguePatch import LeaguePatch
+from leeger.model.patch.PatchOperation import PatchOperation
+
+"""
+League Diff
+
+    - Finds the changes between 2 snapshots of the same League (e.g. yesterday's and today's load of a league).
+    - Models are matched by their natural keys instead of their IDs (see PatchOperation), since each load of a League gives new IDs.
+    - Years and Weeks are compared by a natural fingerprint (built from natural keys, without IDs), so they match across loads.
+    - Natural fingerprints are cached on each Year and Week, so diffing the same snapshot again skips unchanged Years without walking their Weeks.
+    - Only Weeks with a different natural fingerprint are diffed matchup by matchup.
+
+"""
+
+# the attribute that a Year's or Week's cached natural fingerprint is saved under
+__NATURAL_FINGERPRINT_CACHE_ATTRIBUTE = "_naturalFingerprintCache"
+
+
+def diffLeagues(oldLeague: League, newLeague: League) -> LeaguePatch:
+    """
+    Returns the LeaguePatch that turns the old League into the new League.
+    """
+    operations = list()
+    if oldLeague.name != newLeague.name:
+        operations.append(
+            PatchOperation(
+                operationType=PatchOperationType.SET_LEAGUE_NAME,
+                value=newLeague.name,
+                previousValue=oldLeague.name,
+            )
+        )
+
+    oldOwnerIdToName = {owner.id: owner.name for owner in oldLeague.owners}
+    newOwnerIdToName = {owner.id: owner.name for owner in newLeague.owners}
+    oldOwnerNames = set(oldOwnerIdToName.values())
+    newOwnerNames = set(newOwnerIdToName.values())
+    for owner in newLeague.owners:
+        if owner.name not in oldOwnerNames:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.ADD_OWNER, key=owner.name
+                )
+            )
+
+    oldYearsByNumber = {year.yearNumber: year for year in oldLeague.years}
+    newYearNumbers = {year.yearNumber for year in newLeague.years}
+    for year in oldLeague.years:
+        if year.yearNumber not in newYearNumbers:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.REMOVE_YEAR,
+                    yearNumber=year.yearNumber,
+                )
+            )
+    for year in newLeague.years:
+        oldYear = oldYearsByNumber.get(year.yearNumber)
+        if oldYear is None:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.ADD_YEAR,
+                    yearNumber=year.yearNumber,
+                    value=_YearView(year, newOwnerIdToName).yearToNatural(),
+                )
+            )
+        elif not _sameYear(oldYear, oldOwnerIdToName, year, newOwnerIdToName):
+            operations += _diffYears(
+                _YearView(oldYear, oldOwnerIdToName),
+                _YearView(year, newOwnerIdToName),
+            )
+
+    for owner in oldLeague.owners:
+        if owner.name not in newOwnerNames:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.REMOVE_OWNER, key=owner.name
+                )
+            )
+    return LeaguePatch(operations=operations)
+
+
+def applyPatch(league: League, patch: LeaguePatch) -> League:
+    """
+    Returns a copy of the given League with the given LeaguePatch applied to it.
+    The given League is not changed.
+    The patched League will be validated before it is returned.
+    """
+    from leeger.validate import leagueValidation
+
+    patchedLeague = copy.deepcopy(league)
+    for operation in patch.operations:
+        __OPERATION_FUNCTIONS[operation.operationType](patchedLeague, operation)
+    leagueValidation.runAllChecks(patchedLeague)
+    return patchedLeague
+
+
+class _YearView:
+    """
+    Looks up the natural keys of the models in a Year.
+    """
+
+    def __init__(self, year: Year, ownerIdToName: dict[str, str]):
+        self.year = year
+        self.teamIdToOwnerName = {
+            team.id: ownerIdToName[team.ownerId] for team in year.teams
+        }
+        self.divisionIdToName = {
+            division.id: division.name for division in year.divisions
+        }
+        # multi-week matchup IDs are labelled by where they first show up, so they line up across loads
+        self.multiWeekMatchupLabels: dict[str, str] = dict()
+        for week in year.weeks:
+            for matchup in week.matchups:
+                if (
+                    matchup.multiWeekMatchupId is not None
+                    and matchup.multiWeekMatchupId not in self.multiWeekMatchupLabels
+                ):
+                    self.multiWeekMatchupLabels[matchup.multiWeekMatchupId] = ":".join(
+                        (str(week.weekNumber),) + self.getMatchupKey(matchup)
+                    )
+        # everything besides a Week itself that its natural fingerprint depends on
+        self.weekFingerprintContext = (
+            tuple(sorted(self.teamIdToOwnerName.items())),
+            tuple(sorted(self.multiWeekMatchupLabels.items())),
+        )
+
+    def getTeamByOwnerName(self, ownerName: str) -> Team:
+        for team in self.year.teams:
+            if self.teamIdToOwnerName[team.id] == ownerName:
+                return team
+        raise DoesNotExistException(
+            f"Year {self.year.yearNumber} does not have a team owned by '{ownerName}'."
+        )
+
+    def getMatchupKey(self, matchup: Matchup) -> tuple[str, str]:
+        return tuple(
+            sorted(
+                (
+                    self.teamIdToOwnerName[matchup.teamAId],
+                    self.teamIdToOwnerName[matchup.teamBId],
+                )
+            )
+        )
+
+    def getMatchupByKey(self, week: Week, key: tuple[str, str]) -> Matchup:
+        for matchup in week.matchups:
+            if self.getMatchupKey(matchup) == tuple(key):
+                return matchup
+        raise DoesNotExistException(
+            f"Week {week.weekNumber} in Year {self.year.yearNumber} does not have a matchup between '{key[0]}' and '{key[1]}'."
+        )
+
+    def teamToNatural(self, team: Team) -> dict:
+        return {
+            "ownerName": self.teamIdToOwnerName[team.id],
+            "name": team.name,
+            "divisionName": self.divisionIdToName.get(team.divisionId),
+        }
+
+    def matchupToNatural(self, matchup: Matchup) -> dict:
+        natural = {
+            "teamAOwnerName": self.teamIdToOwnerName[matchup.teamAId],
+            "teamBOwnerName": self.teamIdToOwnerName[matchup.teamBId],
+            "teamAScore": matchup.teamAScore,
+            "teamBScore": matchup.teamBScore,
+            "teamAHasTiebreaker": matchup.teamAHasTiebreaker,
+            "teamBHasTiebreaker": matchup.teamBHasTiebreaker,
+            "matchupType": matchup.matchupType.name,
+            "multiWeekMatchupId": self.multiWeekMatchupLabels.get(
+                matchup.multiWeekMatchupId
+            ),
+        }
+        # team A is always the team whose owner name sorts first
+        if natural["teamBOwnerName"] < natural["teamAOwnerName"]:
+            natural = {
+                _getOtherSideFieldName(fieldName): value
+                for fieldName, value in natural.items()
+            }
+        return natural
+
+    def getNaturalMatchupsByKey(self, week: Week) -> dict[tuple[str, str], dict]:
+        naturalMatchupsByKey = dict()
+        for matchup in week.matchups:
+            natural = self.matchupToNatural(matchup)
+            naturalMatchupsByKey[
+                (natural["teamAOwnerName"], natural["teamBOwnerName"])
+            ] = natural
+        return naturalMatchupsByKey
+
+    def weekToNatural(self, week: Week) -> dict:
+        return {
+            "weekNumber": week.weekNumber,
+            "matchups": [self.matchupToNatural(matchup) for matchup in week.matchups],
+        }
+
+    def yearToNatural(self) -> dict:
+        return {
+            "yearNumber": self.year.yearNumber,
+            "yearSettings": self.year.yearSettings.toJson(),
+            "divisions": [division.name for division in self.year.divisions],
+            "teams": [self.teamToNatural(team) for team in self.year.teams],
+            "weeks": [self.weekToNatural(week) for week in self.year.weeks],
+        }
+
+
+def _sameYear(
+    oldYear: Year,
+    oldOwnerIdToName: dict[str, str],
+    newYear: Year,
+    newOwnerIdToName: dict[str, str],
+) -> bool:
+    """
+    Checks if the given Years are the same, without walking their Weeks if their fingerprints are cached.
+    """
+    if oldYear is newYear:
+        return True
+    oldOwnerNames = _getOwnerNames(oldYear, oldOwnerIdToName)
+    if oldYear.id == newYear.id and oldOwnerNames == _getOwnerNames(
+        newYear, newOwnerIdToName
+    ):
+        # the IDs mean the same thing in both Years, so the structural fingerprint is enough
+        return oldYear.fingerprint() == newYear.fingerprint()
+    return _getNaturalYearFingerprint(
+        oldYear, oldOwnerIdToName
+    ) == _getNaturalYearFingerprint(newYear, newOwnerIdToName)
+
+
+def _sameWeek(
+    oldYearView: _YearView, oldWeek: Week, newYearView: _YearView, newWeek: Week
+) -> bool:
+    if oldWeek is newWeek:
+        return True
+    if (
+        oldWeek.id == newWeek.id
+        and oldYearView.weekFingerprintContext == newYearView.weekFingerprintContext
+    ):
+        return oldWeek.fingerprint() == newWeek.fingerprint()
+    return _getNaturalWeekFingerprint(
+        oldYearView, oldWeek
+    ) == _getNaturalWeekFingerprint(newYearView, newWeek)
+
+
+def _getOwnerNames(year: Year, ownerIdToName: dict[str, str]) -> tuple:
+    return tuple(
+        sorted((team.ownerId, ownerIdToName[team.ownerId]) for team in year.teams)
+    )
+
+
+def _getNaturalYearFingerprint(year: Year, ownerIdToName: dict[str, str]) -> bytes:
+    """
+    Returns a hash of the given Year by natural keys, which is the same for Years from different loads that have no changes between them.
+    It is cached on the Year until the Year (or its owners' names) change.
+    """
+    cacheKey = (year.fingerprint(), _getOwnerNames(year, ownerIdToName))
+    cache = year.__dict__.get(__NATURAL_FINGERPRINT_CACHE_ATTRIBUTE)
+    if cache is not None and cache[0] == cacheKey:
+        return cache[1]
+    yearView = _YearView(year, ownerIdToName)
+    fingerprint = _hash(
+        (
+            year.yearNumber,
+            year.yearSettings.toJson(),
+            sorted(yearView.divisionIdToName.values()),
+            sorted(sorted(yearView.teamToNatural(team).items()) for team in year.teams),
+            sorted(
+                (week.weekNumber, _getNaturalWeekFingerprint(yearView, week))
+                for week in year.weeks
+            ),
+        )
+    )
+    # set directly in __dict__ so this does not clear the cached fingerprint or count as a model field
+    year.__dict__[__NATURAL_FINGERPRINT_CACHE_ATTRIBUTE] = (cacheKey, fingerprint)
+    return fingerprint
+
+
+def _getNaturalWeekFingerprint(yearView: _YearView, week: Week) -> bytes:
+    """
+    Returns a hash of the given Week's matchups by natural keys, cached on the Week until the Week (or the Year's natural keys) change.
+    """
+    cacheKey = (week.fingerprint(), yearView.weekFingerprintContext)
+    cache = week.__dict__.get(__NATURAL_FINGERPRINT_CACHE_ATTRIBUTE)
+    if cache is not None and cache[0] == cacheKey:
+        return cache[1]
+    fingerprint = _hash(
+        sorted(
+            (key, sorted(naturalMatchup.items()))
+            for key, naturalMatchup in yearView.getNaturalMatchupsByKey(week).items()
+        )
+    )
+    week.__dict__[__NATURAL_FINGERPRINT_CACHE_ATTRIBUTE] = (cacheKey, fingerprint)
+    return fingerprint
+
+
+def _hash(value: Any) -> bytes:
+    return hashlib.blake2b(repr(value).encode(), digest_size=16).digest()
+
+
+def _getOtherSideFieldName(fieldName: str) -> str:
+    if fieldName.startswith("teamA"):
+        return "teamB" + fieldName[5:]
+    if fieldName.startswith("teamB"):
+        return "teamA" + fieldName[5:]
+    return fieldName
+
+
+def _getChangedFields(oldNatural: dict, newNatural: dict) -> tuple[dict, dict]:
+    """
+    Returns the fields that changed with their new values and with their old values.
+    """
+    changedFieldNames = [
+        fieldName
+        for fieldName in newNatural
+        if oldNatural.get(fieldName) != newNatural[fieldName]
+    ]
+    return (
+        {fieldName: newNatural[fieldName] for fieldName in changedFieldNames},
+        {fieldName: oldNatural.get(fieldName) for fieldName in changedFieldNames},
+    )
+
+
+def _diffYears(oldYearView: _YearView, newYearView: _YearView) -> list[PatchOperation]:
+    """
+    Returns the operations that turn the old Year into the new Year.
+    Operations are ordered so that everything a model refers to is added before it and removed after it.
+    """
+    operations = list()
+    oldYear, newYear = oldYearView.year, newYearView.year
+    yearNumber = newYear.yearNumber
+
+    if oldYear.yearSettings.toJson() != newYear.yearSettings.toJson():
+        operations.append(
+            PatchOperation(
+                operationType=PatchOperationType.UPDATE_YEAR_SETTINGS,
+                yearNumber=yearNumber,
+                value=newYear.yearSettings.toJson(),
+                previousValue=oldYear.yearSettings.toJson(),
+            )
+        )
+
+    oldDivisionNames = set(oldYearView.divisionIdToName.values())
+    newDivisionNames = set(newYearView.divisionIdToName.values())
+    for division in newYear.divisions:
+        if division.name not in oldDivisionNames:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.ADD_DIVISION,
+                    yearNumber=yearNumber,
+                    key=division.name,
+                )
+            )
+
+    oldTeamsByOwnerName = {
+        naturalTeam["ownerName"]: naturalTeam
+        for naturalTeam in map(oldYearView.teamToNatural, oldYear.teams)
+    }
+    newTeamsByOwnerName = {
+        naturalTeam["ownerName"]: naturalTeam
+        for naturalTeam in map(newYearView.teamToNatural, newYear.teams)
+    }
+    for ownerName, naturalTeam in newTeamsByOwnerName.items():
+        if ownerName not in oldTeamsByOwnerName:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.ADD_TEAM,
+                    yearNumber=yearNumber,
+                    key=ownerName,
+                    value=naturalTeam,
+                )
+            )
+        else:
+            value, previousValue = _getChangedFields(
+                oldTeamsByOwnerName[ownerName], naturalTeam
+            )
+            if value:
+                operations.append(
+                    PatchOperation(
+                        operationType=PatchOperationType.UPDATE_TEAM,
+                        yearNumber=yearNumber,
+                        key=ownerName,
+                        value=value,
+                        previousValue=previousValue,
+                    )
+                )
+
+    oldWeeksByNumber = {week.weekNumber: week for week in oldYear.weeks}
+    newWeekNumbers = {week.weekNumber for week in newYear.weeks}
+    for week in oldYear.weeks:
+        if week.weekNumber not in newWeekNumbers:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.REMOVE_WEEK,
+                    yearNumber=yearNumber,
+                    weekNumber=week.weekNumber,
+                )
+            )
+    for week in newYear.weeks:
+        oldWeek = oldWeeksByNumber.get(week.weekNumber)
+        if oldWeek is None:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.ADD_WEEK,
+                    yearNumber=yearNumber,
+                    weekNumber=week.weekNumber,
+                    value=newYearView.weekToNatural(week),
+                )
+            )
+        elif not _sameWeek(oldYearView, oldWeek, newYearView, week):
+            operations += _diffWeeks(
+                yearNumber,
+                week.weekNumber,
+                oldYearView.getNaturalMatchupsByKey(oldWeek),
+                newYearView.getNaturalMatchupsByKey(week),
+            )
+
+    for ownerName in oldTeamsByOwnerName:
+        if ownerName not in newTeamsByOwnerName:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.REMOVE_TEAM,
+                    yearNumber=yearNumber,
+                    key=ownerName,
+                )
+            )
+    for division in oldYear.divisions:
+        if division.name not in newDivisionNames:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.REMOVE_DIVISION,
+                    yearNumber=yearNumber,
+                    key=division.name,
+                )
+            )
+    return operations
+
+
+def _diffWeeks(
+    yearNumber: int,
+    weekNumber: int,
+    oldMatchupsByKey: dict[tuple[str, str], dict],
+    newMatchupsByKey: dict[tuple[str, str], dict],
+) -> list[PatchOperation]:
+    """
+    Returns the operations that turn the old Week's matchups into the new Week's matchups.
+    Matchups are removed first, so a team can be moved to a new matchup in the same Week.
+    """
+    operations = list()
+    for key in oldMatchupsByKey:
+        if key not in newMatchupsByKey:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.REMOVE_MATCHUP,
+                    yearNumber=yearNumber,
+                    weekNumber=weekNumber,
+                    key=key,
+                )
+            )
+    for key, naturalMatchup in newMatchupsByKey.items():
+        if key not in oldMatchupsByKey:
+            operations.append(
+                PatchOperation(
+                    operationType=PatchOperationType.ADD_MATCHUP,
+                    yearNumber=yearNumber,
+                    weekNumber=weekNumber,
+                    key=key,
+                    value=naturalMatchup,
+                )
+            )
+        else:
+            value, previousValue = _getChangedFields(
+                oldMatchupsByKey[key], naturalMatchup
+            )
+            if value:
+                operations.append(
+                    PatchOperation(
+                        operationType=PatchOperationType.UPDATE_MATCHUP,
+                        yearNumber=yearNumber,
+                        weekNumber=weekNumber,
+                        key=key,
+                        value=value,
+                        previousValue=previousValue,
+                    )
+                )
+    return operations
+
+
+def _getYearView(league: League, yearNumber: int) -> _YearView:
+    return _YearView(
+        league.getYearByYearNumber(yearNumber),
+        {owner.id: owner.name for owner in league.owners},
+    )
+
+
+def _getMultiWeekMatchupIdsByLabel(yearView: _YearView) -> dict[str, str]:
+    return {
+        label: multiWeekMatchupId
+        for multiWeekMatchupId, label in yearView.multiWeekMatchupLabels.items()
+    }
+
+
+def _naturalToTeam(league: League, year: Year, naturalTeam: dict) -> Team:
+    divisionName = naturalTeam["divisionName"]
+    divisionId = None
+    if divisionName is not None:
+        divisionId = _getDivisionByName(year, divisionName).id
+    return Team(
+        ownerId=league.getOwnerByName(naturalTeam["ownerName"]).id,
+        name=naturalTeam["name"],
+        divisionId=divisionId,
+    )
+
+
+def _naturalToMatchup(
+    yearView: _YearView,
+    naturalMatchup: dict,
+    multiWeekMatchupIdsByLabel: dict[str, str],
+) -> Matchup:
+    label = naturalMatchup["multiWeekMatchupId"]
+    return Matchup(
+        teamAId=yearView.getTeamByOwnerName(naturalMatchup["teamAOwnerName"]).id,
+        teamBId=yearView.getTeamByOwnerName(naturalMatchup["teamBOwnerName"]).id,
+        teamAScore=naturalMatchup["teamAScore"],
+        teamBScore=naturalMatchup["teamBScore"],
+        teamAHasTiebreaker=naturalMatchup["teamAHasTiebreaker"],
+        teamBHasTiebreaker=naturalMatchup["teamBHasTiebreaker"],
+        matchupType=MatchupType.fromStr(naturalMatchup["matchupType"]),
+        # a label that is new to this year is used as the ID itself
+        multiWeekMatchupId=None
+        if label is None
+        else multiWeekMatchupIdsByLabel.get(label, label),
+    )
+
+
+def _naturalToWeek(
+    yearView: _YearView, naturalWeek: dict, multiWeekMatchupIdsByLabel: dict[str, str]
+) -> Week:
+    return Week(
+        weekNumber=naturalWeek["weekNumber"],
+        matchups=[
+            _naturalToMatchup(yearView, naturalMatchup, multiWeekMatchupIdsByLabel)
+            for naturalMatchup in naturalWeek["matchups"]
+        ],
+    )
+
+
+def _getDivisionByName(year: Year, divisionName: str) -> Division:
+    for division in year.divisions:
+        if division.name == divisionName:
+            return division
+    raise DoesNotExistException(
+        f"Year {year.yearNumber} does not have a division with name '{divisionName}'."
+    )
+
+
+def _setLeagueName(league: League, operation: PatchOperation) -> None:
+    league.name = operation.value
+
+
+def _addOwner(league: League, operation: PatchOperation) -> None:
+    league.owners.append(Owner(name=operation.key))
+
+
+def _removeOwner(league: League, operation: PatchOperation) -> None:
+    owner = league.getOwnerByName(operation.key)
+    league.owners = [o for o in league.owners if o is not owner]
+
+
+def _addYear(league: League, operation: PatchOperation) -> None:
+    naturalYear = operation.value
+    year = Year(
+        yearNumber=naturalYear["yearNumber"],
+        teams=list(),
+        weeks=list(),
+        divisions=[Division(name=name) for name in naturalYear["divisions"]],
+        yearSettings=YearSettings.fromJson(naturalYear["yearSettings"]),
+    )
+    year.teams = [
+        _naturalToTeam(league, year, naturalTeam)
+        for naturalTeam in naturalYear["teams"]
+    ]
+    yearView = _YearView(year, {owner.id: owner.name for owner in league.owners})
+    multiWeekMatchupIdsByLabel = dict()
+    year.weeks = [
+        _naturalToWeek(yearView, naturalWeek, multiWeekMatchupIdsByLabel)
+        for naturalWeek in naturalYear["weeks"]
+    ]
+    league.years = sorted(league.years + [year], key=lambda y: y.yearNumber)
+
+
+def _removeYear(league: League, operation: PatchOperation) -> None:
+    year = league.getYearByYearNumber(operation.yearNumber)
+    league.years = [y for y in league.years if y is not year]
+
+
+def _updateYearSettings(league: League, operation: PatchOperation) -> None:
+    year = league.getYearByYearNumber(operation.yearNumber)
+    year.yearSettings = YearSettings.fromJson(operation.value)
+
+
+def _addDivision(league: League, operation: PatchOperation) -> None:
+    year = league.getYearByYearNumber(operation.yearNumber)
+    year.divisions.append(Division(name=operation.key))
+
+
+def _removeDivision(league: League, operation: PatchOperation) -> None:
+    year = league.getYearByYearNumber(operation.yearNumber)
+    division = _getDivisionByName(year, operation.key)
+    year.divisions = [d for d in year.divisions if d is not division]
+
+
+def _addTeam(league: League, operation: PatchOperation) -> None:
+    year = league.getYearByYearNumber(operation.yearNumber)
+    year.teams.append(_naturalToTeam(league, year, operation.value))
+
+
+def _removeTeam(league: League, operation: PatchOperation) -> None:
+    yearView = _getYearView(league, operation.yearNumber)
+    team = yearView.getTeamByOwnerName(operation.key)
+    yearView.year.teams = [t for t in yearView.year.teams if t is not team]
+
+
+def _updateTeam(league: League, operation: PatchOperation) -> None:
+    yearView = _getYearView(league, operation.yearNumber)
+    team = yearView.getTeamByOwnerName(operation.key)
+    for fieldName, value in operation.value.items():
+        if fieldName == "name":
+            team.name = value
+        elif fieldName == "divisionName":
+            team.divisionId = (
+                None if value is None else _getDivisionByName(yearView.year, value).id
+            )
+
+
+def _addWeek(league: League, operation: PatchOperation) -> None:
+    yearView = _getYearView(league, operation.yearNumber)
+    week = _naturalToWeek(
+        yearView, operation.value, _getMultiWeekMatchupIdsByLabel(yearView)
+    )
+    yearView.year.weeks = sorted(
+        yearView.year.weeks + [week], key=lambda w: w.weekNumber
+    )
+
+
+def _removeWeek(league: League, operation: PatchOperation) -> None:
+    year = league.getYearByYearNumber(operation.yearNumber)
+    week = year.getWeekByWeekNumber(operation.weekNumber)
+    year.weeks = [w for w in year.weeks if w is not week]
+
+
+def _addMatchup(league: League, operation: PatchOperation) -> None:
+    yearView = _getYearView(league, operation.yearNumber)
+    week = yearView.year.getWeekByWeekNumber(operation.weekNumber)
+    week.matchups.append(
+        _naturalToMatchup(
+            yearView, operation.value, _getMultiWeekMatchupIdsByLabel(yearView)
+        )
+    )
+
+
+def _removeMatchup(league: League, operation: PatchOperation) -> None:
+    yearView = _getYearView(league, operation.yearNumber)
+    week = yearView.year.getWeekByWeekNumber(operation.weekNumber)
+    matchup = yearView.getMatchupByKey(week, operation.key)
+    week.matchups = [m for m in week.matchups if m is not matchup]
+
+
+def _updateMatchup(league: League, operation: PatchOperation) -> None:
+    yearView = _getYearView(league, operation.yearNumber)
+    week = yearView.year.getWeekByWeekNumber(operation.weekNumber)
+    matchup = yearView.getMatchupByKey(week, operation.key)
+    # the patch always has team A as the team whose owner name sorts first
+    flipped = yearView.teamIdToOwnerName[matchup.teamAId] != operation.key[0]
+    for fieldName, value in operation.value.items():
+        if fieldName == "matchupType":
+            value = MatchupType.fromStr(value)
+        elif fieldName == "multiWeekMatchupId" and value is not None:
+            value = _getMultiWeekMatchupIdsByLabel(yearView).get(value, value)
+        setattr(
+            matchup, _getOtherSideFieldName(fieldName) if flipped else fieldName, value
+        )
+
+
+__OPERATION_FUNCTIONS: dict[
+    PatchOperationType, Callable[[League, PatchOperation], None]
+] = {
+    PatchOperationType.SET_LEAGUE_NAME: _setLeagueName,
+    PatchOperationType.ADD_OWNER: _addOwner,
+    PatchOperationType.REMOVE_OWNER: _removeOwner,
+    PatchOperationType.ADD_YEAR: _addYear,
+    PatchOperationType.REMOVE_YEAR: _removeYear,
+    PatchOperationType.UPDATE_YEAR_SETTINGS: _updateYearSettings,
+    PatchOperationType.ADD_DIVISION: _addDivision,
+    PatchOperationType.REMOVE_DIVISION: _removeDivision,
+    PatchOperationType.ADD_TEAM: _addTeam,
+    PatchOperationType.REMOVE_TEAM: _removeTeam,
+    PatchOperationType.UPDATE_TEAM: _updateTeam,
+    PatchOperationType.ADD_WEEK: _addWeek,
+    PatchOperationType.REMOVE_WEEK: _removeWeek,
+    PatchOperationType.ADD_MATCHUP: _addMatchup,
+    PatchOperationType.REMOVE_MATCHUP: _removeMatchup,
+    PatchOperationType.UPDATE_MATCHUP: _updateMatchup,
+}
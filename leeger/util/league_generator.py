@@ -0,0 +1,267 @@
+import random
+from typing import Optional
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league.Division import Division
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Owner import Owner
+from leeger.model.league.Team import Team
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.league.YearSettings import YearSettings
+
+"""
+League Generator
+
+    - Generates valid Leagues of any size for testing and benchmarking.
+    - The same arguments (including the seed) always give the same League, IDs included.
+    - Regular seasons are round robins, playoffs are single elimination brackets seeded by regular season record.
+
+"""
+
+__MIN_YEAR_NUMBER = 1920
+__MAX_YEAR_NUMBER = 2999
+__DEFAULT_START_YEAR_NUMBER = 2000
+# average and spread of team strength and of weekly scores around a team's strength
+__AVERAGE_SCORE = 110
+__TEAM_STRENGTH_STANDARD_DEVIATION = 10
+__SCORE_STANDARD_DEVIATION = 20
+
+
+def generateLeague(
+    *,
+    seed: int = 0,
+    numberOfYears: int = 1,
+    numberOfTeams: int = 4,
+    numberOfRegularSeasonWeeks: int = 13,
+    numberOfPlayoffTeams: int = 4,
+    numberOfChampionshipWeeks: int = 1,
+    numberOfDivisions: int = 0,
+    leagueMedianGames: bool = False,
+    startYearNumber: Optional[int] = None,
+    name: str = "Generated League",
+) -> League:
+    """
+    Returns a generated League that passes leagueValidation.runAllChecks().
+
+    seed: seed for the random number generator, the same seed always gives the same League
+    numberOfYears: number of Years in the League
+    numberOfTeams: number of Teams in each Year (one per Owner)
+    numberOfRegularSeasonWeeks: number of regular season Weeks in each Year
+    numberOfPlayoffTeams: number of Teams that make the playoffs, must be 0 (no playoffs) or a power of 2
+    numberOfChampionshipWeeks: number of Weeks the championship Matchup is played over, more than 1 gives a multi-week Matchup
+    numberOfDivisions: number of Divisions in each Year, Teams are split between them as evenly as possible
+    leagueMedianGames: whether each Year has league median games turned on
+    startYearNumber: year number of the first Year, defaults to 2000 (or earlier, if needed to fit all Years in the valid range)
+    """
+    if numberOfYears < 1:
+        raise ValueError("'numberOfYears' must be at least 1.")
+    if numberOfTeams < 2:
+        raise ValueError("'numberOfTeams' must be at least 2.")
+    if numberOfRegularSeasonWeeks < 0:
+        raise ValueError("'numberOfRegularSeasonWeeks' cannot be negative.")
+    if numberOfPlayoffTeams != 0 and (
+        numberOfPlayoffTeams < 2
+        or numberOfPlayoffTeams > numberOfTeams
+        or numberOfPlayoffTeams & (numberOfPlayoffTeams - 1) != 0
+    ):
+        raise ValueError(
+            "'numberOfPlayoffTeams' must be 0 or a power of 2 that is not more than 'numberOfTeams'."
+        )
+    if numberOfChampionshipWeeks < 1:
+        raise ValueError("'numberOfChampionshipWeeks' must be at least 1.")
+    if numberOfRegularSeasonWeeks == 0 and numberOfPlayoffTeams != numberOfTeams:
+        raise ValueError(
+            "Every Team must make the playoffs if there are no regular season Weeks."
+        )
+    if numberOfDivisions < 0 or numberOfDivisions > numberOfTeams:
+        raise ValueError("'numberOfDivisions' must be between 0 and 'numberOfTeams'.")
+    if startYearNumber is None:
+        startYearNumber = min(
+            __DEFAULT_START_YEAR_NUMBER, __MAX_YEAR_NUMBER - numberOfYears + 1
+        )
+    if (
+        startYearNumber < __MIN_YEAR_NUMBER
+        or startYearNumber + numberOfYears - 1 > __MAX_YEAR_NUMBER
+    ):
+        raise ValueError(
+            f"All year numbers must be in range {__MIN_YEAR_NUMBER}-{__MAX_YEAR_NUMBER}."
+        )
+
+    rand = random.Random(seed)
+    owners = list()
+    for i in range(numberOfTeams):
+        owner = Owner(name=f"Owner {i + 1}")
+        owner.id = _generateId(rand)
+        owners.append(owner)
+    years = list()
+    for yearNumber in range(startYearNumber, startYearNumber + numberOfYears):
+        years.append(
+            _generateYear(
+                rand,
+                yearNumber=yearNumber,
+                owners=owners,
+                numberOfRegularSeasonWeeks=numberOfRegularSeasonWeeks,
+                numberOfPlayoffTeams=numberOfPlayoffTeams,
+                numberOfChampionshipWeeks=numberOfChampionshipWeeks,
+                numberOfDivisions=numberOfDivisions,
+                leagueMedianGames=leagueMedianGames,
+            )
+        )
+    league = League(name=name, owners=owners, years=years)
+    league.id = _generateId(rand)
+    return league
+
+
+def _generateId(rand: random.Random) -> str:
+    """
+    Generates an ID in the same format as IdGenerator.generateId(), but from the given random number generator.
+    """
+    return f"{rand.getrandbits(128):032x}"
+
+
+def _generateScore(rand: random.Random, teamStrength: float) -> float:
+    return max(0.0, round(rand.gauss(teamStrength, __SCORE_STANDARD_DEVIATION), 2))
+
+
+def _generateMatchup(
+    rand: random.Random,
+    *,
+    teamA: Team,
+    teamB: Team,
+    teamStrengths: dict[str, float],
+    matchupType: MatchupType,
+    multiWeekMatchupId: Optional[str] = None,
+) -> Matchup:
+    teamAScore = _generateScore(rand, teamStrengths[teamA.id])
+    teamBScore = _generateScore(rand, teamStrengths[teamB.id])
+    if matchupType != MatchupType.REGULAR_SEASON and teamAScore == teamBScore:
+        # playoff matchups cannot end in a tie
+        teamAScore = round(teamAScore + 0.01, 2)
+    matchup = Matchup(
+        teamAId=teamA.id,
+        teamBId=teamB.id,
+        teamAScore=teamAScore,
+        teamBScore=teamBScore,
+        matchupType=matchupType,
+        multiWeekMatchupId=multiWeekMatchupId,
+    )
+    matchup.id = _generateId(rand)
+    return matchup
+
+
+def _generateYear(
+    rand: random.Random,
+    *,
+    yearNumber: int,
+    owners: list[Owner],
+    numberOfRegularSeasonWeeks: int,
+    numberOfPlayoffTeams: int,
+    numberOfChampionshipWeeks: int,
+    numberOfDivisions: int,
+    leagueMedianGames: bool,
+) -> Year:
+    divisions = list()
+    for i in range(numberOfDivisions):
+        division = Division(name=f"Division {i + 1}")
+        division.id = _generateId(rand)
+        divisions.append(division)
+    teams = list()
+    for i, owner in enumerate(owners):
+        team = Team(
+            ownerId=owner.id,
+            name=f"Team {i + 1}",
+            divisionId=divisions[i % numberOfDivisions].id if divisions else None,
+        )
+        team.id = _generateId(rand)
+        teams.append(team)
+    teamStrengths = {
+        team.id: rand.gauss(__AVERAGE_SCORE, __TEAM_STRENGTH_STANDARD_DEVIATION)
+        for team in teams
+    }
+
+    weekMatchups: list[list[Matchup]] = list()
+    # regular season round robin (circle method), a None team is a bye
+    rotation: list[Optional[Team]] = rand.sample(teams, len(teams))
+    if len(rotation) % 2 == 1:
+        rotation.append(None)
+    wins = {team.id: 0 for team in teams}
+    pointsFor = {team.id: 0.0 for team in teams}
+    for _ in range(numberOfRegularSeasonWeeks):
+        matchups = list()
+        for i in range(len(rotation) // 2):
+            teamA, teamB = rotation[i], rotation[-1 - i]
+            if teamA is None or teamB is None:
+                continue
+            matchup = _generateMatchup(
+                rand,
+                teamA=teamA,
+                teamB=teamB,
+                teamStrengths=teamStrengths,
+                matchupType=MatchupType.REGULAR_SEASON,
+            )
+            pointsFor[teamA.id] += matchup.teamAScore
+            pointsFor[teamB.id] += matchup.teamBScore
+            if matchup.teamAScore > matchup.teamBScore:
+                wins[teamA.id] += 1
+            elif matchup.teamBScore > matchup.teamAScore:
+                wins[teamB.id] += 1
+            matchups.append(matchup)
+        weekMatchups.append(matchups)
+        rotation.insert(1, rotation.pop())
+
+    if numberOfPlayoffTeams > 0:
+        # bracket order, so the best remaining seed always plays the worst remaining seed
+        bracket = sorted(
+            teams, key=lambda t: (wins[t.id], pointsFor[t.id]), reverse=True
+        )[:numberOfPlayoffTeams]
+        while len(bracket) > 2:
+            matchups = list()
+            winners = list()
+            for i in range(len(bracket) // 2):
+                teamA, teamB = bracket[i], bracket[-1 - i]
+                matchup = _generateMatchup(
+                    rand,
+                    teamA=teamA,
+                    teamB=teamB,
+                    teamStrengths=teamStrengths,
+                    matchupType=MatchupType.PLAYOFF,
+                )
+                winners.append(
+                    teamA if matchup.teamAScore > matchup.teamBScore else teamB
+                )
+                matchups.append(matchup)
+            weekMatchups.append(matchups)
+            bracket = winners
+        multiWeekMatchupId = (
+            _generateId(rand) if numberOfChampionshipWeeks > 1 else None
+        )
+        for _ in range(numberOfChampionshipWeeks):
+            weekMatchups.append(
+                [
+                    _generateMatchup(
+                        rand,
+                        teamA=bracket[0],
+                        teamB=bracket[1],
+                        teamStrengths=teamStrengths,
+                        matchupType=MatchupType.CHAMPIONSHIP,
+                        multiWeekMatchupId=multiWeekMatchupId,
+                    )
+                ]
+            )
+
+    weeks = list()
+    for i, matchups in enumerate(weekMatchups):
+        week = Week(weekNumber=i + 1, matchups=matchups)
+        week.id = _generateId(rand)
+        weeks.append(week)
+    year = Year(
+        yearNumber=yearNumber,
+        teams=teams,
+        weeks=weeks,
+        divisions=divisions,
+        yearSettings=YearSettings(leagueMedianGames=leagueMedianGames),
+    )
+    year.id = _generateId(rand)
+    return year
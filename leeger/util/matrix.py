@@ -0,0 +1,272 @@
+import threading
+from collections import OrderedDict
+
+import numpy
+
+from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.decorator.validators import validateLeague, validateYear
+from leeger.model.filter import YearFilters
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Year import Year
+from leeger.model.matrix.AllPlayMatrix import AllPlayMatrix
+from leeger.model.matrix.HeadToHeadMatrix import HeadToHeadMatrix
+from leeger.util.navigator.MatchupNavigator import MatchupNavigator
+
+"""
+Matrices
+
+    - Builds an Owner vs Owner head-to-head matrix and a Week vs Owner all-play matrix for a Year in a single pass over its Matchups.
+    - Year matrices are cached by the Year's fingerprint and filters, so changing a Year gives new matrices.
+      The cache doesn't keep a reference to the Year, and holds the matrices of the most recently used 256 (Year, filters).
+    - All-time matrices are combined from the (cached) matrices of each Year.
+    - Filters are the same kwargs the Year and All-Time calculators take.
+
+"""
+
+__CACHE_SIZE = 256
+# (Year fingerprint, filters) -> Year matrices, least recently used first
+__yearMatricesCache: OrderedDict[tuple, tuple[HeadToHeadMatrix, AllPlayMatrix]] = (
+    OrderedDict()
+)
+__yearMatricesCacheLock = threading.Lock()
+
+
+@validateYear
+def getYearHeadToHeadMatrix(year: Year, **kwargs) -> HeadToHeadMatrix:
+    """
+    Returns the Owner vs Owner head-to-head matrix for the given Year.
+    """
+    return _getYearMatrices(year, **_getCacheKwargs(kwargs))[0]
+
+
+@validateYear
+def getYearAllPlayMatrix(year: Year, **kwargs) -> AllPlayMatrix:
+    """
+    Returns the Week vs Owner all-play matrix for the given Year.
+    """
+    return _getYearMatrices(year, **_getCacheKwargs(kwargs))[1]
+
+
+@validateLeague
+def getLeagueHeadToHeadMatrix(league: League, **kwargs) -> HeadToHeadMatrix:
+    """
+    Returns the all-time Owner vs Owner head-to-head matrix for the given League.
+    Every Owner in the League is in the matrix, in the same order as League.owners.
+    """
+    headToHeadMatrix = _getEmptyHeadToHeadMatrix([owner.id for owner in league.owners])
+    for yearMatrices in _getAllYearMatrices(league, **kwargs):
+        headToHeadMatrix += yearMatrices[0]
+    return headToHeadMatrix
+
+
+@validateLeague
+def getLeagueAllPlayMatrix(league: League, **kwargs) -> AllPlayMatrix:
+    """
+    Returns the all-time Week vs Owner all-play matrix for the given League, with a row for every Week in every Year.
+    Every Owner in the League is in the matrix, in the same order as League.owners.
+    """
+    ownerIds = [owner.id for owner in league.owners]
+    ownerIdToIndex = {ownerId: i for i, ownerId in enumerate(ownerIds)}
+    allYearMatrices = [
+        yearMatrices[1] for yearMatrices in _getAllYearMatrices(league, **kwargs)
+    ]
+    numberOfWeeks = sum(len(allPlayMatrix.weeks) for allPlayMatrix in allYearMatrices)
+    scores = numpy.full((numberOfWeeks, len(ownerIds)), numpy.nan)
+    outscored = numpy.zeros((numberOfWeeks, len(ownerIds)), dtype=numpy.int64)
+    tied = numpy.zeros((numberOfWeeks, len(ownerIds)), dtype=numpy.int64)
+    gameScores = numpy.full((numberOfWeeks, len(ownerIds)), numpy.nan)
+    multiWeekGames = numpy.zeros((numberOfWeeks, len(ownerIds)), dtype=bool)
+    weeks = list()
+    row = 0
+    for allPlayMatrix in allYearMatrices:
+        rows = slice(row, row + len(allPlayMatrix.weeks))
+        columns = [ownerIdToIndex[ownerId] for ownerId in allPlayMatrix.ownerIds]
+        scores[rows, columns] = allPlayMatrix.scores
+        outscored[rows, columns] = allPlayMatrix.outscored
+        tied[rows, columns] = allPlayMatrix.tied
+        gameScores[rows, columns] = allPlayMatrix.gameScores
+        multiWeekGames[rows, columns] = allPlayMatrix.multiWeekGames
+        weeks += allPlayMatrix.weeks
+        row += len(allPlayMatrix.weeks)
+    return _getAllPlayMatrix(
+        weeks=weeks,
+        ownerIds=ownerIds,
+        scores=scores,
+        outscored=outscored,
+        tied=tied,
+        gameScores=gameScores,
+        multiWeekGames=multiWeekGames,
+    )
+
+
+def clearMatrixCache() -> None:
+    with __yearMatricesCacheLock:
+        __yearMatricesCache.clear()
+
+
+def _getCacheKwargs(kwargs: dict) -> dict:
+    # validation is done before the cache is checked, so it doesn't need to be part of the key
+    return {key: value for key, value in kwargs.items() if key != "validate"}
+
+
+def _getAllYearMatrices(
+    league: League, **kwargs
+) -> list[tuple[HeadToHeadMatrix, AllPlayMatrix]]:
+    def getYearMatrices(year: Year, **yearKwargs):
+        return _getYearMatrices(year, **_getCacheKwargs(yearKwargs))
+
+    return list(
+        AllTimeCalculator._getAllResultDictsByYear(
+            league, getYearMatrices, **kwargs
+        ).values()
+    )
+
+
+def _getYearMatrices(year: Year, **kwargs) -> tuple[HeadToHeadMatrix, AllPlayMatrix]:
+    """
+    Returns both matrices for the given Year, from the cache if they have been built for the same Year and filters.
+    """
+    key = (year.fingerprint(), tuple(sorted(kwargs.items())))
+    with __yearMatricesCacheLock:
+        yearMatrices = __yearMatricesCache.get(key)
+        if yearMatrices is not None:
+            __yearMatricesCache.move_to_end(key)
+            return yearMatrices
+    # built outside the lock, so other Years aren't held up
+    yearMatrices = _buildYearMatrices(year, **kwargs)
+    with __yearMatricesCacheLock:
+        yearMatrices = __yearMatricesCache.setdefault(key, yearMatrices)
+        __yearMatricesCache.move_to_end(key)
+        while len(__yearMatricesCache) > __CACHE_SIZE:
+            __yearMatricesCache.popitem(last=False)
+    return yearMatrices
+
+
+def _buildYearMatrices(year: Year, **kwargs) -> tuple[HeadToHeadMatrix, AllPlayMatrix]:
+    """
+    Builds both matrices for the given Year in one pass over its Matchups.
+    """
+    filters = YearFilters.getForYear(year, **kwargs)
+    teamIdToOwnerId = {team.id: team.ownerId for team in year.teams}
+    ownerIds = [team.ownerId for team in year.teams]
+    ownerIdToIndex = {ownerId: i for i, ownerId in enumerate(ownerIds)}
+    teamIdToIndex = {
+        teamId: ownerIdToIndex[ownerId] for teamId, ownerId in teamIdToOwnerId.items()
+    }
+    n = len(ownerIds)
+    weekIndexes = range(filters.weekNumberStart - 1, filters.weekNumberEnd)
+
+    scores = numpy.full((len(weekIndexes), n), numpy.nan)
+    wins = numpy.zeros((n, n), dtype=numpy.int64)
+    losses = numpy.zeros((n, n), dtype=numpy.int64)
+    ties = numpy.zeros((n, n), dtype=numpy.int64)
+    pointsFor = numpy.zeros((n, n), dtype=numpy.float64)
+    # multi-week matchups only count as a single game, so they are combined once all their weeks are found
+    gameMatchups: list[Matchup] = list()
+    multiWeekMatchupIdToMatchupListMap: dict[str, list[Matchup]] = dict()
+    # multi-week matchup ID -> the rows of its Weeks
+    multiWeekMatchupIdToRowsMap: dict[str, list[int]] = dict()
+
+    for row, weekIndex in enumerate(weekIndexes):
+        for matchup in year.weeks[weekIndex].matchups:
+            if matchup.matchupType not in filters.includeMatchupTypes:
+                continue
+            a, b = teamIdToIndex[matchup.teamAId], teamIdToIndex[matchup.teamBId]
+            scores[row, a] = matchup.teamAScore
+            scores[row, b] = matchup.teamBScore
+            pointsFor[a, b] += matchup.teamAScore
+            pointsFor[b, a] += matchup.teamBScore
+            mwmid = matchup.multiWeekMatchupId
+            if mwmid is None:
+                gameMatchups.append(matchup)
+            elif mwmid in multiWeekMatchupIdToMatchupListMap:
+                multiWeekMatchupIdToMatchupListMap[mwmid].append(matchup)
+                multiWeekMatchupIdToRowsMap[mwmid].append(row)
+            else:
+                multiWeekMatchupIdToMatchupListMap[mwmid] = [matchup]
+                multiWeekMatchupIdToRowsMap[mwmid] = [row]
+
+    # the same as scores, except a multi-week matchup is one score in its last Week
+    gameScores = scores.copy()
+    multiWeekGames = numpy.zeros(scores.shape, dtype=bool)
+    for mwmid, matchupList in multiWeekMatchupIdToMatchupListMap.items():
+        matchup = MatchupNavigator.simplifyMultiWeekMatchups(matchupList)
+        gameMatchups.append(matchup)
+        a, b = teamIdToIndex[matchup.teamAId], teamIdToIndex[matchup.teamBId]
+        *earlierRows, lastRow = multiWeekMatchupIdToRowsMap[mwmid]
+        gameScores[earlierRows, a] = numpy.nan
+        gameScores[earlierRows, b] = numpy.nan
+        gameScores[lastRow, a] = matchup.teamAScore
+        gameScores[lastRow, b] = matchup.teamBScore
+        multiWeekGames[lastRow, [a, b]] = True
+    for matchup in gameMatchups:
+        a, b = teamIdToIndex[matchup.teamAId], teamIdToIndex[matchup.teamBId]
+        winnerTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(matchup)
+        if winnerTeamId is None:
+            ties[a, b] += 1
+            ties[b, a] += 1
+        elif winnerTeamId == matchup.teamAId:
+            wins[a, b] += 1
+            losses[b, a] += 1
+        else:
+            wins[b, a] += 1
+            losses[a, b] += 1
+
+    # compare every score in a week with every other score in that week at once (NaN never compares as greater or equal)
+    outscored = (scores[:, :, None] > scores[:, None, :]).sum(axis=2)
+    tied = (scores[:, :, None] == scores[:, None, :]).sum(axis=2)
+    # don't count each score as tying itself
+    tied[~numpy.isnan(scores)] -= 1
+
+    for array in (wins, losses, ties, pointsFor):
+        array.flags.writeable = False
+    headToHeadMatrix = HeadToHeadMatrix(
+        ownerIds=ownerIds, wins=wins, losses=losses, ties=ties, pointsFor=pointsFor
+    )
+    allPlayMatrix = _getAllPlayMatrix(
+        weeks=[(year.yearNumber, year.weeks[i].weekNumber) for i in weekIndexes],
+        ownerIds=ownerIds,
+        scores=scores,
+        outscored=outscored,
+        tied=tied,
+        gameScores=gameScores,
+        multiWeekGames=multiWeekGames,
+    )
+    return headToHeadMatrix, allPlayMatrix
+
+
+def _getAllPlayMatrix(
+    *,
+    weeks: list[tuple[int, int]],
+    ownerIds: list[str],
+    scores: numpy.ndarray,
+    outscored: numpy.ndarray,
+    tied: numpy.ndarray,
+    gameScores: numpy.ndarray,
+    multiWeekGames: numpy.ndarray,
+) -> AllPlayMatrix:
+    for array in (scores, outscored, tied, gameScores, multiWeekGames):
+        array.flags.writeable = False
+    return AllPlayMatrix(
+        weeks=weeks,
+        ownerIds=ownerIds,
+        scores=scores,
+        outscored=outscored,
+        tied=tied,
+        gameScores=gameScores,
+        multiWeekGames=multiWeekGames,
+    )
+
+
+def _getEmptyHeadToHeadMatrix(ownerIds: list[str]) -> HeadToHeadMatrix:
+    n = len(ownerIds)
+    arrays = {
+        "wins": numpy.zeros((n, n), dtype=numpy.int64),
+        "losses": numpy.zeros((n, n), dtype=numpy.int64),
+        "ties": numpy.zeros((n, n), dtype=numpy.int64),
+        "pointsFor": numpy.zeros((n, n), dtype=numpy.float64),
+    }
+    for array in arrays.values():
+        array.flags.writeable = False
+    return HeadToHeadMatrix(ownerIds=ownerIds, **arrays)
@@ -0,0 +1,242 @@
+from typing import Any, Callable, Optional
+
+from leeger.model.filter import YearFilters
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.navigator.MatchupNavigator import MatchupNavigator
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.validate import yearValidation
+
+"""
+Multi-Filter Queries
+
+    - Computes several Year stats under several sets of filters at once.
+    - The Year is scanned once and each Matchup is routed to every set of filters that includes it.
+    - Counting stats (wins, losses, ties, points scored, games played) are computed straight from the routed Matchups.
+    - Any other Year calculator method can be given too, it is called once per set of filters.
+
+"""
+
+
+def computeMany(
+    year: Year,
+    stats: list[Callable],
+    filterSets: list[dict[str, Any]],
+    **kwargs,
+) -> list[dict[Callable, dict[str, Any]]]:
+    """
+    Returns the result of each of the given stats for each of the given sets of filters, in the same order as filterSets.
+    Stats are Year calculator methods (e.g. GameOutcomeYearCalculator.getWins) and each set of filters holds the kwargs that would be given to them.
+    Each result is exactly what calling the stat with that set of filters would return.
+    The Year is validated once, unless validate=False is given.
+
+    Example:
+        results = computeMany(
+            year,
+            [GameOutcomeYearCalculator.getWins, PointsScoredYearCalculator.getPointsScored],
+            [dict(), {"onlyRegularSeason": True}, {"weekNumberStart": 1, "weekNumberEnd": 4}],
+        )
+
+    Example response:
+        [
+            {
+                GameOutcomeYearCalculator.getWins: {"someTeamId": 8, "someOtherTeamId": 11, ...},
+                PointsScoredYearCalculator.getPointsScored: {"someTeamId": Deci("1009.7"), ...},
+            },
+            {
+                GameOutcomeYearCalculator.getWins: {"someTeamId": 7, "someOtherTeamId": 10, ...},
+                ...
+            },
+            ...
+        ]
+    """
+    if kwargs.get("validate", True):
+        yearValidation.runAllChecks(year)
+    allYearFilters = [
+        YearFilters.getForYear(year, **{**kwargs, **filterSet})
+        for filterSet in filterSets
+    ]
+    allFilteredMatchups = _routeMatchups(year, allYearFilters)
+    allTeamIds = YearNavigator.getAllTeamIds(year)
+
+    results = list()
+    for filterSet, yearFilters, filteredMatchups in zip(
+        filterSets, allYearFilters, allFilteredMatchups
+    ):
+        routedYear = _RoutedYear(allTeamIds, yearFilters, filteredMatchups)
+        result = dict()
+        for stat in stats:
+            fastStatFunction = __FAST_STAT_FUNCTIONS.get(_getStatName(stat))
+            if fastStatFunction is not None and routedYear.canUse(fastStatFunction):
+                result[stat] = fastStatFunction(routedYear)
+            else:
+                result[stat] = stat(year, **{**kwargs, **filterSet, "validate": False})
+        results.append(result)
+    return results
+
+
+def _getStatName(stat: Callable) -> Optional[str]:
+    cls = getattr(stat, "__self__", None)
+    if not isinstance(cls, type):
+        return None
+    return f"{cls.__name__}.{stat.__name__}"
+
+
+def _routeMatchups(
+    year: Year, allYearFilters: list[YearFilters]
+) -> list[list[Matchup]]:
+    """
+    Scans the given Year once and returns the Matchups included by each of the given filters, in the same order as the filters.
+    """
+    allFilteredMatchups: list[list[Matchup]] = [list() for _ in allYearFilters]
+    if not allYearFilters:
+        return allFilteredMatchups
+    allIncludeMatchupTypes = [
+        set(yearFilters.includeMatchupTypes) for yearFilters in allYearFilters
+    ]
+    firstWeekIndex = min(yearFilters.weekNumberStart for yearFilters in allYearFilters)
+    lastWeekIndex = max(yearFilters.weekNumberEnd for yearFilters in allYearFilters)
+    for weekIndex in range(firstWeekIndex - 1, lastWeekIndex):
+        # filters that include this week
+        filterIndexes = [
+            i
+            for i, yearFilters in enumerate(allYearFilters)
+            if yearFilters.weekNumberStart - 1 <= weekIndex < yearFilters.weekNumberEnd
+        ]
+        for matchup in year.weeks[weekIndex].matchups:
+            for i in filterIndexes:
+                if matchup.matchupType in allIncludeMatchupTypes[i]:
+                    allFilteredMatchups[i].append(matchup)
+    return allFilteredMatchups
+
+
+class _RoutedYear:
+    """
+    The Matchups of a Year that are included by a single set of filters, with what the counting stats need worked out once.
+    """
+
+    def __init__(
+        self, allTeamIds: list[str], yearFilters: YearFilters, matchups: list[Matchup]
+    ):
+        self.allTeamIds = allTeamIds
+        self.yearFilters = yearFilters
+        self.matchups = matchups
+        self.__simplifiedMatchups: Optional[list[Matchup]] = None
+        self.__numberOfGamesPlayed: Optional[dict[str, int]] = None
+
+    def canUse(self, fastStatFunction: Callable) -> bool:
+        # simplified matchups can't be used when multi-week matchups are left out
+        return (
+            fastStatFunction is not _getGamesPlayed
+            or self.yearFilters.includeMultiWeekMatchups
+        )
+
+    @property
+    def simplifiedMatchups(self) -> list[Matchup]:
+        """
+        The Matchups with each multi-week matchup combined into a single Matchup.
+        """
+        if self.__simplifiedMatchups is None:
+            simplifiedMatchups = list()
+            multiWeekMatchupIdToMatchupListMap: dict[str, list[Matchup]] = dict()
+            for matchup in self.matchups:
+                mwmid = matchup.multiWeekMatchupId
+                if mwmid is None:
+                    simplifiedMatchups.append(matchup)
+                elif mwmid in multiWeekMatchupIdToMatchupListMap:
+                    multiWeekMatchupIdToMatchupListMap[mwmid].append(matchup)
+                else:
+                    multiWeekMatchupIdToMatchupListMap[mwmid] = [matchup]
+            for matchupList in multiWeekMatchupIdToMatchupListMap.values():
+                simplifiedMatchups.append(
+                    MatchupNavigator.simplifyMultiWeekMatchups(matchupList)
+                )
+            self.__simplifiedMatchups = simplifiedMatchups
+        return self.__simplifiedMatchups
+
+    @property
+    def numberOfGamesPlayed(self) -> dict[str, int]:
+        """
+        Same as YearNavigator.getNumberOfGamesPlayed() with the default options.
+        """
+        if self.__numberOfGamesPlayed is None:
+            numberOfGamesPlayed = {teamId: 0 for teamId in self.allTeamIds}
+            for matchup in self.matchups:
+                numberOfGamesPlayed[matchup.teamAId] += 1
+                numberOfGamesPlayed[matchup.teamBId] += 1
+            self.__numberOfGamesPlayed = numberOfGamesPlayed
+        return self.__numberOfGamesPlayed
+
+    def setToNoneIfNoGamesPlayed(self, responseDict: dict[str, Any]) -> dict[str, Any]:
+        for teamId, numberOfGamesPlayed in self.numberOfGamesPlayed.items():
+            if numberOfGamesPlayed == 0:
+                responseDict[teamId] = None
+        return responseDict
+
+
+def _getWins(routedYear: _RoutedYear) -> dict[str, Optional[int]]:
+    teamIdAndWins = {teamId: 0 for teamId in routedYear.allTeamIds}
+    for matchup in routedYear.simplifiedMatchups:
+        winnerTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(matchup)
+        if winnerTeamId is not None:
+            teamIdAndWins[winnerTeamId] += 1
+    return routedYear.setToNoneIfNoGamesPlayed(teamIdAndWins)
+
+
+def _getLosses(routedYear: _RoutedYear) -> dict[str, Optional[int]]:
+    teamIdAndLosses = {teamId: 0 for teamId in routedYear.allTeamIds}
+    for matchup in routedYear.simplifiedMatchups:
+        winnerTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(matchup)
+        if winnerTeamId is not None:
+            loserTeamId = (
+                matchup.teamAId if winnerTeamId == matchup.teamBId else matchup.teamBId
+            )
+            teamIdAndLosses[loserTeamId] += 1
+    return routedYear.setToNoneIfNoGamesPlayed(teamIdAndLosses)
+
+
+def _getTies(routedYear: _RoutedYear) -> dict[str, Optional[int]]:
+    teamIdAndTies = {teamId: 0 for teamId in routedYear.allTeamIds}
+    for matchup in routedYear.simplifiedMatchups:
+        if MatchupNavigator.getTeamIdOfMatchupWinner(matchup) is None:
+            teamIdAndTies[matchup.teamAId] += 1
+            teamIdAndTies[matchup.teamBId] += 1
+    return routedYear.setToNoneIfNoGamesPlayed(teamIdAndTies)
+
+
+def _getPointsScored(routedYear: _RoutedYear) -> dict[str, Optional[Deci]]:
+    teamIdAndPointsScored = {teamId: Deci(0) for teamId in routedYear.allTeamIds}
+    for matchup in routedYear.matchups:
+        teamIdAndPointsScored[matchup.teamAId] += Deci(matchup.teamAScore)
+        teamIdAndPointsScored[matchup.teamBId] += Deci(matchup.teamBScore)
+    return routedYear.setToNoneIfNoGamesPlayed(teamIdAndPointsScored)
+
+
+def _getOpponentPointsScored(routedYear: _RoutedYear) -> dict[str, Optional[Deci]]:
+    teamIdAndOpponentPointsScored = {
+        teamId: Deci(0) for teamId in routedYear.allTeamIds
+    }
+    for matchup in routedYear.matchups:
+        teamIdAndOpponentPointsScored[matchup.teamAId] += Deci(matchup.teamBScore)
+        teamIdAndOpponentPointsScored[matchup.teamBId] += Deci(matchup.teamAScore)
+    return routedYear.setToNoneIfNoGamesPlayed(teamIdAndOpponentPointsScored)
+
+
+def _getGamesPlayed(routedYear: _RoutedYear) -> dict[str, Optional[int]]:
+    teamIdAndGamesPlayed = {teamId: 0 for teamId in routedYear.allTeamIds}
+    for matchup in routedYear.simplifiedMatchups:
+        teamIdAndGamesPlayed[matchup.teamAId] += 1
+        teamIdAndGamesPlayed[matchup.teamBId] += 1
+    return teamIdAndGamesPlayed
+
+
+# stats that are computed straight from the routed Matchups, keyed by "CalculatorName.methodName"
+__FAST_STAT_FUNCTIONS: dict[str, Callable[[_RoutedYear], dict[str, Any]]] = {
+    "GameOutcomeYearCalculator.getWins": _getWins,
+    "GameOutcomeYearCalculator.getLosses": _getLosses,
+    "GameOutcomeYearCalculator.getTies": _getTies,
+    "PointsScoredYearCalculator.getPointsScored": _getPointsScored,
+    "PointsScoredYearCalculator.getOpponentPointsScored": _getOpponentPointsScored,
+    "TeamSummaryYearCalculator.getGamesPlayed": _getGamesPlayed,
+}
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import contextvars
+import functools
+import importlib
+import inspect
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterator, Optional
+
+from leeger.model.profile.CallRecord import CallRecord
+from leeger.model.profile.FunctionStats import FunctionStats
+
+"""
+Profiling
+
+    - Times calls to calculators, validation, navigators and League Loaders while a Profile is open.
+    - Profiled functions are only wrapped while at least one Profile is open, so there is no overhead at all otherwise.
+    - Only calls made through the class or module a function lives on are seen (this is how leeger calls them).
+    - A Profile only sees calls made in the context it was opened in: its thread, and asyncio tasks (or contextvars.copy_context() runs) started from it.
+      So a Profile opened while handling one request in a server doesn't see calls made for requests on other threads.
+    - Calls made in other processes (e.g. leagueToExcel() with maxWorkers) are not seen.
+
+"""
+
+__CALCULATOR_MODULE_NAMES = (
+    "leeger.calculator.year_calculator",
+    "leeger.calculator.all_time_calculator",
+)
+__CALCULATOR_PARENT_CLASS_PATHS = (
+    ("leeger.calculator.parent.YearCalculator", "YearCalculator"),
+    ("leeger.calculator.parent.AllTimeCalculator", "AllTimeCalculator"),
+)
+__NAVIGATOR_CLASS_NAMES = (
+    "LeagueNavigator",
+    "MatchupNavigator",
+    "WeekNavigator",
+    "YearNavigator",
+)
+__VALIDATION_MODULE_NAMES = (
+    "leeger.validate.divisionValidation",
+    "leeger.validate.leagueValidation",
+    "leeger.validate.matchupValidation",
+    "leeger.validate.ownerValidation",
+    "leeger.validate.teamValidation",
+    "leeger.validate.weekValidation",
+    "leeger.validate.yearSettingsValidation",
+    "leeger.validate.yearValidation",
+)
+
+# all open Profiles, functions stay wrapped while there are any
+__OPEN_PROFILES: list[Profile] = list()
+# the open Profiles that calls made in the current context are recorded in
+__ACTIVE_PROFILES: contextvars.ContextVar[tuple[Profile, ...]] = contextvars.ContextVar(
+    "leegerActiveProfiles", default=()
+)
+# (class or module, attribute name, original attribute) for each wrapped function
+__WRAPPED_ATTRIBUTES: list[tuple[Any, str, Any]] = list()
+__LOCK = threading.RLock()
+__THREAD_STATE = threading.local()
+
+
+class ProfileSink(ABC):
+    """
+    Receives profiled calls as they happen, to send them on to a metrics system.
+    """
+
+    @abstractmethod
+    def record(self, callRecord: CallRecord) -> None:
+        """
+        Called after each profiled call.
+        This is called on the thread that made the call, so it should be quick.
+        """
+
+    def close(self, profile: Profile) -> None:
+        """
+        Called once when the Profile is closed, with all the stats it collected.
+        """
+
+
+class Profile:
+    """
+    Collects stats for every profiled call made while it is open.
+    Open it with `with leeger.profile() as p:`.
+    """
+
+    def __init__(self, *, sink: Optional[ProfileSink] = None):
+        self.__sink = sink
+        self.__lock = threading.Lock()
+        # function name -> stats
+        self.stats: dict[str, FunctionStats] = dict()
+
+    def __enter__(self) -> Profile:
+        _openProfile(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        _closeProfile(self)
+        if self.__sink is not None:
+            self.__sink.close(self)
+
+    def record(self, callRecord: CallRecord) -> None:
+        with self.__lock:
+            if callRecord.name not in self.stats:
+                self.stats[callRecord.name] = FunctionStats(name=callRecord.name)
+            self.stats[callRecord.name].add(callRecord)
+        if self.__sink is not None:
+            self.__sink.record(callRecord)
+
+    def report(self, *, sortBy: str = "selfTime", limit: Optional[int] = None) -> str:
+        """
+        Returns a table of the collected stats, slowest first.
+        sortBy can be any FunctionStats field: "calls", "totalTime", "selfTime" or "cacheHits".
+        """
+        stats = sorted(
+            self.stats.values(), key=lambda s: getattr(s, sortBy), reverse=True
+        )[:limit]
+        nameWidth = max([len("name")] + [len(s.name) for s in stats])
+        lines = [
+            f"{'name':<{nameWidth}}  {'calls':>8}  {'total (s)':>10}  {'self (s)':>10}  {'cache hits':>10}"
+        ]
+        for s in stats:
+            lines.append(
+                f"{s.name:<{nameWidth}}  {s.calls:>8}  {s.totalTime:>10.4f}  {s.selfTime:>10.4f}  {s.cacheHits:>10}"
+            )
+        return "\n".join(lines)
+
+
+def profile(*, sink: Optional[ProfileSink] = None) -> Profile:
+    """
+    Returns a Profile to use as a context manager.
+    Every profiled call made while it is open is recorded in it and passed to the given sink.
+
+    Example:
+        with leeger.profile() as p:
+            leagueStatSheet(league)
+        print(p.report(limit=10))
+        print(p.stats["AWALYearCalculator.getAWAL"].years[2023].totalTime)
+    """
+    return Profile(sink=sink)
+
+
+def _openProfile(profile: Profile) -> None:
+    with __LOCK:
+        if not __OPEN_PROFILES:
+            try:
+                _wrapAll()
+            except BaseException:
+                # don't leave some functions wrapped, the next Profile would wrap them again
+                _unwrapAll()
+                raise
+        __OPEN_PROFILES.append(profile)
+    __ACTIVE_PROFILES.set(__ACTIVE_PROFILES.get() + (profile,))
+
+
+def _closeProfile(profile: Profile) -> None:
+    __ACTIVE_PROFILES.set(
+        tuple(
+            activeProfile
+            for activeProfile in __ACTIVE_PROFILES.get()
+            if activeProfile is not profile
+        )
+    )
+    with __LOCK:
+        __OPEN_PROFILES.remove(profile)
+        if not __OPEN_PROFILES:
+            _unwrapAll()
+
+
+def _unwrapAll() -> None:
+    """
+    Puts back the original functions.
+    """
+    for owner, attributeName, original in reversed(__WRAPPED_ATTRIBUTES):
+        setattr(owner, attributeName, original)
+    __WRAPPED_ATTRIBUTES.clear()
+
+
+def _wrapAll() -> None:
+    from leeger.model.league.Year import Year
+
+    for owner, attributeName, name in _getProfiledAttributes():
+        original = vars(owner)[attributeName]
+        if isinstance(original, classmethod):
+            wrapped = classmethod(_wrapFunction(original.__func__, name, Year))
+        elif isinstance(original, staticmethod):
+            wrapped = staticmethod(_wrapFunction(original.__func__, name, Year))
+        else:
+            wrapped = _wrapFunction(original, name, Year)
+        setattr(owner, attributeName, wrapped)
+        __WRAPPED_ATTRIBUTES.append((owner, attributeName, original))
+
+
+def _getProfiledAttributes() -> Iterator[tuple[Any, str, str]]:
+    """
+    Yields (class or module, attribute name, profiled function name) for each function to profile.
+    League Loaders are only profiled if they have already been imported, so opening a Profile does not import every platform SDK.
+    """
+    for moduleName in __CALCULATOR_MODULE_NAMES:
+        module = importlib.import_module(moduleName)
+        for className in module.__all__:
+            yield from _getClassAttributes(getattr(module, className))
+    for moduleName, className in __CALCULATOR_PARENT_CLASS_PATHS:
+        yield from _getClassAttributes(
+            getattr(importlib.import_module(moduleName), className)
+        )
+
+    navigatorModule = importlib.import_module("leeger.util.navigator")
+    for className in __NAVIGATOR_CLASS_NAMES:
+        yield from _getClassAttributes(getattr(navigatorModule, className))
+
+    for moduleName in __VALIDATION_MODULE_NAMES:
+        module = importlib.import_module(moduleName)
+        shortModuleName = moduleName.rsplit(".", 1)[1]
+        for attributeName, value in list(vars(module).items()):
+            if attributeName == "runAllChecks" or (
+                attributeName.startswith("check")
+                and inspect.isfunction(value)
+                and value.__module__ == moduleName
+            ):
+                yield module, attributeName, f"{shortModuleName}.{attributeName}"
+
+    leagueLoaderModule = importlib.import_module("leeger.league_loader")
+    for className in ["LeagueLoader"] + list(leagueLoaderModule.__all__):
+        module = sys.modules.get(f"leeger.league_loader.{className}")
+        if module is not None:
+            yield from _getClassAttributes(getattr(module, className))
+
+
+def _getClassAttributes(cls: type) -> Iterator[tuple[Any, str, str]]:
+    for attributeName, value in list(vars(cls).items()):
+        if attributeName.startswith("__"):
+            continue
+        if isinstance(value, (classmethod, staticmethod)) or inspect.isfunction(value):
+            yield cls, attributeName, f"{cls.__name__}.{attributeName}"
+
+
+def _getThreadState() -> tuple[list[float], dict[str, int]]:
+    """
+    Returns the time spent in profiled calls made by each call on the current thread's call stack,
+    and how many times each profiled function is on the current thread's call stack.
+    """
+    try:
+        return __THREAD_STATE.childTimes, __THREAD_STATE.depths
+    except AttributeError:
+        __THREAD_STATE.childTimes = list()
+        __THREAD_STATE.depths = dict()
+        return __THREAD_STATE.childTimes, __THREAD_STATE.depths
+
+
+def _getCacheCalls(cacheInfo: Callable) -> tuple[int, int]:
+    """
+    Returns the number of hits and the number of calls of an lru_cache function so far.
+    """
+    info = cacheInfo()
+    return info.hits, info.hits + info.misses
+
+
+def _wrapFunction(function: Callable, name: str, yearType: type) -> Callable:
+    cacheInfo = getattr(function, "cache_info", None)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not __ACTIVE_PROFILES.get():
+            # no Profile is open in this context
+            return function(*args, **kwargs)
+        childTimes, depths = _getThreadState()
+        depth = depths.get(name, 0)
+        depths[name] = depth + 1
+        childTimes.append(0.0)
+        cacheCallsBefore = _getCacheCalls(cacheInfo) if cacheInfo is not None else None
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            totalTime = time.perf_counter() - start
+            childTime = childTimes.pop()
+            if childTimes:
+                childTimes[-1] += totalTime
+            depths[name] = depth
+            yearNumber = None
+            for arg in args:
+                if isinstance(arg, yearType):
+                    yearNumber = arg.yearNumber
+                    break
+            cacheHit = None
+            if cacheCallsBefore is not None:
+                hits, calls = _getCacheCalls(cacheInfo)
+                # the cache's counters are shared, so they only tell if this call was a hit when no other call to it (e.g. on another thread) was made at the same time
+                if calls - cacheCallsBefore[1] == 1:
+                    cacheHit = hits > cacheCallsBefore[0]
+            callRecord = CallRecord(
+                name=name,
+                totalTime=totalTime,
+                selfTime=totalTime - childTime,
+                yearNumber=yearNumber,
+                cacheHit=cacheHit,
+                recursive=depth > 0,
+            )
+            for activeProfile in __ACTIVE_PROFILES.get():
+                activeProfile.record(callRecord)
+
+    if cacheInfo is not None:
+        # keep the cache functions of lru_cache functions available
+        wrapper.cache_info = function.cache_info
+        wrapper.cache_clear = function.cache_clear
+    return wrapper
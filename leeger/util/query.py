@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Optional
+
+import numpy
+
+from leeger.decorator.validators import validateLeague
+from leeger.enum.MatchupType import MatchupType
+from leeger.exception import InvalidFilterException
+from leeger.model.league.League import League
+from leeger.util.Deci import Deci
+from leeger.util.navigator.MatchupNavigator import MatchupNavigator
+
+"""
+League Queries
+
+    - Answers ad-hoc questions about a League (e.g. points scored by an Owner in playoff games since 2018 against division rivals) without walking League.years.
+    - A LeagueIndex holds one row per Team per Matchup as columns (NumPy arrays) in chronological order, along with the rows of each Owner, Team, opponent, division, Matchup type and Year.
+    - Queries are planned: the smallest index that matches is used to pick candidate rows, other predicates are only checked on those rows and a predicate that matches nothing ends the query early.
+    - Rows can be grouped by Owner, Year or opponent and aggregated with count(), sum(), mean(), min(), max() and winPercentage().
+    - IGNORE Matchups are left out. A multi-week matchup has a row for each of its Weeks, and counts as a single game (for winPercentage()) in its last Week.
+
+"""
+
+
+class LeagueIndex:
+    """
+    A columnar, indexed copy of the Matchups in a League that can be queried.
+
+    Example:
+        leagueIndex = LeagueIndex(league)
+        leagueIndex.query().where(
+            ownerIds=[someOwnerId],
+            yearNumberStart=2018,
+            matchupTypes=[MatchupType.PLAYOFF, MatchupType.CHAMPIONSHIP],
+            divisionRival=True,
+        ).aggregate(points="sum(pointsFor)", games="count()")
+    """
+
+    # predicate -> the column it checks, for predicates with an index
+    _INDEXED_PREDICATES = {
+        "ownerIds": "ownerId",
+        "teamIds": "teamId",
+        "divisionIds": "divisionId",
+        "opponentOwnerIds": "opponentOwnerId",
+        "opponentTeamIds": "opponentTeamId",
+        "matchupTypes": "matchupType",
+        "yearNumbers": "yearNumber",
+    }
+    _GROUP_BY_COLUMNS = {
+        "owner": "ownerId",
+        "year": "yearNumber",
+        "opponent": "opponentOwnerId",
+    }
+    _FIELDS = ("pointsFor", "pointsAgainst", "margin")
+
+    @validateLeague
+    def __init__(self, league: League, **kwargs):
+        rows: dict[str, list] = {
+            name: list()
+            for name in (
+                "yearNumber",
+                "weekNumber",
+                "matchupType",
+                "ownerId",
+                "teamId",
+                "divisionId",
+                "opponentOwnerId",
+                "opponentTeamId",
+                "isDivisionRival",
+                "isMultiWeek",
+                "pointsFor",
+                "pointsAgainst",
+                "result",
+                "isGame",
+            )
+        }
+        for year in league.years:
+            teamIdToTeam = {team.id: team for team in year.teams}
+            multiWeekMatchups = dict()
+            for week in year.weeks:
+                for matchup in week.matchups:
+                    if matchup.multiWeekMatchupId is not None:
+                        multiWeekMatchups.setdefault(
+                            matchup.multiWeekMatchupId, list()
+                        ).append(matchup)
+            for week in year.weeks:
+                for matchup in week.matchups:
+                    if matchup.matchupType == MatchupType.IGNORE:
+                        continue
+                    mwmid = matchup.multiWeekMatchupId
+                    isGame = mwmid is None or multiWeekMatchups[mwmid][-1] is matchup
+                    # the result of a multi-week matchup is the result of all its Weeks together
+                    winnerTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(
+                        matchup
+                        if mwmid is None
+                        else MatchupNavigator.simplifyMultiWeekMatchups(
+                            multiWeekMatchups[mwmid]
+                        )
+                    )
+                    for team, opponent, pointsFor, pointsAgainst in (
+                        (
+                            teamIdToTeam[matchup.teamAId],
+                            teamIdToTeam[matchup.teamBId],
+                            matchup.teamAScore,
+                            matchup.teamBScore,
+                        ),
+                        (
+                            teamIdToTeam[matchup.teamBId],
+                            teamIdToTeam[matchup.teamAId],
+                            matchup.teamBScore,
+                            matchup.teamAScore,
+                        ),
+                    ):
+                        rows["yearNumber"].append(year.yearNumber)
+                        rows["weekNumber"].append(week.weekNumber)
+                        rows["matchupType"].append(matchup.matchupType)
+                        rows["ownerId"].append(team.ownerId)
+                        rows["teamId"].append(team.id)
+                        rows["divisionId"].append(team.divisionId)
+                        rows["opponentOwnerId"].append(opponent.ownerId)
+                        rows["opponentTeamId"].append(opponent.id)
+                        rows["isDivisionRival"].append(
+                            team.divisionId is not None
+                            and team.divisionId == opponent.divisionId
+                        )
+                        rows["isMultiWeek"].append(mwmid is not None)
+                        rows["pointsFor"].append(pointsFor)
+                        rows["pointsAgainst"].append(pointsAgainst)
+                        if winnerTeamId is None:
+                            rows["result"].append(0.5)
+                        else:
+                            rows["result"].append(
+                                1.0 if winnerTeamId == team.id else 0.0
+                            )
+                        rows["isGame"].append(isGame)
+
+        self.numberOfRows = len(rows["yearNumber"])
+        self.columns: dict[str, numpy.ndarray] = dict()
+        for name, values in rows.items():
+            if name in ("yearNumber", "weekNumber"):
+                self.columns[name] = numpy.array(values, dtype=numpy.int64)
+            elif name in ("pointsFor", "pointsAgainst", "result"):
+                self.columns[name] = numpy.array(values, dtype=float)
+            elif name in ("isDivisionRival", "isMultiWeek", "isGame"):
+                self.columns[name] = numpy.array(values, dtype=bool)
+            else:
+                self.columns[name] = numpy.array(values, dtype=object)
+
+        # column -> value -> the rows with that value, in order
+        self.indexes: dict[str, dict[Any, numpy.ndarray]] = dict()
+        for column in self._INDEXED_PREDICATES.values():
+            valueToRows: dict[Any, list[int]] = dict()
+            for row, value in enumerate(rows[column]):
+                valueToRows.setdefault(value, list()).append(row)
+            self.indexes[column] = {
+                value: numpy.array(rowList, dtype=numpy.int64)
+                for value, rowList in valueToRows.items()
+            }
+
+    def query(self) -> LeagueQuery:
+        """
+        Returns a query over every row in this index.
+        """
+        return LeagueQuery(self)
+
+
+class LeagueQuery:
+    """
+    A query over a LeagueIndex. Each method returns a new query, so a query can be reused as the start of others.
+
+    Predicates (all given predicates must match):
+        yearNumbers, ownerIds, teamIds, divisionIds, opponentOwnerIds, opponentTeamIds, matchupTypes: lists of the values to match
+        yearNumberStart, yearNumberEnd, weekNumberStart, weekNumberEnd: inclusive bounds
+        divisionRival: True to only match games against a Team in the same division, False to only match others
+        multiWeek: True to only match multi-week matchups, False to only match others
+
+    Aggregates:
+        count(): number of rows (a Team's Week in a Matchup)
+        sum(field), mean(field), min(field), max(field): where field is pointsFor, pointsAgainst or margin
+        winPercentage(): (wins + ties / 2) / games, where a multi-week matchup is a single game
+    """
+
+    __AGGREGATE_PATTERN = re.compile(r"^\s*(\w+)\s*\(\s*(\w*)\s*\)\s*$")
+
+    def __init__(
+        self,
+        leagueIndex: LeagueIndex,
+        predicates: Optional[dict[str, Any]] = None,
+        groupByColumn: Optional[str] = None,
+    ):
+        self.__leagueIndex = leagueIndex
+        self.__predicates = dict() if predicates is None else predicates
+        self.__groupByColumn = groupByColumn
+
+    def where(self, **predicates) -> LeagueQuery:
+        """
+        Returns this query with the given predicates added (replacing any predicate given again).
+        """
+        for name, value in predicates.items():
+            self.__checkPredicate(name, value)
+        return LeagueQuery(
+            self.__leagueIndex,
+            {**self.__predicates, **predicates},
+            self.__groupByColumn,
+        )
+
+    def groupBy(self, groupBy: str) -> LeagueQuery:
+        """
+        Returns this query grouped by "owner", "year" or "opponent" (the opponent's Owner).
+        """
+        if groupBy not in LeagueIndex._GROUP_BY_COLUMNS:
+            raise ValueError(
+                f"Can't group by '{groupBy}', must be one of {list(LeagueIndex._GROUP_BY_COLUMNS)}."
+            )
+        return LeagueQuery(
+            self.__leagueIndex,
+            self.__predicates,
+            LeagueIndex._GROUP_BY_COLUMNS[groupBy],
+        )
+
+    def getRows(self) -> numpy.ndarray:
+        """
+        Returns the numbers of the rows in the LeagueIndex that match this query's predicates, in order.
+        """
+        return self.__plan()
+
+    def aggregate(self, **aggregates: str) -> dict:
+        """
+        Returns each of the given aggregates over the rows that match, for each group if this query is grouped.
+        Values are None for mean(), min(), max() and winPercentage() with no rows (or games).
+
+        Example:
+            query.groupBy("year").aggregate(points="sum(pointsFor)", winPct="winPercentage()")
+
+        Example response:
+            {
+            2021: {"points": Deci("1487.3"), "winPct": Deci("0.5833333333333333333333333333")},
+            2022: {"points": Deci("1612.9"), "winPct": Deci("0.75")},
+            ...
+            }
+        """
+        parsedAggregates = {
+            name: self.__parseAggregate(expression)
+            for name, expression in aggregates.items()
+        }
+        rows = self.__plan()
+        if self.__groupByColumn is None:
+            return self.__aggregateRows(rows, parsedAggregates)
+        groups: dict[Any, list[int]] = dict()
+        for row, key in zip(
+            rows, self.__leagueIndex.columns[self.__groupByColumn][rows]
+        ):
+            groups.setdefault(key, list()).append(row)
+        return {
+            key: self.__aggregateRows(
+                numpy.array(groupRows, dtype=numpy.int64), parsedAggregates
+            )
+            for key, groupRows in groups.items()
+        }
+
+    @staticmethod
+    def __checkPredicate(name: str, value: Any) -> None:
+        if name in LeagueIndex._INDEXED_PREDICATES:
+            if not isinstance(value, (list, tuple, set)):
+                raise InvalidFilterException(f"'{name}' must be type 'list'")
+        elif name in (
+            "yearNumberStart",
+            "yearNumberEnd",
+            "weekNumberStart",
+            "weekNumberEnd",
+        ):
+            if not isinstance(value, int):
+                raise InvalidFilterException(f"'{name}' must be type 'int'")
+        elif name in ("divisionRival", "multiWeek"):
+            if not isinstance(value, bool):
+                raise InvalidFilterException(f"'{name}' must be type 'bool'")
+        else:
+            raise InvalidFilterException(f"'{name}' is not a valid predicate.")
+
+    def __parseAggregate(self, expression: str) -> tuple[str, Optional[str]]:
+        match = self.__AGGREGATE_PATTERN.match(expression)
+        if match is None:
+            raise ValueError(f"Invalid aggregate '{expression}'.")
+        function, field = match.group(1), match.group(2) or None
+        if function in ("count", "winPercentage"):
+            if field is not None:
+                raise ValueError(f"'{function}()' doesn't take a field.")
+        elif function in ("sum", "mean", "min", "max"):
+            if field not in LeagueIndex._FIELDS:
+                raise ValueError(
+                    f"'{function}()' needs one of the fields {list(LeagueIndex._FIELDS)}."
+                )
+        else:
+            raise ValueError(f"Unknown aggregate function '{function}'.")
+        return function, field
+
+    def __plan(self) -> numpy.ndarray:
+        """
+        Returns the rows that match every predicate.
+        """
+        leagueIndex = self.__leagueIndex
+        columns = leagueIndex.columns
+        predicates = self.__predicates
+        noRows = numpy.array(list(), dtype=numpy.int64)
+
+        # rows are in chronological order, so a range of Years is a slice of rows
+        yearNumbers = columns["yearNumber"]
+        start = 0
+        stop = leagueIndex.numberOfRows
+        if "yearNumberStart" in predicates:
+            start = int(
+                numpy.searchsorted(yearNumbers, predicates["yearNumberStart"], "left")
+            )
+        if "yearNumberEnd" in predicates:
+            stop = int(
+                numpy.searchsorted(yearNumbers, predicates["yearNumberEnd"], "right")
+            )
+        if start >= stop:
+            return noRows
+
+        # the smallest index picks the candidate rows, any index with no rows ends the query
+        indexedPredicates = list()
+        for name, column in LeagueIndex._INDEXED_PREDICATES.items():
+            if name in predicates:
+                valueToRows = leagueIndex.indexes[column]
+                allRows = [
+                    valueToRows[value]
+                    for value in predicates[name]
+                    if value in valueToRows
+                ]
+                numberOfRows = sum(len(rows) for rows in allRows)
+                if numberOfRows == 0:
+                    return noRows
+                indexedPredicates.append((numberOfRows, name, column, allRows))
+        indexedPredicates.sort(key=lambda indexedPredicate: indexedPredicate[0])
+
+        if indexedPredicates:
+            _, _, _, allRows = indexedPredicates[0]
+            rows = numpy.sort(numpy.concatenate(allRows))
+            rows = rows[
+                numpy.searchsorted(rows, start, "left") : numpy.searchsorted(
+                    rows, stop, "left"
+                )
+            ]
+        else:
+            rows = numpy.arange(start, stop, dtype=numpy.int64)
+
+        # every other predicate is only checked on the candidate rows
+        checks = [
+            (
+                lambda rows, column=column, name=name: numpy.isin(
+                    columns[column][rows], list(predicates[name])
+                )
+            )
+            for _, name, column, _ in indexedPredicates[1:]
+        ]
+        if "weekNumberStart" in predicates:
+            checks.append(
+                lambda rows: columns["weekNumber"][rows]
+                >= predicates["weekNumberStart"]
+            )
+        if "weekNumberEnd" in predicates:
+            checks.append(
+                lambda rows: columns["weekNumber"][rows] <= predicates["weekNumberEnd"]
+            )
+        if "multiWeek" in predicates:
+            checks.append(
+                lambda rows: columns["isMultiWeek"][rows] == predicates["multiWeek"]
+            )
+        if "divisionRival" in predicates:
+            checks.append(
+                lambda rows: columns["isDivisionRival"][rows]
+                == predicates["divisionRival"]
+            )
+
+        for check in checks:
+            if len(rows) == 0:
+                break
+            rows = rows[check(rows)]
+        return rows
+
+    def __aggregateRows(
+        self,
+        rows: numpy.ndarray,
+        parsedAggregates: dict[str, tuple[str, Optional[str]]],
+    ) -> dict[str, Any]:
+        columns = self.__leagueIndex.columns
+        results = dict()
+        for name, (function, field) in parsedAggregates.items():
+            if function == "count":
+                results[name] = len(rows)
+            elif function == "winPercentage":
+                games = rows[columns["isGame"][rows]]
+                results[name] = (
+                    sum((Deci(result) for result in columns["result"][games]), Deci(0))
+                    / Deci(len(games))
+                    if len(games) > 0
+                    else None
+                )
+            else:
+                values = [Deci(value) for value in self.__getFieldValues(field, rows)]
+                if function == "sum":
+                    results[name] = sum(values, Deci(0))
+                elif not values:
+                    results[name] = None
+                elif function == "mean":
+                    results[name] = sum(values, Deci(0)) / Deci(len(values))
+                elif function == "min":
+                    results[name] = min(values)
+                else:
+                    results[name] = max(values)
+        return results
+
+    def __getFieldValues(self, field: str, rows: numpy.ndarray) -> list[float | Deci]:
+        columns = self.__leagueIndex.columns
+        if field == "margin":
+            # from the scores, so margins are exact
+            return [
+                Deci(pointsFor) - Deci(pointsAgainst)
+                for pointsFor, pointsAgainst in zip(
+                    columns["pointsFor"][rows].tolist(),
+                    columns["pointsAgainst"][rows].tolist(),
+                )
+            ]
+        return columns[field][rows].tolist()
@@ -0,0 +1,358 @@
+import copy
+import heapq
+from typing import Any, Optional
+
+from leeger.decorator.validators import validateLeague
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.records.MatchupRecord import MatchupRecord
+from leeger.model.records.RecordsReport import RecordsReport
+from leeger.model.records.StreakRecord import StreakRecord
+from leeger.util.navigator.MatchupNavigator import MatchupNavigator
+from leeger.util.week_tracker import WeekTracker
+
+"""
+Records
+
+    - Finds all-time records (highest and lowest scores, highest combined scores, biggest blowouts, best week by Owner) and win and losing streaks.
+    - Matchups are streamed once in chronological order, only the top records are kept (in bounded heaps) along with the streak each Owner and Team is on.
+    - Use RecordsTracker to keep records up to date as new Weeks are played, or getRecords() to get them for a League at once.
+    - Score records are for each Week, so each Week of a multi-week matchup is its own record.
+    - Streaks are made of games, so a multi-week matchup counts once its last Week (in the Year, when added) is added (see WeekTracker).
+    - A tie ends any streak. Team streaks end with their Year, Owner streaks carry on into the next Year.
+
+"""
+
+
+class _TopK:
+    """
+    Keeps the k entries with the highest values. Entries with the same value are kept in the order they were added.
+    """
+
+    def __init__(self, k: int):
+        self.__k = k
+        # (value, -order, item), so the smallest value (and then the latest entry) is at the top
+        self.__heap: list[tuple[Any, int, Any]] = list()
+
+    def add(self, value: Any, order: int, item: Any) -> None:
+        entry = (value, -order, item)
+        if len(self.__heap) < self.__k:
+            heapq.heappush(self.__heap, entry)
+        elif entry[:2] > self.__heap[0][:2]:
+            heapq.heapreplace(self.__heap, entry)
+
+    def copy(self) -> "_TopK":
+        topK = _TopK(self.__k)
+        topK.__heap = list(self.__heap)
+        return topK
+
+    def getSorted(
+        self, extraEntries: Optional[list[tuple[Any, int, Any]]] = None
+    ) -> list:
+        """
+        Returns the items of the top k entries (including the given (value, order, item) entries), best first.
+        """
+        entries = list(self.__heap)
+        entries += [(value, -order, item) for value, order, item in extraEntries or []]
+        entries.sort(key=lambda entry: entry[:2], reverse=True)
+        return [entry[2] for entry in entries[: self.__k]]
+
+
+class _Run:
+    """
+    The wins or losses in a row an Owner or Team is on.
+    """
+
+    def __init__(
+        self,
+        *,
+        ownerId: str,
+        teamId: Optional[str],
+        isWin: bool,
+        yearNumber: int,
+        weekNumber: int,
+        order: int,
+    ):
+        self.ownerId = ownerId
+        self.teamId = teamId
+        self.isWin = isWin
+        self.length = 1
+        self.startYearNumber = yearNumber
+        self.startWeekNumber = weekNumber
+        self.endYearNumber = yearNumber
+        self.endWeekNumber = weekNumber
+        self.order = order
+
+    def toStreakRecord(self, *, isActive: bool) -> StreakRecord:
+        return StreakRecord(
+            ownerId=self.ownerId,
+            teamId=self.teamId,
+            isWinStreak=self.isWin,
+            length=self.length,
+            startYearNumber=self.startYearNumber,
+            startWeekNumber=self.startWeekNumber,
+            endYearNumber=self.endYearNumber,
+            endWeekNumber=self.endWeekNumber,
+            isActive=isActive,
+        )
+
+
+class RecordsTracker(WeekTracker):
+    """
+    Keeps records up to date as Weeks are added, which must be in chronological order.
+
+    Example:
+        tracker = RecordsTracker(topK=5)
+        for year in league.years:
+            tracker.addYear(year)
+        ...
+        # once a new Week has been played
+        tracker.addWeek(currentYear, 7)
+        report = tracker.getReport()
+    """
+
+    __DEFAULT_TOP_K = 10
+
+    def __init__(self, *, topK: int = __DEFAULT_TOP_K):
+        if topK < 1:
+            raise ValueError("'topK' must be at least 1.")
+        super().__init__()
+        self.__nextOrder = 0
+        self.__highestScores = _TopK(topK)
+        self.__lowestScores = _TopK(topK)
+        self.__highestCombinedScores = _TopK(topK)
+        self.__biggestBlowouts = _TopK(topK)
+        self.__ownerWinStreaks = _TopK(topK)
+        self.__ownerLosingStreaks = _TopK(topK)
+        self.__teamWinStreaks = _TopK(topK)
+        self.__teamLosingStreaks = _TopK(topK)
+        self.__bestWeekByOwner: dict[str, MatchupRecord] = dict()
+        self.__ownerRuns: dict[str, _Run] = dict()
+        self.__teamRuns: dict[str, _Run] = dict()
+
+    def getReport(self) -> RecordsReport:
+        """
+        Returns the records over every Week added so far.
+        """
+        ownerRunEntries = [
+            (run.length, run.order, run.toStreakRecord(isActive=True))
+            for run in self.__ownerRuns.values()
+        ]
+        teamRunEntries = [
+            (run.length, run.order, run.toStreakRecord(isActive=True))
+            for run in self.__teamRuns.values()
+        ]
+        return RecordsReport(
+            highestScores=self.__highestScores.getSorted(),
+            lowestScores=self.__lowestScores.getSorted(),
+            highestCombinedScores=self.__highestCombinedScores.getSorted(),
+            biggestBlowouts=self.__biggestBlowouts.getSorted(),
+            longestOwnerWinStreaks=self.__ownerWinStreaks.getSorted(
+                [entry for entry in ownerRunEntries if entry[2].isWinStreak]
+            ),
+            longestOwnerLosingStreaks=self.__ownerLosingStreaks.getSorted(
+                [entry for entry in ownerRunEntries if not entry[2].isWinStreak]
+            ),
+            longestTeamWinStreaks=self.__teamWinStreaks.getSorted(
+                [entry for entry in teamRunEntries if entry[2].isWinStreak]
+            ),
+            longestTeamLosingStreaks=self.__teamLosingStreaks.getSorted(
+                [entry for entry in teamRunEntries if not entry[2].isWinStreak]
+            ),
+            bestWeekByOwner=dict(self.__bestWeekByOwner),
+            currentOwnerStreaks={
+                ownerId: entry[2]
+                for ownerId, entry in zip(self.__ownerRuns.keys(), ownerRunEntries)
+            },
+        )
+
+    def _getState(self) -> tuple:
+        # records are frozen, so only the containers and the runs (which grow) need to be copied
+        return (
+            self.__nextOrder,
+            tuple(
+                topK.copy()
+                for topK in (
+                    self.__highestScores,
+                    self.__lowestScores,
+                    self.__highestCombinedScores,
+                    self.__biggestBlowouts,
+                    self.__ownerWinStreaks,
+                    self.__ownerLosingStreaks,
+                    self.__teamWinStreaks,
+                    self.__teamLosingStreaks,
+                )
+            ),
+            dict(self.__bestWeekByOwner),
+            {ownerId: copy.copy(run) for ownerId, run in self.__ownerRuns.items()},
+            {teamId: copy.copy(run) for teamId, run in self.__teamRuns.items()},
+        )
+
+    def _setState(self, state: tuple) -> None:
+        nextOrder, topKs, bestWeekByOwner, ownerRuns, teamRuns = state
+        self.__nextOrder = nextOrder
+        (
+            self.__highestScores,
+            self.__lowestScores,
+            self.__highestCombinedScores,
+            self.__biggestBlowouts,
+            self.__ownerWinStreaks,
+            self.__ownerLosingStreaks,
+            self.__teamWinStreaks,
+            self.__teamLosingStreaks,
+        ) = (topK.copy() for topK in topKs)
+        self.__bestWeekByOwner = dict(bestWeekByOwner)
+        self.__ownerRuns = {
+            ownerId: copy.copy(run) for ownerId, run in ownerRuns.items()
+        }
+        self.__teamRuns = {teamId: copy.copy(run) for teamId, run in teamRuns.items()}
+
+    def _startYear(self, year: Year) -> None:
+        # Team streaks can't carry on into another Year
+        for run in self.__teamRuns.values():
+            self.__endRun(run, self.__teamWinStreaks, self.__teamLosingStreaks)
+        self.__teamRuns.clear()
+
+    def _addMatchup(
+        self, year: Year, week: Week, matchup: Matchup, teamIdToOwnerId: dict[str, str]
+    ) -> None:
+        # score records are for each Week, even of a multi-week matchup
+        teamARecord = MatchupRecord(
+            yearNumber=year.yearNumber,
+            weekNumber=week.weekNumber,
+            matchupId=matchup.id,
+            teamId=matchup.teamAId,
+            ownerId=teamIdToOwnerId[matchup.teamAId],
+            opponentTeamId=matchup.teamBId,
+            opponentOwnerId=teamIdToOwnerId[matchup.teamBId],
+            pointsFor=matchup.teamAScore,
+            pointsAgainst=matchup.teamBScore,
+        )
+        teamBRecord = MatchupRecord(
+            yearNumber=year.yearNumber,
+            weekNumber=week.weekNumber,
+            matchupId=matchup.id,
+            teamId=matchup.teamBId,
+            ownerId=teamIdToOwnerId[matchup.teamBId],
+            opponentTeamId=matchup.teamAId,
+            opponentOwnerId=teamIdToOwnerId[matchup.teamAId],
+            pointsFor=matchup.teamBScore,
+            pointsAgainst=matchup.teamAScore,
+        )
+        for record in (teamARecord, teamBRecord):
+            order = self.__getOrder()
+            self.__highestScores.add(record.pointsFor, order, record)
+            self.__lowestScores.add(-record.pointsFor, order, record)
+            bestWeek = self.__bestWeekByOwner.get(record.ownerId)
+            if bestWeek is None or record.pointsFor > bestWeek.pointsFor:
+                self.__bestWeekByOwner[record.ownerId] = record
+
+        winnerRecord = (
+            teamBRecord
+            if MatchupNavigator.getTeamIdOfMatchupWinner(matchup) == matchup.teamBId
+            else teamARecord
+        )
+        order = self.__getOrder()
+        self.__highestCombinedScores.add(
+            winnerRecord.combinedScore, order, winnerRecord
+        )
+        self.__biggestBlowouts.add(winnerRecord.margin, order, winnerRecord)
+
+    def _addGame(
+        self, year: Year, week: Week, matchup: Matchup, teamIdToOwnerId: dict[str, str]
+    ) -> None:
+        winnerTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(matchup)
+        for teamId in (matchup.teamAId, matchup.teamBId):
+            won = None if winnerTeamId is None else winnerTeamId == teamId
+            ownerId = teamIdToOwnerId[teamId]
+            self.__advanceRun(
+                self.__ownerRuns,
+                ownerId,
+                won,
+                ownerId=ownerId,
+                teamId=None,
+                yearNumber=year.yearNumber,
+                weekNumber=week.weekNumber,
+                winStreaks=self.__ownerWinStreaks,
+                losingStreaks=self.__ownerLosingStreaks,
+            )
+            self.__advanceRun(
+                self.__teamRuns,
+                teamId,
+                won,
+                ownerId=ownerId,
+                teamId=teamId,
+                yearNumber=year.yearNumber,
+                weekNumber=week.weekNumber,
+                winStreaks=self.__teamWinStreaks,
+                losingStreaks=self.__teamLosingStreaks,
+            )
+
+    def __getOrder(self) -> int:
+        """
+        Returns the order of the next record, so records that tie are kept in the order they were added.
+        """
+        order = self.__nextOrder
+        self.__nextOrder += 1
+        return order
+
+    def __advanceRun(
+        self,
+        runs: dict[str, _Run],
+        key: str,
+        won: Optional[bool],
+        *,
+        ownerId: str,
+        teamId: Optional[str],
+        yearNumber: int,
+        weekNumber: int,
+        winStreaks: _TopK,
+        losingStreaks: _TopK,
+    ) -> None:
+        run = runs.get(key)
+        if run is not None and (won is None or run.isWin != won):
+            self.__endRun(runs.pop(key), winStreaks, losingStreaks)
+            run = None
+        if won is None:
+            return
+        if run is None:
+            runs[key] = _Run(
+                ownerId=ownerId,
+                teamId=teamId,
+                isWin=won,
+                yearNumber=yearNumber,
+                weekNumber=weekNumber,
+                order=self.__getOrder(),
+            )
+        else:
+            run.length += 1
+            run.endYearNumber = yearNumber
+            run.endWeekNumber = weekNumber
+
+    @staticmethod
+    def __endRun(run: _Run, winStreaks: _TopK, losingStreaks: _TopK) -> None:
+        streaks = winStreaks if run.isWin else losingStreaks
+        streaks.add(run.length, run.order, run.toStreakRecord(isActive=False))
+
+
+@validateLeague
+def getRecords(
+    league: League, *, topK: Optional[int] = None, **kwargs
+) -> RecordsReport:
+    """
+    Returns the top topK records (10 by default) in the given League, streaming every Matchup that passes the given filters once.
+    Filters are the same kwargs the All-Time calculators take.
+
+    Example response:
+        RecordsReport(
+            highestScores=[MatchupRecord(yearNumber=2021, weekNumber=3, ..., pointsFor=187.4, pointsAgainst=99.1), ...],
+            ...
+            longestOwnerWinStreaks=[StreakRecord(ownerId="someOwnerId", length=11, ...), ...],
+            ...
+        )
+    """
+    recordsTracker = RecordsTracker() if topK is None else RecordsTracker(topK=topK)
+    recordsTracker._addLeague(league, **kwargs)
+    return recordsTracker.getReport()
@@ -0,0 +1,308 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy
+
+from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
+    GameOutcomeYearCalculator,
+)
+from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
+    PointsScoredYearCalculator,
+)
+from leeger.calculator.year_calculator.ScoringStandardDeviationYearCalculator import (
+    ScoringStandardDeviationYearCalculator,
+)
+from leeger.decorator.validators import validateYear
+from leeger.model.filter import YearFilters
+from leeger.model.league.Year import Year
+from leeger.model.simulation.SeasonSimulation import SeasonSimulation
+from leeger.util.Deci import Deci
+from leeger.util.navigator.YearNavigator import YearNavigator
+
+"""
+Simulation
+
+    - Simulates the rest of a Year many times to get seed, playoff and championship probabilities.
+    - Each Team's weekly score is drawn from a normal distribution fitted to the scores it has already put up (its PPG and Scoring STDEV).
+    - Whole batches of seasons are drawn at once with NumPy, one Week at a time.
+    - Regular season games are won by the higher score, an equal score is a tie (as in MatchupNavigator.getTeamIdOfMatchupWinner() with no tiebreaker).
+    - Standings are ordered by WAL (league median games included, if turned on), then points scored.
+    - Playoffs are single elimination brackets where the best remaining seed plays the worst remaining seed and the better seed holds the tiebreaker.
+    - Batches are given their own seed from the given seed, so the same seed gives the same result with any number of workers.
+
+"""
+
+__DEFAULT_NUMBER_OF_SIMULATIONS = 100_000
+__DEFAULT_CHUNK_SIZE = 25_000
+
+
+@validateYear
+def simulateYear(
+    year: Year,
+    remainingSchedule: list[list[tuple[str, str]]],
+    *,
+    numberOfPlayoffTeams: int,
+    numberOfSimulations: int = __DEFAULT_NUMBER_OF_SIMULATIONS,
+    seed: Optional[int] = None,
+    maxWorkers: Optional[int] = None,
+    chunkSize: int = __DEFAULT_CHUNK_SIZE,
+    **kwargs,
+) -> SeasonSimulation:
+    """
+    Simulates the rest of the regular season and the playoffs of the given Year numberOfSimulations times.
+
+    remainingSchedule: the regular season Weeks left to play, each a list of (teamAId, teamBId) games
+    numberOfPlayoffTeams: number of Teams that make the playoffs, must be a power of 2 that is not more than the number of Teams
+    seed: seed for the random number generator, the same seed always gives the same result
+    maxWorkers: simulations are run in a process pool with up to this many processes (defaults to the number of CPUs), 1 runs everything in the current process
+    chunkSize: number of seasons simulated at once by each worker
+
+    Standings start from the regular season games already played in the Year.
+    Any kwargs (e.g. filters like weekNumberStart) are used to pick the scores each Team's distribution is fitted to.
+    A Team with fewer than 2 scores is given the average and spread of every score in the Year.
+
+    Example:
+        simulation = simulateYear(
+            year,
+            [[("team1Id", "team2Id"), ("team3Id", "team4Id")], [("team1Id", "team3Id"), ("team2Id", "team4Id")]],
+            numberOfPlayoffTeams=2,
+            seed=42,
+        )
+
+    Example response:
+        SeasonSimulation(
+            numberOfSimulations=100000,
+            teamIds=["team1Id", "team2Id", "team3Id", "team4Id"],
+            seedProbabilities={"team1Id": [Deci("0.61234"), Deci("0.28011"), ...], ...},
+            playoffProbabilities={"team1Id": Deci("0.89245"), ...},
+            championshipProbabilities={"team1Id": Deci("0.51002"), ...},
+            averageWAL={"team1Id": Deci("9.40183"), ...},
+        )
+    """
+    teamIds = YearNavigator.getAllTeamIds(year)
+    numberOfTeams = len(teamIds)
+    if numberOfSimulations < 1:
+        raise ValueError("'numberOfSimulations' must be at least 1.")
+    if chunkSize < 1:
+        raise ValueError("'chunkSize' must be at least 1.")
+    if (
+        numberOfPlayoffTeams < 1
+        or numberOfPlayoffTeams > numberOfTeams
+        or numberOfPlayoffTeams & (numberOfPlayoffTeams - 1) != 0
+    ):
+        raise ValueError(
+            "'numberOfPlayoffTeams' must be a power of 2 that is not more than the number of Teams."
+        )
+
+    seasonModel = _getSeasonModel(year, teamIds, remainingSchedule, **kwargs)
+    maxWorkers = maxWorkers if maxWorkers is not None else os.cpu_count() or 1
+    chunkSizes = [chunkSize] * (numberOfSimulations // chunkSize)
+    if numberOfSimulations % chunkSize > 0:
+        chunkSizes.append(numberOfSimulations % chunkSize)
+    chunkSeedSequences = numpy.random.SeedSequence(seed).spawn(len(chunkSizes))
+    chunkArgs = [
+        (seasonModel, numberOfPlayoffTeams, chunkSeedSequence, size)
+        for chunkSeedSequence, size in zip(chunkSeedSequences, chunkSizes)
+    ]
+
+    if maxWorkers <= 1 or len(chunkArgs) == 1:
+        chunkResults = [_simulateChunk(*args) for args in chunkArgs]
+    else:
+        with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+            chunkResults = list(executor.map(_simulateChunk, *zip(*chunkArgs)))
+
+    seedCounts = sum(chunkResult[0] for chunkResult in chunkResults)
+    championshipCounts = sum(chunkResult[1] for chunkResult in chunkResults)
+    walSums = sum(chunkResult[2] for chunkResult in chunkResults)
+
+    def toProbability(count: int) -> Deci:
+        return Deci(int(count)) / Deci(numberOfSimulations)
+
+    return SeasonSimulation(
+        numberOfSimulations=numberOfSimulations,
+        teamIds=teamIds,
+        seedProbabilities={
+            teamId: [toProbability(count) for count in seedCounts[i]]
+            for i, teamId in enumerate(teamIds)
+        },
+        playoffProbabilities={
+            teamId: toProbability(seedCounts[i, :numberOfPlayoffTeams].sum())
+            for i, teamId in enumerate(teamIds)
+        },
+        championshipProbabilities={
+            teamId: toProbability(championshipCounts[i])
+            for i, teamId in enumerate(teamIds)
+        },
+        averageWAL={
+            teamId: Deci(float(walSums[i])) / Deci(numberOfSimulations)
+            for i, teamId in enumerate(teamIds)
+        },
+    )
+
+
+@dataclass(kw_only=True, frozen=True)
+class _SeasonModel:
+    """
+    Everything needed to simulate the rest of a Year, with Teams referred to by their index in Year.teams.
+    """
+
+    scoreMeans: numpy.ndarray  # float, shape (Teams,)
+    scoreStandardDeviations: numpy.ndarray  # float, shape (Teams,)
+    startingWAL: numpy.ndarray  # float, shape (Teams,)
+    startingPointsScored: numpy.ndarray  # float, shape (Teams,)
+    # (teamA indexes, teamB indexes) for each remaining Week
+    remainingWeeks: list[tuple[numpy.ndarray, numpy.ndarray]]
+    leagueMedianGames: bool
+
+
+def _getSeasonModel(
+    year: Year,
+    teamIds: list[str],
+    remainingSchedule: list[list[tuple[str, str]]],
+    **kwargs,
+) -> _SeasonModel:
+    teamIdToIndex = {teamId: i for i, teamId in enumerate(teamIds)}
+    remainingWeeks = list()
+    for weekIndex, games in enumerate(remainingSchedule):
+        teamIdsInWeek = [teamId for game in games for teamId in game]
+        for teamId in teamIdsInWeek:
+            if teamId not in teamIdToIndex:
+                raise ValueError(
+                    f"Team with ID '{teamId}' in remaining Week {weekIndex + 1} is not in the Year."
+                )
+        if len(set(teamIdsInWeek)) != len(teamIdsInWeek):
+            raise ValueError(
+                f"A Team plays more than once in remaining Week {weekIndex + 1}."
+            )
+        remainingWeeks.append(
+            (
+                numpy.array([teamIdToIndex[a] for a, _ in games], dtype=numpy.int64),
+                numpy.array([teamIdToIndex[b] for _, b in games], dtype=numpy.int64),
+            )
+        )
+
+    # fit each Team's score distribution
+    filters = YearFilters.getForYear(year, **kwargs)
+    allScores = [
+        score
+        for matchup in YearNavigator.getAllMatchupsInYear(year, filters)
+        for score in (matchup.teamAScore, matchup.teamBScore)
+    ]
+    numberOfGamesPlayed = YearNavigator.getNumberOfGamesPlayed(year, filters)
+    calculatorKwargs = {**kwargs, "validate": False}
+    pointsScoredPerGame = PointsScoredYearCalculator.getPointsScoredPerGame(
+        year, **calculatorKwargs
+    )
+    scoringStandardDeviation = (
+        ScoringStandardDeviationYearCalculator.getScoringStandardDeviation(
+            year, **calculatorKwargs
+        )
+    )
+    scoreMeans = numpy.full(len(teamIds), numpy.mean(allScores))
+    scoreStandardDeviations = numpy.full(len(teamIds), numpy.std(allScores))
+    for i, teamId in enumerate(teamIds):
+        if numberOfGamesPlayed[teamId] >= 2:
+            scoreMeans[i] = float(pointsScoredPerGame[teamId])
+            scoreStandardDeviations[i] = float(scoringStandardDeviation[teamId])
+
+    # standings so far
+    wal = GameOutcomeYearCalculator.getWAL(year, validate=False, onlyRegularSeason=True)
+    pointsScored = PointsScoredYearCalculator.getPointsScored(
+        year, validate=False, onlyRegularSeason=True
+    )
+    return _SeasonModel(
+        scoreMeans=scoreMeans,
+        scoreStandardDeviations=scoreStandardDeviations,
+        startingWAL=numpy.array([float(wal[teamId] or 0) for teamId in teamIds]),
+        startingPointsScored=numpy.array(
+            [float(pointsScored[teamId] or 0) for teamId in teamIds]
+        ),
+        remainingWeeks=remainingWeeks,
+        leagueMedianGames=bool(year.yearSettings.leagueMedianGames),
+    )
+
+
+def _drawScores(
+    rng: numpy.random.Generator, seasonModel: _SeasonModel, teamIndexes: numpy.ndarray
+) -> numpy.ndarray:
+    """
+    Draws a score for each of the given Team indexes (any shape), scores can't be negative.
+    """
+    return numpy.maximum(
+        rng.normal(
+            seasonModel.scoreMeans[teamIndexes],
+            seasonModel.scoreStandardDeviations[teamIndexes],
+        ),
+        0.0,
+    )
+
+
+def _simulateChunk(
+    seasonModel: _SeasonModel,
+    numberOfPlayoffTeams: int,
+    seedSequence: numpy.random.SeedSequence,
+    numberOfSimulations: int,
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """
+    Simulates numberOfSimulations seasons at once.
+    Can run in a worker process.
+    Returns how many times each Team finished as each seed, how many times each Team won the championship and each Team's total WAL.
+    """
+    rng = numpy.random.default_rng(seedSequence)
+    numberOfTeams = len(seasonModel.scoreMeans)
+    wal = numpy.tile(seasonModel.startingWAL, (numberOfSimulations, 1))
+    pointsScored = numpy.tile(
+        seasonModel.startingPointsScored, (numberOfSimulations, 1)
+    )
+
+    for teamAIndexes, teamBIndexes in seasonModel.remainingWeeks:
+        if len(teamAIndexes) == 0:
+            continue
+        shape = (numberOfSimulations, len(teamAIndexes))
+        teamAScores = _drawScores(
+            rng, seasonModel, numpy.broadcast_to(teamAIndexes, shape)
+        )
+        teamBScores = _drawScores(
+            rng, seasonModel, numpy.broadcast_to(teamBIndexes, shape)
+        )
+        # a Team plays at most once a week, so each column is only added to once
+        wal[:, teamAIndexes] += (teamAScores > teamBScores) + 0.5 * (
+            teamAScores == teamBScores
+        )
+        wal[:, teamBIndexes] += (teamBScores > teamAScores) + 0.5 * (
+            teamAScores == teamBScores
+        )
+        pointsScored[:, teamAIndexes] += teamAScores
+        pointsScored[:, teamBIndexes] += teamBScores
+        if seasonModel.leagueMedianGames:
+            weekTeamIndexes = numpy.concatenate((teamAIndexes, teamBIndexes))
+            weekScores = numpy.concatenate((teamAScores, teamBScores), axis=1)
+            median = numpy.median(weekScores, axis=1, keepdims=True)
+            wal[:, weekTeamIndexes] += (weekScores > median) + 0.5 * (
+                weekScores == median
+            )
+
+    # Team indexes ordered by seed, best WAL then most points first
+    seeds = numpy.lexsort((-pointsScored, -wal), axis=1)
+    seedCounts = numpy.zeros((numberOfTeams, numberOfTeams), dtype=numpy.int64)
+    for seedIndex in range(numberOfTeams):
+        seedCounts[:, seedIndex] = numpy.bincount(
+            seeds[:, seedIndex], minlength=numberOfTeams
+        )
+
+    # bracket order, so the best remaining seed always plays the worst remaining seed
+    bracket = seeds[:, :numberOfPlayoffTeams]
+    while bracket.shape[1] > 1:
+        half = bracket.shape[1] // 2
+        betterSeeds = bracket[:, :half]
+        worseSeeds = bracket[:, ::-1][:, :half]
+        betterSeedScores = _drawScores(rng, seasonModel, betterSeeds)
+        worseSeedScores = _drawScores(rng, seasonModel, worseSeeds)
+        bracket = numpy.where(
+            betterSeedScores >= worseSeedScores, betterSeeds, worseSeeds
+        )
+    championshipCounts = numpy.bincount(bracket[:, 0], minlength=numberOfTeams)
+
+    return seedCounts, championshipCounts, wal.sum(axis=0)
@@ -1,53 +1,5 @@
-from leeger.calculator.all_time_calculator import (
-    AWALAllTimeCalculator,
-    TeamSummaryAllTimeCalculator,
-)
-from leeger.calculator.all_time_calculator.GameOutcomeAllTimeCalculator import (
-    GameOutcomeAllTimeCalculator,
-)
-from leeger.calculator.all_time_calculator.PlusMinusAllTimeCalculator import (
-    PlusMinusAllTimeCalculator,
-)
-from leeger.calculator.all_time_calculator.PointsScoredAllTimeCalculator import (
-    PointsScoredAllTimeCalculator,
-)
-from leeger.calculator.all_time_calculator.ScoringShareAllTimeCalculator import (
-    ScoringShareAllTimeCalculator,
-)
-from leeger.calculator.all_time_calculator.ScoringStandardDeviationAllTimeCalculator import (
-    ScoringStandardDeviationAllTimeCalculator,
-)
-from leeger.calculator.all_time_calculator.SingleScoreAllTimeCalculator import (
-    SingleScoreAllTimeCalculator,
-)
-from leeger.calculator.all_time_calculator.SmartWinsAllTimeCalculator import (
-    SmartWinsAllTimeCalculator,
-)
-from leeger.calculator.all_time_calculator.SSLAllTimeCalculator import (
-    SSLAllTimeCalculator,
-)
-from leeger.calculator.year_calculator import (
-    ScoringStandardDeviationYearCalculator,
-    SingleScoreYearCalculator,
-    TeamSummaryYearCalculator,
-)
-from leeger.calculator.year_calculator.AWALYearCalculator import AWALYearCalculator
-from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
-    GameOutcomeYearCalculator,
-)
-from leeger.calculator.year_calculator.PlusMinusYearCalculator import (
-    PlusMinusYearCalculator,
-)
-from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
-    PointsScoredYearCalculator,
-)
-from leeger.calculator.year_calculator.ScoringShareYearCalculator import (
-    ScoringShareYearCalculator,
-)
-from leeger.calculator.year_calculator.SmartWinsYearCalculator import (
-    SmartWinsYearCalculator,
-)
-from leeger.calculator.year_calculator.SSLYearCalculator import SSLYearCalculator
+# calculators are accessed through their packages so they are only imported the first time a stat sheet is made
+from leeger.calculator import all_time_calculator, year_calculator
 from leeger.model.league import League, Year
 from leeger.model.stat.AllTimeStatSheet import AllTimeStatSheet
 from leeger.model.stat.YearStatSheet import YearStatSheet
@@ -55,70 +7,126 @@ from leeger.model.stat.YearStatSheet import YearStatSheet
 
 def leagueStatSheet(league: League, **kwargs) -> AllTimeStatSheet:
     # Team Summary
-    gamesPlayed = TeamSummaryAllTimeCalculator.getGamesPlayed(league, **kwargs)
+    gamesPlayed = all_time_calculator.TeamSummaryAllTimeCalculator.getGamesPlayed(
+        league, **kwargs
+    )
 
     # Game Outcome
-    wins = GameOutcomeAllTimeCalculator.getWins(league, **kwargs)
-    losses = GameOutcomeAllTimeCalculator.getLosses(league, **kwargs)
-    ties = GameOutcomeAllTimeCalculator.getTies(league, **kwargs)
-    winPercentage = GameOutcomeAllTimeCalculator.getWinPercentage(league, **kwargs)
-    wal = GameOutcomeAllTimeCalculator.getWAL(league, **kwargs)
-    walPerGame = GameOutcomeAllTimeCalculator.getWALPerGame(league, **kwargs)
+    wins = all_time_calculator.GameOutcomeAllTimeCalculator.getWins(league, **kwargs)
+    losses = all_time_calculator.GameOutcomeAllTimeCalculator.getLosses(
+        league, **kwargs
+    )
+    ties = all_time_calculator.GameOutcomeAllTimeCalculator.getTies(league, **kwargs)
+    winPercentage = all_time_calculator.GameOutcomeAllTimeCalculator.getWinPercentage(
+        league, **kwargs
+    )
+    wal = all_time_calculator.GameOutcomeAllTimeCalculator.getWAL(league, **kwargs)
+    walPerGame = all_time_calculator.GameOutcomeAllTimeCalculator.getWALPerGame(
+        league, **kwargs
+    )
 
     # AWAL
-    awal = AWALAllTimeCalculator.getAWAL(league, **kwargs)
-    awalPerGame = AWALAllTimeCalculator.getAWALPerGame(league, **kwargs)
-    opponentAWAL = AWALAllTimeCalculator.getOpponentAWAL(league, **kwargs)
-    opponentAWALPerGame = AWALAllTimeCalculator.getOpponentAWALPerGame(league, **kwargs)
+    awal = all_time_calculator.AWALAllTimeCalculator.getAWAL(league, **kwargs)
+    awalPerGame = all_time_calculator.AWALAllTimeCalculator.getAWALPerGame(
+        league, **kwargs
+    )
+    opponentAWAL = all_time_calculator.AWALAllTimeCalculator.getOpponentAWAL(
+        league, **kwargs
+    )
+    opponentAWALPerGame = (
+        all_time_calculator.AWALAllTimeCalculator.getOpponentAWALPerGame(
+            league, **kwargs
+        )
+    )
 
     # Smart Wins
-    smartWins = SmartWinsAllTimeCalculator.getSmartWins(league, **kwargs)
-    smartWinsPerGame = SmartWinsAllTimeCalculator.getSmartWinsPerGame(league, **kwargs)
-    opponentSmartWins = SmartWinsAllTimeCalculator.getOpponentSmartWins(
+    smartWins = all_time_calculator.SmartWinsAllTimeCalculator.getSmartWins(
         league, **kwargs
     )
-    opponentSmartWinsPerGame = SmartWinsAllTimeCalculator.getOpponentSmartWinsPerGame(
-        league, **kwargs
+    smartWinsPerGame = (
+        all_time_calculator.SmartWinsAllTimeCalculator.getSmartWinsPerGame(
+            league, **kwargs
+        )
+    )
+    opponentSmartWins = (
+        all_time_calculator.SmartWinsAllTimeCalculator.getOpponentSmartWins(
+            league, **kwargs
+        )
+    )
+    opponentSmartWinsPerGame = (
+        all_time_calculator.SmartWinsAllTimeCalculator.getOpponentSmartWinsPerGame(
+            league, **kwargs
+        )
     )
 
     # Points Scored
-    pointsScored = PointsScoredAllTimeCalculator.getPointsScored(league, **kwargs)
-    pointsScoredPerGame = PointsScoredAllTimeCalculator.getPointsScoredPerGame(
+    pointsScored = all_time_calculator.PointsScoredAllTimeCalculator.getPointsScored(
         league, **kwargs
     )
-    opponentPointsScored = PointsScoredAllTimeCalculator.getOpponentPointsScored(
-        league, **kwargs
+    pointsScoredPerGame = (
+        all_time_calculator.PointsScoredAllTimeCalculator.getPointsScoredPerGame(
+            league, **kwargs
+        )
     )
-    opponentPointsScoredPerGame = (
-        PointsScoredAllTimeCalculator.getOpponentPointsScoredPerGame(league, **kwargs)
+    opponentPointsScored = (
+        all_time_calculator.PointsScoredAllTimeCalculator.getOpponentPointsScored(
+            league, **kwargs
+        )
+    )
+    opponentPointsScoredPerGame = all_time_calculator.PointsScoredAllTimeCalculator.getOpponentPointsScoredPerGame(
+        league, **kwargs
     )
 
     # Scoring Share
-    scoringShare = ScoringShareAllTimeCalculator.getScoringShare(league, **kwargs)
-    opponentScoringShare = ScoringShareAllTimeCalculator.getOpponentScoringShare(
+    scoringShare = all_time_calculator.ScoringShareAllTimeCalculator.getScoringShare(
         league, **kwargs
     )
-    maxScoringShare = ScoringShareAllTimeCalculator.getMaxScoringShare(league, **kwargs)
-    minScoringShare = ScoringShareAllTimeCalculator.getMinScoringShare(league, **kwargs)
+    opponentScoringShare = (
+        all_time_calculator.ScoringShareAllTimeCalculator.getOpponentScoringShare(
+            league, **kwargs
+        )
+    )
+    maxScoringShare = (
+        all_time_calculator.ScoringShareAllTimeCalculator.getMaxScoringShare(
+            league, **kwargs
+        )
+    )
+    minScoringShare = (
+        all_time_calculator.ScoringShareAllTimeCalculator.getMinScoringShare(
+            league, **kwargs
+        )
+    )
 
     # Single Score
-    maxScore = SingleScoreAllTimeCalculator.getMaxScore(league, **kwargs)
-    minScore = SingleScoreAllTimeCalculator.getMinScore(league, **kwargs)
+    maxScore = all_time_calculator.SingleScoreAllTimeCalculator.getMaxScore(
+        league, **kwargs
+    )
+    minScore = all_time_calculator.SingleScoreAllTimeCalculator.getMinScore(
+        league, **kwargs
+    )
 
     # Scoring Standard Deviation
-    scoringStandardDeviation = (
-        ScoringStandardDeviationAllTimeCalculator.getScoringStandardDeviation(
-            league, **kwargs
-        )
+    scoringStandardDeviation = all_time_calculator.ScoringStandardDeviationAllTimeCalculator.getScoringStandardDeviation(
+        league, **kwargs
     )
 
     # Plus Minus
-    plusMinus = PlusMinusAllTimeCalculator.getPlusMinus(league, **kwargs)
+    plusMinus = all_time_calculator.PlusMinusAllTimeCalculator.getPlusMinus(
+        league, **kwargs
+    )
 
     # SSL
-    adjustedTeamScore = SSLAllTimeCalculator.getAdjustedTeamScore(league, **kwargs)
-    adjustedTeamSuccess = SSLAllTimeCalculator.getAdjustedTeamSuccess(league, **kwargs)
-    adjustedTeamLuck = SSLAllTimeCalculator.getAdjustedTeamLuck(league, **kwargs)
+    adjustedTeamScore = all_time_calculator.SSLAllTimeCalculator.getAdjustedTeamScore(
+        league, **kwargs
+    )
+    adjustedTeamSuccess = (
+        all_time_calculator.SSLAllTimeCalculator.getAdjustedTeamSuccess(
+            league, **kwargs
+        )
+    )
+    adjustedTeamLuck = all_time_calculator.SSLAllTimeCalculator.getAdjustedTeamLuck(
+        league, **kwargs
+    )
 
     # check for optional stats
     totalGames = None
@@ -126,15 +134,17 @@ def leagueStatSheet(league: League, **kwargs) -> AllTimeStatSheet:
     opponentLeagueMedianWins = None
     for year in league.years:
         if year.yearSettings.leagueMedianGames is True:
-            totalGames = TeamSummaryAllTimeCalculator.getTotalGames(league, **kwargs)
-            leagueMedianWins = GameOutcomeAllTimeCalculator.getLeagueMedianWins(
+            totalGames = all_time_calculator.TeamSummaryAllTimeCalculator.getTotalGames(
                 league, **kwargs
             )
-            opponentLeagueMedianWins = (
-                GameOutcomeAllTimeCalculator.getOpponentLeagueMedianWins(
+            leagueMedianWins = (
+                all_time_calculator.GameOutcomeAllTimeCalculator.getLeagueMedianWins(
                     league, **kwargs
                 )
             )
+            opponentLeagueMedianWins = all_time_calculator.GameOutcomeAllTimeCalculator.getOpponentLeagueMedianWins(
+                league, **kwargs
+            )
             break
 
     return AllTimeStatSheet(
@@ -178,77 +188,111 @@ def yearStatSheet(year: Year, **kwargs) -> YearStatSheet:
     ownerNames = kwargs.pop("ownerNames", None)
     years = kwargs.pop("years", None)
     # Team Summary
-    gamesPlayed = TeamSummaryYearCalculator.getGamesPlayed(year, **kwargs)
+    gamesPlayed = year_calculator.TeamSummaryYearCalculator.getGamesPlayed(
+        year, **kwargs
+    )
     # Game Outcome
-    wins = GameOutcomeYearCalculator.getWins(year, **kwargs)
-    losses = GameOutcomeYearCalculator.getLosses(year, **kwargs)
-    ties = GameOutcomeYearCalculator.getTies(year, **kwargs)
-    winPercentage = GameOutcomeYearCalculator.getWinPercentage(year, **kwargs)
-    wal = GameOutcomeYearCalculator.getWAL(year, **kwargs)
-    walPerGame = GameOutcomeYearCalculator.getWALPerGame(year, **kwargs)
+    wins = year_calculator.GameOutcomeYearCalculator.getWins(year, **kwargs)
+    losses = year_calculator.GameOutcomeYearCalculator.getLosses(year, **kwargs)
+    ties = year_calculator.GameOutcomeYearCalculator.getTies(year, **kwargs)
+    winPercentage = year_calculator.GameOutcomeYearCalculator.getWinPercentage(
+        year, **kwargs
+    )
+    wal = year_calculator.GameOutcomeYearCalculator.getWAL(year, **kwargs)
+    walPerGame = year_calculator.GameOutcomeYearCalculator.getWALPerGame(year, **kwargs)
 
     # AWAL
-    awal = AWALYearCalculator.getAWAL(year, **kwargs)
-    awalPerGame = AWALYearCalculator.getAWALPerGame(year, **kwargs)
-    opponentAWAL = AWALYearCalculator.getOpponentAWAL(year, **kwargs)
-    opponentAWALPerGame = AWALYearCalculator.getOpponentAWALPerGame(year, **kwargs)
+    awal = year_calculator.AWALYearCalculator.getAWAL(year, **kwargs)
+    awalPerGame = year_calculator.AWALYearCalculator.getAWALPerGame(year, **kwargs)
+    opponentAWAL = year_calculator.AWALYearCalculator.getOpponentAWAL(year, **kwargs)
+    opponentAWALPerGame = year_calculator.AWALYearCalculator.getOpponentAWALPerGame(
+        year, **kwargs
+    )
 
     # Smart Wins
-    smartWins = SmartWinsYearCalculator.getSmartWins(year, **kwargs)
-    smartWinsPerGame = SmartWinsYearCalculator.getSmartWinsPerGame(year, **kwargs)
-    opponentSmartWins = SmartWinsYearCalculator.getOpponentSmartWins(year, **kwargs)
-    opponentSmartWinsPerGame = SmartWinsYearCalculator.getOpponentSmartWinsPerGame(
+    smartWins = year_calculator.SmartWinsYearCalculator.getSmartWins(year, **kwargs)
+    smartWinsPerGame = year_calculator.SmartWinsYearCalculator.getSmartWinsPerGame(
         year, **kwargs
     )
+    opponentSmartWins = year_calculator.SmartWinsYearCalculator.getOpponentSmartWins(
+        year, **kwargs
+    )
+    opponentSmartWinsPerGame = (
+        year_calculator.SmartWinsYearCalculator.getOpponentSmartWinsPerGame(
+            year, **kwargs
+        )
+    )
 
     # Points Scored
-    pointsScored = PointsScoredYearCalculator.getPointsScored(year, **kwargs)
-    pointsScoredPerGame = PointsScoredYearCalculator.getPointsScoredPerGame(
+    pointsScored = year_calculator.PointsScoredYearCalculator.getPointsScored(
         year, **kwargs
     )
-    opponentPointsScored = PointsScoredYearCalculator.getOpponentPointsScored(
-        year, **kwargs
+    pointsScoredPerGame = (
+        year_calculator.PointsScoredYearCalculator.getPointsScoredPerGame(
+            year, **kwargs
+        )
+    )
+    opponentPointsScored = (
+        year_calculator.PointsScoredYearCalculator.getOpponentPointsScored(
+            year, **kwargs
+        )
     )
     opponentPointsScoredPerGame = (
-        PointsScoredYearCalculator.getOpponentPointsScoredPerGame(year, **kwargs)
+        year_calculator.PointsScoredYearCalculator.getOpponentPointsScoredPerGame(
+            year, **kwargs
+        )
     )
 
     # Scoring Share
-    scoringShare = ScoringShareYearCalculator.getScoringShare(year, **kwargs)
-    opponentScoringShare = ScoringShareYearCalculator.getOpponentScoringShare(
+    scoringShare = year_calculator.ScoringShareYearCalculator.getScoringShare(
+        year, **kwargs
+    )
+    opponentScoringShare = (
+        year_calculator.ScoringShareYearCalculator.getOpponentScoringShare(
+            year, **kwargs
+        )
+    )
+    maxScoringShare = year_calculator.ScoringShareYearCalculator.getMaxScoringShare(
+        year, **kwargs
+    )
+    minScoringShare = year_calculator.ScoringShareYearCalculator.getMinScoringShare(
         year, **kwargs
     )
-    maxScoringShare = ScoringShareYearCalculator.getMaxScoringShare(year, **kwargs)
-    minScoringShare = ScoringShareYearCalculator.getMinScoringShare(year, **kwargs)
 
     # Single Score
-    maxScore = SingleScoreYearCalculator.getMaxScore(year, **kwargs)
-    minScore = SingleScoreYearCalculator.getMinScore(year, **kwargs)
+    maxScore = year_calculator.SingleScoreYearCalculator.getMaxScore(year, **kwargs)
+    minScore = year_calculator.SingleScoreYearCalculator.getMinScore(year, **kwargs)
 
     # Scoring Standard Deviation
-    scoringStandardDeviation = (
-        ScoringStandardDeviationYearCalculator.getScoringStandardDeviation(
-            year, **kwargs
-        )
+    scoringStandardDeviation = year_calculator.ScoringStandardDeviationYearCalculator.getScoringStandardDeviation(
+        year, **kwargs
     )
 
     # Plus Minus
-    plusMinus = PlusMinusYearCalculator.getPlusMinus(year, **kwargs)
+    plusMinus = year_calculator.PlusMinusYearCalculator.getPlusMinus(year, **kwargs)
 
     # SSL
-    teamScore = SSLYearCalculator.getTeamScore(year, **kwargs)
-    teamSuccess = SSLYearCalculator.getTeamSuccess(year, **kwargs)
-    teamLuck = SSLYearCalculator.getTeamLuck(year, **kwargs)
+    teamScore = year_calculator.SSLYearCalculator.getTeamScore(year, **kwargs)
+    teamSuccess = year_calculator.SSLYearCalculator.getTeamSuccess(year, **kwargs)
+    teamLuck = year_calculator.SSLYearCalculator.getTeamLuck(year, **kwargs)
 
     # check for optional stats
     totalGames = None
     leagueMedianWins = None
     opponentLeagueMedianWins = None
     if year.yearSettings.leagueMedianGames is True:
-        totalGames = TeamSummaryYearCalculator.getTotalGames(year, **kwargs)
-        leagueMedianWins = GameOutcomeYearCalculator.getLeagueMedianWins(year, **kwargs)
+        totalGames = year_calculator.TeamSummaryYearCalculator.getTotalGames(
+            year, **kwargs
+        )
+        leagueMedianWins = (
+            year_calculator.GameOutcomeYearCalculator.getLeagueMedianWins(
+                year, **kwargs
+            )
+        )
         opponentLeagueMedianWins = (
-            GameOutcomeYearCalculator.getOpponentLeagueMedianWins(year, **kwargs)
+            year_calculator.GameOutcomeYearCalculator.getOpponentLeagueMedianWins(
+                year, **kwargs
+            )
         )
 
     return YearStatSheet(
@@ -0,0 +1,347 @@
+import csv
+import os
+from typing import Any, Callable, Iterable, Iterator
+
+from leeger.model.league import League
+from leeger.util.excel_helper import iterAllTimeMatchupRows, iterYearMatchupRows
+from leeger.util.stat_sheet import leagueStatSheet, yearStatSheet
+
+"""
+Table Export
+
+    - Writes the same stats as leagueToExcel() as flat tables that are easy to load into other tools.
+    - Every table has a fixed set of typed columns, so rows from any number of Leagues can be written to the same file.
+    - Numeric stats are written as numbers (not Deci strings) and missing stats are left empty.
+    - Leagues are consumed one at a time, so memory use does not grow with the number of Leagues exported.
+
+"""
+
+# column types
+__STRING = "string"
+__INTEGER = "integer"
+__FLOAT = "float"
+
+__YEAR_STAT_COLUMNS = [
+    ("Games Played", __INTEGER),
+    ("Total Games", __INTEGER),
+    ("Wins", __INTEGER),
+    ("Losses", __INTEGER),
+    ("League Median Wins", __FLOAT),
+    ("Opponent League Median Wins", __FLOAT),
+    ("Ties", __INTEGER),
+    ("Win Percentage", __FLOAT),
+    ("WAL", __FLOAT),
+    ("WAL Per Game", __FLOAT),
+    ("AWAL", __FLOAT),
+    ("AWAL Per Game", __FLOAT),
+    ("Opponent AWAL", __FLOAT),
+    ("Opponent AWAL Per Game", __FLOAT),
+    ("Smart Wins", __FLOAT),
+    ("Smart Wins Per Game", __FLOAT),
+    ("Opponent Smart Wins", __FLOAT),
+    ("Opponent Smart Wins Per Game", __FLOAT),
+    ("Points Scored", __FLOAT),
+    ("Points Scored Per Game", __FLOAT),
+    ("Opponent Points Scored", __FLOAT),
+    ("Opponent Points Scored Per Game", __FLOAT),
+    ("Scoring Share", __FLOAT),
+    ("Opponent Scoring Share", __FLOAT),
+    ("Max Scoring Share", __FLOAT),
+    ("Min Scoring Share", __FLOAT),
+    ("Max Score", __FLOAT),
+    ("Min Score", __FLOAT),
+    ("Scoring Standard Deviation", __FLOAT),
+    ("Plus/Minus", __FLOAT),
+]
+
+# table name -> [(column title, column type), ...]
+TABLE_COLUMNS: dict[str, list[tuple[str, str]]] = {
+    "yearTeams": [
+        ("League ID", __STRING),
+        ("League Name", __STRING),
+        ("Year", __INTEGER),
+        ("Team ID", __STRING),
+        ("Team", __STRING),
+        ("Owner ID", __STRING),
+        ("Owner", __STRING),
+        ("Division", __STRING),
+        *__YEAR_STAT_COLUMNS,
+        ("Team Score", __FLOAT),
+        ("Team Success", __FLOAT),
+        ("Team Luck", __FLOAT),
+    ],
+    "yearMatchups": [
+        ("League ID", __STRING),
+        ("League Name", __STRING),
+        ("Year", __INTEGER),
+        ("Week Number", __INTEGER),
+        ("Matchup ID", __STRING),
+        ("Team For", __STRING),
+        ("Owner ID For", __STRING),
+        ("Team Against", __STRING),
+        ("Owner ID Against", __STRING),
+        ("Matchup Type", __STRING),
+        ("Points For", __FLOAT),
+        ("Points Against", __FLOAT),
+    ],
+    "allTimeOwners": [
+        ("League ID", __STRING),
+        ("League Name", __STRING),
+        ("Owner ID", __STRING),
+        ("Owner", __STRING),
+        *__YEAR_STAT_COLUMNS,
+        ("Adjusted Team Score", __FLOAT),
+        ("Adjusted Team Success", __FLOAT),
+        ("Adjusted Team Luck", __FLOAT),
+    ],
+    "allTimeMatchups": [
+        ("League ID", __STRING),
+        ("League Name", __STRING),
+        ("Matchup ID", __STRING),
+        ("Team For", __STRING),
+        ("Owner For", __STRING),
+        ("Team Against", __STRING),
+        ("Owner Against", __STRING),
+        ("Year", __INTEGER),
+        ("Week Number", __INTEGER),
+        ("Matchup Type", __STRING),
+        ("Points For", __FLOAT),
+        ("Points Against", __FLOAT),
+    ],
+}
+
+
+def leagueToCsv(
+    league: League, directoryPath: str, overwrite: bool = False, **kwargs
+) -> None:
+    """
+    Saves the stats for the given League as CSV files in the given directory.
+    See leaguesToCsv() for the files that are written.
+    """
+    leaguesToCsv([league], directoryPath, overwrite, **kwargs)
+
+
+def leaguesToCsv(
+    leagues: Iterable[League], directoryPath: str, overwrite: bool = False, **kwargs
+) -> None:
+    """
+    Saves the stats for the given Leagues as CSV files in the given directory.
+    One file is written for each table in TABLE_COLUMNS (yearTeams.csv, yearMatchups.csv, allTimeOwners.csv, allTimeMatchups.csv).
+    Rows are written as they are computed, one League at a time.
+    """
+    filePaths = _getFilePaths(directoryPath, "csv", overwrite)
+    files = {
+        tableName: open(filePath, "w", newline="", encoding="utf-8")
+        for tableName, filePath in filePaths.items()
+    }
+    try:
+        writers = dict()
+        for tableName, file in files.items():
+            writers[tableName] = csv.writer(file)
+            writers[tableName].writerow(
+                [title for title, _ in TABLE_COLUMNS[tableName]]
+            )
+        for league in leagues:
+            for tableName, rows in _iterTables(league, **kwargs):
+                for row in rows:
+                    writers[tableName].writerow(_getRowValues(tableName, row))
+    finally:
+        for file in files.values():
+            file.close()
+
+
+def leagueToParquet(
+    league: League, directoryPath: str, overwrite: bool = False, **kwargs
+) -> None:
+    """
+    Saves the stats for the given League as Parquet files in the given directory.
+    See leaguesToParquet() for the files that are written.
+    """
+    leaguesToParquet([league], directoryPath, overwrite, **kwargs)
+
+
+def leaguesToParquet(
+    leagues: Iterable[League], directoryPath: str, overwrite: bool = False, **kwargs
+) -> None:
+    """
+    Saves the stats for the given Leagues as typed, columnar Parquet files in the given directory.
+    One file is written for each table in TABLE_COLUMNS (yearTeams.parquet, yearMatchups.parquet, allTimeOwners.parquet, allTimeMatchups.parquet).
+    Each League is written as its own row group, so only 1 League worth of rows is held in memory at a time.
+
+    Requires the optional 'pyarrow' package.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "'pyarrow' is required to export to Parquet. Install it with 'pip install pyarrow'."
+        ) from e
+
+    pyarrowTypes = {
+        __STRING: pyarrow.string(),
+        __INTEGER: pyarrow.int64(),
+        __FLOAT: pyarrow.float64(),
+    }
+    schemas = {
+        tableName: pyarrow.schema(
+            [(title, pyarrowTypes[columnType]) for title, columnType in columns]
+        )
+        for tableName, columns in TABLE_COLUMNS.items()
+    }
+
+    filePaths = _getFilePaths(directoryPath, "parquet", overwrite)
+    writers = dict()
+    try:
+        for tableName, filePath in filePaths.items():
+            writers[tableName] = pyarrow.parquet.ParquetWriter(
+                filePath, schemas[tableName]
+            )
+        for league in leagues:
+            for tableName, rows in _iterTables(league, **kwargs):
+                columnValues: list[list] = [list() for _ in TABLE_COLUMNS[tableName]]
+                for row in rows:
+                    for i, value in enumerate(_getRowValues(tableName, row)):
+                        columnValues[i].append(value)
+                if len(columnValues[0]) > 0:
+                    writers[tableName].write_table(
+                        pyarrow.Table.from_arrays(
+                            columnValues, schema=schemas[tableName]
+                        )
+                    )
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+
+def _getFilePaths(directoryPath: str, extension: str, overwrite: bool) -> dict:
+    """
+    Returns the file path for each table and makes sure they can be written to.
+
+    Example response:
+        {
+            "yearTeams": "some/directory/yearTeams.csv",
+            ...
+        }
+    """
+    os.makedirs(directoryPath, exist_ok=True)
+    filePaths = dict()
+    for tableName in TABLE_COLUMNS.keys():
+        filePath = os.path.join(directoryPath, f"{tableName}.{extension}")
+        if os.path.exists(filePath) and not overwrite:
+            raise FileExistsError(
+                f"Cannot create file at path: '{filePath}' because there is already a file there."
+            )
+        filePaths[tableName] = filePath
+    return filePaths
+
+
+def _getRowValues(tableName: str, row: dict[str, Any]) -> list:
+    """
+    Returns the values of the given row in column order, cast to the type of each column.
+    """
+    values = list()
+    for title, columnType in TABLE_COLUMNS[tableName]:
+        value = row.get(title)
+        if value is not None:
+            if columnType == __FLOAT:
+                value = float(value)
+            elif columnType == __INTEGER:
+                value = int(value)
+            elif not isinstance(value, str):
+                value = str(value)
+        values.append(value)
+    return values
+
+
+def _iterTables(league: League, **kwargs) -> Iterator[tuple[str, Iterator[dict]]]:
+    """
+    Yields each table name with an iterator of the rows for that table in the given League.
+    """
+    tableRowFunctions: dict[str, Callable[..., Iterator[dict]]] = {
+        "yearTeams": _iterYearTeamRows,
+        "yearMatchups": _iterYearMatchupRows,
+        "allTimeOwners": _iterAllTimeOwnerRows,
+        "allTimeMatchups": _iterAllTimeMatchupRows,
+    }
+    for tableName, tableRowFunction in tableRowFunctions.items():
+        yield tableName, tableRowFunction(league, **kwargs.copy())
+
+
+def _iterYearTeamRows(league: League, **kwargs) -> Iterator[dict]:
+    ownerIdToNameMap = {owner.id: owner.name for owner in league.owners}
+    for year in league.years:
+        divisionIdToNameMap = {
+            division.id: division.name for division in year.divisions
+        }
+        yearStatsWithTitles = yearStatSheet(
+            year, **kwargs.copy()
+        ).preferredOrderWithTitle()
+        for team in year.teams:
+            row = {
+                "League ID": league.id,
+                "League Name": league.name,
+                "Year": year.yearNumber,
+                "Team ID": team.id,
+                "Team": team.name,
+                "Owner ID": team.ownerId,
+                "Owner": ownerIdToNameMap.get(team.ownerId),
+                "Division": divisionIdToNameMap.get(team.divisionId),
+            }
+            for title, statDict in yearStatsWithTitles:
+                row[title] = statDict.get(team.id)
+            yield row
+
+
+def _iterYearMatchupRows(league: League, **kwargs) -> Iterator[dict]:
+    for year in league.years:
+        for matchupStatRow in iterYearMatchupRows(year, **kwargs.copy()):
+            yield {
+                "League ID": league.id,
+                "League Name": league.name,
+                "Year": matchupStatRow.yearNumber,
+                "Week Number": matchupStatRow.weekNumber,
+                "Matchup ID": matchupStatRow.matchupId,
+                "Team For": matchupStatRow.teamForName,
+                "Owner ID For": matchupStatRow.ownerForId,
+                "Team Against": matchupStatRow.teamAgainstName,
+                "Owner ID Against": matchupStatRow.ownerAgainstId,
+                "Matchup Type": matchupStatRow.matchupType,
+                "Points For": matchupStatRow.pointsFor,
+                "Points Against": matchupStatRow.pointsAgainst,
+            }
+
+
+def _iterAllTimeOwnerRows(league: League, **kwargs) -> Iterator[dict]:
+    allTimeStatsWithTitles = leagueStatSheet(
+        league, **kwargs.copy()
+    ).preferredOrderWithTitle()
+    for owner in league.owners:
+        row = {
+            "League ID": league.id,
+            "League Name": league.name,
+            "Owner ID": owner.id,
+            "Owner": owner.name,
+        }
+        for title, statDict in allTimeStatsWithTitles:
+            row[title] = statDict.get(owner.id)
+        yield row
+
+
+def _iterAllTimeMatchupRows(league: League, **kwargs) -> Iterator[dict]:
+    ownerIdToNameMap = {owner.id: owner.name for owner in league.owners}
+    for matchupStatRow in iterAllTimeMatchupRows(league, **kwargs.copy()):
+        yield {
+            "League ID": league.id,
+            "League Name": league.name,
+            "Matchup ID": matchupStatRow.matchupId,
+            "Team For": matchupStatRow.teamForName,
+            "Owner For": ownerIdToNameMap.get(matchupStatRow.ownerForId),
+            "Team Against": matchupStatRow.teamAgainstName,
+            "Owner Against": ownerIdToNameMap.get(matchupStatRow.ownerAgainstId),
+            "Year": matchupStatRow.yearNumber,
+            "Week Number": matchupStatRow.weekNumber,
+            "Matchup Type": matchupStatRow.matchupType,
+            "Points For": matchupStatRow.pointsFor,
+            "Points Against": matchupStatRow.pointsAgainst,
+        }
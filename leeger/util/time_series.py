@@ -0,0 +1,376 @@
+from typing import Optional
+
+import numpy
+
+from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.decorator.validators import validateLeague, validateYear
+from leeger.enum.TimeSeriesStat import TimeSeriesStat
+from leeger.model.filter import AllTimeFilters, YearFilters
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Year import Year
+from leeger.model.time_series.TimeSeries import TimeSeries
+from leeger.util.navigator.LeagueNavigator import LeagueNavigator
+from leeger.util.navigator.MatchupNavigator import MatchupNavigator
+from leeger.util.navigator.YearNavigator import YearNavigator
+from leeger.util.week_tracker import WeekTracker
+
+"""
+Time Series
+
+    - Gets week-by-week rolling and cumulative stats for each Team in a Year, or each Owner all-time.
+    - Matchups are visited once to get what each Week adds to each stat, then every Week's value comes from running sums (a rolling window is the difference of 2 running sums).
+    - Cumulative stats are the same as the calculators' (e.g. AWALYearCalculator.getAWAL()) with the filtered range ending at that Week.
+    - A multi-week matchup adds its points in each of its Weeks, and counts as a game in rolling win percentage in its last Week.
+    - Cumulative WAL and Smart Wins count the Weeks of a multi-week matchup so far as a game, as the calculators do for a range ending partway through it.
+    - Filters are the same kwargs the Year and All-Time calculators take.
+
+"""
+
+__DEFAULT_WINDOW = 3
+
+
+@validateYear
+def getYearTimeSeries(
+    year: Year,
+    stats: Optional[list[TimeSeriesStat]] = None,
+    *,
+    window: int = __DEFAULT_WINDOW,
+    **kwargs,
+) -> TimeSeries:
+    """
+    Returns the given stats (every stat by default) for each Team in each Week of the given Year.
+    Rolling stats are over the last window Weeks (or fewer, for the first Weeks).
+
+    Example response:
+        TimeSeries(
+            weeks=[(2023, 1), (2023, 2), ...],
+            ids=["someTeamId", "someOtherTeamId", ...],
+            window=3,
+            values={TimeSeriesStat.CUMULATIVE_AWAL: numpy.array([[0.6, 0.2, ...], [1.4, 0.5, ...], ...]), ...},
+        )
+    """
+    if window < 1:
+        raise ValueError("'window' must be at least 1.")
+    teamIds = YearNavigator.getAllTeamIds(year)
+    weeklyTotals = _getWeeklyTotals(
+        year,
+        YearFilters.getForYear(year, **kwargs),
+        teamIds,
+        numpy.sort(
+            YearNavigator.getAllScoresInYear(year, simplifyMultiWeekMatchups=True)
+        ),
+    )
+    return _getTimeSeries(weeklyTotals, teamIds, stats, window)
+
+
+@validateLeague
+def getLeagueTimeSeries(
+    league: League,
+    stats: Optional[list[TimeSeriesStat]] = None,
+    *,
+    window: int = __DEFAULT_WINDOW,
+    **kwargs,
+) -> TimeSeries:
+    """
+    Returns the given stats (every stat by default) for each Owner in each Week of the given League.
+    Rolling stats are over the last window Weeks (or fewer, for the first Weeks) and carry on across Years, as do cumulative stats.
+
+    Example response:
+        TimeSeries(
+            weeks=[(2022, 1), (2022, 2), ..., (2023, 1), ...],
+            ids=["someOwnerId", "someOtherOwnerId", ...],
+            window=3,
+            values={TimeSeriesStat.CUMULATIVE_AWAL: numpy.array([[0.6, 0.2, ...], [1.4, 0.5, ...], ...]), ...},
+        )
+    """
+    if window < 1:
+        raise ValueError("'window' must be at least 1.")
+    yearNumberToYearFilters = AllTimeCalculator._allTimeFiltersToYearFilters(
+        league, AllTimeFilters.getForLeague(league, **kwargs)
+    )
+    ownerIds = [owner.id for owner in league.owners]
+    ownerIdToIndex = {ownerId: i for i, ownerId in enumerate(ownerIds)}
+    # Smart Wins all-time are against every score in the League
+    allScores = numpy.sort(
+        LeagueNavigator.getAllScoresInLeague(league, simplifyMultiWeekMatchups=True)
+    )
+
+    allWeeklyTotals = list()
+    for year in league.years:
+        yearFilters = yearNumberToYearFilters.get(str(year.yearNumber))
+        if yearFilters is None:
+            continue
+        teamIds = YearNavigator.getAllTeamIds(year)
+        ownerIndexes = [
+            ownerIdToIndex[YearNavigator.getTeamById(year, teamId).ownerId]
+            for teamId in teamIds
+        ]
+        allWeeklyTotals.append(
+            _getWeeklyTotals(year, yearFilters, teamIds, allScores).toColumns(
+                ownerIndexes, len(ownerIds)
+            )
+        )
+    return _getTimeSeries(
+        _WeeklyTotals.concatenate(allWeeklyTotals, len(ownerIds)),
+        ownerIds,
+        stats,
+        window,
+    )
+
+
+class _WeeklyTotals:
+    """
+    What each Week adds to each stat, for each Team or Owner.
+    Every array is float, shape (Weeks, Teams or Owners).
+    """
+
+    def __init__(self, weeks: list[tuple[int, int]], numberOfColumns: int):
+        self.weeks = weeks
+        shape = (len(weeks), numberOfColumns)
+        self.points = numpy.zeros(shape)
+        self.scores = numpy.zeros(shape)
+        self.wal = numpy.zeros(shape)
+        self.games = numpy.zeros(shape)
+        # what the Weeks of a multi-week matchup before its last add to cumulative WAL, these net to zero by its last Week
+        self.partialWal = numpy.zeros(shape)
+        self.partialGames = numpy.zeros(shape)
+        self.awal = numpy.zeros(shape)
+        # Smart Wins are only cumulative, so a multi-week matchup adds to them in each of its Weeks
+        self.smartWins = numpy.zeros(shape)
+        # games for Smart Wins, which don't include league median games
+        self.smartWinsGames = numpy.zeros(shape)
+
+    def __arrayNames(self) -> list[str]:
+        return [name for name in vars(self) if name != "weeks"]
+
+    def toColumns(self, columns: list[int], numberOfColumns: int) -> "_WeeklyTotals":
+        """
+        Returns these totals with column i moved to column columns[i], out of numberOfColumns.
+        """
+        weeklyTotals = _WeeklyTotals(self.weeks, numberOfColumns)
+        for name in self.__arrayNames():
+            getattr(weeklyTotals, name)[:, columns] = getattr(self, name)
+        return weeklyTotals
+
+    @classmethod
+    def concatenate(
+        cls, allWeeklyTotals: list["_WeeklyTotals"], numberOfColumns: int
+    ) -> "_WeeklyTotals":
+        weeklyTotals = cls(
+            [week for totals in allWeeklyTotals for week in totals.weeks],
+            numberOfColumns,
+        )
+        if allWeeklyTotals:
+            for name in weeklyTotals.__arrayNames():
+                setattr(
+                    weeklyTotals,
+                    name,
+                    numpy.concatenate(
+                        [getattr(totals, name) for totals in allWeeklyTotals]
+                    ),
+                )
+        return weeklyTotals
+
+
+def _getWeeklyTotals(
+    year: Year, yearFilters: YearFilters, teamIds: list[str], allScores: numpy.ndarray
+) -> _WeeklyTotals:
+    """
+    Visits each Matchup in the given Year that passes the given filters once.
+    allScores is every score (sorted) that Smart Wins are against.
+    """
+    teamIdToIndex = {teamId: i for i, teamId in enumerate(teamIds)}
+    weeks = year.weeks[yearFilters.weekNumberStart - 1 : yearFilters.weekNumberEnd]
+    weeklyTotals = _WeeklyTotals(
+        [(year.yearNumber, week.weekNumber) for week in weeks], len(teamIds)
+    )
+    includeMatchupTypes = set(yearFilters.includeMatchupTypes)
+    lastWeekNumbers = WeekTracker.getLastWeekNumbersOfMultiWeekMatchups(
+        year, yearFilters.weekNumberEnd
+    )
+    multiWeekMatchups: dict[str, list[Matchup]] = dict()
+
+    for row, week in enumerate(weeks):
+        matchups = [
+            matchup
+            for matchup in week.matchups
+            if matchup.matchupType in includeMatchupTypes
+            and (
+                yearFilters.includeMultiWeekMatchups
+                or matchup.multiWeekMatchupId is None
+            )
+        ]
+        if not matchups:
+            continue
+        indexes = numpy.array(
+            [teamIdToIndex[matchup.teamAId] for matchup in matchups]
+            + [teamIdToIndex[matchup.teamBId] for matchup in matchups]
+        )
+        scores = numpy.array(
+            [matchup.teamAScore for matchup in matchups]
+            + [matchup.teamBScore for matchup in matchups],
+            dtype=float,
+        )
+        weeklyTotals.points[row, indexes] = scores
+        weeklyTotals.scores[row, indexes] = 1
+
+        # AWAL, against every other score in the Week
+        sortedScores = numpy.sort(scores)
+        outscored = numpy.searchsorted(sortedScores, scores, side="left")
+        tied = numpy.searchsorted(sortedScores, scores, side="right") - outscored - 1
+        weeklyTotals.awal[row, indexes] = (outscored + tied * 0.5) / (len(scores) - 1)
+
+        # league median games
+        if year.yearSettings.leagueMedianGames and week.isRegularSeasonWeek:
+            leagueMedianScore = numpy.median(scores)
+            leagueMedianWins = (scores > leagueMedianScore) + 0.5 * (
+                scores == leagueMedianScore
+            )
+            weeklyTotals.wal[row, indexes] += leagueMedianWins
+            weeklyTotals.awal[row, indexes] += leagueMedianWins
+            weeklyTotals.games[row, indexes] += 1
+
+        # games
+        for matchup in matchups:
+            mwmid = matchup.multiWeekMatchupId
+            if mwmid is None:
+                __addGame(
+                    weeklyTotals.wal, weeklyTotals.games, row, matchup, teamIdToIndex
+                )
+                __addSmartWins(weeklyTotals, row, matchup, teamIdToIndex, allScores)
+                continue
+            # a multi-week matchup is a game once its last Week is reached,
+            # until then each Week swaps the game so far for the one with this Week added
+            matchupsSoFar = multiWeekMatchups.setdefault(mwmid, list())
+            if matchupsSoFar:
+                gameSoFar = MatchupNavigator.simplifyMultiWeekMatchups(matchupsSoFar)
+                __addGame(
+                    weeklyTotals.partialWal,
+                    weeklyTotals.partialGames,
+                    row,
+                    gameSoFar,
+                    teamIdToIndex,
+                    sign=-1,
+                )
+                __addSmartWins(
+                    weeklyTotals, row, gameSoFar, teamIdToIndex, allScores, sign=-1
+                )
+            matchupsSoFar.append(matchup)
+            game = MatchupNavigator.simplifyMultiWeekMatchups(matchupsSoFar)
+            if lastWeekNumbers[mwmid] == week.weekNumber:
+                __addGame(
+                    weeklyTotals.wal, weeklyTotals.games, row, game, teamIdToIndex
+                )
+            else:
+                __addGame(
+                    weeklyTotals.partialWal,
+                    weeklyTotals.partialGames,
+                    row,
+                    game,
+                    teamIdToIndex,
+                )
+            __addSmartWins(weeklyTotals, row, game, teamIdToIndex, allScores)
+    return weeklyTotals
+
+
+def __addGame(
+    wal: numpy.ndarray,
+    games: numpy.ndarray,
+    row: int,
+    matchup: Matchup,
+    teamIdToIndex: dict[str, int],
+    sign: int = 1,
+) -> None:
+    """
+    Adds the given Matchup to the given WAL and games arrays, or takes it away with sign=-1.
+    """
+    winnerTeamId = MatchupNavigator.getTeamIdOfMatchupWinner(matchup)
+    for teamId in (matchup.teamAId, matchup.teamBId):
+        i = teamIdToIndex[teamId]
+        games[row, i] += sign
+        if winnerTeamId is None:
+            wal[row, i] += 0.5 * sign
+        elif winnerTeamId == teamId:
+            wal[row, i] += sign
+
+
+def __addSmartWins(
+    weeklyTotals: _WeeklyTotals,
+    row: int,
+    matchup: Matchup,
+    teamIdToIndex: dict[str, int],
+    allScores: numpy.ndarray,
+    sign: int = 1,
+) -> None:
+    """
+    Adds the Smart Wins of the given Matchup, against every other score, or takes them away with sign=-1.
+    """
+    for teamId, score in (
+        (matchup.teamAId, matchup.teamAScore),
+        (matchup.teamBId, matchup.teamBScore),
+    ):
+        i = teamIdToIndex[teamId]
+        scoresBeat = numpy.searchsorted(allScores, score, side="left")
+        scoresTied = numpy.searchsorted(allScores, score, side="right") - scoresBeat - 1
+        weeklyTotals.smartWins[row, i] += (
+            sign * (scoresBeat + scoresTied * 0.5) / (len(allScores) - 1)
+        )
+        weeklyTotals.smartWinsGames[row, i] += sign
+
+
+def _getTimeSeries(
+    weeklyTotals: _WeeklyTotals,
+    ids: list[str],
+    stats: Optional[list[TimeSeriesStat]],
+    window: int,
+) -> TimeSeries:
+    stats = list(TimeSeriesStat) if stats is None else stats
+
+    def runningSum(array: numpy.ndarray) -> numpy.ndarray:
+        # with a row of zeros first, so row i is the sum of the first i Weeks
+        return numpy.concatenate(
+            [numpy.zeros((1, array.shape[1])), numpy.cumsum(array, axis=0)]
+        )
+
+    def divide(numerator: numpy.ndarray, denominator: numpy.ndarray) -> numpy.ndarray:
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            return numpy.where(denominator > 0, numerator / denominator, numpy.nan)
+
+    def cumulative(array: numpy.ndarray, games: numpy.ndarray) -> numpy.ndarray:
+        return numpy.where(runningSum(games)[1:] > 0, runningSum(array)[1:], numpy.nan)
+
+    # row i of a rolling window is the running sum at i + 1 minus the running sum at i + 1 - window
+    ends = numpy.arange(1, len(weeklyTotals.weeks) + 1)
+    starts = numpy.maximum(ends - window, 0)
+
+    def rolling(array: numpy.ndarray) -> numpy.ndarray:
+        sums = runningSum(array)
+        return sums[ends] - sums[starts]
+
+    values = dict()
+    for stat in stats:
+        if stat == TimeSeriesStat.MOVING_AVERAGE_POINTS:
+            values[stat] = divide(
+                rolling(weeklyTotals.points), rolling(weeklyTotals.scores)
+            )
+        elif stat == TimeSeriesStat.ROLLING_WIN_PERCENTAGE:
+            values[stat] = divide(
+                rolling(weeklyTotals.wal), rolling(weeklyTotals.games)
+            )
+        elif stat == TimeSeriesStat.CUMULATIVE_POINTS:
+            values[stat] = cumulative(weeklyTotals.points, weeklyTotals.scores)
+        elif stat == TimeSeriesStat.CUMULATIVE_WAL:
+            values[stat] = cumulative(
+                weeklyTotals.wal + weeklyTotals.partialWal,
+                weeklyTotals.games + weeklyTotals.partialGames,
+            )
+        elif stat == TimeSeriesStat.CUMULATIVE_AWAL:
+            values[stat] = cumulative(weeklyTotals.awal, weeklyTotals.scores)
+        elif stat == TimeSeriesStat.CUMULATIVE_SMART_WINS:
+            values[stat] = cumulative(
+                weeklyTotals.smartWins, weeklyTotals.smartWinsGames
+            )
+        else:
+            raise ValueError(f"'{stat}' is not a TimeSeriesStat.")
+    return TimeSeries(weeks=weeklyTotals.weeks, ids=ids, window=window, values=values)
@@ -0,0 +1,250 @@
+import copy
+from typing import Any, Optional
+
+from leeger.calculator.parent.AllTimeCalculator import AllTimeCalculator
+from leeger.decorator.validators import validateYear
+from leeger.model.filter import AllTimeFilters, YearFilters
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.navigator.MatchupNavigator import MatchupNavigator
+
+"""
+Week Tracker
+
+    - Base for trackers (e.g. RecordsTracker, EloTracker) that are given Weeks one at a time in chronological order and keep their results up to date.
+    - Subclasses get each Matchup that passes the filters, each game once it is complete and the start of each Year.
+    - A multi-week matchup is simplified into a single game, which is complete once its last Week (in the Year, when added) is added.
+      If another Week of it is added later (e.g. the Weeks of a championship are added as they are played), the game is replaced:
+      the tracker goes back to how it was before the first Week the game was counted in and adds those Weeks again.
+      So adding Weeks one at a time gives the same results as adding them all at once.
+
+"""
+
+
+class WeekTracker:
+    """
+    Adds Weeks in chronological order, calling the hooks subclasses override for each Year, Week, Matchup and game.
+    """
+
+    def __init__(self):
+        self.__lastYearNumberAndWeekNumber: Optional[tuple[int, int]] = None
+        # multi-week matchup ID -> the Matchups of it added so far
+        self.__multiWeekMatchups: dict[str, list[Matchup]] = dict()
+        # (state before the Weeks, the Weeks with their filters, IDs of the multi-week matchups counted in them) while a multi-week matchup counted in the last Week added could still go on
+        self.__provisionalWeeks: Optional[
+            tuple[Any, list[tuple[Week, YearFilters]], set[str]]
+        ] = None
+
+    @validateYear
+    def addYear(self, year: Year, **kwargs) -> None:
+        """
+        Adds every Week in the given Year that passes the given filters (the same kwargs the Year calculators take).
+        """
+        self._addYear(year, YearFilters.getForYear(year, **kwargs))
+
+    @validateYear
+    def addWeek(self, year: Year, weekNumber: int, **kwargs) -> None:
+        """
+        Adds the Week with the given week number in the given Year.
+        Filters for which Matchups to include (e.g. onlyRegularSeason) can be given, the Week must be between weekNumberStart and weekNumberEnd if they are given.
+        """
+        if not 1 <= weekNumber <= len(year.weeks):
+            raise ValueError(f"Year {year.yearNumber} has no Week {weekNumber}.")
+        yearFilters = YearFilters.getForYear(year, **kwargs)
+        if not yearFilters.weekNumberStart <= weekNumber <= yearFilters.weekNumberEnd:
+            raise ValueError(
+                f"Week {weekNumber} is not between 'weekNumberStart' ({yearFilters.weekNumberStart}) and 'weekNumberEnd' ({yearFilters.weekNumberEnd})."
+            )
+        self.__addWeek(
+            year,
+            year.weeks[weekNumber - 1],
+            yearFilters,
+            # the same as adding every Week up to weekNumberEnd with addYear()
+            self.getLastWeekNumbersOfMultiWeekMatchups(year, yearFilters.weekNumberEnd),
+        )
+
+    @staticmethod
+    def getLastWeekNumbersOfMultiWeekMatchups(
+        year: Year, weekNumberEnd: int
+    ) -> dict[str, int]:
+        """
+        Returns the last week number of each multi-week matchup in the given Year, up to the given week number.
+        """
+        lastWeekNumbers = dict()
+        for week in year.weeks[:weekNumberEnd]:
+            for matchup in week.matchups:
+                if matchup.multiWeekMatchupId is not None:
+                    lastWeekNumbers[matchup.multiWeekMatchupId] = week.weekNumber
+        return lastWeekNumbers
+
+    def _addLeague(self, league: League, **kwargs) -> None:
+        """
+        Adds every Week in the given League that passes the given filters (the same kwargs the All-Time calculators take).
+        """
+        allTimeFilters = AllTimeFilters.getForLeague(league, **kwargs)
+        yearNumberToYearFilters = AllTimeCalculator._allTimeFiltersToYearFilters(
+            league, allTimeFilters
+        )
+        for year in league.years:
+            yearFilters = yearNumberToYearFilters.get(str(year.yearNumber))
+            if yearFilters is not None:
+                self._addYear(year, yearFilters)
+
+    def _addYear(self, year: Year, yearFilters: YearFilters) -> None:
+        lastWeekNumbers = self.getLastWeekNumbersOfMultiWeekMatchups(
+            year, yearFilters.weekNumberEnd
+        )
+        for week in year.weeks[
+            yearFilters.weekNumberStart - 1 : yearFilters.weekNumberEnd
+        ]:
+            self.__addWeek(year, week, yearFilters, lastWeekNumbers)
+
+    def _startYear(self, year: Year) -> None:
+        """
+        Called before the first Week of each Year is added.
+        """
+        ...
+
+    def _addMatchup(
+        self, year: Year, week: Week, matchup: Matchup, teamIdToOwnerId: dict[str, str]
+    ) -> None:
+        """
+        Called for each Matchup that passes the filters, including each Week of a multi-week matchup.
+        """
+        ...
+
+    def _addGame(
+        self, year: Year, week: Week, matchup: Matchup, teamIdToOwnerId: dict[str, str]
+    ) -> None:
+        """
+        Called for each complete game, a multi-week matchup is given simplified into one Matchup in its last Week.
+        """
+        ...
+
+    def _endWeek(self, year: Year, week: Week) -> None:
+        """
+        Called after every Matchup in a Week has been added.
+        """
+        ...
+
+    def _getState(self) -> Any:
+        """
+        Returns a copy of everything the subclass keeps, used to go back to before a multi-week matchup that turns out to go on was counted.
+        Subclasses that keep models or other shared objects should override this and _setState().
+        """
+        return copy.deepcopy(
+            {
+                name: value
+                for name, value in vars(self).items()
+                if not name.startswith("_WeekTracker__")
+            }
+        )
+
+    def _setState(self, state: Any) -> None:
+        """
+        Goes back to the given state from _getState(), which can be set more than once.
+        """
+        vars(self).update(copy.deepcopy(state))
+
+    def __addWeek(
+        self,
+        year: Year,
+        week: Week,
+        yearFilters: YearFilters,
+        lastWeekNumbers: dict[str, int],
+    ) -> None:
+        yearNumberAndWeekNumber = (year.yearNumber, week.weekNumber)
+        if (
+            self.__lastYearNumberAndWeekNumber is not None
+            and yearNumberAndWeekNumber <= self.__lastYearNumberAndWeekNumber
+        ):
+            raise ValueError(
+                f"Week {week.weekNumber} of Year {year.yearNumber} can't be added after Week {self.__lastYearNumberAndWeekNumber[1]} of Year {self.__lastYearNumberAndWeekNumber[0]}, Weeks must be added in chronological order."
+            )
+        if (
+            self.__lastYearNumberAndWeekNumber is None
+            or year.yearNumber != self.__lastYearNumberAndWeekNumber[0]
+        ):
+            # multi-week matchups are never split across Years
+            self.__multiWeekMatchups.clear()
+            self.__provisionalWeeks = None
+            self._startYear(year)
+        self.__lastYearNumberAndWeekNumber = yearNumberAndWeekNumber
+
+        weeks = [(week, yearFilters)]
+        snapshot = None
+        if self.__provisionalWeeks is not None:
+            snapshot, provisionalWeeks, multiWeekMatchupIds = self.__provisionalWeeks
+            self.__provisionalWeeks = None
+            if any(
+                matchup.multiWeekMatchupId in multiWeekMatchupIds
+                for matchup in week.matchups
+            ):
+                # a multi-week matchup goes on into this Week, so it wasn't complete when it was counted
+                state, multiWeekMatchups = snapshot
+                self._setState(state)
+                self.__multiWeekMatchups = {
+                    mwmid: list(matchups)
+                    for mwmid, matchups in multiWeekMatchups.items()
+                }
+                weeks = provisionalWeeks + weeks
+            else:
+                snapshot = None
+        # multi-week matchups that are counted as complete in this Week, but could go on into the next Week added
+        # (not the ones the next Week in the Year already shows are over)
+        nextWeekMultiWeekMatchupIds = None
+        if week.weekNumber < len(year.weeks):
+            nextWeekMultiWeekMatchupIds = {
+                matchup.multiWeekMatchupId
+                for matchup in year.weeks[week.weekNumber].matchups
+            }
+        multiWeekMatchupIds = {
+            matchup.multiWeekMatchupId
+            for matchup in week.matchups
+            if matchup.multiWeekMatchupId is not None
+            and lastWeekNumbers.get(matchup.multiWeekMatchupId) == week.weekNumber
+            and (
+                nextWeekMultiWeekMatchupIds is None
+                or matchup.multiWeekMatchupId in nextWeekMultiWeekMatchupIds
+            )
+        }
+        if multiWeekMatchupIds:
+            if snapshot is None:
+                snapshot = (
+                    self._getState(),
+                    {
+                        mwmid: list(matchups)
+                        for mwmid, matchups in self.__multiWeekMatchups.items()
+                    },
+                )
+            self.__provisionalWeeks = (snapshot, weeks, multiWeekMatchupIds)
+
+        for weekToAdd, weekYearFilters in weeks:
+            self.__addMatchups(year, weekToAdd, weekYearFilters, lastWeekNumbers)
+
+    def __addMatchups(
+        self,
+        year: Year,
+        week: Week,
+        yearFilters: YearFilters,
+        lastWeekNumbers: dict[str, int],
+    ) -> None:
+        teamIdToOwnerId = {team.id: team.ownerId for team in year.teams}
+        for matchup in week.matchups:
+            if matchup.matchupType not in yearFilters.includeMatchupTypes:
+                continue
+            mwmid = matchup.multiWeekMatchupId
+            if mwmid is not None and not yearFilters.includeMultiWeekMatchups:
+                continue
+            self._addMatchup(year, week, matchup, teamIdToOwnerId)
+            if mwmid is not None:
+                self.__multiWeekMatchups.setdefault(mwmid, list()).append(matchup)
+                if lastWeekNumbers.get(mwmid) != week.weekNumber:
+                    continue
+                matchup = MatchupNavigator.simplifyMultiWeekMatchups(
+                    self.__multiWeekMatchups.pop(mwmid)
+                )
+            self._addGame(year, week, matchup, teamIdToOwnerId)
+        self._endWeek(year, week)
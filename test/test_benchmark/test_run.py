@@ -0,0 +1,99 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from benchmark.run import compareToBaseline, getScalingExponent, main
+from leeger.util.CustomLogger import CustomLogger
+
+
+class TestRun(unittest.TestCase):
+    @staticmethod
+    def __getRun(secondsPerCall: dict, sizes: dict = None) -> dict:
+        return {
+            "sizes": sizes if sizes is not None else {"small": {"numberOfYears": 1}},
+            "results": {
+                name: {"secondsPerCall": {"small": seconds}}
+                for name, seconds in secondsPerCall.items()
+            },
+        }
+
+    def test_compareToBaseline(self):
+        baseline = self.__getRun({"a": 0.01, "b": 0.01, "c": 0.01, "d": 0.0001})
+        run = self.__getRun(
+            {
+                # slower by more than the tolerance
+                "a": 0.02,
+                # slower, but within the tolerance
+                "b": 0.012,
+                # faster
+                "c": 0.005,
+                # much slower, but by less than the noise floor
+                "d": 0.0004,
+                # not in the baseline
+                "e": 1.0,
+            }
+        )
+
+        regressions = compareToBaseline(run, baseline, tolerance=0.25)
+
+        self.assertEqual(["a [small]: 10.00ms -> 20.00ms (2.00x)"], regressions)
+        self.assertEqual(
+            [
+                "a [small]: 10.00ms -> 20.00ms (2.00x)",
+                "b [small]: 10.00ms -> 12.00ms (1.20x)",
+            ],
+            compareToBaseline(run, baseline, tolerance=0.1),
+        )
+
+    def test_compareToBaseline_sizeGeneratedDifferently_isNotCompared(self):
+        baseline = self.__getRun({"a": 0.01})
+        run = self.__getRun({"a": 0.02}, sizes={"small": {"numberOfYears": 2}})
+
+        self.assertEqual(list(), compareToBaseline(run, baseline))
+
+    def test_getScalingExponent(self):
+        self.assertAlmostEqual(1, getScalingExponent([10, 20, 40], [1, 2, 4]))
+        self.assertAlmostEqual(2, getScalingExponent([10, 20, 40], [1, 4, 16]))
+        self.assertIsNone(getScalingExponent([10], [1]))
+
+    def test_main_saveBaselineThenCompare(self):
+        # main() turns logging off
+        self.addCleanup(CustomLogger.setEnabled, CustomLogger.isEnabled())
+        baselinePath = os.path.join(tempfile.mkdtemp(), "baseline.json")
+        args = [
+            "--filter",
+            "yearStatSheet",
+            "--sizes",
+            "small",
+            "--min-time",
+            "0",
+            "--max-calls",
+            "1",
+            "--baseline",
+            baselinePath,
+        ]
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            # no baseline yet
+            self.assertEqual(0, main(args))
+            self.assertIn("Run with --save-baseline to make one.", output.getvalue())
+            self.assertEqual(0, main(args + ["--save-baseline"]))
+        with open(baselinePath) as f:
+            baseline = json.load(f)
+        self.assertEqual(["yearStatSheet"], list(baseline["results"]))
+        self.assertEqual(
+            {"small": {"numberOfYears": 1, "numberOfTeams": 4}}, baseline["sizes"]
+        )
+
+        # a baseline much slower than this run has no regressions, a much faster one does
+        for secondsPerCall, expectedExitCode in ((1_000.0, 0), (0.000001, 1)):
+            baseline["results"]["yearStatSheet"]["secondsPerCall"]["small"] = (
+                secondsPerCall
+            )
+            with open(baselinePath, "w") as f:
+                json.dump(baseline, f)
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(expectedExitCode, main(args))
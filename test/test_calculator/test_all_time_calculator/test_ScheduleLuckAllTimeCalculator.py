@@ -0,0 +1,83 @@
+import unittest
+
+from leeger.calculator.all_time_calculator.ScheduleLuckAllTimeCalculator import (
+    ScheduleLuckAllTimeCalculator,
+)
+from leeger.calculator.year_calculator.ScheduleLuckYearCalculator import (
+    ScheduleLuckYearCalculator,
+)
+from leeger.model.league.League import League
+from leeger.util.Deci import Deci
+from leeger.util.league_generator import generateLeague
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+from test.test_calculator.test_year_calculator import (
+    test_ScheduleLuckYearCalculator,
+)
+
+
+class TestScheduleLuckAllTimeCalculator(unittest.TestCase):
+    @staticmethod
+    def getLeague() -> League:
+        owners, teamsA = getNDefaultOwnersAndTeams(4)
+        teamsB = getTeamsFromOwners(owners)
+        yearA = test_ScheduleLuckYearCalculator.TestScheduleLuckYearCalculator.getYear(
+            teamsA
+        )
+        yearB = test_ScheduleLuckYearCalculator.TestScheduleLuckYearCalculator.getYear(
+            teamsB
+        )
+        yearB.yearNumber = 2001
+        return League(name="TEST", owners=owners, years=[yearA, yearB])
+
+    def test_getScheduleLuck_happyPath(self):
+        league = self.getLeague()
+        owners = league.owners
+
+        response = ScheduleLuckAllTimeCalculator.getScheduleLuck(
+            league, onlyRegularSeason=True
+        )
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(4, len(response.keys()))
+        yearLuck = Deci(1) - Deci(4) / Deci(3)
+        self.assertEqual(yearLuck + yearLuck, response[owners[0].id])
+        self.assertEqual(yearLuck + yearLuck, response[owners[1].id])
+        self.assertEqual(Deci(0), response[owners[3].id])
+
+    def test_getScheduleLuck_matchesSumOfYears(self):
+        league = generateLeague(numberOfYears=3, numberOfTeams=6)
+
+        response = ScheduleLuckAllTimeCalculator.getScheduleLuck(league)
+
+        for owner in league.owners:
+            expected = sum(
+                ScheduleLuckYearCalculator.getScheduleLuck(year)[
+                    next(team.id for team in year.teams if team.ownerId == owner.id)
+                ]
+                for year in league.years
+            )
+            self.assertEqual(expected, response[owner.id])
+
+    def test_getScheduleLuckPercentile_happyPath(self):
+        league = self.getLeague()
+        owners = league.owners
+
+        response = ScheduleLuckAllTimeCalculator.getScheduleLuckPercentile(
+            league, onlyRegularSeason=True
+        )
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(4, len(response.keys()))
+        self.assertEqual(Deci("0.5"), response[owners[3].id])
+
+    def test_getScheduleLuckPercentile_seedIsUsedForEachYear(self):
+        league = generateLeague(numberOfYears=2, numberOfTeams=10)
+
+        responseA = ScheduleLuckAllTimeCalculator.getScheduleLuckPercentile(
+            league, numberOfSchedules=200, seed=3
+        )
+        responseB = ScheduleLuckAllTimeCalculator.getScheduleLuckPercentile(
+            league, numberOfSchedules=200, seed=3
+        )
+
+        self.assertEqual(responseA, responseB)
@@ -0,0 +1,192 @@
+import unittest
+
+from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
+    GameOutcomeYearCalculator,
+)
+from leeger.calculator.year_calculator.ScheduleLuckYearCalculator import (
+    ScheduleLuckYearCalculator,
+)
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Team import Team
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.league_generator import generateLeague
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestScheduleLuckYearCalculator(unittest.TestCase):
+    @staticmethod
+    def getYear(teams: list[Team]) -> Year:
+        """
+        Schedules: Team 1 plays Teams 2 and 3, Team 2 plays Teams 1 and 4, Team 3 plays Teams 4 and 1, Team 4 plays Teams 3 and 2.
+        Team 4 has the lowest score each Week.
+        """
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=100,
+                    teamBScore=90,
+                ),
+                Matchup(
+                    teamAId=teams[2].id,
+                    teamBId=teams[3].id,
+                    teamAScore=80,
+                    teamBScore=70,
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=60,
+                    teamBScore=95,
+                ),
+                Matchup(
+                    teamAId=teams[1].id,
+                    teamBId=teams[3].id,
+                    teamAScore=85,
+                    teamBScore=50,
+                ),
+            ],
+        )
+        week3 = Week(
+            weekNumber=3,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=100,
+                    teamBScore=95,
+                    matchupType=MatchupType.PLAYOFF,
+                ),
+            ],
+        )
+        return Year(yearNumber=2000, teams=teams, weeks=[week1, week2, week3])
+
+    def test_getWALBySchedule_happyPath(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = self.getYear(teams)
+        t1, t2, t3, t4 = [team.id for team in teams]
+
+        response = ScheduleLuckYearCalculator.getWALBySchedule(
+            year, onlyRegularSeason=True
+        )
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(4, len(response.keys()))
+        self.assertEqual(
+            {t1: Deci(1), t2: Deci(2), t3: Deci(1), t4: Deci(1)}, response[t1]
+        )
+        self.assertEqual(
+            {t1: Deci(0), t2: Deci(1), t3: Deci(2), t4: Deci(2)}, response[t2]
+        )
+        self.assertEqual(
+            {t1: Deci(1), t2: Deci(1), t3: Deci(2), t4: Deci(2)}, response[t3]
+        )
+        self.assertEqual(
+            {t1: Deci(0), t2: Deci(0), t3: Deci(0), t4: Deci(0)}, response[t4]
+        )
+
+    def test_getWALBySchedule_noGamesPlayed(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = self.getYear(teams)
+        t1, t2, t3, t4 = [team.id for team in teams]
+
+        response = ScheduleLuckYearCalculator.getWALBySchedule(
+            year, onlyPostSeason=True
+        )
+
+        self.assertIsNone(response[t2])
+        self.assertIsNone(response[t4])
+        self.assertEqual({t1: Deci(1), t2: None, t3: Deci(1), t4: None}, response[t1])
+
+    def test_getWALBySchedule_ownScheduleIsWAL(self):
+        year = generateLeague(numberOfTeams=8).years[0]
+
+        response = ScheduleLuckYearCalculator.getWALBySchedule(
+            year, onlyRegularSeason=True
+        )
+        teamIdAndWAL = GameOutcomeYearCalculator.getWAL(year, onlyRegularSeason=True)
+
+        for teamId, wal in teamIdAndWAL.items():
+            self.assertEqual(wal, response[teamId][teamId])
+
+    def test_getScheduleLuck_happyPath(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = self.getYear(teams)
+
+        response = ScheduleLuckYearCalculator.getScheduleLuck(
+            year, onlyRegularSeason=True
+        )
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(4, len(response.keys()))
+        self.assertEqual(Deci(1) - Deci(4) / Deci(3), response[teams[0].id])
+        self.assertEqual(Deci(1) - Deci(4) / Deci(3), response[teams[1].id])
+        self.assertEqual(Deci(2) - Deci(4) / Deci(3), response[teams[2].id])
+        self.assertEqual(Deci(0), response[teams[3].id])
+
+    def test_getScheduleLuck_byeWeeksDontCountAgainstOtherSchedules(self):
+        # 5 Teams, so one Team has a bye each Week
+        year = generateLeague(numberOfTeams=5, numberOfPlayoffTeams=2).years[0]
+
+        response = ScheduleLuckYearCalculator.getScheduleLuck(
+            year, onlyRegularSeason=True
+        )
+
+        self.assertLess(abs(sum(response.values())), Deci(1))
+
+    def test_getScheduleLuckPercentile_everyScheduleIsUsed(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = self.getYear(teams)
+
+        response = ScheduleLuckYearCalculator.getScheduleLuckPercentile(
+            year, onlyRegularSeason=True
+        )
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(4, len(response.keys()))
+        # Team 4 has 0 WAL with every schedule
+        self.assertEqual(Deci("0.5"), response[teams[3].id])
+        for percentile in response.values():
+            self.assertGreaterEqual(percentile, Deci(0))
+            self.assertLessEqual(percentile, Deci(1))
+
+    def test_getScheduleLuckPercentile_randomSchedules(self):
+        year = generateLeague(numberOfTeams=10).years[0]
+
+        responseA = ScheduleLuckYearCalculator.getScheduleLuckPercentile(
+            year, numberOfSchedules=500, seed=1, onlyRegularSeason=True
+        )
+        responseB = ScheduleLuckYearCalculator.getScheduleLuckPercentile(
+            year, numberOfSchedules=500, seed=1, onlyRegularSeason=True
+        )
+        responseC = ScheduleLuckYearCalculator.getScheduleLuckPercentile(
+            year, numberOfSchedules=500, seed=2, onlyRegularSeason=True
+        )
+
+        self.assertEqual(responseA, responseB)
+        self.assertNotEqual(responseA, responseC)
+        for percentile in responseA.values():
+            # every percentile is a multiple of half a schedule
+            self.assertEqual(0, (percentile * 1000) % 1)
+
+    def test_getScheduleLuckPercentile_invalidNumberOfSchedules_raisesException(self):
+        _, teams = getNDefaultOwnersAndTeams(4)
+        year = self.getYear(teams)
+
+        with self.assertRaises(ValueError) as context:
+            ScheduleLuckYearCalculator.getScheduleLuckPercentile(
+                year, numberOfSchedules=0
+            )
+        self.assertEqual(
+            "'numberOfSchedules' must be at least 1.", str(context.exception)
+        )
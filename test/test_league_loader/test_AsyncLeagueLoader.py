@@ -0,0 +1,216 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from fleaflicker.api.LeagueInfoAPIClient import LeagueInfoAPIClient
+from fleaflicker.api.ScoringAPIClient import ScoringAPIClient
+
+from leeger.league_loader.AsyncLeagueLoader import AsyncLeagueLoader
+from leeger.league_loader.AsyncRequestPool import AsyncRequestPool
+from leeger.league_loader.FleaflickerLeagueLoader import FleaflickerLeagueLoader
+from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.league_loader.RequestScheduler import RequestScheduler
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
+
+
+class TestAsyncLeagueLoader(unittest.TestCase):
+    """
+    Uses fake Fleaflicker responses that are picked by the arguments of each request, so they don't depend on the order requests are sent in.
+    """
+
+    NUMBER_OF_WEEKS = 3
+
+    def setUp(self):
+        # don't share rate limits with other tests
+        requestSchedulerPatch = mock.patch.object(
+            LeagueLoader, "requestScheduler", RequestScheduler(dict())
+        )
+        requestSchedulerPatch.start()
+        self.addCleanup(requestSchedulerPatch.stop)
+
+    @staticmethod
+    def __getMockTeam(teamId: int) -> dict:
+        return {
+            "owners": [{"displayName": f"Owner {teamId}"}],
+            "id": teamId,
+            "name": f"Team {teamId}",
+        }
+
+    @classmethod
+    def __mockGetLeagueStandings(cls, *, sport, league_id: int, season: int) -> dict:
+        return {
+            "divisions": [
+                {
+                    "id": 1,
+                    "name": "d1",
+                    "teams": [cls.__getMockTeam(teamId) for teamId in range(1, 5)],
+                }
+            ],
+            "league": {"name": f"League {league_id} {season}", "id": league_id},
+            "season": season,
+        }
+
+    @classmethod
+    def __mockGetLeagueScoreboard(
+        cls, *, sport, league_id: int, season: int, scoring_period: int = None
+    ) -> dict:
+        if scoring_period is None:
+            return {"eligibleSchedulePeriods": [dict()] * cls.NUMBER_OF_WEEKS}
+        return {
+            "games": [
+                {
+                    "away": cls.__getMockTeam(awayTeamId),
+                    "home": cls.__getMockTeam(awayTeamId + 1),
+                    "awayScore": {"score": {"value": 100 + scoring_period}},
+                    "homeScore": {"score": {"value": 90 + awayTeamId}},
+                    "awayResult": "WIN",
+                    "homeResult": "LOSS",
+                    "isFinalScore": True,
+                }
+                for awayTeamId in (1, 3)
+            ]
+        }
+
+    def __patchFleaflicker(self, getLeagueScoreboard=None):
+        standingsPatch = mock.patch.object(
+            LeagueInfoAPIClient,
+            "get_league_standings",
+            side_effect=self.__mockGetLeagueStandings,
+        )
+        scoreboardPatch = mock.patch.object(
+            ScoringAPIClient,
+            "get_league_scoreboard",
+            side_effect=getLeagueScoreboard or self.__mockGetLeagueScoreboard,
+        )
+        standingsPatch.start()
+        scoreboardPatch.start()
+        self.addCleanup(standingsPatch.stop)
+        self.addCleanup(scoreboardPatch.stop)
+
+    def test_loadLeagueAsync_sameAsLoadLeague(self):
+        self.__patchFleaflicker()
+
+        league = FleaflickerLeagueLoader("123", [2022, 2023]).loadLeague()
+        asyncLeague = asyncio.run(
+            FleaflickerLeagueLoader("123", [2022, 2023]).loadLeagueAsync()
+        )
+
+        self.assertTrue(league.equals(asyncLeague, ignoreBaseIds=True, ignoreIds=True))
+        self.assertEqual("League 123 2023", asyncLeague.name)
+        self.assertEqual([2022, 2023], [year.yearNumber for year in asyncLeague.years])
+        self.assertEqual(
+            [1, 2, 3], [week.weekNumber for week in asyncLeague.years[0].weeks]
+        )
+
+    def test_loadLeaguesAsync_limitsConcurrentRequests(self):
+        lock = threading.Lock()
+        inFlight = [0]
+        maxInFlight = [0]
+
+        def slowGetLeagueScoreboard(**kwargs) -> dict:
+            with lock:
+                inFlight[0] += 1
+                maxInFlight[0] = max(maxInFlight[0], inFlight[0])
+            time.sleep(0.01)
+            with lock:
+                inFlight[0] -= 1
+            return self.__mockGetLeagueScoreboard(**kwargs)
+
+        self.__patchFleaflicker(slowGetLeagueScoreboard)
+
+        leagueLoaders = [
+            FleaflickerLeagueLoader("123", [2021, 2022, 2023]),
+            FleaflickerLeagueLoader("456", [2022, 2023]),
+        ]
+        leagues = asyncio.run(
+            AsyncLeagueLoader.loadLeaguesAsync(leagueLoaders, maxConcurrentRequests=3)
+        )
+
+        self.assertEqual(
+            ["League 123 2023", "League 456 2023"], [league.name for league in leagues]
+        )
+        self.assertEqual(3, len(leagues[0].years))
+        # requests for different Years and Leagues were sent at the same time, but never more than allowed
+        self.assertGreater(maxInFlight[0], 1)
+        self.assertLessEqual(maxInFlight[0], 3)
+
+    def test_loadLeagueAsync_sharedRequestPool(self):
+        self.__patchFleaflicker()
+
+        async def loadLeagues():
+            with AsyncRequestPool(2) as requestPool:
+                return await asyncio.gather(
+                    FleaflickerLeagueLoader("123", [2022]).loadLeagueAsync(
+                        requestPool=requestPool
+                    ),
+                    FleaflickerLeagueLoader("456", [2022]).loadLeagueAsync(
+                        requestPool=requestPool
+                    ),
+                )
+
+        leagues = asyncio.run(loadLeagues())
+
+        self.assertEqual(
+            ["League 123 2022", "League 456 2022"], [league.name for league in leagues]
+        )
+
+    def test_loadLeagueAsync_requestFails_raisesException(self):
+        def failingGetLeagueScoreboard(**kwargs) -> dict:
+            if kwargs.get("scoring_period") == 2:
+                raise ValueError("request failed")
+            return self.__mockGetLeagueScoreboard(**kwargs)
+
+        self.__patchFleaflicker(failingGetLeagueScoreboard)
+
+        with self.assertRaises(ValueError) as context:
+            asyncio.run(FleaflickerLeagueLoader("123", [2022, 2023]).loadLeagueAsync())
+        self.assertEqual("request failed", str(context.exception))
+
+    def test_sendRequests_nestedGenerators(self):
+        sentRequests = list()
+
+        def send(name: str) -> str:
+            sentRequests.append(name)
+            return name.upper()
+
+        def iterInnerRequests(prefix: str):
+            (first,) = yield [
+                PlatformRequest(function=send, kwargs=dict(name=f"{prefix}1"))
+            ]
+            responses = yield [
+                PlatformRequest(function=send, kwargs=dict(name=f"{first}-{i}"))
+                for i in range(2)
+            ]
+            return responses
+
+        def iterRequests():
+            (start,) = yield [PlatformRequest(function=send, kwargs=dict(name="start"))]
+            responses = yield [iterInnerRequests("a"), iterInnerRequests("b")]
+            return start, responses
+
+        expected = ("START", [["A1-0", "A1-1"], ["B1-0", "B1-1"]])
+        self.assertEqual(expected, LeagueLoader._sendRequests(iterRequests()))
+        # nested generators are run to the end one at a time when sending synchronously
+        self.assertEqual(
+            ["start", "a1", "A1-0", "A1-1", "b1", "B1-0", "B1-1"], sentRequests
+        )
+
+        sentRequests.clear()
+
+        async def sendAsync():
+            with AsyncRequestPool(4) as requestPool:
+                return await LeagueLoader._sendRequestsAsync(
+                    iterRequests(), requestPool
+                )
+
+        self.assertEqual(expected, asyncio.run(sendAsync()))
+        self.assertEqual(7, len(sentRequests))
+
+    def test_asyncRequestPool_maxConcurrentRequestsLessThanOne_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            AsyncRequestPool(0)
+        self.assertEqual(
+            "'maxConcurrentRequests' must be at least 1.", str(context.exception)
+        )
@@ -0,0 +1,312 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from fleaflicker.api.LeagueInfoAPIClient import LeagueInfoAPIClient
+from fleaflicker.api.ScoringAPIClient import ScoringAPIClient
+from yahoofantasy import Context as YahooContext
+from yahoofantasy import League as YahooLeague
+
+from leeger.enum.FixtureMode import FixtureMode
+from leeger.enum.Platform import Platform
+from leeger.exception.LeagueLoaderException import LeagueLoaderException
+from leeger.league_loader.FleaflickerLeagueLoader import FleaflickerLeagueLoader
+from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.league_loader.RequestFixtures import RequestFixtures, getFixtureKey
+from leeger.league_loader.RequestScheduler import RequestScheduler
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
+
+
+def getGreeting(*, name: str, platform: Platform = None) -> str:
+    return f"Hello {name}"
+
+
+class _SdkLeague:
+    def __init__(self, leagueId: str):
+        self.id = leagueId
+
+    def teams(self) -> list[str]:
+        return [f"{self.id} team"]
+
+
+class TestRequestFixtures(unittest.TestCase):
+    NUMBER_OF_WEEKS = 3
+
+    def setUp(self):
+        temporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporaryDirectory.cleanup)
+        self.fixturePath = os.path.join(temporaryDirectory.name, "fixtures")
+
+        # the same mocks are used when recording and replaying, so they are found by the same key
+        self.mockGetLeagueStandings = mock.Mock(side_effect=self.__getLeagueStandings)
+        self.mockGetLeagueScoreboard = mock.Mock(side_effect=self.__getLeagueScoreboard)
+        for cls, name, new in (
+            (LeagueInfoAPIClient, "get_league_standings", self.mockGetLeagueStandings),
+            (ScoringAPIClient, "get_league_scoreboard", self.mockGetLeagueScoreboard),
+        ):
+            patch = mock.patch.object(cls, name, new)
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    @staticmethod
+    def __getTeam(teamId: int) -> dict:
+        return {
+            "owners": [{"displayName": f"Owner {teamId}"}],
+            "id": teamId,
+            "name": f"Team {teamId}",
+        }
+
+    @classmethod
+    def __getLeagueStandings(cls, *, sport, league_id: int, season: int) -> dict:
+        return {
+            "divisions": [
+                {
+                    "id": 1,
+                    "name": "d1",
+                    "teams": [cls.__getTeam(teamId) for teamId in range(1, 5)],
+                }
+            ],
+            "league": {"name": f"League {league_id} {season}", "id": league_id},
+            "season": season,
+        }
+
+    @classmethod
+    def __getLeagueScoreboard(
+        cls, *, sport, league_id: int, season: int, scoring_period: int = None
+    ) -> dict:
+        if scoring_period is None:
+            return {"eligibleSchedulePeriods": [dict()] * cls.NUMBER_OF_WEEKS}
+        return {
+            "games": [
+                {
+                    "away": cls.__getTeam(awayTeamId),
+                    "home": cls.__getTeam(awayTeamId + 1),
+                    "awayScore": {"score": {"value": 100 + scoring_period}},
+                    "homeScore": {"score": {"value": 90 + awayTeamId}},
+                    "awayResult": "WIN",
+                    "homeResult": "LOSS",
+                    "isFinalScore": True,
+                }
+                for awayTeamId in (1, 3)
+            ]
+        }
+
+    def __useFixtures(self, mode: FixtureMode, **kwargs) -> RequestFixtures:
+        requestFixtures = RequestFixtures(self.fixturePath, mode, **kwargs)
+        requestSchedulerPatch = mock.patch.object(
+            LeagueLoader,
+            "requestScheduler",
+            RequestScheduler(dict(), fixtures=requestFixtures),
+        )
+        requestSchedulerPatch.start()
+        self.addCleanup(requestSchedulerPatch.stop)
+        return requestFixtures
+
+    def __record(self):
+        recordingFixtures = self.__useFixtures(FixtureMode.RECORD)
+        league = FleaflickerLeagueLoader("123", [2022, 2023]).loadLeague()
+        self.mockGetLeagueStandings.side_effect = AssertionError("request sent")
+        self.mockGetLeagueScoreboard.side_effect = AssertionError("request sent")
+        return recordingFixtures, league
+
+    def test_recordAndReplay_sameLeagueWithoutSendingRequests(self):
+        recordingFixtures, league = self.__record()
+
+        # 2 standings, and an overview and 3 weeks for each Year
+        self.assertEqual(10, recordingFixtures.numberOfRecordedResponses)
+        self.assertEqual(11, len(os.listdir(self.fixturePath)))
+
+        replayingFixtures = self.__useFixtures(FixtureMode.REPLAY)
+        replayedLeague = FleaflickerLeagueLoader("123", [2022, 2023]).loadLeague()
+        asyncReplayedLeague = asyncio.run(
+            FleaflickerLeagueLoader("123", [2022, 2023]).loadLeagueAsync()
+        )
+
+        self.assertEqual(10, replayingFixtures.numberOfRecordedResponses)
+        self.assertEqual(2, self.mockGetLeagueStandings.call_count)
+        self.assertEqual(8, self.mockGetLeagueScoreboard.call_count)
+        self.assertTrue(
+            league.equals(replayedLeague, ignoreBaseIds=True, ignoreIds=True)
+        )
+        self.assertTrue(
+            league.equals(asyncReplayedLeague, ignoreBaseIds=True, ignoreIds=True)
+        )
+
+    def test_replay_latencySeconds_asyncRequestsOverlap(self):
+        self.__record()
+        self.__useFixtures(FixtureMode.REPLAY, latencySeconds=0.02)
+
+        start = time.perf_counter()
+        FleaflickerLeagueLoader("123", [2022, 2023]).loadLeague()
+        syncSeconds = time.perf_counter() - start
+        start = time.perf_counter()
+        asyncio.run(FleaflickerLeagueLoader("123", [2022, 2023]).loadLeagueAsync())
+        asyncSeconds = time.perf_counter() - start
+
+        # every request waits when sent one at a time, the requests in each batch wait together when sent asynchronously
+        self.assertGreaterEqual(syncSeconds, 10 * 0.02)
+        self.assertLess(asyncSeconds, syncSeconds)
+
+    def test_replay_requestNotRecorded_raisesException(self):
+        self.__record()
+        self.__useFixtures(FixtureMode.REPLAY)
+
+        with self.assertRaises(LeagueLoaderException) as context:
+            FleaflickerLeagueLoader("456", [2022]).loadLeague()
+        self.assertIn(
+            f"No fixture recorded in '{self.fixturePath}' for request: FLEAFLICKER ",
+            str(context.exception),
+        )
+        self.assertIn("league_id=456", str(context.exception))
+
+    def test_record_fixturesAlreadyRecorded_raisesException(self):
+        self.__record()
+
+        with self.assertRaises(FileExistsError) as context:
+            RequestFixtures(self.fixturePath, FixtureMode.RECORD)
+        self.assertEqual(
+            f"Fixtures were already recorded in '{self.fixturePath}'.",
+            str(context.exception),
+        )
+
+    def test_record_responseCantBePickled_raisesException(self):
+        requestScheduler = RequestScheduler(
+            dict(), fixtures=RequestFixtures(self.fixturePath, FixtureMode.RECORD)
+        )
+
+        with self.assertRaises(LeagueLoaderException) as context:
+            requestScheduler.send(PlatformRequest(function=threading.Lock))
+        self.assertIn(
+            "Response can't be saved as a fixture for request: NONE ",
+            str(context.exception),
+        )
+
+    def test_replay_sameKeyRecordedMoreThanOnce_replayedInOrder(self):
+        responses = iter(["first", "second"])
+        request = PlatformRequest(function=lambda: next(responses))
+        requestScheduler = RequestScheduler(
+            dict(),
+            fixtures=RequestFixtures(self.fixturePath, FixtureMode.RECORD),
+            coalesceRequests=False,
+        )
+        self.assertEqual("first", requestScheduler.send(request))
+        self.assertEqual("second", requestScheduler.send(request))
+
+        requestScheduler = RequestScheduler(
+            dict(), fixtures=RequestFixtures(self.fixturePath, FixtureMode.REPLAY)
+        )
+
+        # starts over after the last response, like when loading the same League again
+        self.assertEqual(
+            ["first", "second", "first"],
+            [requestScheduler.send(request) for _ in range(3)],
+        )
+
+    def test_replay_methodsOfDifferentObjects_eachGetTheirOwnResponses(self):
+        requestScheduler = RequestScheduler(
+            dict(), fixtures=RequestFixtures(self.fixturePath, FixtureMode.RECORD)
+        )
+        for leagueId in ("1", "2"):
+            requestScheduler.send(PlatformRequest(function=_SdkLeague(leagueId).teams))
+
+        requestScheduler = RequestScheduler(
+            dict(), fixtures=RequestFixtures(self.fixturePath, FixtureMode.REPLAY)
+        )
+
+        # replayed in a different order than recorded
+        self.assertEqual(
+            ["2 team"],
+            requestScheduler.send(PlatformRequest(function=_SdkLeague("2").teams)),
+        )
+        self.assertEqual(
+            ["1 team"],
+            requestScheduler.send(PlatformRequest(function=_SdkLeague("1").teams)),
+        )
+
+    def test_replay_eachReplayReturnsANewCopy(self):
+        request = PlatformRequest(function=lambda: {"teams": [1, 2]})
+        RequestScheduler(
+            dict(), fixtures=RequestFixtures(self.fixturePath, FixtureMode.RECORD)
+        ).send(request)
+        requestScheduler = RequestScheduler(
+            dict(),
+            fixtures=RequestFixtures(self.fixturePath, FixtureMode.REPLAY),
+            coalesceRequests=False,
+        )
+
+        response = requestScheduler.send(request)
+        response["teams"].append(3)
+
+        self.assertEqual({"teams": [1, 2]}, requestScheduler.send(request))
+
+    def test_record_credentialsAreNotSaved(self):
+        yahooContext = YahooContext(
+            client_id="clientId", client_secret="SECRET1", refresh_token="SECRET2"
+        )
+        yahooContext._access_token = "SECRET3"
+        espnRequests = EspnFantasyRequests(
+            sport="nfl",
+            year=2022,
+            league_id=123,
+            cookies={"espn_s2": "SECRET4", "SWID": "SECRET5"},
+        )
+        request = PlatformRequest(
+            function=lambda **kwargs: [
+                YahooLeague(yahooContext, "423.l.1"),
+                espnRequests,
+            ],
+            kwargs=dict(espn_s2="SECRET6", swid="SECRET7"),
+        )
+        RequestScheduler(
+            dict(), fixtures=RequestFixtures(self.fixturePath, FixtureMode.RECORD)
+        ).send(request)
+
+        for fileName in os.listdir(self.fixturePath):
+            with open(os.path.join(self.fixturePath, fileName), "rb") as file:
+                self.assertNotIn(b"SECRET", file.read(), fileName)
+
+        yahooLeague, replayedEspnRequests = RequestScheduler(
+            dict(), fixtures=RequestFixtures(self.fixturePath, FixtureMode.REPLAY)
+        ).send(request)
+        # everything else is still there
+        self.assertEqual("423.l.1", yahooLeague.id)
+        self.assertEqual("clientId", yahooLeague.ctx._client_id)
+        self.assertIsNone(yahooLeague.ctx._client_secret)
+        self.assertIsNone(yahooLeague.ctx._refresh_token)
+        self.assertIsNone(yahooLeague.ctx._access_token)
+        self.assertEqual(123, replayedEspnRequests.league_id)
+        self.assertIsNone(replayedEspnRequests.cookies)
+        # the credentials given to the live request are left out of the replayed response only
+        self.assertEqual("SECRET1", yahooContext._client_secret)
+
+    def test_getFixtureKey(self):
+        request = PlatformRequest(
+            function=getGreeting,
+            kwargs=dict(platform=Platform.SLEEPER, name="Bob", extra=[1, object()]),
+        )
+
+        self.assertEqual(
+            f"SLEEPER {__name__}.getGreeting(extra=[1, <object>], name='Bob', platform=Platform.SLEEPER)",
+            getFixtureKey(request, Platform.SLEEPER),
+        )
+
+    def test_getFixtureKey_objectsWithIds(self):
+        request = PlatformRequest(
+            function=_SdkLeague("423.l.1").teams,
+            kwargs=dict(league=_SdkLeague(5)),
+        )
+
+        self.assertEqual(
+            f"NONE {__name__}._SdkLeague.teams(self=<_SdkLeague id='423.l.1'>, league=<_SdkLeague id=5>)",
+            getFixtureKey(request),
+        )
+
+    def test_latencySecondsLessThanZero_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            RequestFixtures(self.fixturePath, FixtureMode.REPLAY, latencySeconds=-1)
+        self.assertEqual("'latencySeconds' must be at least 0.", str(context.exception))
@@ -0,0 +1,351 @@
+import asyncio
+import random
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest import mock
+
+from fleaflicker.api.LeagueInfoAPIClient import LeagueInfoAPIClient
+from fleaflicker.api.ScoringAPIClient import ScoringAPIClient
+
+from leeger.enum.Platform import Platform
+from leeger.league_loader.AsyncLeagueLoader import AsyncLeagueLoader
+from leeger.league_loader.AsyncRequestPool import AsyncRequestPool
+from leeger.league_loader.FleaflickerLeagueLoader import FleaflickerLeagueLoader
+from leeger.league_loader.LeagueLoader import LeagueLoader
+from leeger.league_loader.RequestScheduler import RequestScheduler, isTransientError
+from leeger.model.league_loader.PlatformRequest import PlatformRequest
+from leeger.model.league_loader.RateLimit import RateLimit
+from leeger.model.league_loader.RetryPolicy import RetryPolicy
+
+
+class HTTPError(Exception):
+    def __init__(self, statusCode: int, headers: dict = None):
+        super().__init__(f"{statusCode} Error")
+        self.response = SimpleNamespace(
+            status_code=statusCode, headers=headers or dict()
+        )
+
+
+class Timeout(OSError): ...
+
+
+class ReadTimeout(Timeout): ...
+
+
+class TestRequestScheduler(unittest.TestCase):
+    FAST_RETRY_POLICY = RetryPolicy(baseDelaySeconds=0.001, maxDelaySeconds=0.01)
+
+    @staticmethod
+    def __getFailingFunction(errors: list[Exception], response="response"):
+        """
+        Returns a mock that raises the given errors, one per call, then returns the given response.
+        """
+        return mock.Mock(side_effect=errors + [response])
+
+    def test_send_retriesTransientErrors(self):
+        function = self.__getFailingFunction([HTTPError(503), ReadTimeout()])
+        requestScheduler = RequestScheduler(dict(), retryPolicy=self.FAST_RETRY_POLICY)
+
+        response = requestScheduler.send(
+            PlatformRequest(function=function, kwargs=dict(a=1)), Platform.SLEEPER
+        )
+
+        self.assertEqual("response", response)
+        self.assertEqual(3, function.call_count)
+        function.assert_called_with(a=1)
+        metrics = requestScheduler.getMetrics(Platform.SLEEPER)
+        self.assertEqual(3, metrics.requestsSent)
+        self.assertEqual(2, metrics.retries)
+        self.assertEqual(0, metrics.failedRequests)
+        self.assertGreaterEqual(metrics.retryWaitSeconds, 0)
+        self.assertLessEqual(metrics.retryWaitSeconds, 0.02)
+
+    def test_send_givesUpAfterMaxRetries(self):
+        function = self.__getFailingFunction([HTTPError(429)] * 3)
+        requestScheduler = RequestScheduler(
+            dict(),
+            retryPolicy=RetryPolicy(maxRetries=2, baseDelaySeconds=0.001),
+        )
+
+        with self.assertRaises(HTTPError):
+            requestScheduler.send(PlatformRequest(function=function))
+
+        self.assertEqual(3, function.call_count)
+        metrics = requestScheduler.getMetrics()
+        self.assertEqual(3, metrics.requestsSent)
+        self.assertEqual(2, metrics.retries)
+        self.assertEqual(1, metrics.failedRequests)
+
+    def test_send_doesNotRetryOtherErrors(self):
+        requestScheduler = RequestScheduler(dict(), retryPolicy=self.FAST_RETRY_POLICY)
+
+        for error in (ValueError("bad league"), HTTPError(404), TimeoutError()):
+            function = self.__getFailingFunction([error])
+            with self.assertRaises(type(error)):
+                requestScheduler.send(PlatformRequest(function=function))
+            self.assertEqual(1, function.call_count)
+        self.assertEqual(3, requestScheduler.getMetrics().failedRequests)
+        self.assertEqual(0, requestScheduler.getMetrics().retries)
+
+    def test_send_waitsForRetryAfter(self):
+        function = self.__getFailingFunction(
+            [HTTPError(429, headers={"Retry-After": "0.05"})]
+        )
+        requestScheduler = RequestScheduler(
+            dict(), retryPolicy=RetryPolicy(baseDelaySeconds=0)
+        )
+
+        start = time.perf_counter()
+        requestScheduler.send(PlatformRequest(function=function))
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+        self.assertEqual(0.05, requestScheduler.getMetrics().retryWaitSeconds)
+
+    def test_isTransientError(self):
+        self.assertTrue(isTransientError(ConnectionResetError()))
+        self.assertTrue(isTransientError(ReadTimeout()))
+        self.assertTrue(isTransientError(HTTPError(502)))
+        self.assertTrue(isTransientError(Exception("ESPN returned an HTTP 503")))
+        self.assertFalse(isTransientError(HTTPError(401)))
+        self.assertFalse(isTransientError(Exception("ESPN returned an HTTP 4000")))
+        self.assertFalse(isTransientError(ValueError("Could not get League.")))
+        # raised when logging in to Yahoo takes too long, sending it again won't help
+        self.assertFalse(isTransientError(TimeoutError()))
+
+    def test_send_rateLimitedPerPlatform(self):
+        function = mock.Mock(return_value="response")
+        requestScheduler = RequestScheduler(
+            {Platform.ESPN: RateLimit(requestsPerSecond=50, burst=2)}
+        )
+
+        start = time.perf_counter()
+        for i in range(6):
+            requestScheduler.send(
+                PlatformRequest(function=function, kwargs=dict(i=i)), Platform.ESPN
+            )
+        elapsed = time.perf_counter() - start
+        for i in range(6):
+            requestScheduler.send(
+                PlatformRequest(function=function, kwargs=dict(i=i)), Platform.SLEEPER
+            )
+
+        # 2 requests are sent right away, then 1 every 0.02 seconds
+        self.assertGreaterEqual(elapsed, 0.07)
+        espnMetrics = requestScheduler.getMetrics(Platform.ESPN)
+        self.assertEqual(6, espnMetrics.requestsSent)
+        self.assertGreater(espnMetrics.rateLimitWaitSeconds, 0.07)
+        self.assertEqual(
+            0, requestScheduler.getMetrics(Platform.SLEEPER).rateLimitWaitSeconds
+        )
+        self.assertEqual(12, requestScheduler.getMetrics().requestsSent)
+
+        requestScheduler.resetMetrics()
+        self.assertEqual(0, requestScheduler.getMetrics().requestsSent)
+
+    def test_send_coalescesIdenticalInFlightRequests(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slowFunction(**kwargs) -> dict:
+            started.set()
+            release.wait()
+            return kwargs
+
+        function = mock.Mock(side_effect=slowFunction)
+        requestScheduler = RequestScheduler(dict())
+
+        def send(season: int) -> dict:
+            return requestScheduler.send(
+                PlatformRequest(function=function, kwargs=dict(season=season)),
+                Platform.SLEEPER,
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            firstResponse = executor.submit(send, 2022)
+            started.wait()
+            otherResponses = [executor.submit(send, 2022) for _ in range(2)]
+            # wait for the other requests to find the first one in flight
+            while requestScheduler.getMetrics().coalescedRequests < 2:
+                time.sleep(0.001)
+            release.set()
+            responses = [firstResponse.result()] + [
+                response.result() for response in otherResponses
+            ]
+            # a different request isn't coalesced, and the same request is sent again once the first finished
+            send(2023)
+            send(2022)
+
+        self.assertEqual([{"season": 2022}] * 3, responses)
+        self.assertEqual(3, function.call_count)
+        self.assertEqual(
+            2, requestScheduler.getMetrics(Platform.SLEEPER).coalescedRequests
+        )
+
+    def test_sendAsync_coalescesIdenticalInFlightRequests(self):
+        function = mock.Mock(side_effect=lambda **kwargs: time.sleep(0.01) or kwargs)
+        failingFunction = mock.Mock(side_effect=ValueError("bad league"))
+        requestScheduler = RequestScheduler(dict())
+
+        async def sendAll():
+            with AsyncRequestPool(4) as requestPool:
+                responses = await asyncio.gather(
+                    *(
+                        requestScheduler.sendAsync(
+                            PlatformRequest(function=function, kwargs=dict(a=1)),
+                            requestPool,
+                        )
+                        for _ in range(3)
+                    )
+                )
+                errors = await asyncio.gather(
+                    *(
+                        requestScheduler.sendAsync(
+                            PlatformRequest(function=failingFunction), requestPool
+                        )
+                        for _ in range(2)
+                    ),
+                    return_exceptions=True,
+                )
+                return responses, errors
+
+        responses, errors = asyncio.run(sendAll())
+
+        self.assertEqual([{"a": 1}] * 3, responses)
+        self.assertEqual(1, function.call_count)
+        # every coalesced request gets the error
+        self.assertEqual(1, failingFunction.call_count)
+        self.assertEqual(["bad league"] * 2, [str(error) for error in errors])
+        self.assertEqual(3, requestScheduler.getMetrics().coalescedRequests)
+
+    def test_coalesceRequestsFalse(self):
+        function = mock.Mock(side_effect=lambda **kwargs: time.sleep(0.01) or kwargs)
+        requestScheduler = RequestScheduler(dict(), coalesceRequests=False)
+
+        async def sendAll():
+            with AsyncRequestPool(4) as requestPool:
+                return await asyncio.gather(
+                    *(
+                        requestScheduler.sendAsync(
+                            PlatformRequest(function=function, kwargs=dict(a=1)),
+                            requestPool,
+                        )
+                        for _ in range(3)
+                    )
+                )
+
+        asyncio.run(sendAll())
+
+        self.assertEqual(3, function.call_count)
+        self.assertEqual(0, requestScheduler.getMetrics().coalescedRequests)
+
+    def test_leagueLoader_usesSharedRequestScheduler(self):
+        def getLeagueStandings(*, sport, league_id: int, season: int) -> dict:
+            time.sleep(0.01)
+            return {
+                "divisions": [
+                    {
+                        "id": 1,
+                        "name": "d1",
+                        "teams": [
+                            {
+                                "owners": [{"displayName": f"Owner {teamId}"}],
+                                "id": teamId,
+                                "name": f"Team {teamId}",
+                            }
+                            for teamId in (1, 2)
+                        ],
+                    }
+                ],
+                "league": {"name": "League", "id": league_id},
+                "season": season,
+            }
+
+        def getLeagueScoreboard(
+            *, sport, league_id: int, season: int, scoring_period=None
+        ) -> dict:
+            if scoring_period is None:
+                return {"eligibleSchedulePeriods": [dict()]}
+            return {
+                "games": [
+                    {
+                        "away": {"id": 1},
+                        "home": {"id": 2},
+                        "awayScore": {"score": {"value": 100}},
+                        "homeScore": {"score": {"value": 90}},
+                        "awayResult": "WIN",
+                        "isFinalScore": True,
+                    }
+                ]
+            }
+
+        requestScheduler = RequestScheduler(
+            {Platform.FLEAFLICKER: RateLimit(requestsPerSecond=1000, burst=1000)},
+            retryPolicy=self.FAST_RETRY_POLICY,
+        )
+        # the first request fails once
+        mockGetLeagueStandings = mock.Mock(
+            side_effect=[HTTPError(503)]
+            + [getLeagueStandings(sport=None, league_id=123, season=2022)]
+        )
+        with mock.patch.object(
+            LeagueLoader, "requestScheduler", requestScheduler
+        ), mock.patch.object(
+            LeagueInfoAPIClient, "get_league_standings", mockGetLeagueStandings
+        ), mock.patch.object(
+            ScoringAPIClient, "get_league_scoreboard", side_effect=getLeagueScoreboard
+        ) as mockGetLeagueScoreboard:
+            # the League is still loaded
+            league = FleaflickerLeagueLoader("123", [2022]).loadLeague()
+            self.assertEqual(
+                1, requestScheduler.getMetrics(Platform.FLEAFLICKER).retries
+            )
+            mockGetLeagueStandings.side_effect = getLeagueStandings
+
+            # loading the same League twice at once sends each request once
+            leagues = asyncio.run(
+                AsyncLeagueLoader.loadLeaguesAsync(
+                    [
+                        FleaflickerLeagueLoader("123", [2022, 2023]),
+                        FleaflickerLeagueLoader("123", [2022, 2023]),
+                    ]
+                )
+            )
+
+        self.assertEqual(1, len(league.years))
+        self.assertTrue(
+            leagues[0].equals(leagues[1], ignoreBaseIds=True, ignoreIds=True)
+        )
+        metrics = requestScheduler.getMetrics(Platform.FLEAFLICKER)
+        self.assertGreater(metrics.coalescedRequests, 0)
+        # 2 requests for the first load, then 1 for each of the 2 Years
+        self.assertEqual(4, mockGetLeagueStandings.call_count)
+        self.assertLess(mockGetLeagueScoreboard.call_count, 2 + 2 * 4)
+
+    def test_invalidArguments_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            RateLimit(requestsPerSecond=0)
+        self.assertEqual(
+            "'requestsPerSecond' must be greater than 0.", str(context.exception)
+        )
+        with self.assertRaises(ValueError) as context:
+            RateLimit(requestsPerSecond=1, burst=0)
+        self.assertEqual("'burst' must be at least 1.", str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            RetryPolicy(maxRetries=-1)
+        self.assertEqual("'maxRetries' cannot be less than 0.", str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            RetryPolicy(baseDelaySeconds=-1)
+        self.assertEqual("Retry delays cannot be less than 0.", str(context.exception))
+
+    def test_retryPolicy_getDelaySeconds(self):
+        retryPolicy = RetryPolicy(baseDelaySeconds=1, maxDelaySeconds=5)
+        rng = random.Random(0)
+
+        for retryNumber, maxDelaySeconds in ((1, 1), (2, 2), (3, 4), (4, 5), (10, 5)):
+            delays = [retryPolicy.getDelaySeconds(retryNumber, rng) for _ in range(50)]
+            self.assertTrue(all(0 <= delay <= maxDelaySeconds for delay in delays))
+            # jittered, so retries from many requests are spread out
+            self.assertGreater(len(set(delays)), 1)
@@ -0,0 +1,94 @@
+import copy
+import unittest
+from unittest.mock import patch
+
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestEqualityCheck(unittest.TestCase):
+    def __getLeague(self) -> League:
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        year = Year(
+            yearNumber=2000, teams=teams, weeks=[Week(weekNumber=1, matchups=[matchup])]
+        )
+        return League(name="LEAGUE", owners=owners, years=[year])
+
+    def test_fingerprint_copiesHaveSameFingerprint(self):
+        league = self.__getLeague()
+        leagueCopy = copy.deepcopy(league)
+        leagueFromJson = League.fromJson(league.toJson())
+
+        self.assertIsInstance(league.fingerprint(), bytes)
+        self.assertEqual(league.fingerprint(), leagueCopy.fingerprint())
+        self.assertEqual(league.fingerprint(), leagueFromJson.fingerprint())
+        self.assertEqual(hash(league), hash(leagueCopy))
+
+    def test_fingerprint_differentIds_differentFingerprint(self):
+        league = self.__getLeague()
+        leagueCopy = copy.deepcopy(league)
+        leagueCopy.years[0].weeks[0].matchups[0].id = "foo"
+
+        self.assertNotEqual(league.fingerprint(), leagueCopy.fingerprint())
+        # still equal when ignoring ids
+        self.assertTrue(league.equals(leagueCopy, ignoreBaseIds=True))
+
+    def test_fingerprint_nestedFieldSet_fingerprintAndHashChange(self):
+        league = self.__getLeague()
+        fingerprint = league.fingerprint()
+        hash_ = hash(league)
+
+        league.years[0].weeks[0].matchups[0].teamAScore = 100
+
+        self.assertNotEqual(fingerprint, league.fingerprint())
+        self.assertNotEqual(hash_, hash(league))
+
+    def test_fingerprint_nestedListChangedInPlace_fingerprintChanges(self):
+        league = self.__getLeague()
+        fingerprint = league.fingerprint()
+        year = league.years[0]
+
+        year.weeks.append(
+            Week(
+                weekNumber=2,
+                matchups=[
+                    Matchup(
+                        teamAId=year.teams[0].id,
+                        teamBId=year.teams[1].id,
+                        teamAScore=1,
+                        teamBScore=2,
+                    )
+                ],
+            )
+        )
+        fingerprintAfterAppend = league.fingerprint()
+        year.weeks.pop()
+
+        self.assertNotEqual(fingerprint, fingerprintAfterAppend)
+        self.assertEqual(fingerprint, league.fingerprint())
+
+    def test_equals_bothFingerprinted_doesNotCompareFields(self):
+        league = self.__getLeague()
+        leagueCopy = copy.deepcopy(league)
+        league.fingerprint()
+        leagueCopy.fingerprint()
+
+        with patch.object(Matchup, "equals") as mockMatchupEquals:
+            self.assertTrue(league.equals(leagueCopy))
+        mockMatchupEquals.assert_not_called()
+
+    def test_equals_bothFingerprintedButNotEqual_comparesFields(self):
+        league = self.__getLeague()
+        leagueCopy = copy.deepcopy(league)
+        leagueCopy.years[0].weeks[0].matchups[0].teamAScore = 100
+        league.fingerprint()
+        leagueCopy.fingerprint()
+
+        self.assertFalse(league.equals(leagueCopy))
+        self.assertFalse(league.equals(leagueCopy, ignoreIds=True, ignoreBaseIds=True))
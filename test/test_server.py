@@ -0,0 +1,292 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from leeger.calculator.all_time_calculator import AWALAllTimeCalculator
+from leeger.calculator.year_calculator import SmartWinsYearCalculator
+from leeger.server import ResultCache, StatsServer, StatsService
+from leeger.util.excel_helper import iterYearMatchupRows
+from leeger.util.json_stream import writeLeagueJson
+from leeger.util.league_generator import generateLeague
+from leeger.util.stat_sheet import leagueStatSheet, yearStatSheet
+
+
+class TestServer(unittest.TestCase):
+    def __getJson(self, statsService: StatsService, target: str):
+        status, body = statsService.handle(target)
+        self.assertEqual(200, status, body)
+        return json.loads(body)
+
+    def __assertStatsEqual(self, expected: dict, actual: dict):
+        self.assertEqual(list(expected.keys()), list(actual.keys()))
+        for key, value in expected.items():
+            self.assertAlmostEqual(float(value), actual[key], places=9)
+
+    def test_resultCache_evictsLeastRecentlyUsed(self):
+        resultCache = ResultCache(2)
+
+        resultCache.put("a", 1)
+        resultCache.put("b", 2)
+        self.assertEqual(1, resultCache.get("a"))
+        resultCache.put("c", 3)
+
+        self.assertEqual(2, len(resultCache))
+        self.assertIsNone(resultCache.get("b"))
+        self.assertEqual(1, resultCache.get("a"))
+        self.assertEqual(3, resultCache.get("c"))
+        self.assertEqual(3, resultCache.hits)
+        self.assertEqual(1, resultCache.misses)
+
+        resultCache.clear()
+        self.assertEqual(0, len(resultCache))
+        self.assertEqual(0, resultCache.hits)
+
+    def test_resultCache_maxSizeZero_cachesNothing(self):
+        resultCache = ResultCache(0)
+        resultCache.put("a", 1)
+        self.assertIsNone(resultCache.get("a"))
+
+        with self.assertRaises(ValueError) as context:
+            ResultCache(-1)
+        self.assertEqual("'maxSize' cannot be less than 0.", str(context.exception))
+
+    def test_statsService_statSheets(self):
+        league = generateLeague(numberOfYears=2, numberOfTeams=4)
+        statsService = StatsService([league])
+
+        leagues = self.__getJson(statsService, "/leagues")
+        self.assertEqual(
+            [{"id": league.id, "name": league.name, "yearNumbers": [2000, 2001]}],
+            leagues,
+        )
+
+        allTimeStats = self.__getJson(
+            statsService, f"/leagues/{league.id}/stats?onlyRegularSeason=true"
+        )
+        expectedAllTimeStats = leagueStatSheet(league, onlyRegularSeason=True)
+        self.__assertStatsEqual(expectedAllTimeStats.awal, allTimeStats["awal"])
+        self.assertEqual(expectedAllTimeStats.wins, allTimeStats["wins"])
+        # optional stats are left out when the League doesn't have them
+        self.assertNotIn("leagueMedianWins", allTimeStats)
+
+        yearStats = self.__getJson(
+            statsService, f"/leagues/{league.id}/years/2001/stats?weekNumberEnd=3"
+        )
+        expectedYearStats = yearStatSheet(league.years[1], weekNumberEnd=3)
+        self.__assertStatsEqual(expectedYearStats.smartWins, yearStats["smartWins"])
+        self.assertEqual(expectedYearStats.maxScore, yearStats["maxScore"])
+
+    def test_statsService_calculatorsAndMatchups(self):
+        league = generateLeague(numberOfYears=2, numberOfTeams=4)
+        statsService = StatsService([league])
+
+        self.__assertStatsEqual(
+            AWALAllTimeCalculator.getAWAL(league, yearNumberStart=2001),
+            self.__getJson(
+                statsService,
+                f"/leagues/{league.id}/calculators/AWALAllTimeCalculator/getAWAL?yearNumberStart=2001",
+            ),
+        )
+        self.__assertStatsEqual(
+            SmartWinsYearCalculator.getSmartWins(league.years[0]),
+            self.__getJson(
+                statsService,
+                f"/leagues/{league.id}/years/2000/calculators/SmartWinsYearCalculator/getSmartWins",
+            ),
+        )
+
+        matchups = self.__getJson(
+            statsService,
+            f"/leagues/{league.id}/years/2000/matchups?onlyPostSeason=true",
+        )
+        expectedRows = list(iterYearMatchupRows(league.years[0], onlyPostSeason=True))
+        self.assertEqual(len(expectedRows), len(matchups))
+        self.assertEqual(expectedRows[0].matchupId, matchups[0]["matchupId"])
+        self.assertEqual(expectedRows[0].pointsFor, matchups[0]["pointsFor"])
+        self.assertEqual(
+            2 * sum(len(week.matchups) for year in league.years for week in year.weeks),
+            len(self.__getJson(statsService, f"/leagues/{league.id}/matchups")),
+        )
+
+    def test_statsService_cachesByFingerprintEndpointAndFilters(self):
+        league = generateLeague(numberOfYears=1, numberOfTeams=4)
+        statsService = StatsService([league], cacheSize=2)
+        target = f"/leagues/{league.id}/stats?weekNumberEnd=2&onlyRegularSeason=true"
+
+        _, body = statsService.handle(target)
+        self.assertEqual(0, statsService.cache.hits)
+        # filters in any order are the same request
+        _, cachedBody = statsService.handle(
+            f"/leagues/{league.id}/stats?onlyRegularSeason=true&weekNumberEnd=2"
+        )
+        self.assertIs(body, cachedBody)
+        self.assertEqual(1, statsService.cache.hits)
+
+        statsService.handle(f"/leagues/{league.id}/stats?weekNumberEnd=3")
+        statsService.handle(f"/leagues/{league.id}/years/2000/stats?weekNumberEnd=2")
+        self.assertEqual(2, len(statsService.cache))
+        # the first response was evicted
+        statsService.handle(target)
+        self.assertEqual(1, statsService.cache.hits)
+
+        # a changed League has a new fingerprint, so old responses aren't used
+        matchup = league.years[0].weeks[0].matchups[0]
+        matchup.teamAScore += 1000
+        statsService.addLeague(league)
+        _, newBody = statsService.handle(target)
+        self.assertNotEqual(body, newBody)
+        self.assertEqual(1, statsService.cache.hits)
+
+    def test_statsService_concurrentMissesAreComputedOnce(self):
+        league = generateLeague(numberOfYears=1, numberOfTeams=4)
+        statsService = StatsService([league])
+        target = f"/leagues/{league.id}/years/2000/stats"
+        started = threading.Event()
+        release = threading.Event()
+
+        def slowYearStatSheet(year, **kwargs):
+            started.set()
+            release.wait()
+            return yearStatSheet(year, **kwargs)
+
+        with mock.patch(
+            "leeger.server.yearStatSheet", side_effect=slowYearStatSheet
+        ) as yearStatSheetMock:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                firstResponse = executor.submit(statsService.handle, target)
+                started.wait()
+                otherResponses = [
+                    executor.submit(statsService.handle, target) for _ in range(3)
+                ]
+                release.set()
+                responses = [firstResponse.result()] + [
+                    response.result() for response in otherResponses
+                ]
+
+        self.assertEqual(1, yearStatSheetMock.call_count)
+        self.assertEqual(1, len({body for _, body in responses}))
+        self.assertEqual({200}, {status for status, _ in responses})
+
+    def test_statsService_badRequests(self):
+        league = generateLeague(numberOfYears=1, numberOfTeams=4)
+        statsService = StatsService([league])
+
+        for target, expectedStatus, expectedError in (
+            ("/", 404, "No endpoint at '/'."),
+            ("/leagues/badId/stats", 404, "No League with ID 'badId'."),
+            (
+                f"/leagues/{league.id}/years/1999/stats",
+                404,
+                f"League '{league.id}' has no Year '1999'.",
+            ),
+            (f"/leagues/{league.id}/bad", 404, "No endpoint at 'bad'."),
+            (
+                f"/leagues/{league.id}/calculators/BadCalculator/getAWAL",
+                404,
+                "No calculator named 'BadCalculator'.",
+            ),
+            (
+                f"/leagues/{league.id}/calculators/AWALAllTimeCalculator/_getYearFilters",
+                404,
+                "'AWALAllTimeCalculator' has no method named '_getYearFilters'.",
+            ),
+            (
+                f"/leagues/{league.id}/stats?badFilter=1",
+                400,
+                "'badFilter' is not a valid filter.",
+            ),
+            (
+                f"/leagues/{league.id}/years/2000/stats?yearNumberStart=2000",
+                400,
+                "'yearNumberStart' is not a valid filter.",
+            ),
+            (
+                f"/leagues/{league.id}/stats?weekNumberEnd=two",
+                400,
+                "Filter 'weekNumberEnd' must be an integer.",
+            ),
+            (
+                f"/leagues/{league.id}/stats?onlyRegularSeason=1",
+                400,
+                "Filter 'onlyRegularSeason' must be 'true' or 'false'.",
+            ),
+            (
+                f"/leagues/{league.id}/stats?weekNumberEnd=1&weekNumberEnd=2",
+                400,
+                "Filter 'weekNumberEnd' was given more than once.",
+            ),
+            (
+                f"/leagues/{league.id}/stats?onlyRegularSeason=true&onlyPostSeason=true",
+                400,
+                "Only one of 'onlyChampionship', 'onlyPostSeason', 'onlyRegularSeason' can be True",
+            ),
+            (
+                f"/leagues/{league.id}/calculators/AWALAllTimeCalculator/getAWAL?yearNumberStart=1999",
+                400,
+                "Year 1999 does not exist in the given League.",
+            ),
+            (
+                f"/leagues/{league.id}/stats?yearNumberEnd=2100",
+                400,
+                "Year 2100 does not exist in the given League.",
+            ),
+        ):
+            # bad requests aren't server errors, so nothing is logged as one
+            with self.assertNoLogs("leeger.server", level="ERROR"):
+                status, body = statsService.handle(target)
+            self.assertEqual(expectedStatus, status, target)
+            self.assertEqual({"error": expectedError}, json.loads(body))
+
+    def test_statsService_loadLeagues(self):
+        league = generateLeague(numberOfYears=1, numberOfTeams=4)
+        with tempfile.TemporaryDirectory() as directoryPath:
+            filePath = os.path.join(directoryPath, "league.json")
+            with open(filePath, "w", encoding="utf8") as f:
+                writeLeagueJson(league, f)
+
+            statsService = StatsService()
+            loadedLeagues = statsService.loadLeagues(filePath)
+
+        self.assertEqual(1, len(loadedLeagues))
+        self.assertTrue(league.equals(loadedLeagues[0]))
+        self.assertEqual(league.id, self.__getJson(statsService, "/leagues")[0]["id"])
+
+    def test_statsServer_concurrentRequests(self):
+        league = generateLeague(numberOfYears=2, numberOfTeams=4)
+        statsService = StatsService([league])
+        statsServer = StatsServer(statsService, port=0)
+        serverThread = threading.Thread(target=statsServer.serve_forever)
+        serverThread.start()
+        try:
+            baseUrl = f"http://127.0.0.1:{statsServer.server_port}"
+            targets = [
+                f"/leagues/{league.id}/stats",
+                f"/leagues/{league.id}/years/2000/stats?onlyRegularSeason=true",
+                f"/leagues/{league.id}/years/2001/matchups",
+            ] * 4
+
+            def get(target: str) -> bytes:
+                with urllib.request.urlopen(baseUrl + target) as response:
+                    self.assertEqual(
+                        "application/json", response.headers["Content-Type"]
+                    )
+                    return response.read()
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                bodies = list(executor.map(get, targets))
+
+            for target, body in zip(targets, bodies):
+                self.assertEqual(statsService.handle(target)[1], body)
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                get("/leagues/badId/stats")
+            self.assertEqual(404, context.exception.code)
+        finally:
+            statsServer.shutdown()
+            statsServer.server_close()
+            serverThread.join()
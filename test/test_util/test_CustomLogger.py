@@ -0,0 +1,81 @@
+import logging
+import unittest
+
+from leeger.model.league.Matchup import Matchup
+from leeger.util.CustomLogger import CustomLogger
+from leeger.util.GeneralUtil import GeneralUtil
+
+
+class TestCustomLogger(unittest.TestCase):
+    def tearDown(self):
+        CustomLogger.setEnabled(True)
+
+    def test_getLogger_returnsLoggerInLeegerHierarchy(self):
+        logger = CustomLogger.getLogger("leeger.model.league.Matchup")
+
+        self.assertEqual("leeger.model.league.Matchup", logger.name)
+        parent = logger.parent
+        while parent.name != "leeger":
+            parent = parent.parent
+        self.assertIs(CustomLogger.getLogger(), parent)
+        self.assertEqual("leeger", CustomLogger.getLogger().name)
+
+    def test_getLogger_configuresOnce(self):
+        handlers = list(CustomLogger.getLogger().handlers)
+        for _ in range(10):
+            CustomLogger.getLogger(__name__)
+        self.assertEqual(handlers, CustomLogger.getLogger().handlers)
+        # does not touch the root logger
+        self.assertNotEqual("leeger", logging.getLogger().name)
+
+    def test_getLogger_keepsLevelSetByUser(self):
+        logger = CustomLogger.getLogger()
+        originalLevel = logger.level
+        try:
+            logger.setLevel(logging.ERROR)
+            CustomLogger.getLogger()
+            self.assertEqual(logging.ERROR, logger.level)
+        finally:
+            logger.setLevel(originalLevel)
+
+    def test_setEnabled_false_silencesAllLeegerLogging(self):
+        CustomLogger.setEnabled(False)
+
+        self.assertFalse(CustomLogger.isEnabled())
+        for name in (
+            "leeger",
+            "leeger.util.GeneralUtil",
+            "leeger.model.league.Matchup",
+        ):
+            self.assertFalse(logging.getLogger(name).isEnabledFor(logging.CRITICAL))
+
+        CustomLogger.setEnabled(True)
+
+        self.assertTrue(CustomLogger.isEnabled())
+        with self.assertLogs("leeger", level=logging.WARNING) as captured:
+            GeneralUtil.warnForUnusedKwargs({"a": 1})
+        self.assertEqual(1, len(captured.records))
+
+    def test_setEnabled_restoresPreviousLevel(self):
+        logger = CustomLogger.getLogger()
+        originalLevel = logger.level
+        try:
+            logger.setLevel(logging.WARNING)
+            CustomLogger.setEnabled(False)
+            CustomLogger.setEnabled(False)
+            CustomLogger.setEnabled(True)
+            self.assertEqual(logging.WARNING, logger.level)
+        finally:
+            logger.setLevel(originalLevel)
+
+    def test_modelEq_logsAtDebug(self):
+        matchup = Matchup(teamAId="a", teamBId="b", teamAScore=1, teamBScore=2)
+
+        with self.assertLogs("leeger", level=logging.DEBUG) as captured:
+            self.assertTrue(matchup == matchup)
+        self.assertEqual(1, len(captured.records))
+        self.assertEqual("leeger.model.league.Matchup", captured.records[0].name)
+        self.assertEqual(logging.DEBUG, captured.records[0].levelno)
+        # not logged at the default level
+        with self.assertNoLogs("leeger", level=logging.INFO):
+            self.assertTrue(matchup == matchup)
@@ -0,0 +1,133 @@
+import unittest
+
+from leeger.model.stat.LeagueStatSheetResult import LeagueStatSheetResult
+from leeger.util.batch import StatSheetBatch, computeStatSheets
+from leeger.util.league_generator import generateLeague
+from leeger.util.stat_sheet import leagueStatSheet
+
+
+class TestBatch(unittest.TestCase):
+    @staticmethod
+    def __getLeagues(numberOfLeagues: int) -> list:
+        return [
+            generateLeague(seed=i, numberOfYears=2, numberOfRegularSeasonWeeks=3)
+            for i in range(numberOfLeagues)
+        ]
+
+    def test_computeStatSheets_inProcess(self):
+        leagues = self.__getLeagues(3)
+
+        batch = computeStatSheets(leagues, maxWorkers=1)
+        results = list(batch)
+
+        self.assertIsInstance(batch, StatSheetBatch)
+        self.assertEqual([0, 1, 2], [result.index for result in results])
+        for result, league in zip(results, leagues):
+            self.assertIsInstance(result, LeagueStatSheetResult)
+            self.assertTrue(result.succeeded)
+            self.assertEqual(league.id, result.leagueId)
+            self.assertEqual(league.name, result.leagueName)
+            self.assertEqual(leagueStatSheet(league), result.statSheet)
+            self.assertGreater(result.computeTime, 0)
+
+    def test_computeStatSheets_processPool(self):
+        leagues = self.__getLeagues(5)
+
+        results = list(computeStatSheets(leagues, maxWorkers=2, chunkSize=2))
+
+        self.assertEqual(list(range(5)), sorted(result.index for result in results))
+        for result in results:
+            league = leagues[result.index]
+            self.assertTrue(result.succeeded)
+            self.assertEqual(league.id, result.leagueId)
+            self.assertEqual(leagueStatSheet(league), result.statSheet)
+
+    def test_computeStatSheets_invalidLeague_givesErrorResult(self):
+        leagues = self.__getLeagues(3)
+        leagues[1].years[0].yearNumber = 1800
+
+        for maxWorkers in (1, 2):
+            with self.subTest(maxWorkers=maxWorkers):
+                batch = computeStatSheets(leagues, maxWorkers=maxWorkers)
+                results = sorted(batch, key=lambda result: result.index)
+
+                self.assertEqual(3, len(results))
+                self.assertTrue(results[0].succeeded)
+                self.assertTrue(results[2].succeeded)
+                self.assertFalse(results[1].succeeded)
+                self.assertIsNone(results[1].statSheet)
+                self.assertEqual(leagues[1].id, results[1].leagueId)
+                self.assertEqual("InvalidYearFormatException", results[1].errorType)
+                self.assertEqual(
+                    "Year 1800 is not in range 1920-2XXX.", results[1].error
+                )
+                self.assertEqual(2, batch.numberOfLeaguesSucceeded)
+                self.assertEqual(1, batch.numberOfLeaguesFailed)
+
+    def test_computeStatSheets_processPool_leagueCantBeSerialized_givesErrorResult(
+        self,
+    ):
+        leagues = self.__getLeagues(5)
+        # not JSON serializable
+        leagues[1].owners[0].name = object()
+        leagues[4].owners[0].name = object()
+
+        batch = computeStatSheets(leagues, maxWorkers=2, chunkSize=2)
+        results = sorted(batch, key=lambda result: result.index)
+
+        self.assertEqual(list(range(5)), [result.index for result in results])
+        for i in (0, 2, 3):
+            self.assertTrue(results[i].succeeded)
+        for i in (1, 4):
+            self.assertFalse(results[i].succeeded)
+            self.assertIsNone(results[i].statSheet)
+            self.assertEqual(leagues[i].id, results[i].leagueId)
+            self.assertEqual("TypeError", results[i].errorType)
+        self.assertEqual(3, batch.numberOfLeaguesSucceeded)
+        self.assertEqual(2, batch.numberOfLeaguesFailed)
+
+    def test_computeStatSheets_kwargsArePassedToStatSheet(self):
+        leagues = self.__getLeagues(2)
+
+        results = list(computeStatSheets(leagues, maxWorkers=1, onlyRegularSeason=True))
+
+        for result, league in zip(results, leagues):
+            self.assertEqual(
+                leagueStatSheet(league, onlyRegularSeason=True), result.statSheet
+            )
+            self.assertNotEqual(leagueStatSheet(league), result.statSheet)
+
+    def test_computeStatSheets_leaguesAreConsumedLazily(self):
+        consumed = list()
+
+        def leagues():
+            for league in self.__getLeagues(3):
+                consumed.append(league.id)
+                yield league
+
+        batch = computeStatSheets(leagues(), maxWorkers=1)
+        self.assertEqual(0, len(consumed))
+        iterator = iter(batch)
+        next(iterator)
+        self.assertEqual(1, len(consumed))
+
+    def test_computeStatSheets_throughput(self):
+        batch = computeStatSheets(self.__getLeagues(2), maxWorkers=1)
+
+        self.assertEqual(0, batch.numberOfLeaguesCompleted)
+        self.assertEqual(0.0, batch.elapsedTime)
+        self.assertEqual(0.0, batch.leaguesPerSecond)
+        list(batch)
+        self.assertEqual(2, batch.numberOfLeaguesCompleted)
+        self.assertGreater(batch.elapsedTime, 0)
+        self.assertAlmostEqual(
+            2 / batch.elapsedTime, batch.leaguesPerSecond, delta=0.001
+        )
+        # a finished batch can't be run again
+        with self.assertRaises(RuntimeError):
+            list(batch)
+
+    def test_computeStatSheets_invalidChunkSize_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            computeStatSheets(list(), chunkSize=0)
+        self.assertEqual("'chunkSize' must be at least 1.", str(context.exception))
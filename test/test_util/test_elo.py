@@ -0,0 +1,241 @@
+import math
+import unittest
+
+import numpy
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.rating import RatingHistory
+from leeger.util.elo import EloTracker, getEloRatings
+from leeger.util.league_generator import generateLeague
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestElo(unittest.TestCase):
+    @staticmethod
+    def __getLeague() -> League:
+        """
+        2 Years of 2 Owners.
+        2000: Owner 1 wins Week 1, Week 2 is a tie.
+        2001: Owner 1 wins Week 1, Week 2 and Week 3 are one multi-week playoff matchup that Owner 2 wins.
+        """
+        owners, teams2000 = getNDefaultOwnersAndTeams(2)
+        teams2001 = getTeamsFromOwners(owners)
+        years = list()
+        for yearNumber, teams, games in (
+            (2000, teams2000, ((100, 90, None), (80, 80, None))),
+            (2001, teams2001, ((110, 70, None), (100, 90, "1"), (90, 120, "1"))),
+        ):
+            weeks = list()
+            for weekNumber, (teamAScore, teamBScore, multiWeekMatchupId) in enumerate(
+                games, start=1
+            ):
+                weeks.append(
+                    Week(
+                        weekNumber=weekNumber,
+                        matchups=[
+                            Matchup(
+                                teamAId=teams[0].id,
+                                teamBId=teams[1].id,
+                                teamAScore=teamAScore,
+                                teamBScore=teamBScore,
+                                matchupType=MatchupType.REGULAR_SEASON
+                                if multiWeekMatchupId is None
+                                else MatchupType.PLAYOFF,
+                                multiWeekMatchupId=multiWeekMatchupId,
+                            )
+                        ],
+                    )
+                )
+            years.append(Year(yearNumber=yearNumber, teams=teams, weeks=weeks))
+        return League(name="TEST", owners=owners, years=years)
+
+    @staticmethod
+    def __getRatingChange(rating: float, opponentRating: float, result: float) -> float:
+        return 32 * (result - 1 / (1 + 10 ** ((opponentRating - rating) / 400)))
+
+    def test_getEloRatings_happyPath(self):
+        league = self.__getLeague()
+        owner1Id, owner2Id = [owner.id for owner in league.owners]
+
+        ratingHistory = getEloRatings(league)
+
+        self.assertIsInstance(ratingHistory, RatingHistory)
+        self.assertEqual(
+            [(2000, 1), (2000, 2), (2001, 1), (2001, 2), (2001, 3)],
+            ratingHistory.weeks,
+        )
+        self.assertEqual([owner1Id, owner2Id], ratingHistory.ownerIds)
+        self.assertEqual((5, 2), ratingHistory.ratings.shape)
+        # evenly rated Owners, so the winner gets half of the K-factor
+        self.assertEqual([1516, 1484], ratingHistory.ratings[0].tolist())
+        # a tie moves the ratings towards each other
+        owner1Rating = 1516 + self.__getRatingChange(1516, 1484, 0.5)
+        self.assertAlmostEqual(owner1Rating, ratingHistory.ratings[1, 0], places=9)
+        self.assertAlmostEqual(
+            3000 - owner1Rating, ratingHistory.ratings[1, 1], places=9
+        )
+        # Owner ratings carry on into the next Year
+        owner1Rating += self.__getRatingChange(owner1Rating, 3000 - owner1Rating, 1)
+        self.assertAlmostEqual(owner1Rating, ratingHistory.ratings[2, 0], places=9)
+        # the multi-week matchup is rated once, in its last Week, and Owner 2 wins it 210 - 190
+        self.assertEqual(
+            ratingHistory.ratings[2].tolist(), ratingHistory.ratings[3].tolist()
+        )
+        owner1Rating += self.__getRatingChange(owner1Rating, 3000 - owner1Rating, 0)
+        self.assertAlmostEqual(
+            owner1Rating, ratingHistory.getCurrentRatings()[owner1Id], places=9
+        )
+        self.assertEqual(
+            ratingHistory.ratings[:, 1].tolist(),
+            ratingHistory.getRatingHistory(owner2Id),
+        )
+        self.assertEqual([owner1Id, owner2Id], ratingHistory.getRankings())
+
+    def test_getEloRatings_ratingsAreNaNUntilFirstGame(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+        t1, t2, t3, t4 = [team.id for team in teams]
+        year = Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(teamAId=t1, teamBId=t2, teamAScore=100, teamBScore=90)
+                    ],
+                ),
+                Week(
+                    weekNumber=2,
+                    matchups=[
+                        Matchup(teamAId=t1, teamBId=t3, teamAScore=100, teamBScore=90),
+                        Matchup(teamAId=t2, teamBId=t4, teamAScore=100, teamBScore=90),
+                    ],
+                ),
+            ],
+        )
+        league = League(name="TEST", owners=owners, years=[year])
+
+        ratingHistory = getEloRatings(league)
+
+        owner3Id = owners[2].id
+        self.assertTrue(math.isnan(ratingHistory.getRatingHistory(owner3Id)[0]))
+        # Owner 3's first game is against Owner 1, who is already rated 1516
+        self.assertAlmostEqual(
+            1500 + self.__getRatingChange(1500, 1516, 0),
+            ratingHistory.getRatingHistory(owner3Id)[1],
+            places=9,
+        )
+        self.assertEqual(4, len(ratingHistory.getCurrentRatings()))
+        self.assertEqual(owners[0].id, ratingHistory.getRankings()[0])
+
+    def test_getEloRatings_withOptions(self):
+        league = self.__getLeague()
+
+        ratingHistory = getEloRatings(league, kFactor=20, initialRating=1000)
+        self.assertEqual([1010, 990], ratingHistory.ratings[0].tolist())
+
+        # ratings start over in every Year
+        ratingHistory = getEloRatings(league, yearRegression=1)
+        self.assertEqual([1516, 1484], ratingHistory.ratings[2].tolist())
+
+        ratingHistory = getEloRatings(league, yearRegression=0.5)
+        ratingsBeforeRegression = ratingHistory.ratings[1]
+        ratingsAfterRegression = 1500 + (ratingsBeforeRegression - 1500) * 0.5
+        self.assertAlmostEqual(
+            ratingsAfterRegression[0]
+            + self.__getRatingChange(*ratingsAfterRegression, 1),
+            ratingHistory.ratings[2, 0],
+            places=9,
+        )
+
+    def test_getEloRatings_withFilters(self):
+        league = self.__getLeague()
+
+        ratingHistory = getEloRatings(league, onlyRegularSeason=True)
+        self.assertEqual(5, len(ratingHistory.weeks))
+        self.assertEqual(
+            ratingHistory.ratings[2].tolist(), ratingHistory.ratings[4].tolist()
+        )
+
+        ratingHistory = getEloRatings(league, yearNumberStart=2001)
+        self.assertEqual([(2001, 1), (2001, 2), (2001, 3)], ratingHistory.weeks)
+        self.assertEqual([1516, 1484], ratingHistory.ratings[0].tolist())
+
+    def test_eloTracker_sameAsGetEloRatings(self):
+        league = generateLeague(numberOfYears=3, numberOfTeams=20)
+        eloTracker = EloTracker(yearRegression=0.25)
+
+        eloTracker.addYear(league.years[0])
+        for year in league.years[1:]:
+            for week in year.weeks:
+                eloTracker.addWeek(year, week.weekNumber)
+
+        self.assertTrue(
+            numpy.array_equal(
+                getEloRatings(league, yearRegression=0.25).ratings,
+                eloTracker.getRatingHistory().ratings,
+                equal_nan=True,
+            )
+        )
+        # every game gives and takes the same number of points
+        self.assertAlmostEqual(
+            1500,
+            numpy.mean(
+                list(eloTracker.getRatingHistory().getCurrentRatings().values())
+            ),
+            places=9,
+        )
+
+    def test_eloTracker_weeksAddedAsPlayed_multiWeekChampionship_sameAsGetEloRatings(
+        self,
+    ):
+        league = generateLeague(seed=2, numberOfChampionshipWeeks=2)
+        eloTracker = EloTracker()
+
+        for year in league.years:
+            # Weeks are added to the Year as they are played
+            yearSoFar = Year(yearNumber=year.yearNumber, teams=year.teams, weeks=[])
+            for week in year.weeks:
+                yearSoFar.weeks.append(week)
+                eloTracker.addWeek(yearSoFar, week.weekNumber)
+
+        ratingHistory = getEloRatings(league)
+        self.assertEqual(ratingHistory.weeks, eloTracker.getRatingHistory().weeks)
+        self.assertTrue(
+            numpy.array_equal(
+                ratingHistory.ratings,
+                eloTracker.getRatingHistory().ratings,
+                equal_nan=True,
+            )
+        )
+
+    def test_eloTracker_invalidArguments_raisesException(self):
+        league = self.__getLeague()
+        year2000, year2001 = league.years
+
+        with self.assertRaises(ValueError) as context:
+            EloTracker(kFactor=0)
+        self.assertEqual("'kFactor' must be greater than 0.", str(context.exception))
+        for yearRegression in (-0.1, 1.1):
+            with self.assertRaises(ValueError) as context:
+                getEloRatings(league, yearRegression=yearRegression)
+            self.assertEqual(
+                "'yearRegression' must be between 0 and 1.", str(context.exception)
+            )
+
+        eloTracker = EloTracker()
+        with self.assertRaises(ValueError) as context:
+            eloTracker.addWeek(year2000, 3)
+        self.assertEqual("Year 2000 has no Week 3.", str(context.exception))
+
+        eloTracker.addWeek(year2001, 1)
+        with self.assertRaises(ValueError) as context:
+            eloTracker.addWeek(year2000, 2)
+        self.assertEqual(
+            "Week 2 of Year 2000 can't be added after Week 1 of Year 2001, Weeks must be added in chronological order.",
+            str(context.exception),
+        )
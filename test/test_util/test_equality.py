@@ -1,9 +1,9 @@
 import unittest
 from dataclasses import dataclass
 from typing import Any, Optional
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from leeger.util.equality import modelEquals
+from leeger.util.equality import modelEquals, modelFingerprint
 
 # helper stuff
 
@@ -30,6 +30,12 @@ class Foo:
         return {"field1": self.field1, "field2": self.field2, "idField1": self.idField1}
 
 
+@dataclass
+class Bar:
+    name: str
+    child: Optional[Foo] = None
+
+
 class TestEquality(unittest.TestCase):
     @patch("leeger.util.CustomLogger.CustomLogger.getLogger")
     def test_equals(self, mockGetLogger):
@@ -242,3 +248,82 @@ class TestEquality(unittest.TestCase):
 
         self.assertFalse(result)
         mockLogger.info.assert_not_called()
+
+    @patch("leeger.util.CustomLogger.CustomLogger.getLogger")
+    def test_equals_shortCircuitsAfterFirstDifference(self, mockGetLogger):
+        mockLogger = mockGetLogger.return_value
+        objA = Foo("a", 1, "id")
+        objB = Foo("b", 1, "id")
+        idFieldEquals = Mock(return_value=True)
+
+        result = modelEquals(
+            objA=objA,
+            objB=objB,
+            baseFields={"field1"},
+            idFields={"idField1"},
+            equalityFunctionMap={"idField1": idFieldEquals},
+        )
+
+        self.assertFalse(result)
+        idFieldEquals.assert_not_called()
+        mockLogger.info.assert_not_called()
+
+    def test_equals_differencesOnlyFoundWhenLogDifferencesIsTrue(self):
+        objA = Foo("a", 1, "id")
+        objB = Foo("b", 1, "id")
+
+        with patch.object(Foo, "toJson", autospec=True) as mockToJson:
+            result = modelEquals(objA=objA, objB=objB, baseFields={"field1"})
+
+        self.assertFalse(result)
+        mockToJson.assert_not_called()
+
+    def test_equals_sameInstance_returnsTrueWithoutComparingFields(self):
+        objA = Foo("a", 1, "id")
+        field1Equals = Mock(return_value=False)
+
+        result = modelEquals(
+            objA=objA,
+            objB=objA,
+            baseFields={"field1"},
+            equalityFunctionMap={"field1": field1Equals},
+        )
+
+        self.assertTrue(result)
+        field1Equals.assert_not_called()
+
+    def test_modelFingerprint_sameFieldsHaveSameFingerprint(self):
+        objA = Foo("a", 1, "id", nestedField=[Foo("b", 2, "id2")])
+        objB = Foo("a", 1, "id", nestedField=[Foo("b", 2, "id2")])
+        objC = Foo("a", 1, "id", nestedField=[Foo("b", 3, "id2")])
+
+        self.assertIsInstance(modelFingerprint(objA), bytes)
+        self.assertEqual(modelFingerprint(objA), modelFingerprint(objB))
+        self.assertNotEqual(modelFingerprint(objA), modelFingerprint(objC))
+
+    def test_modelFingerprint_nestedListChangedInPlace_fingerprintChanges(self):
+        nested = Foo("b", 2, "id2", nestedField=[])
+        objA = Foo("a", 1, "id", nestedField=[nested])
+        fingerprint1 = modelFingerprint(objA)
+
+        nested.nestedField.append(Foo("c", 3, "id3"))
+        fingerprint2 = modelFingerprint(objA)
+
+        objA.nestedField[0] = Foo("b", 2, "id2", nestedField=[])
+        fingerprint3 = modelFingerprint(objA)
+
+        self.assertNotEqual(fingerprint1, fingerprint2)
+        self.assertNotEqual(fingerprint2, fingerprint3)
+        self.assertEqual(fingerprint1, fingerprint3)
+
+    def test_modelFingerprint_childFieldFirstSeenEmpty_nestedChangesAreStillFound(self):
+        # the first Bar fingerprinted has no child, which must not make its child field be treated as a plain value
+        modelFingerprint(Bar("a"))
+        child = Foo("b", 2, "id2", nestedField=[])
+        bar = Bar("a", child=child)
+        fingerprint1 = modelFingerprint(bar)
+
+        child.nestedField.append(Foo("c", 3, "id3"))
+        fingerprint2 = modelFingerprint(bar)
+
+        self.assertNotEqual(fingerprint1, fingerprint2)
@@ -2,8 +2,9 @@ import os
 import tempfile
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
 
 from leeger.model.league.Division import Division
@@ -13,7 +14,7 @@ from leeger.model.league.Team import Team
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
 from leeger.util.excel import leagueToExcel
-from test.helper.prototypes import getNDefaultOwnersAndTeams
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
 
 
 class TestExcel(unittest.TestCase):
@@ -1964,3 +1965,213 @@ class TestExcel(unittest.TestCase):
             f"Cannot create file at path: '{fullPath}' because there is already a file there.",
             str(context.exception),
         )
+
+    def test_leagueToExcel_writeOnly_sameValuesAsDefault(self):
+        division1 = Division(name="d1")
+        division2 = Division(name="d2")
+        owners, teams1 = getNDefaultOwnersAndTeams(2)
+        teams1[0].name = "a"
+        teams1[1].name = "b"
+        teams1[0].divisionId = division1.id
+        teams1[1].divisionId = division2.id
+        matchup1 = Matchup(
+            teamAId=teams1[0].id, teamBId=teams1[1].id, teamAScore=1, teamBScore=2
+        )
+        week1 = Week(weekNumber=1, matchups=[matchup1])
+        year1 = Year(
+            yearNumber=2000,
+            teams=teams1,
+            weeks=[week1],
+            divisions=[division1, division2],
+        )
+
+        teams2 = [
+            Team(ownerId=owners[0].id, name="a2"),
+            Team(ownerId=owners[1].id, name="b2"),
+        ]
+        matchup2 = Matchup(
+            teamAId=teams2[0].id, teamBId=teams2[1].id, teamAScore=1, teamBScore=2
+        )
+        week2 = Week(weekNumber=1, matchups=[matchup2])
+        year2 = Year(yearNumber=2001, teams=teams2, weeks=[week2])
+
+        league = League(name="", owners=owners, years=[year1, year2])
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            defaultPath = os.path.join(tempDir, "default.xlsx")
+            writeOnlyPath = os.path.join(tempDir, "writeOnly.xlsx")
+            leagueToExcel(league, defaultPath)
+            leagueToExcel(league, writeOnlyPath, writeOnly=True)
+
+            defaultWorkbook = load_workbook(filename=defaultPath)
+            writeOnlyWorkbook = load_workbook(filename=writeOnlyPath)
+
+            self.assertEqual(defaultWorkbook.sheetnames, writeOnlyWorkbook.sheetnames)
+            for ws1, ws2 in zip(
+                defaultWorkbook.worksheets, writeOnlyWorkbook.worksheets
+            ):
+                self.assertEqual(ws1.freeze_panes, ws2.freeze_panes)
+                self.assertEqual(list(ws1.tables.keys()), list(ws2.tables.keys()))
+                self.assertEqual(
+                    [[cell.value for cell in row] for row in ws1.rows],
+                    [[cell.value for cell in row] for row in ws2.rows],
+                )
+                for columnLetter, dimension in ws1.column_dimensions.items():
+                    self.assertEqual(
+                        dimension.width, ws2.column_dimensions[columnLetter].width
+                    )
+                # shared styles are used for headers and rows
+                self.assertEqual("leegerHeader", ws2["A1"].style)
+                self.assertTrue(ws2["A2"].font.b)
+
+    def test_leagueToExcel_savesOnce(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        week = Week(weekNumber=1, matchups=[matchup])
+        year1 = Year(yearNumber=2000, teams=teams, weeks=[week])
+        teams2 = [
+            Team(ownerId=owners[0].id, name="a2"),
+            Team(ownerId=owners[1].id, name="b2"),
+        ]
+        matchup2 = Matchup(
+            teamAId=teams2[0].id, teamBId=teams2[1].id, teamAScore=1, teamBScore=2
+        )
+        year2 = Year(
+            yearNumber=2001,
+            teams=teams2,
+            weeks=[Week(weekNumber=1, matchups=[matchup2])],
+        )
+        league = League(name="", owners=owners, years=[year1, year2])
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            for writeOnly in (False, True):
+                fullPath = os.path.join(tempDir, f"tmp{writeOnly}.xlsx")
+                with patch.object(
+                    Workbook, "save", autospec=True, side_effect=Workbook.save
+                ) as mockSave:
+                    leagueToExcel(league, fullPath, writeOnly=writeOnly)
+                self.assertEqual(1, mockSave.call_count)
+
+    def test_leagueToExcel_singleEntity_headerIsWritten(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        year = Year(
+            yearNumber=2000, teams=teams, weeks=[Week(weekNumber=1, matchups=[matchup])]
+        )
+        league = League(name="", owners=owners, years=[year])
+
+        workbook = leagueToExcel(league)
+
+        self.assertEqual("Team For", workbook["2000 Matchups"]["A1"].value)
+        self.assertEqual("Owner", workbook["All Time Owners"]["A1"].value)
+
+    def test_leagueToExcel_writeOnlyWithoutFilePath_raisesException(self):
+        owners, teams = getNDefaultOwnersAndTeams(2)
+        matchup = Matchup(
+            teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=2
+        )
+        year = Year(
+            yearNumber=2000, teams=teams, weeks=[Week(weekNumber=1, matchups=[matchup])]
+        )
+        league = League(name="", owners=owners, years=[year])
+
+        with self.assertRaises(ValueError) as context:
+            leagueToExcel(league, writeOnly=True)
+        self.assertEqual(
+            "'filePath' must be given when 'writeOnly' is True.", str(context.exception)
+        )
+
+    def test_leagueToExcel_processPool_sameValuesAsSingleProcess(self):
+        owners, teams1 = getNDefaultOwnersAndTeams(2)
+        division1 = Division(name="d1")
+        teams1[0].divisionId = division1.id
+        teams1[1].divisionId = division1.id
+        matchup1 = Matchup(
+            teamAId=teams1[0].id, teamBId=teams1[1].id, teamAScore=1, teamBScore=2
+        )
+        year1 = Year(
+            yearNumber=2000,
+            teams=teams1,
+            weeks=[Week(weekNumber=1, matchups=[matchup1])],
+            divisions=[division1],
+        )
+        years = [year1]
+        for yearNumber in (2001, 2002):
+            teams = [
+                Team(ownerId=owners[0].id, name=f"a{yearNumber}"),
+                Team(ownerId=owners[1].id, name=f"b{yearNumber}"),
+            ]
+            matchup = Matchup(
+                teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=3, teamBScore=2
+            )
+            years.append(
+                Year(
+                    yearNumber=yearNumber,
+                    teams=teams,
+                    weeks=[Week(weekNumber=1, matchups=[matchup])],
+                )
+            )
+        league = League(name="", owners=owners, years=years)
+
+        singleProcessWorkbook = leagueToExcel(league, maxWorkers=1)
+        processPoolWorkbook = leagueToExcel(league, maxWorkers=2)
+
+        self.assertEqual(
+            [
+                "2000 Teams",
+                "2000 Matchups",
+                "2001 Teams",
+                "2001 Matchups",
+                "2002 Teams",
+                "2002 Matchups",
+                "All Time Teams",
+                "All Time Matchups",
+                "All Time Owners",
+            ],
+            processPoolWorkbook.sheetnames,
+        )
+        for ws1, ws2 in zip(
+            singleProcessWorkbook.worksheets, processPoolWorkbook.worksheets
+        ):
+            self.assertEqual(ws1.freeze_panes, ws2.freeze_panes)
+            self.assertEqual(
+                [[cell.value for cell in row] for row in ws1.rows],
+                [[cell.value for cell in row] for row in ws2.rows],
+            )
+            self.assertEqual(
+                [[cell.style for cell in row] for row in ws1.rows],
+                [[cell.style for cell in row] for row in ws2.rows],
+            )
+
+    def test_leagueToExcel_defaultOrMaxWorkersIsOne_doesNotUseProcessPool(self):
+        owners, teams1 = getNDefaultOwnersAndTeams(2)
+        matchup1 = Matchup(
+            teamAId=teams1[0].id, teamBId=teams1[1].id, teamAScore=1, teamBScore=2
+        )
+        year1 = Year(
+            yearNumber=2000,
+            teams=teams1,
+            weeks=[Week(weekNumber=1, matchups=[matchup1])],
+        )
+        teams2 = getTeamsFromOwners(owners)
+        matchup2 = Matchup(
+            teamAId=teams2[0].id, teamBId=teams2[1].id, teamAScore=1, teamBScore=2
+        )
+        year2 = Year(
+            yearNumber=2001,
+            teams=teams2,
+            weeks=[Week(weekNumber=1, matchups=[matchup2])],
+        )
+        league = League(name="", owners=owners, years=[year1, year2])
+
+        for kwargs in (dict(), dict(maxWorkers=1)):
+            with self.subTest(kwargs=kwargs):
+                with patch("leeger.util.excel.ProcessPoolExecutor") as mockExecutor:
+                    workbook = leagueToExcel(league, **kwargs)
+
+                mockExecutor.assert_not_called()
+                self.assertEqual("2001 Teams", workbook.sheetnames[2])
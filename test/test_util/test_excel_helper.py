@@ -1,12 +1,22 @@
+import types
 import unittest
+from unittest.mock import patch
 
+from leeger.enum.MatchupType import MatchupType
 from leeger.model.league import YearSettings
 from leeger.model.league.League import League
 from leeger.model.league.Matchup import Matchup
 from leeger.model.league.Week import Week
 from leeger.model.league.Year import Year
-from leeger.util.excel_helper import allTimeTeamsStatSheet
-from test.helper.prototypes import getNDefaultOwnersAndTeams
+from leeger.model.stat.MatchupStatRow import MatchupStatRow
+from leeger.util.excel_helper import (
+    allTimeMatchupsStatSheet,
+    allTimeTeamsStatSheet,
+    iterAllTimeMatchupRows,
+    iterYearMatchupRows,
+    yearMatchupsStatSheet,
+)
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
 
 
 class TestExcelHelper(unittest.TestCase):
@@ -129,3 +139,167 @@ class TestExcelHelper(unittest.TestCase):
         self.assertEqual("Team Score", allTimeTeamsStatSheet_[33][0])
         self.assertEqual("Team Success", allTimeTeamsStatSheet_[34][0])
         self.assertEqual("Team Luck", allTimeTeamsStatSheet_[35][0])
+
+    def __getLeague(self) -> League:
+        owners, teams1 = getNDefaultOwnersAndTeams(2)
+        matchup1 = Matchup(
+            teamAId=teams1[0].id, teamBId=teams1[1].id, teamAScore=1, teamBScore=2
+        )
+        matchup2 = Matchup(
+            teamAId=teams1[1].id,
+            teamBId=teams1[0].id,
+            teamAScore=3.5,
+            teamBScore=4,
+            matchupType=MatchupType.PLAYOFF,
+        )
+        year1 = Year(
+            yearNumber=2000,
+            teams=teams1,
+            weeks=[
+                Week(weekNumber=1, matchups=[matchup1]),
+                Week(weekNumber=2, matchups=[matchup2]),
+            ],
+        )
+        teams2 = getTeamsFromOwners(owners)
+        matchup3 = Matchup(
+            teamAId=teams2[0].id, teamBId=teams2[1].id, teamAScore=5, teamBScore=6
+        )
+        year2 = Year(
+            yearNumber=2001,
+            teams=teams2,
+            weeks=[Week(weekNumber=1, matchups=[matchup3])],
+        )
+        return League(name="TEST", owners=owners, years=[year1, year2])
+
+    def test_iterYearMatchupRows_happyPath(self):
+        league = self.__getLeague()
+        year = league.years[0]
+        matchup1 = year.weeks[0].matchups[0]
+        teams = year.teams
+
+        rows = iterYearMatchupRows(year)
+
+        self.assertIsInstance(rows, types.GeneratorType)
+        rows = list(rows)
+        self.assertEqual(4, len(rows))
+        self.assertEqual(
+            MatchupStatRow(
+                modifiedMatchupId=f"{matchup1.id}A",
+                matchupId=matchup1.id,
+                yearNumber=2000,
+                weekNumber=1,
+                teamForName=teams[0].name,
+                ownerForId=teams[0].ownerId,
+                teamAgainstName=teams[1].name,
+                ownerAgainstId=teams[1].ownerId,
+                matchupType="REGULAR_SEASON",
+                pointsFor=1,
+                pointsAgainst=2,
+            ),
+            rows[0],
+        )
+        self.assertEqual(f"{matchup1.id}B", rows[1].modifiedMatchupId)
+        self.assertEqual(teams[1].name, rows[1].teamForName)
+        self.assertEqual(2, rows[1].pointsFor)
+        self.assertEqual(1, rows[1].pointsAgainst)
+        self.assertEqual("PLAYOFF", rows[2].matchupType)
+        self.assertEqual(2, rows[2].weekNumber)
+
+    def test_iterYearMatchupRows_filtersGiven(self):
+        league = self.__getLeague()
+
+        rows = list(iterYearMatchupRows(league.years[0], onlyPostSeason=True))
+
+        self.assertEqual(2, len(rows))
+        self.assertEqual({"PLAYOFF"}, {row.matchupType for row in rows})
+
+    def test_iterYearMatchupRows_doesNotScanTeamsForEachMatchup(self):
+        league = self.__getLeague()
+
+        with patch(
+            "leeger.util.excel_helper.YearNavigator.getTeamById"
+        ) as mockGetTeamById:
+            rows = list(iterYearMatchupRows(league.years[0]))
+
+        self.assertEqual(4, len(rows))
+        mockGetTeamById.assert_not_called()
+
+    def test_iterAllTimeMatchupRows_happyPath(self):
+        league = self.__getLeague()
+
+        rows = list(iterAllTimeMatchupRows(league))
+
+        self.assertEqual(6, len(rows))
+        self.assertEqual(
+            [2000, 2000, 2000, 2000, 2001, 2001], [row.yearNumber for row in rows]
+        )
+
+        rows = list(
+            iterAllTimeMatchupRows(league, yearNumberStart=2001, yearNumberEnd=2001)
+        )
+        self.assertEqual([2001, 2001], [row.yearNumber for row in rows])
+
+    def test_yearMatchupsStatSheet_happyPath(self):
+        league = self.__getLeague()
+        year = league.years[0]
+        matchup1 = year.weeks[0].matchups[0]
+
+        titlesAndStatDicts, modifiedMatchupIdToOwnerIdMap = yearMatchupsStatSheet(
+            year, includeOwnerIds=True, includeYears=True
+        )
+
+        self.assertEqual(
+            [
+                "Team For",
+                "Owner ID For",
+                "Team Against",
+                "Owner ID Against",
+                "Year",
+                "Week Number",
+                "Matchup Type",
+                "Points For",
+                "Points Against",
+            ],
+            [title for title, _ in titlesAndStatDicts],
+        )
+        self.assertEqual(4, len(modifiedMatchupIdToOwnerIdMap))
+        self.assertEqual(
+            year.teams[0].ownerId, modifiedMatchupIdToOwnerIdMap[f"{matchup1.id}A"]
+        )
+        statDicts = dict(titlesAndStatDicts)
+        self.assertEqual(1, statDicts["Points For"][f"{matchup1.id}A"])
+        self.assertEqual(2, statDicts["Points For"][f"{matchup1.id}B"])
+        self.assertEqual(2000, statDicts["Year"][f"{matchup1.id}B"])
+
+    def test_allTimeMatchupsStatSheet_happyPath(self):
+        league = self.__getLeague()
+        matchup3 = league.years[1].weeks[0].matchups[0]
+
+        titlesAndStatDicts, modifiedMatchupIdToOwnerIdMap = allTimeMatchupsStatSheet(
+            league
+        )
+
+        self.assertEqual(
+            [
+                "Team For",
+                "Owner For",
+                "Team Against",
+                "Owner Against",
+                "Year",
+                "Week Number",
+                "Matchup Type",
+                "Points For",
+                "Points Against",
+            ],
+            [title for title, _ in titlesAndStatDicts],
+        )
+        self.assertEqual(6, len(modifiedMatchupIdToOwnerIdMap))
+        statDicts = dict(titlesAndStatDicts)
+        self.assertEqual(
+            league.owners[1].name, statDicts["Owner For"][f"{matchup3.id}B"]
+        )
+        self.assertEqual(
+            league.owners[0].name, statDicts["Owner Against"][f"{matchup3.id}B"]
+        )
+        self.assertEqual(2001, statDicts["Year"][f"{matchup3.id}B"])
+        self.assertEqual(6, statDicts["Points For"][f"{matchup3.id}B"])
@@ -0,0 +1,143 @@
+import io
+import json
+import unittest
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league import YearSettings
+from leeger.model.league.Division import Division
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.json_stream import iterLeaguesJson, writeLeagueJson, writeLeaguesJson
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestJsonStream(unittest.TestCase):
+    def __getLeague(self, name: str = "LEAGUE") -> League:
+        owners, teams1 = getNDefaultOwnersAndTeams(2)
+        division = Division(name="d1")
+        for team in teams1:
+            team.divisionId = division.id
+        matchup1 = Matchup(
+            teamAId=teams1[0].id,
+            teamBId=teams1[1].id,
+            teamAScore=1.1,
+            teamBScore=2,
+            multiWeekMatchupId="mwmid",
+            matchupType=MatchupType.CHAMPIONSHIP,
+        )
+        week1 = Week(weekNumber=1, matchups=[matchup1])
+        year1 = Year(
+            yearNumber=2000,
+            teams=teams1,
+            weeks=[week1],
+            divisions=[division],
+            yearSettings=YearSettings(leagueMedianGames=True),
+        )
+
+        teams2 = getTeamsFromOwners(owners)
+        matchup2 = Matchup(
+            teamAId=teams2[0].id,
+            teamBId=teams2[1].id,
+            teamAScore=123456789,
+            teamBScore=0.5,
+            teamBHasTiebreaker=True,
+        )
+        week2 = Week(weekNumber=1, matchups=[matchup2])
+        year2 = Year(yearNumber=2001, teams=teams2, weeks=[week2])
+
+        return League(name=name, owners=owners, years=[year1, year2])
+
+    def test_writeLeagueJson_matchesToJson(self):
+        league = self.__getLeague()
+        fileObj = io.StringIO()
+
+        writeLeagueJson(league, fileObj)
+
+        self.assertEqual(league.toJson(), json.loads(fileObj.getvalue()))
+
+    def test_writeLeaguesJson_writesJsonArray(self):
+        league1 = self.__getLeague("l1")
+        league2 = self.__getLeague("l2")
+        fileObj = io.StringIO()
+
+        writeLeaguesJson((league for league in [league1, league2]), fileObj)
+
+        self.assertEqual(
+            [league1.toJson(), league2.toJson()], json.loads(fileObj.getvalue())
+        )
+
+    def test_writeLeaguesJson_noLeagues_writesEmptyArray(self):
+        fileObj = io.StringIO()
+
+        writeLeaguesJson([], fileObj)
+
+        self.assertEqual([], json.loads(fileObj.getvalue()))
+
+    def test_iterLeaguesJson_singleLeague_happyPath(self):
+        league = self.__getLeague()
+        fileObj = io.StringIO()
+        writeLeagueJson(league, fileObj)
+        fileObj.seek(0)
+
+        leagues = list(iterLeaguesJson(fileObj))
+
+        self.assertEqual(1, len(leagues))
+        self.assertTrue(league.equals(leagues[0]))
+
+    def test_iterLeaguesJson_multipleLeagues_happyPath(self):
+        league1 = self.__getLeague("l1")
+        league2 = self.__getLeague("l2")
+        fileObj = io.StringIO()
+        writeLeaguesJson([league1, league2], fileObj)
+        fileObj.seek(0)
+
+        leagues = list(iterLeaguesJson(fileObj))
+
+        self.assertEqual(2, len(leagues))
+        self.assertTrue(league1.equals(leagues[0]))
+        self.assertTrue(league2.equals(leagues[1]))
+
+    def test_iterLeaguesJson_smallChunkSize_happyPath(self):
+        league1 = self.__getLeague("l1")
+        league2 = self.__getLeague("l2")
+        fileObj = io.StringIO()
+        writeLeaguesJson([league1, league2], fileObj)
+        fileObj.seek(0)
+
+        leagues = list(iterLeaguesJson(fileObj, chunkSize=1))
+
+        self.assertEqual(2, len(leagues))
+        self.assertTrue(league1.equals(leagues[0]))
+        self.assertTrue(league2.equals(leagues[1]))
+
+    def test_iterLeaguesJson_readsIndentedToJsonOutput(self):
+        league = self.__getLeague()
+        fileObj = io.StringIO(json.dumps([league.toJson()], indent=4))
+
+        leagues = list(iterLeaguesJson(fileObj, chunkSize=7))
+
+        self.assertEqual(1, len(leagues))
+        self.assertTrue(league.equals(leagues[0]))
+        self.assertEqual(league.toJson(), leagues[0].toJson())
+
+    def test_iterLeaguesJson_emptyArray_yieldsNothing(self):
+        self.assertEqual([], list(iterLeaguesJson(io.StringIO(" [ ] "))))
+
+    def test_iterLeaguesJson_invalidJson_raisesException(self):
+        with self.assertRaises(ValueError) as context:
+            list(iterLeaguesJson(io.StringIO('"foo"')))
+        self.assertEqual(
+            "Expected League JSON object or array, found '\"'.",
+            str(context.exception),
+        )
+
+        with self.assertRaises(ValueError):
+            list(iterLeaguesJson(io.StringIO('{"id": "a", "name": ')))
+
+        with self.assertRaises(ValueError) as context:
+            list(iterLeaguesJson(io.StringIO("[] []")))
+        self.assertEqual(
+            "Expected end of League JSON, found '['.", str(context.exception)
+        )
@@ -0,0 +1,104 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import leeger
+
+
+class TestLazyImport(unittest.TestCase):
+    # generous upper bound for a cold import, this guards against accidentally importing platform SDKs again
+    __IMPORT_TIME_BUDGET_SECONDS = 1.0
+    __PLATFORM_SDK_MODULES = [
+        "espn_api",
+        "sleeper",
+        "yahoofantasy",
+        "pymfl",
+        "fleaflicker",
+    ]
+
+    def __runInFreshInterpreter(self, code: str) -> str:
+        """
+        Runs the given code in a new Python process (so nothing is already imported) and returns what it printed.
+        """
+        projectRoot = os.path.dirname(os.path.dirname(leeger.__file__))
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=projectRoot,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+
+    def test_importLeagueLoader_doesNotImportPlatformSdks(self):
+        output = self.__runInFreshInterpreter(
+            "import sys\n"
+            "import leeger.league_loader\n"
+            f"print(sorted(m for m in {self.__PLATFORM_SDK_MODULES} if m in sys.modules))"
+        )
+        self.assertEqual("[]", output)
+
+    def test_importLeagueLoaderClass_onlyImportsItsPlatformSdk(self):
+        output = self.__runInFreshInterpreter(
+            "import sys\n"
+            "from leeger.league_loader import ESPNLeagueLoader\n"
+            "print(ESPNLeagueLoader.__name__)\n"
+            f"print(sorted(m for m in {self.__PLATFORM_SDK_MODULES} if m in sys.modules))"
+        )
+        self.assertEqual("ESPNLeagueLoader\n['espn_api']", output)
+
+    def test_importStatsModules_doesNotImportPlatformSdks(self):
+        output = self.__runInFreshInterpreter(
+            "import sys\n"
+            "import leeger.model.league\n"
+            "import leeger.util.CustomLogger\n"
+            "import leeger.util.stat_sheet\n"
+            "import leeger.util.excel\n"
+            f"print(sorted(m for m in {self.__PLATFORM_SDK_MODULES} if m in sys.modules))"
+        )
+        self.assertEqual("[]", output)
+
+    def test_importCalculatorPackages_doesNotImportCalculators(self):
+        output = self.__runInFreshInterpreter(
+            "import sys\n"
+            "import leeger.calculator.all_time_calculator\n"
+            "import leeger.calculator.year_calculator\n"
+            "import leeger.util.stat_sheet\n"
+            "print(len([m for m in sys.modules if m.endswith('Calculator') and 'parent' not in m]))\n"
+            "from leeger.calculator.year_calculator import AWALYearCalculator\n"
+            "print(AWALYearCalculator.__name__)"
+        )
+        self.assertEqual("0\nAWALYearCalculator", output)
+
+    def test_importSubmoduleFirst_packageAttributeIsClass(self):
+        output = self.__runInFreshInterpreter(
+            "import leeger.league_loader.SleeperLeagueLoader\n"
+            "import leeger.league_loader as leagueLoader\n"
+            "from leeger.league_loader import SleeperLeagueLoader\n"
+            "print(isinstance(leagueLoader.SleeperLeagueLoader, type))\n"
+            "print(SleeperLeagueLoader is leagueLoader.SleeperLeagueLoader)"
+        )
+        self.assertEqual("True\nTrue", output)
+
+    def test_unknownAttribute_raisesException(self):
+        import leeger.league_loader
+
+        with self.assertRaises(AttributeError) as context:
+            leeger.league_loader.FooLeagueLoader
+        self.assertEqual(
+            "module 'leeger.league_loader' has no attribute 'FooLeagueLoader'",
+            str(context.exception),
+        )
+        self.assertIn("YahooLeagueLoader", dir(leeger.league_loader))
+
+    def test_coldImportTime_isWithinBudget(self):
+        output = self.__runInFreshInterpreter(
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import leeger.league_loader\n"
+            "import leeger.model.league\n"
+            "import leeger.util.stat_sheet\n"
+            "print(time.perf_counter() - start)"
+        )
+        self.assertLess(float(output), self.__IMPORT_TIME_BUDGET_SECONDS)
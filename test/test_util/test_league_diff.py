@@ -0,0 +1,275 @@
+import copy
+import json
+import unittest
+from unittest.mock import patch
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.enum.PatchOperationType import PatchOperationType
+from leeger.exception import DoesNotExistException
+from leeger.model.league.Division import Division
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.patch import LeaguePatch, PatchOperation
+from leeger.util import league_diff
+from leeger.util.league_diff import applyPatch, diffLeagues
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestLeagueDiff(unittest.TestCase):
+    def __getLeague(self, yearNumbers: list[int]) -> League:
+        owners, _ = getNDefaultOwnersAndTeams(4)
+        years = list()
+        for yearNumber in yearNumbers:
+            teams = getTeamsFromOwners(owners)
+            weeks = list()
+            for weekNumber in range(1, 3):
+                weeks.append(
+                    Week(
+                        weekNumber=weekNumber,
+                        matchups=[
+                            Matchup(
+                                teamAId=teams[0].id,
+                                teamBId=teams[1].id,
+                                teamAScore=100 + weekNumber,
+                                teamBScore=90,
+                            ),
+                            Matchup(
+                                teamAId=teams[2].id,
+                                teamBId=teams[3].id,
+                                teamAScore=80,
+                                teamBScore=85.5,
+                            ),
+                        ],
+                    )
+                )
+            for weekNumber in range(3, 5):
+                weeks.append(
+                    Week(
+                        weekNumber=weekNumber,
+                        matchups=[
+                            Matchup(
+                                teamAId=teams[0].id,
+                                teamBId=teams[1].id,
+                                teamAScore=weekNumber * 10,
+                                teamBScore=4,
+                                matchupType=MatchupType.PLAYOFF,
+                                multiWeekMatchupId=f"mw{yearNumber}",
+                            )
+                        ],
+                    )
+                )
+            years.append(Year(yearNumber=yearNumber, teams=teams, weeks=weeks))
+        return League(name="LEAGUE", owners=owners, years=years)
+
+    def test_diffLeagues_sameLeague_returnsEmptyPatch(self):
+        league = self.__getLeague([2000, 2001])
+
+        self.assertTrue(diffLeagues(league, copy.deepcopy(league)).isEmpty())
+        self.assertTrue(diffLeagues(league, league).isEmpty())
+
+    def test_diffLeagues_reloadedLeagueWithNewIds_returnsEmptyPatch(self):
+        league1 = self.__getLeague([2000, 2001])
+        league2 = self.__getLeague([2000, 2001])
+
+        self.assertTrue(diffLeagues(league1, league2).isEmpty())
+
+    def test_diffLeagues_changedScore_onlyChangedWeekIsDiffed(self):
+        yearNumbers = list(range(2000, 2020))
+        for oldLeague, newLeague in (
+            # same IDs, so unchanged subtrees are skipped by fingerprint
+            (
+                self.__getLeague(yearNumbers),
+                None,
+            ),
+            # new IDs, as if the league was loaded again
+            (
+                self.__getLeague(yearNumbers),
+                self.__getLeague(yearNumbers),
+            ),
+        ):
+            if newLeague is None:
+                newLeague = copy.deepcopy(oldLeague)
+            newLeague.getYearByYearNumber(2010).getWeekByWeekNumber(2).matchups[
+                1
+            ].teamBScore = 85.75
+
+            with patch.object(
+                league_diff, "_diffWeeks", wraps=league_diff._diffWeeks
+            ) as mockDiffWeeks:
+                leaguePatch = diffLeagues(oldLeague, newLeague)
+
+            mockDiffWeeks.assert_called_once()
+            self.assertEqual(
+                [
+                    PatchOperation(
+                        operationType=PatchOperationType.UPDATE_MATCHUP,
+                        yearNumber=2010,
+                        weekNumber=2,
+                        key=("3", "4"),
+                        value={"teamBScore": 85.75},
+                        previousValue={"teamBScore": 85.5},
+                    )
+                ],
+                leaguePatch.operations,
+            )
+
+    def test_diffLeagues_sameIds_unchangedWeeksAreNotWalked(self):
+        oldLeague = self.__getLeague(list(range(2000, 2020)))
+        newLeague = copy.deepcopy(oldLeague)
+        newLeague.years[5].weeks[0].matchups[0].teamAScore = 1
+
+        with patch.object(
+            league_diff._YearView,
+            "getNaturalMatchupsByKey",
+            autospec=True,
+            side_effect=league_diff._YearView.getNaturalMatchupsByKey,
+        ) as mockGetNaturalMatchupsByKey:
+            leaguePatch = diffLeagues(oldLeague, newLeague)
+
+        # once for the old week and once for the new week
+        self.assertEqual(2, mockGetNaturalMatchupsByKey.call_count)
+        self.assertEqual(1, len(leaguePatch.operations))
+
+    def test_diffLeagues_newIds_unchangedYearsAreNotWalkedOnceFingerprinted(self):
+        oldLeague = self.__getLeague(list(range(2000, 2020)))
+        # loaded again, so every ID is new
+        newLeague = self.__getLeague(list(range(2000, 2020)))
+        self.assertTrue(diffLeagues(oldLeague, newLeague).isEmpty())
+        newLeague.years[5].weeks[0].matchups[0].teamAScore = 1
+
+        with patch.object(
+            league_diff._YearView,
+            "getNaturalMatchupsByKey",
+            autospec=True,
+            side_effect=league_diff._YearView.getNaturalMatchupsByKey,
+        ) as mockGetNaturalMatchupsByKey:
+            leaguePatch = diffLeagues(oldLeague, newLeague)
+
+        # once to fingerprint the changed week, then once for the old week and once for the new week
+        self.assertEqual(3, mockGetNaturalMatchupsByKey.call_count)
+        self.assertEqual(1, len(leaguePatch.operations))
+        self.assertEqual(2005, leaguePatch.operations[0].yearNumber)
+
+    def test_diffLeagues_matchupWithTeamsSwapped_returnsEmptyPatch(self):
+        oldLeague = self.__getLeague([2000])
+        newLeague = copy.deepcopy(oldLeague)
+        matchup = newLeague.years[0].weeks[0].matchups[0]
+        matchup.teamAId, matchup.teamBId = matchup.teamBId, matchup.teamAId
+        matchup.teamAScore, matchup.teamBScore = matchup.teamBScore, matchup.teamAScore
+
+        self.assertTrue(diffLeagues(oldLeague, newLeague).isEmpty())
+
+        matchup.teamAScore = 95
+        leaguePatch = diffLeagues(oldLeague, newLeague)
+        patchedLeague = applyPatch(oldLeague, leaguePatch)
+
+        # team A in the patch is the team with the owner name that sorts first
+        self.assertEqual({"teamBScore": 95}, leaguePatch.operations[0].value)
+        self.assertEqual(95, patchedLeague.years[0].weeks[0].matchups[0].teamBScore)
+        self.assertTrue(diffLeagues(patchedLeague, newLeague).isEmpty())
+
+    def test_diffLeagues_addedWeekAndRenamedTeam(self):
+        newLeague = self.__getLeague([2000, 2001])
+        oldLeague = copy.deepcopy(newLeague)
+        oldLeague.years[1].weeks.pop()
+        oldLeague.years[1].teams[2].name = "old name"
+
+        leaguePatch = diffLeagues(oldLeague, newLeague)
+
+        self.assertEqual(
+            [
+                PatchOperationType.UPDATE_TEAM,
+                PatchOperationType.ADD_WEEK,
+            ],
+            [operation.operationType for operation in leaguePatch.operations],
+        )
+        self.assertEqual({"name": "3"}, leaguePatch.operations[0].value)
+        self.assertEqual({"name": "old name"}, leaguePatch.operations[0].previousValue)
+        self.assertEqual(4, leaguePatch.operations[1].weekNumber)
+
+        patchedLeague = applyPatch(oldLeague, leaguePatch)
+
+        self.assertTrue(diffLeagues(patchedLeague, newLeague).isEmpty())
+        # the multi-week matchup in the added week is linked to the stored week before it
+        self.assertEqual(
+            patchedLeague.years[1].weeks[2].matchups[0].multiWeekMatchupId,
+            patchedLeague.years[1].weeks[3].matchups[0].multiWeekMatchupId,
+        )
+
+    def test_applyPatch_reloadedLeague_bringsStoredLeagueUpToDate(self):
+        storedLeague = self.__getLeague([2000, 2001])
+        newLeague = self.__getLeague([2000, 2001, 2002])
+        newLeague.name = "NEW NAME"
+        newLeague.years[0].weeks[1].matchups[0].teamAScore = 0
+        division1, division2 = Division(name="d1"), Division(name="d2")
+        newLeague.years[1].divisions = [division1, division2]
+        for i, team in enumerate(newLeague.years[1].teams):
+            team.divisionId = division1.id if i < 2 else division2.id
+        storedLeagueJson = storedLeague.toJson()
+
+        leaguePatch = diffLeagues(storedLeague, newLeague)
+        patchedLeague = applyPatch(storedLeague, leaguePatch)
+
+        self.assertTrue(diffLeagues(patchedLeague, newLeague).isEmpty())
+        self.assertEqual("NEW NAME", patchedLeague.name)
+        self.assertEqual(3, len(patchedLeague.years))
+        # IDs of the stored League are kept
+        self.assertEqual(storedLeague.id, patchedLeague.id)
+        self.assertEqual(storedLeague.years[0].id, patchedLeague.years[0].id)
+        # the given League is not changed
+        self.assertEqual(storedLeagueJson, storedLeague.toJson())
+
+    def test_applyPatch_ownersAddedAndRemoved(self):
+        oldLeague = self.__getLeague([2000])
+        newLeague = copy.deepcopy(oldLeague)
+        newLeague.owners[3].name = "new owner"
+
+        leaguePatch = diffLeagues(oldLeague, newLeague)
+        patchedLeague = applyPatch(oldLeague, leaguePatch)
+
+        self.assertEqual(
+            PatchOperationType.ADD_OWNER, leaguePatch.operations[0].operationType
+        )
+        self.assertEqual(
+            PatchOperationType.REMOVE_OWNER, leaguePatch.operations[-1].operationType
+        )
+        self.assertEqual(
+            ["1", "2", "3", "new owner"],
+            [owner.name for owner in patchedLeague.owners],
+        )
+        self.assertTrue(diffLeagues(patchedLeague, newLeague).isEmpty())
+
+    def test_applyPatch_modelDoesNotExist_raisesException(self):
+        league = self.__getLeague([2000])
+        leaguePatch = LeaguePatch(
+            operations=[
+                PatchOperation(
+                    operationType=PatchOperationType.REMOVE_WEEK,
+                    yearNumber=2000,
+                    weekNumber=5,
+                )
+            ]
+        )
+
+        with self.assertRaises(DoesNotExistException) as context:
+            applyPatch(league, leaguePatch)
+        self.assertEqual(
+            "Year does not have a week with week number 5.", str(context.exception)
+        )
+
+    def test_leaguePatch_toJsonAndFromJson(self):
+        oldLeague = self.__getLeague([2000])
+        newLeague = self.__getLeague([2000, 2001])
+        newLeague.years[0].weeks[0].matchups[0].teamAScore = 1
+
+        leaguePatch = diffLeagues(oldLeague, newLeague)
+        leaguePatchFromJson = LeaguePatch.fromJson(
+            json.loads(json.dumps(leaguePatch.toJson()))
+        )
+
+        self.assertEqual(leaguePatch, leaguePatchFromJson)
+        self.assertTrue(
+            diffLeagues(applyPatch(oldLeague, leaguePatchFromJson), newLeague).isEmpty()
+        )
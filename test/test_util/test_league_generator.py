@@ -0,0 +1,155 @@
+import unittest
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.util.league_generator import generateLeague
+from leeger.validate import leagueValidation
+
+
+class TestLeagueGenerator(unittest.TestCase):
+    def test_generateLeague_defaults(self):
+        league = generateLeague()
+
+        leagueValidation.runAllChecks(league)
+        self.assertEqual(1, len(league.years))
+        self.assertEqual(2000, league.years[0].yearNumber)
+        self.assertEqual(4, len(league.owners))
+        self.assertEqual(4, len(league.years[0].teams))
+        # 13 regular season weeks, 1 semifinal week and 1 championship week
+        self.assertEqual(15, len(league.years[0].weeks))
+        self.assertTrue(league.years[0].weeks[13].isPlayoffWeek)
+        self.assertTrue(league.years[0].weeks[14].isChampionshipWeek)
+
+    def test_generateLeague_sameSeed_generatesSameLeague(self):
+        league1 = generateLeague(seed=123, numberOfYears=3)
+        league2 = generateLeague(seed=123, numberOfYears=3)
+        league3 = generateLeague(seed=124, numberOfYears=3)
+
+        self.assertEqual(league1.toJson(), league2.toJson())
+        self.assertNotEqual(league1.toJson(), league3.toJson())
+
+    def test_generateLeague_manyOptions_passesValidation(self):
+        for kwargs in (
+            {"numberOfTeams": 2, "numberOfPlayoffTeams": 2},
+            {"numberOfTeams": 5, "numberOfPlayoffTeams": 2, "numberOfDivisions": 2},
+            {"numberOfTeams": 3, "numberOfPlayoffTeams": 0},
+            {
+                "numberOfTeams": 4,
+                "numberOfRegularSeasonWeeks": 0,
+                "numberOfPlayoffTeams": 4,
+            },
+            {
+                "numberOfYears": 5,
+                "numberOfTeams": 12,
+                "numberOfPlayoffTeams": 8,
+                "numberOfChampionshipWeeks": 2,
+                "numberOfDivisions": 3,
+                "leagueMedianGames": True,
+            },
+        ):
+            with self.subTest(kwargs=kwargs):
+                leagueValidation.runAllChecks(generateLeague(**kwargs))
+
+    def test_generateLeague_multiWeekChampionship(self):
+        league = generateLeague(numberOfTeams=8, numberOfChampionshipWeeks=3)
+
+        championshipWeeks = [
+            week for week in league.years[0].weeks if week.isChampionshipWeek
+        ]
+        self.assertEqual(3, len(championshipWeeks))
+        multiWeekMatchupIds = {
+            week.matchups[0].multiWeekMatchupId for week in championshipWeeks
+        }
+        self.assertEqual(1, len(multiWeekMatchupIds))
+        self.assertIsNotNone(multiWeekMatchupIds.pop())
+        self.assertTrue(
+            all(
+                week.matchups[0].matchupType == MatchupType.CHAMPIONSHIP
+                for week in championshipWeeks
+            )
+        )
+
+    def test_generateLeague_divisionsAndLeagueMedianGames(self):
+        league = generateLeague(
+            numberOfTeams=10, numberOfDivisions=3, leagueMedianGames=True
+        )
+
+        year = league.years[0]
+        self.assertEqual(3, len(year.divisions))
+        self.assertEqual(
+            {division.id for division in year.divisions},
+            {team.divisionId for team in year.teams},
+        )
+        self.assertTrue(year.yearSettings.leagueMedianGames)
+
+    def test_generateLeague_largeLeague_passesValidation(self):
+        league = generateLeague(
+            numberOfYears=20,
+            numberOfTeams=32,
+            numberOfPlayoffTeams=16,
+            numberOfDivisions=4,
+        )
+
+        leagueValidation.runAllChecks(league)
+        self.assertEqual(20, len(league.years))
+        self.assertEqual(16, len(league.years[0].weeks[0].matchups))
+
+    def test_generateLeague_manyYears_startYearNumberFitsInValidRange(self):
+        league = generateLeague(
+            numberOfYears=1_000,
+            numberOfTeams=2,
+            numberOfPlayoffTeams=0,
+            numberOfRegularSeasonWeeks=1,
+        )
+
+        self.assertEqual(1_000, len(league.years))
+        self.assertEqual(2000, league.years[0].yearNumber)
+        self.assertEqual(2999, league.years[-1].yearNumber)
+        self.assertEqual(
+            1920,
+            generateLeague(
+                numberOfYears=1_080,
+                numberOfTeams=2,
+                numberOfPlayoffTeams=0,
+                numberOfRegularSeasonWeeks=1,
+            )
+            .years[0]
+            .yearNumber,
+        )
+
+    def test_generateLeague_invalidArguments_raisesException(self):
+        for kwargs, message in (
+            ({"numberOfYears": 0}, "'numberOfYears' must be at least 1."),
+            ({"numberOfTeams": 1}, "'numberOfTeams' must be at least 2."),
+            (
+                {"numberOfPlayoffTeams": 3},
+                "'numberOfPlayoffTeams' must be 0 or a power of 2 that is not more than 'numberOfTeams'.",
+            ),
+            (
+                {"numberOfPlayoffTeams": 8},
+                "'numberOfPlayoffTeams' must be 0 or a power of 2 that is not more than 'numberOfTeams'.",
+            ),
+            (
+                {"numberOfChampionshipWeeks": 0},
+                "'numberOfChampionshipWeeks' must be at least 1.",
+            ),
+            (
+                {"numberOfRegularSeasonWeeks": 0, "numberOfPlayoffTeams": 2},
+                "Every Team must make the playoffs if there are no regular season Weeks.",
+            ),
+            (
+                {"numberOfDivisions": 5},
+                "'numberOfDivisions' must be between 0 and 'numberOfTeams'.",
+            ),
+            (
+                {"numberOfYears": 1_081},
+                "All year numbers must be in range 1920-2999.",
+            ),
+            (
+                {"startYearNumber": 1919},
+                "All year numbers must be in range 1920-2999.",
+            ),
+        ):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError) as context:
+                    generateLeague(**kwargs)
+                self.assertEqual(message, str(context.exception))
@@ -0,0 +1,323 @@
+import copy
+import gc
+import unittest
+import weakref
+
+import numpy
+
+from leeger.calculator.all_time_calculator.AWALAllTimeCalculator import (
+    AWALAllTimeCalculator,
+)
+from leeger.calculator.all_time_calculator.GameOutcomeAllTimeCalculator import (
+    GameOutcomeAllTimeCalculator,
+)
+from leeger.calculator.all_time_calculator.SmartWinsAllTimeCalculator import (
+    SmartWinsAllTimeCalculator,
+)
+from leeger.calculator.year_calculator.AWALYearCalculator import AWALYearCalculator
+from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
+    GameOutcomeYearCalculator,
+)
+from leeger.calculator.year_calculator.SmartWinsYearCalculator import (
+    SmartWinsYearCalculator,
+)
+from leeger.enum.MatchupType import MatchupType
+from leeger.exception import InvalidYearFormatException
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.matrix import AllPlayMatrix, HeadToHeadMatrix
+from leeger.util.league_generator import generateLeague
+from leeger.util.matrix import (
+    clearMatrixCache,
+    getLeagueAllPlayMatrix,
+    getLeagueHeadToHeadMatrix,
+    getYearAllPlayMatrix,
+    getYearHeadToHeadMatrix,
+)
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestMatrix(unittest.TestCase):
+    def setUp(self):
+        clearMatrixCache()
+
+    @staticmethod
+    def __byOwnerId(year: Year, teamIdDict: dict) -> dict:
+        teamIdToOwnerId = {team.id: team.ownerId for team in year.teams}
+        return {teamIdToOwnerId[teamId]: value for teamId, value in teamIdDict.items()}
+
+    @staticmethod
+    def __getYear() -> tuple[list, Year]:
+        owners, teams = getNDefaultOwnersAndTeams(4)
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=5, teamBScore=3
+                ),
+                Matchup(
+                    teamAId=teams[2].id, teamBId=teams[3].id, teamAScore=3, teamBScore=3
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=1,
+                    teamBScore=2,
+                    matchupType=MatchupType.PLAYOFF,
+                    multiWeekMatchupId="1",
+                )
+            ],
+        )
+        week3 = Week(
+            weekNumber=3,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=4,
+                    teamBScore=2,
+                    matchupType=MatchupType.PLAYOFF,
+                    multiWeekMatchupId="1",
+                )
+            ],
+        )
+        return owners, Year(yearNumber=2000, teams=teams, weeks=[week1, week2, week3])
+
+    def test_getYearHeadToHeadMatrix(self):
+        owners, year = self.__getYear()
+
+        matrix = getYearHeadToHeadMatrix(year)
+
+        self.assertIsInstance(matrix, HeadToHeadMatrix)
+        self.assertEqual([owner.id for owner in owners], matrix.ownerIds)
+        # the multi-week matchup is 1 game, won 5-4 by owner 1
+        self.assertEqual((2, 0, 0), matrix.getRecord(owners[0].id, owners[1].id))
+        self.assertEqual((0, 2, 0), matrix.getRecord(owners[1].id, owners[0].id))
+        self.assertEqual((0, 0, 1), matrix.getRecord(owners[2].id, owners[3].id))
+        self.assertEqual((0, 0, 0), matrix.getRecord(owners[0].id, owners[2].id))
+        self.assertEqual(10, matrix.pointsFor[0, 1])
+        self.assertEqual(7, matrix.pointsAgainst[0, 1])
+        self.assertEqual(2, matrix.gamesPlayed[1, 0])
+        self.assertEqual(
+            self.__byOwnerId(year, GameOutcomeYearCalculator.getWAL(year)),
+            matrix.getWAL(),
+        )
+
+    def test_getYearAllPlayMatrix(self):
+        owners, year = self.__getYear()
+
+        matrix = getYearAllPlayMatrix(year)
+
+        self.assertIsInstance(matrix, AllPlayMatrix)
+        self.assertEqual([(2000, 1), (2000, 2), (2000, 3)], matrix.weeks)
+        numpy.testing.assert_array_equal(
+            [[5, 3, 3, 3], [1, 2, numpy.nan, numpy.nan], [4, 2, numpy.nan, numpy.nan]],
+            matrix.scores,
+        )
+        numpy.testing.assert_array_equal(
+            [[3, 0, 0, 0], [0, 1, 0, 0], [1, 0, 0, 0]], matrix.outscored
+        )
+        numpy.testing.assert_array_equal(
+            [[0, 2, 2, 2], [0, 0, 0, 0], [0, 0, 0, 0]], matrix.tied
+        )
+        numpy.testing.assert_array_equal([3, 1, 1], matrix.opponentsInWeek)
+        self.assertEqual(
+            self.__byOwnerId(year, AWALYearCalculator.getAWAL(year)), matrix.getAWAL()
+        )
+
+    def test_yearMatrices_matchCalculators(self):
+        year = generateLeague(
+            numberOfTeams=8, numberOfPlayoffTeams=4, numberOfChampionshipWeeks=2
+        ).years[0]
+
+        for kwargs in (
+            dict(),
+            {"onlyRegularSeason": True},
+            {"onlyPostSeason": True},
+            {"weekNumberStart": 3, "weekNumberEnd": 9},
+        ):
+            with self.subTest(kwargs=kwargs):
+                self.assertEqual(
+                    self.__byOwnerId(
+                        year, GameOutcomeYearCalculator.getWAL(year, **kwargs)
+                    ),
+                    getYearHeadToHeadMatrix(year, **kwargs).getWAL(),
+                )
+                self.assertEqual(
+                    self.__byOwnerId(year, AWALYearCalculator.getAWAL(year, **kwargs)),
+                    getYearAllPlayMatrix(year, **kwargs).getAWAL(),
+                )
+
+    def test_getSmartWins_matchesCalculator(self):
+        year = generateLeague(numberOfTeams=6).years[0]
+
+        self.assertEqual(
+            self.__byOwnerId(year, SmartWinsYearCalculator.getSmartWins(year)),
+            getYearAllPlayMatrix(year).getSmartWins(),
+        )
+
+    def test_getSmartWins_multiWeekMatchups_matchesCalculators(self):
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                league = generateLeague(
+                    seed=seed,
+                    numberOfYears=2,
+                    numberOfTeams=6,
+                    numberOfPlayoffTeams=4,
+                    numberOfChampionshipWeeks=2,
+                )
+
+                for year in league.years:
+                    self.assertEqual(
+                        self.__byOwnerId(
+                            year, SmartWinsYearCalculator.getSmartWins(year)
+                        ),
+                        getYearAllPlayMatrix(year).getSmartWins(),
+                    )
+                self.assertEqual(
+                    SmartWinsAllTimeCalculator.getSmartWins(league),
+                    getLeagueAllPlayMatrix(league).getSmartWins(),
+                )
+
+    def test_leagueMatrices_matchCalculators(self):
+        league = generateLeague(
+            numberOfYears=3,
+            numberOfTeams=6,
+            numberOfPlayoffTeams=4,
+            numberOfChampionshipWeeks=2,
+        )
+
+        for kwargs in (
+            dict(),
+            {"onlyRegularSeason": True},
+            {
+                "yearNumberStart": 2000,
+                "weekNumberStart": 5,
+                "yearNumberEnd": 2001,
+                "weekNumberEnd": 6,
+            },
+        ):
+            with self.subTest(kwargs=kwargs):
+                headToHeadMatrix = getLeagueHeadToHeadMatrix(league, **kwargs)
+                allPlayMatrix = getLeagueAllPlayMatrix(league, **kwargs)
+
+                self.assertEqual(
+                    [owner.id for owner in league.owners], headToHeadMatrix.ownerIds
+                )
+                self.assertEqual(
+                    GameOutcomeAllTimeCalculator.getWAL(league, **kwargs),
+                    headToHeadMatrix.getWAL(),
+                )
+                self.assertEqual(
+                    AWALAllTimeCalculator.getAWAL(league, **kwargs),
+                    allPlayMatrix.getAWAL(),
+                )
+
+        allPlayMatrix = getLeagueAllPlayMatrix(league)
+        self.assertEqual(3 * 16, len(allPlayMatrix.weeks))
+        self.assertEqual((2001, 1), allPlayMatrix.weeks[16])
+
+    def test_getLeagueHeadToHeadMatrix_ownerNotInEveryYear(self):
+        owners, year1 = self.__getYear()
+        _, teams = getNDefaultOwnersAndTeams(2)
+        teams[0].ownerId = owners[0].id
+        teams[1].ownerId = owners[1].id
+        year2 = Year(
+            yearNumber=2001,
+            teams=teams,
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams[1].id,
+                            teamBId=teams[0].id,
+                            teamAScore=9,
+                            teamBScore=1,
+                        )
+                    ],
+                )
+            ],
+        )
+        league = League(name="L", owners=owners, years=[year1, year2])
+
+        headToHeadMatrix = getLeagueHeadToHeadMatrix(league)
+        allPlayMatrix = getLeagueAllPlayMatrix(league)
+
+        self.assertEqual(
+            (2, 1, 0), headToHeadMatrix.getRecord(owners[0].id, owners[1].id)
+        )
+        self.assertEqual(
+            (0, 0, 1), headToHeadMatrix.getRecord(owners[3].id, owners[2].id)
+        )
+        self.assertTrue(numpy.isnan(allPlayMatrix.scores[3, 2]))
+        self.assertEqual(AWALAllTimeCalculator.getAWAL(league), allPlayMatrix.getAWAL())
+
+    def test_headToHeadMatrix_add(self):
+        owners, year = self.__getYear()
+        matrix = getYearHeadToHeadMatrix(year)
+        otherMatrix = HeadToHeadMatrix(
+            ownerIds=[owners[1].id, "newOwnerId"],
+            wins=numpy.array([[0, 1], [0, 0]]),
+            losses=numpy.array([[0, 0], [1, 0]]),
+            ties=numpy.zeros((2, 2), dtype=int),
+            pointsFor=numpy.array([[0.0, 10.0], [5.0, 0.0]]),
+        )
+
+        combined = matrix + otherMatrix
+
+        self.assertEqual(
+            [owner.id for owner in owners] + ["newOwnerId"], combined.ownerIds
+        )
+        self.assertEqual((1, 0, 0), combined.getRecord(owners[1].id, "newOwnerId"))
+        self.assertEqual((0, 2, 0), combined.getRecord(owners[1].id, owners[0].id))
+        self.assertEqual(5, combined.pointsAgainst[1, 4])
+
+    def test_matrices_areCachedAndReadOnly(self):
+        _, year = self.__getYear()
+
+        self.assertIs(getYearAllPlayMatrix(year), getYearAllPlayMatrix(year))
+        self.assertIs(
+            getYearHeadToHeadMatrix(year, onlyPostSeason=True),
+            getYearHeadToHeadMatrix(year, onlyPostSeason=True, validate=False),
+        )
+        self.assertIsNot(
+            getYearHeadToHeadMatrix(year),
+            getYearHeadToHeadMatrix(year, onlyPostSeason=True),
+        )
+        with self.assertRaises(ValueError):
+            getYearHeadToHeadMatrix(year).wins[0, 0] = 1
+        with self.assertRaises(ValueError):
+            getYearAllPlayMatrix(year).scores[0, 0] = 1
+
+        # changing the Year gives a new matrix
+        matrix = getYearAllPlayMatrix(year)
+        year.weeks[0].matchups[0].teamAScore = 100
+        self.assertIsNot(matrix, getYearAllPlayMatrix(year))
+        self.assertEqual(100, getYearAllPlayMatrix(year).scores[0, 0])
+
+    def test_matrixCache_doesNotKeepYearAlive(self):
+        _, year = self.__getYear()
+        # validation has its own cache of Years
+        matrix = getYearAllPlayMatrix(year, validate=False)
+        yearReference = weakref.ref(year)
+
+        # an equal Year (e.g. loaded again) gets the cached matrix
+        self.assertIs(matrix, getYearAllPlayMatrix(copy.deepcopy(year), validate=False))
+        del year
+        gc.collect()
+        self.assertIsNone(yearReference())
+
+    def test_getYearHeadToHeadMatrix_invalidYear_raisesException(self):
+        _, year = self.__getYear()
+        year.yearNumber = 1800
+
+        with self.assertRaises(InvalidYearFormatException):
+            getYearHeadToHeadMatrix(year)
@@ -0,0 +1,167 @@
+import unittest
+from unittest.mock import patch
+
+from leeger.calculator.year_calculator.AWALYearCalculator import AWALYearCalculator
+from leeger.calculator.year_calculator.GameOutcomeYearCalculator import (
+    GameOutcomeYearCalculator,
+)
+from leeger.calculator.year_calculator.PointsScoredYearCalculator import (
+    PointsScoredYearCalculator,
+)
+from leeger.calculator.year_calculator.TeamSummaryYearCalculator import (
+    TeamSummaryYearCalculator,
+)
+from leeger.enum.MatchupType import MatchupType
+from leeger.exception import InvalidFilterException, InvalidYearFormatException
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.league_generator import generateLeague
+from leeger.util.multi_filter import computeMany
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestMultiFilter(unittest.TestCase):
+    __STATS = [
+        GameOutcomeYearCalculator.getWins,
+        GameOutcomeYearCalculator.getLosses,
+        GameOutcomeYearCalculator.getTies,
+        PointsScoredYearCalculator.getPointsScored,
+        PointsScoredYearCalculator.getOpponentPointsScored,
+        TeamSummaryYearCalculator.getGamesPlayed,
+        AWALYearCalculator.getAWAL,
+    ]
+
+    def __assertSameAsCallingEachStat(self, year: Year, filterSets: list[dict]):
+        results = computeMany(year, self.__STATS, filterSets)
+
+        self.assertEqual(len(filterSets), len(results))
+        for filterSet, result in zip(filterSets, results):
+            self.assertEqual(set(self.__STATS), set(result.keys()))
+            for stat in self.__STATS:
+                with self.subTest(filterSet=filterSet, stat=stat.__name__):
+                    self.assertEqual(stat(year, **filterSet), result[stat])
+
+    def test_computeMany_generatedYear(self):
+        year = generateLeague(
+            numberOfTeams=6,
+            numberOfPlayoffTeams=4,
+            numberOfRegularSeasonWeeks=5,
+            numberOfChampionshipWeeks=2,
+        ).years[0]
+
+        self.__assertSameAsCallingEachStat(
+            year,
+            [
+                dict(),
+                {"onlyRegularSeason": True},
+                {"onlyPostSeason": True},
+                {"onlyChampionship": True},
+                {"weekNumberStart": 2, "weekNumberEnd": 4},
+                {"weekNumberStart": 7, "weekNumberEnd": 7},
+                {"weekNumberStart": 8, "weekNumberEnd": 8, "onlyRegularSeason": True},
+            ],
+        )
+
+    def test_computeMany_tiesTiebreakersAndTeamsWithNoGames(self):
+        owners, teams = getNDefaultOwnersAndTeams(4)
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id, teamBId=teams[1].id, teamAScore=1, teamBScore=1
+                ),
+                Matchup(
+                    teamAId=teams[2].id,
+                    teamBId=teams[3].id,
+                    teamAScore=1,
+                    teamBScore=1,
+                    teamAHasTiebreaker=True,
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=3,
+                    teamBScore=2,
+                    matchupType=MatchupType.PLAYOFF,
+                    multiWeekMatchupId="1",
+                )
+            ],
+        )
+        week3 = Week(
+            weekNumber=3,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=1,
+                    teamBScore=5,
+                    matchupType=MatchupType.PLAYOFF,
+                    multiWeekMatchupId="1",
+                )
+            ],
+        )
+        year = Year(yearNumber=2000, teams=teams, weeks=[week1, week2, week3])
+
+        self.__assertSameAsCallingEachStat(
+            year,
+            [
+                dict(),
+                {"onlyPostSeason": True},
+                {"weekNumberStart": 2, "weekNumberEnd": 2},
+            ],
+        )
+
+    def test_computeMany_otherStatsAreCalledOncePerFilterSet(self):
+        year = generateLeague(numberOfRegularSeasonWeeks=3).years[0]
+        filterSets = [dict(), {"onlyRegularSeason": True}]
+
+        with patch.object(
+            GameOutcomeYearCalculator,
+            "getWins",
+            wraps=GameOutcomeYearCalculator.getWins,
+        ) as mockGetWins:
+            results = computeMany(
+                year, [GameOutcomeYearCalculator.getWinPercentage], filterSets
+            )
+            # the fast path is not used for a stat it doesn't know about
+            self.assertEqual(2, mockGetWins.call_count)
+
+        for filterSet, result in zip(filterSets, results):
+            self.assertEqual(
+                GameOutcomeYearCalculator.getWinPercentage(year, **filterSet),
+                result[GameOutcomeYearCalculator.getWinPercentage],
+            )
+
+    def test_computeMany_noFilterSets(self):
+        year = generateLeague().years[0]
+
+        self.assertEqual(list(), computeMany(year, self.__STATS, list()))
+
+    def test_computeMany_invalidFilters_raisesException(self):
+        year = generateLeague().years[0]
+
+        with self.assertRaises(InvalidFilterException) as context:
+            computeMany(
+                year,
+                self.__STATS,
+                [dict(), {"onlyRegularSeason": True, "onlyPostSeason": True}],
+            )
+        self.assertEqual(
+            "Only one of 'onlyChampionship', 'onlyPostSeason', 'onlyRegularSeason' can be True",
+            str(context.exception),
+        )
+
+    def test_computeMany_invalidYear_raisesException(self):
+        year = generateLeague().years[0]
+        year.yearNumber = 1800
+
+        with self.assertRaises(InvalidYearFormatException):
+            computeMany(year, self.__STATS, [dict()])
+        # not validated when validate=False is given
+        computeMany(year, [GameOutcomeYearCalculator.getWins], [dict()], validate=False)
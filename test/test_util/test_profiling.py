@@ -0,0 +1,198 @@
+import functools
+import threading
+import unittest
+from unittest import mock
+
+import leeger
+from leeger.calculator.year_calculator import AWALYearCalculator
+from leeger.model.league.Year import Year
+from leeger.model.profile import CallRecord
+from leeger.util import profiling
+from leeger.util.league_generator import generateLeague
+from leeger.util.navigator import YearNavigator
+from leeger.util.profiling import Profile, ProfileSink
+from leeger.util.stat_sheet import yearStatSheet
+from leeger.validate import yearValidation
+
+
+class TestProfiling(unittest.TestCase):
+    def test_profile_recordsCallsWithYearBreakdown(self):
+        league = generateLeague(numberOfYears=2)
+
+        with leeger.profile() as p:
+            AWALYearCalculator.getAWAL(league.years[0])
+            AWALYearCalculator.getAWAL(league.years[1])
+            AWALYearCalculator.getAWAL(league.years[1])
+
+        self.assertIsInstance(p, Profile)
+        stats = p.stats["AWALYearCalculator.getAWAL"]
+        self.assertEqual(3, stats.calls)
+        self.assertEqual(
+            {2000: 1, 2001: 2}, {y: s.calls for y, s in stats.years.items()}
+        )
+        self.assertGreater(stats.totalTime, 0)
+        self.assertLessEqual(stats.selfTime, stats.totalTime)
+        # calls made by the calculator are profiled too
+        self.assertIn("YearNavigator.getAllTeamIds", p.stats)
+        self.assertIn("yearValidation.runAllChecks", p.stats)
+
+    def test_profile_recordsCacheHits(self):
+        league = generateLeague()
+        yearValidation.runAllChecks(league.years[0])
+
+        with leeger.profile() as p:
+            yearValidation.runAllChecks(league.years[0])
+
+        self.assertEqual(1, p.stats["yearValidation.runAllChecks"].cacheHits)
+        # the cache functions are still available while profiling
+        with leeger.profile():
+            self.assertTrue(hasattr(yearValidation.runAllChecks, "cache_clear"))
+
+    def test_profile_selfTimeDoesNotIncludeProfiledCallsMade(self):
+        league = generateLeague()
+
+        with leeger.profile() as p:
+            yearStatSheet(league.years[0])
+
+        for stats in p.stats.values():
+            self.assertLessEqual(stats.selfTime, stats.totalTime + 1e-9)
+        totalSelfTime = sum(stats.selfTime for stats in p.stats.values())
+        longestTotalTime = max(stats.totalTime for stats in p.stats.values())
+        self.assertGreaterEqual(totalSelfTime, longestTotalTime * 0.99)
+
+    def test_profile_originalFunctionsAreRestored(self):
+        originalGetAWAL = vars(AWALYearCalculator)["getAWAL"]
+        originalGetAllTeamIds = vars(YearNavigator)["getAllTeamIds"]
+        originalRunAllChecks = yearValidation.runAllChecks
+
+        with leeger.profile():
+            self.assertIsNot(originalGetAWAL, vars(AWALYearCalculator)["getAWAL"])
+            self.assertIsNot(originalRunAllChecks, yearValidation.runAllChecks)
+
+        self.assertIs(originalGetAWAL, vars(AWALYearCalculator)["getAWAL"])
+        self.assertIs(originalGetAllTeamIds, vars(YearNavigator)["getAllTeamIds"])
+        self.assertIs(originalRunAllChecks, yearValidation.runAllChecks)
+
+    def test_profile_exceptionInBlock_originalFunctionsAreRestored(self):
+        originalGetAWAL = vars(AWALYearCalculator)["getAWAL"]
+
+        with self.assertRaises(ValueError):
+            with leeger.profile():
+                raise ValueError("oops")
+
+        self.assertIs(originalGetAWAL, vars(AWALYearCalculator)["getAWAL"])
+
+    def test_profile_nestedProfiles(self):
+        league = generateLeague()
+        originalGetAWAL = vars(AWALYearCalculator)["getAWAL"]
+
+        with leeger.profile() as outer:
+            AWALYearCalculator.getAWAL(league.years[0])
+            with leeger.profile() as inner:
+                AWALYearCalculator.getAWAL(league.years[0])
+            AWALYearCalculator.getAWAL(league.years[0])
+            # still wrapped, since the outer Profile is open
+            self.assertIsNot(originalGetAWAL, vars(AWALYearCalculator)["getAWAL"])
+
+        self.assertEqual(3, outer.stats["AWALYearCalculator.getAWAL"].calls)
+        self.assertEqual(1, inner.stats["AWALYearCalculator.getAWAL"].calls)
+        self.assertIs(originalGetAWAL, vars(AWALYearCalculator)["getAWAL"])
+
+    def test_profile_callsInOtherThreadsAreNotRecorded(self):
+        league = generateLeague()
+
+        with leeger.profile() as p:
+            thread = threading.Thread(
+                target=AWALYearCalculator.getAWAL, args=(league.years[0],)
+            )
+            thread.start()
+            thread.join()
+            AWALYearCalculator.getAWAL(league.years[0])
+
+        self.assertEqual(1, p.stats["AWALYearCalculator.getAWAL"].calls)
+
+    def test_profile_otherCallsToCachedFunctionAtTheSameTime_cacheHitIsNone(self):
+        @functools.lru_cache(maxsize=None)
+        def getNumber(number: int) -> int:
+            # another call to the cache is made before this one returns
+            return number if number == 0 else getNumber(number - 1)
+
+        wrapped = profiling._wrapFunction(getNumber, "getNumber", Year)
+        records = list()
+        with leeger.profile() as p:
+            with mock.patch.object(p, "record", records.append):
+                wrapped(0)
+                wrapped(0)
+                wrapped(1)
+
+        self.assertEqual([False, True, None], [r.cacheHit for r in records])
+
+    def test_profile_wrappingFails_originalFunctionsAreRestored(self):
+        originalGetAWAL = vars(AWALYearCalculator)["getAWAL"]
+        getProfiledAttributes = profiling._getProfiledAttributes
+
+        def failPartway():
+            yield next(
+                attributes
+                for attributes in getProfiledAttributes()
+                if attributes[2] == "AWALYearCalculator.getAWAL"
+            )
+            raise ImportError("oops")
+
+        with mock.patch.object(profiling, "_getProfiledAttributes", failPartway):
+            with self.assertRaises(ImportError):
+                with leeger.profile():
+                    pass
+
+        self.assertIs(originalGetAWAL, vars(AWALYearCalculator)["getAWAL"])
+        # the next Profile wraps and restores as usual
+        league = generateLeague()
+        with leeger.profile() as p:
+            AWALYearCalculator.getAWAL(league.years[0])
+        self.assertEqual(1, p.stats["AWALYearCalculator.getAWAL"].calls)
+        self.assertIs(originalGetAWAL, vars(AWALYearCalculator)["getAWAL"])
+
+    def test_profile_sink(self):
+        league = generateLeague()
+
+        class ListSink(ProfileSink):
+            def __init__(self):
+                self.callRecords = list()
+                self.closedProfiles = list()
+
+            def record(self, callRecord: CallRecord) -> None:
+                self.callRecords.append(callRecord)
+
+            def close(self, profile: Profile) -> None:
+                self.closedProfiles.append(profile)
+
+        sink = ListSink()
+        with leeger.profile(sink=sink) as p:
+            AWALYearCalculator.getAWAL(league.years[0])
+
+        self.assertEqual([p], sink.closedProfiles)
+        getAWALRecords = [
+            callRecord
+            for callRecord in sink.callRecords
+            if callRecord.name == "AWALYearCalculator.getAWAL"
+        ]
+        self.assertEqual(1, len(getAWALRecords))
+        self.assertEqual(2000, getAWALRecords[0].yearNumber)
+        self.assertIsNone(getAWALRecords[0].cacheHit)
+        self.assertFalse(getAWALRecords[0].recursive)
+        self.assertEqual(
+            sum(stats.calls for stats in p.stats.values()), len(sink.callRecords)
+        )
+
+    def test_profile_report(self):
+        league = generateLeague()
+
+        with leeger.profile() as p:
+            AWALYearCalculator.getAWAL(league.years[0])
+
+        report = p.report(sortBy="totalTime", limit=1)
+        lines = report.splitlines()
+        self.assertEqual(2, len(lines))
+        self.assertTrue(lines[0].startswith("name"))
+        self.assertTrue(lines[1].startswith("AWALYearCalculator.getAWAL"))
+        self.assertEqual(p.stats["AWALYearCalculator.getAWAL"].toJson()["calls"], 1)
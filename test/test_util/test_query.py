@@ -0,0 +1,326 @@
+import unittest
+
+import numpy
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.exception import InvalidFilterException
+from leeger.model.league.Division import Division
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.Deci import Deci
+from leeger.util.league_generator import generateLeague
+from leeger.util.query import LeagueIndex
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestQuery(unittest.TestCase):
+    @staticmethod
+    def __getLeague() -> League:
+        """
+        2017: Week 1: Team 1 100 - Team 2 90, Team 3 80 - Team 4 70
+              Week 2 (playoff): Team 1 110 - Team 3 120
+        2018 (Team 1 and Team 2 in division A, Team 3 and Team 4 in division B):
+              Week 1: Team 1 95 - Team 2 105, Team 3 100 - Team 4 100
+              Week 2: Team 1 130 - Team 3 90, Team 2 80 - Team 4 85
+              Week 3 and Week 4 (playoff, multi-week): Team 1 70 + 100 - Team 2 90 + 60
+        """
+        owners, teams2017 = getNDefaultOwnersAndTeams(4)
+        teams2018 = getTeamsFromOwners(owners)
+        divisionA = Division(name="A")
+        divisionB = Division(name="B")
+        for team, division in zip(
+            teams2018, (divisionA, divisionA, divisionB, divisionB)
+        ):
+            team.divisionId = division.id
+
+        def getWeek(weekNumber: int, games: tuple, teams: list, **kwargs) -> Week:
+            return Week(
+                weekNumber=weekNumber,
+                matchups=[
+                    Matchup(
+                        teamAId=teams[a].id,
+                        teamBId=teams[b].id,
+                        teamAScore=teamAScore,
+                        teamBScore=teamBScore,
+                        **kwargs,
+                    )
+                    for a, b, teamAScore, teamBScore in games
+                ],
+            )
+
+        year2017 = Year(
+            yearNumber=2017,
+            teams=teams2017,
+            weeks=[
+                getWeek(1, ((0, 1, 100, 90), (2, 3, 80, 70)), teams2017),
+                getWeek(
+                    2,
+                    ((0, 2, 110, 120),),
+                    teams2017,
+                    matchupType=MatchupType.PLAYOFF,
+                ),
+            ],
+        )
+        year2018 = Year(
+            yearNumber=2018,
+            teams=teams2018,
+            divisions=[divisionA, divisionB],
+            weeks=[
+                getWeek(1, ((0, 1, 95, 105), (2, 3, 100, 100)), teams2018),
+                getWeek(2, ((0, 2, 130, 90), (1, 3, 80, 85)), teams2018),
+                getWeek(
+                    3,
+                    ((0, 1, 70, 90),),
+                    teams2018,
+                    matchupType=MatchupType.PLAYOFF,
+                    multiWeekMatchupId="1",
+                ),
+                getWeek(
+                    4,
+                    ((0, 1, 100, 60),),
+                    teams2018,
+                    matchupType=MatchupType.PLAYOFF,
+                    multiWeekMatchupId="1",
+                ),
+            ],
+        )
+        return League(name="TEST", owners=owners, years=[year2017, year2018])
+
+    def test_query_happyPath(self):
+        league = self.__getLeague()
+        owner1Id = league.owners[0].id
+
+        result = (
+            LeagueIndex(league)
+            .query()
+            .where(
+                ownerIds=[owner1Id],
+                matchupTypes=[MatchupType.PLAYOFF, MatchupType.CHAMPIONSHIP],
+                yearNumberStart=2018,
+                divisionRival=True,
+            )
+            .aggregate(
+                points="sum(pointsFor)", rows="count()", winPct="winPercentage()"
+            )
+        )
+
+        self.assertEqual({"points": Deci(170), "rows": 2, "winPct": Deci(1)}, result)
+
+    def test_query_groupByOpponent(self):
+        league = self.__getLeague()
+        owner1Id, owner2Id, owner3Id, _ = [owner.id for owner in league.owners]
+
+        result = (
+            LeagueIndex(league)
+            .query()
+            .where(ownerIds=[owner1Id])
+            .groupBy("opponent")
+            .aggregate(
+                points="sum(pointsFor)", rows="count()", winPct="winPercentage()"
+            )
+        )
+
+        # the multi-week matchup is one game that Team 1 wins 170 - 150
+        self.assertEqual(
+            {
+                owner2Id: {"points": Deci(365), "rows": 4, "winPct": Deci(2) / Deci(3)},
+                owner3Id: {"points": Deci(240), "rows": 2, "winPct": Deci("0.5")},
+            },
+            result,
+        )
+
+    def test_query_groupByYearAndOwner(self):
+        leagueIndex = LeagueIndex(self.__getLeague())
+
+        self.assertEqual(
+            {2017: {"rows": 6}, 2018: {"rows": 12}},
+            leagueIndex.query().groupBy("year").aggregate(rows="count()"),
+        )
+        # Team 3 and Team 4 tie in 2018 Week 1
+        result = (
+            leagueIndex.query()
+            .where(yearNumbers=[2018], weekNumberEnd=1)
+            .groupBy("owner")
+            .aggregate(winPct="winPercentage()")
+        )
+        self.assertEqual(
+            [Deci(0), Deci(1), Deci("0.5"), Deci("0.5")],
+            [values["winPct"] for values in result.values()],
+        )
+
+    def test_query_fieldAggregates(self):
+        league = self.__getLeague()
+        owner1Id = league.owners[0].id
+
+        result = (
+            LeagueIndex(league)
+            .query()
+            .where(ownerIds=[owner1Id])
+            .aggregate(
+                low="min(pointsFor)",
+                high="max(pointsFor)",
+                average="mean(pointsFor)",
+                against="sum(pointsAgainst)",
+                biggestMargin="max(margin)",
+                smallestMargin="min(margin)",
+            )
+        )
+
+        self.assertEqual(Deci(70), result["low"])
+        self.assertEqual(Deci(130), result["high"])
+        self.assertEqual(Deci(605) / Deci(6), result["average"])
+        self.assertEqual(Deci(555), result["against"])
+        self.assertEqual(Deci(40), result["biggestMargin"])
+        self.assertEqual(Deci(-20), result["smallestMargin"])
+
+    def test_query_predicates(self):
+        league = self.__getLeague()
+        leagueIndex = LeagueIndex(league)
+        year2018 = league.years[1]
+        divisionAId = year2018.divisions[0].id
+
+        def countRows(**predicates) -> int:
+            return (
+                leagueIndex.query()
+                .where(**predicates)
+                .aggregate(rows="count()")["rows"]
+            )
+
+        self.assertEqual(18, countRows())
+        self.assertEqual(4, countRows(multiWeek=True))
+        self.assertEqual(14, countRows(multiWeek=False))
+        self.assertEqual(8, countRows(divisionIds=[divisionAId]))
+        self.assertEqual(8, countRows(divisionRival=True))
+        self.assertEqual(4, countRows(yearNumbers=[2018], divisionRival=False))
+        self.assertEqual(8, countRows(weekNumberStart=2, weekNumberEnd=3))
+        self.assertEqual(2, countRows(yearNumberEnd=2017, weekNumberStart=2))
+        self.assertEqual(
+            2,
+            countRows(
+                teamIds=[year2018.teams[0].id],
+                opponentTeamIds=[year2018.teams[1].id, year2018.teams[2].id],
+                multiWeek=True,
+            ),
+        )
+        self.assertEqual(
+            3,
+            countRows(
+                opponentOwnerIds=[league.owners[2].id],
+                matchupTypes=[MatchupType.REGULAR_SEASON],
+            ),
+        )
+
+    def test_query_noRowsMatch(self):
+        leagueIndex = LeagueIndex(self.__getLeague())
+
+        for query in (
+            leagueIndex.query().where(ownerIds=["badId"]),
+            leagueIndex.query().where(yearNumberStart=2019),
+            leagueIndex.query().where(yearNumberStart=2018, yearNumberEnd=2017),
+            leagueIndex.query().where(
+                yearNumbers=[2017], matchupTypes=[MatchupType.CHAMPIONSHIP]
+            ),
+            leagueIndex.query().where(yearNumbers=[2017], divisionRival=True),
+        ):
+            self.assertEqual(0, len(query.getRows()))
+            self.assertEqual(
+                {
+                    "rows": 0,
+                    "points": Deci(0),
+                    "average": None,
+                    "winPct": None,
+                },
+                query.aggregate(
+                    rows="count()",
+                    points="sum(pointsFor)",
+                    average="mean(pointsFor)",
+                    winPct="winPercentage()",
+                ),
+            )
+            self.assertEqual(dict(), query.groupBy("owner").aggregate(rows="count()"))
+
+    def test_query_isReusable(self):
+        league = self.__getLeague()
+        leagueIndex = LeagueIndex(league)
+        owner1Query = leagueIndex.query().where(ownerIds=[league.owners[0].id])
+
+        owner1In2017Query = owner1Query.where(yearNumbers=[2017])
+
+        self.assertEqual(6, len(owner1Query.getRows()))
+        self.assertEqual(2, len(owner1In2017Query.getRows()))
+        # a predicate given again replaces the old one
+        self.assertEqual(4, len(owner1In2017Query.where(yearNumbers=[2018]).getRows()))
+
+    def test_query_sameAsCheckingEveryRow(self):
+        league = generateLeague(numberOfYears=4, numberOfTeams=8)
+        leagueIndex = LeagueIndex(league)
+        columns = leagueIndex.columns
+        ownerIds = [owner.id for owner in league.owners]
+
+        for predicates, mask in (
+            (
+                dict(ownerIds=ownerIds[:3], yearNumberStart=2001),
+                numpy.isin(columns["ownerId"], ownerIds[:3])
+                & (columns["yearNumber"] >= 2001),
+            ),
+            (
+                dict(
+                    opponentOwnerIds=ownerIds[2:5],
+                    matchupTypes=[MatchupType.REGULAR_SEASON],
+                    weekNumberEnd=4,
+                ),
+                numpy.isin(columns["opponentOwnerId"], ownerIds[2:5])
+                & (columns["matchupType"] == MatchupType.REGULAR_SEASON)
+                & (columns["weekNumber"] <= 4),
+            ),
+            (
+                dict(yearNumbers=[2000, 2003], ownerIds=ownerIds[:1]),
+                numpy.isin(columns["yearNumber"], [2000, 2003])
+                & (columns["ownerId"] == ownerIds[0]),
+            ),
+        ):
+            self.assertEqual(
+                numpy.flatnonzero(mask).tolist(),
+                leagueIndex.query().where(**predicates).getRows().tolist(),
+            )
+
+    def test_query_invalidArguments_raisesException(self):
+        leagueIndex = LeagueIndex(self.__getLeague())
+        query = leagueIndex.query()
+
+        with self.assertRaises(InvalidFilterException) as context:
+            query.where(badPredicate=1)
+        self.assertEqual(
+            "'badPredicate' is not a valid predicate.", str(context.exception)
+        )
+        with self.assertRaises(InvalidFilterException) as context:
+            query.where(ownerIds="someOwnerId")
+        self.assertEqual("'ownerIds' must be type 'list'", str(context.exception))
+        with self.assertRaises(InvalidFilterException):
+            query.where(yearNumberStart="2018")
+        with self.assertRaises(InvalidFilterException):
+            query.where(divisionRival=1)
+        with self.assertRaises(ValueError) as context:
+            query.groupBy("week")
+        self.assertEqual(
+            "Can't group by 'week', must be one of ['owner', 'year', 'opponent'].",
+            str(context.exception),
+        )
+        for expression, message in (
+            ("median(pointsFor)", "Unknown aggregate function 'median'."),
+            (
+                "sum()",
+                "'sum()' needs one of the fields ['pointsFor', 'pointsAgainst', 'margin'].",
+            ),
+            ("count(pointsFor)", "'count()' doesn't take a field."),
+            (
+                "sum(points)",
+                "'sum()' needs one of the fields ['pointsFor', 'pointsAgainst', 'margin'].",
+            ),
+            ("sum pointsFor", "Invalid aggregate 'sum pointsFor'."),
+        ):
+            with self.assertRaises(ValueError) as context:
+                query.aggregate(value=expression)
+            self.assertEqual(message, str(context.exception))
@@ -0,0 +1,339 @@
+import unittest
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.records import RecordsReport, StreakRecord
+from leeger.util.league_generator import generateLeague
+from leeger.util.records import RecordsTracker, getRecords
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestRecords(unittest.TestCase):
+    @staticmethod
+    def __getLeague() -> League:
+        """
+        2 Years of 2 Owners.
+        2000: Owner 1 wins Week 1 and Week 2, Week 3 is a tie.
+        2001: Owner 2 wins Week 1, Week 2 and Week 3 are one multi-week playoff matchup that Owner 1 wins.
+        """
+        owners, teams2000 = getNDefaultOwnersAndTeams(2)
+        teams2001 = getTeamsFromOwners(owners)
+        year2000 = Year(
+            yearNumber=2000,
+            teams=teams2000,
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams2000[0].id,
+                            teamBId=teams2000[1].id,
+                            teamAScore=100,
+                            teamBScore=90,
+                        )
+                    ],
+                ),
+                Week(
+                    weekNumber=2,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams2000[0].id,
+                            teamBId=teams2000[1].id,
+                            teamAScore=150,
+                            teamBScore=50,
+                        )
+                    ],
+                ),
+                Week(
+                    weekNumber=3,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams2000[0].id,
+                            teamBId=teams2000[1].id,
+                            teamAScore=80,
+                            teamBScore=80,
+                        )
+                    ],
+                ),
+            ],
+        )
+        year2001 = Year(
+            yearNumber=2001,
+            teams=teams2001,
+            weeks=[
+                Week(
+                    weekNumber=1,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams2001[0].id,
+                            teamBId=teams2001[1].id,
+                            teamAScore=70,
+                            teamBScore=120,
+                        )
+                    ],
+                ),
+                Week(
+                    weekNumber=2,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams2001[0].id,
+                            teamBId=teams2001[1].id,
+                            teamAScore=100,
+                            teamBScore=110,
+                            matchupType=MatchupType.PLAYOFF,
+                            multiWeekMatchupId="1",
+                        )
+                    ],
+                ),
+                Week(
+                    weekNumber=3,
+                    matchups=[
+                        Matchup(
+                            teamAId=teams2001[0].id,
+                            teamBId=teams2001[1].id,
+                            teamAScore=130,
+                            teamBScore=100,
+                            matchupType=MatchupType.PLAYOFF,
+                            multiWeekMatchupId="1",
+                        )
+                    ],
+                ),
+            ],
+        )
+        return League(name="TEST", owners=owners, years=[year2000, year2001])
+
+    def test_getRecords_happyPath(self):
+        league = self.__getLeague()
+        owner1Id, owner2Id = [owner.id for owner in league.owners]
+
+        report = getRecords(league, topK=3)
+
+        self.assertIsInstance(report, RecordsReport)
+        self.assertEqual(
+            [(150, 2000, 2), (130, 2001, 3), (120, 2001, 1)],
+            [
+                (record.pointsFor, record.yearNumber, record.weekNumber)
+                for record in report.highestScores
+            ],
+        )
+        self.assertEqual(
+            [50, 70, 80], [record.pointsFor for record in report.lowestScores]
+        )
+        self.assertEqual(owner1Id, report.lowestScores[1].ownerId)
+        self.assertEqual(owner2Id, report.lowestScores[1].opponentOwnerId)
+        # the winner's side of each Matchup is kept
+        self.assertEqual(
+            [230, 210, 200],
+            [record.combinedScore for record in report.highestCombinedScores],
+        )
+        self.assertEqual(owner2Id, report.highestCombinedScores[1].ownerId)
+        self.assertEqual(
+            [100, 50, 30], [record.margin for record in report.biggestBlowouts]
+        )
+        self.assertEqual(owner1Id, report.biggestBlowouts[0].ownerId)
+        self.assertEqual(150, report.bestWeekByOwner[owner1Id].pointsFor)
+        self.assertEqual(120, report.bestWeekByOwner[owner2Id].pointsFor)
+
+    def test_getRecords_streaks(self):
+        league = self.__getLeague()
+        owner1Id, owner2Id = [owner.id for owner in league.owners]
+
+        report = getRecords(league)
+
+        # the tie in 2000 Week 3 ends Owner 1's 2-game win streak
+        self.assertEqual(
+            StreakRecord(
+                ownerId=owner1Id,
+                teamId=None,
+                isWinStreak=True,
+                length=2,
+                startYearNumber=2000,
+                startWeekNumber=1,
+                endYearNumber=2000,
+                endWeekNumber=2,
+                isActive=False,
+            ),
+            report.longestOwnerWinStreaks[0],
+        )
+        # the multi-week matchup is one game, which Owner 1 wins 230-210
+        self.assertEqual(3, len(report.longestOwnerWinStreaks))
+        self.assertTrue(report.currentOwnerStreaks[owner1Id].isWinStreak)
+        self.assertEqual(1, report.currentOwnerStreaks[owner1Id].length)
+        self.assertEqual(3, report.currentOwnerStreaks[owner1Id].endWeekNumber)
+        self.assertTrue(report.currentOwnerStreaks[owner1Id].isActive)
+        self.assertFalse(report.currentOwnerStreaks[owner2Id].isWinStreak)
+        self.assertEqual(1, report.currentOwnerStreaks[owner2Id].length)
+        # Owner 2's 2-game losing streak is in 2000
+        self.assertEqual(2, report.longestOwnerLosingStreaks[0].length)
+        self.assertEqual(owner2Id, report.longestOwnerLosingStreaks[0].ownerId)
+
+    def test_getRecords_teamStreaksEndWithTheirYear(self):
+        owners, teams2000 = getNDefaultOwnersAndTeams(2)
+        teams2001 = getTeamsFromOwners(owners)
+        years = list()
+        for yearNumber, teams in ((2000, teams2000), (2001, teams2001)):
+            years.append(
+                Year(
+                    yearNumber=yearNumber,
+                    teams=teams,
+                    weeks=[
+                        Week(
+                            weekNumber=weekNumber,
+                            matchups=[
+                                Matchup(
+                                    teamAId=teams[0].id,
+                                    teamBId=teams[1].id,
+                                    teamAScore=100,
+                                    teamBScore=90,
+                                )
+                            ],
+                        )
+                        for weekNumber in (1, 2)
+                    ],
+                )
+            )
+        league = League(name="TEST", owners=owners, years=years)
+
+        report = getRecords(league)
+
+        self.assertEqual(4, report.longestOwnerWinStreaks[0].length)
+        self.assertEqual(
+            [2, 2], [streak.length for streak in report.longestTeamWinStreaks]
+        )
+        self.assertEqual(teams2000[0].id, report.longestTeamWinStreaks[0].teamId)
+        self.assertFalse(report.longestTeamWinStreaks[0].isActive)
+        self.assertEqual(teams2001[0].id, report.longestTeamWinStreaks[1].teamId)
+        self.assertTrue(report.longestTeamWinStreaks[1].isActive)
+
+    def test_getRecords_withFilters(self):
+        league = self.__getLeague()
+
+        report = getRecords(league, onlyRegularSeason=True)
+        self.assertEqual(
+            [150, 120, 100, 90, 80, 80, 70, 50],
+            [record.pointsFor for record in report.highestScores],
+        )
+
+        report = getRecords(league, yearNumberStart=2001, onlyPostSeason=True)
+        self.assertEqual(
+            [130, 110, 100, 100], [record.pointsFor for record in report.highestScores]
+        )
+        self.assertEqual(1, report.longestOwnerWinStreaks[0].length)
+
+        tracker = RecordsTracker()
+        tracker.addYear(league.years[1], includeMultiWeekMatchups=False)
+        self.assertEqual(
+            [120, 70],
+            [record.pointsFor for record in tracker.getReport().highestScores],
+        )
+
+    def test_getRecords_generatedLeague_isBounded(self):
+        league = generateLeague(numberOfYears=3, numberOfTeams=6)
+
+        report = getRecords(league, topK=5)
+
+        self.assertEqual(5, len(report.highestScores))
+        self.assertEqual(5, len(report.longestTeamLosingStreaks))
+        self.assertEqual(
+            sorted([record.pointsFor for record in report.highestScores], reverse=True),
+            [record.pointsFor for record in report.highestScores],
+        )
+        self.assertEqual(len(league.owners), len(report.bestWeekByOwner))
+        self.assertEqual(
+            report.highestScores[0].pointsFor,
+            max(
+                max(matchup.teamAScore, matchup.teamBScore)
+                for year in league.years
+                for week in year.weeks
+                for matchup in week.matchups
+            ),
+        )
+
+    def test_recordsTracker_addWeek_sameAsGetRecords(self):
+        league = generateLeague(numberOfYears=2, numberOfTeams=6)
+        tracker = RecordsTracker(topK=5)
+
+        for year in league.years:
+            for week in year.weeks:
+                tracker.addWeek(year, week.weekNumber)
+
+        self.assertEqual(getRecords(league, topK=5), tracker.getReport())
+
+    def test_recordsTracker_addYear_thenAddWeek(self):
+        league = self.__getLeague()
+        year2000, year2001 = league.years
+        tracker = RecordsTracker()
+
+        tracker.addYear(year2000)
+        tracker.addWeek(year2001, 1)
+        tracker.addWeek(year2001, 2)
+        # the multi-week matchup isn't a game until its last Week is added
+        self.assertFalse(
+            tracker.getReport().currentOwnerStreaks[league.owners[0].id].isWinStreak
+        )
+        tracker.addWeek(year2001, 3)
+
+        self.assertEqual(getRecords(league), tracker.getReport())
+
+    def test_recordsTracker_weeksAddedAsPlayed_multiWeekChampionship_sameAsGetRecords(
+        self,
+    ):
+        league = generateLeague(seed=2, numberOfChampionshipWeeks=2)
+        tracker = RecordsTracker()
+
+        for year in league.years:
+            # Weeks are added to the Year as they are played
+            yearSoFar = Year(yearNumber=year.yearNumber, teams=year.teams, weeks=[])
+            for week in year.weeks:
+                yearSoFar.weeks.append(week)
+                tracker.addWeek(yearSoFar, week.weekNumber)
+
+        self.assertEqual(getRecords(league), tracker.getReport())
+
+    def test_recordsTracker_multiWeekMatchupAddedAsPlayed_countsOnce(self):
+        league = self.__getLeague()
+        year2000, year2001 = league.years
+        tracker = RecordsTracker()
+        tracker.addYear(year2000)
+        year2001SoFar = Year(yearNumber=2001, teams=year2001.teams, weeks=[])
+
+        for week in year2001.weeks:
+            year2001SoFar.weeks.append(week)
+            tracker.addWeek(year2001SoFar, week.weekNumber)
+
+        self.assertEqual(getRecords(league), tracker.getReport())
+
+    def test_recordsTracker_invalidArguments_raisesException(self):
+        league = self.__getLeague()
+        year2000, year2001 = league.years
+
+        with self.assertRaises(ValueError) as context:
+            RecordsTracker(topK=0)
+        self.assertEqual("'topK' must be at least 1.", str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            getRecords(league, topK=0)
+        self.assertEqual("'topK' must be at least 1.", str(context.exception))
+
+        tracker = RecordsTracker()
+        with self.assertRaises(ValueError) as context:
+            tracker.addWeek(year2000, 4)
+        self.assertEqual("Year 2000 has no Week 4.", str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            tracker.addWeek(year2000, 3, weekNumberStart=1, weekNumberEnd=2)
+        self.assertEqual(
+            "Week 3 is not between 'weekNumberStart' (1) and 'weekNumberEnd' (2).",
+            str(context.exception),
+        )
+
+        tracker.addWeek(year2001, 1)
+        with self.assertRaises(ValueError) as context:
+            tracker.addWeek(year2000, 3)
+        self.assertEqual(
+            "Week 3 of Year 2000 can't be added after Week 1 of Year 2001, Weeks must be added in chronological order.",
+            str(context.exception),
+        )
+        with self.assertRaises(ValueError):
+            tracker.addWeek(year2001, 1)
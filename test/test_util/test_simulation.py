@@ -0,0 +1,220 @@
+import unittest
+
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.league.YearSettings import YearSettings
+from leeger.model.simulation import SeasonSimulation
+from leeger.util.Deci import Deci
+from leeger.util.league_generator import generateLeague
+from leeger.util.simulation import simulateYear
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestSimulation(unittest.TestCase):
+    @staticmethod
+    def __getYear(*, leagueMedianGames: bool = False) -> Year:
+        """
+        4 Teams after 2 Weeks: Team 1 is 2-0, Team 2 is 1-1, Team 3 is 1-1 (with fewer points), Team 4 is 0-2.
+        Team 1 scores far more than anyone else.
+        """
+        _, teams = getNDefaultOwnersAndTeams(4)
+        week1 = Week(
+            weekNumber=1,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[1].id,
+                    teamAScore=200,
+                    teamBScore=100,
+                ),
+                Matchup(
+                    teamAId=teams[2].id,
+                    teamBId=teams[3].id,
+                    teamAScore=95,
+                    teamBScore=90,
+                ),
+            ],
+        )
+        week2 = Week(
+            weekNumber=2,
+            matchups=[
+                Matchup(
+                    teamAId=teams[0].id,
+                    teamBId=teams[2].id,
+                    teamAScore=210,
+                    teamBScore=85,
+                ),
+                Matchup(
+                    teamAId=teams[1].id,
+                    teamBId=teams[3].id,
+                    teamAScore=105,
+                    teamBScore=95,
+                ),
+            ],
+        )
+        return Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=[week1, week2],
+            yearSettings=YearSettings(leagueMedianGames=leagueMedianGames),
+        )
+
+    @staticmethod
+    def __getRemainingSchedule(year: Year) -> list[list[tuple[str, str]]]:
+        t1, t2, t3, t4 = [team.id for team in year.teams]
+        return [[(t1, t4), (t2, t3)], [(t1, t2), (t3, t4)]]
+
+    def test_simulateYear_happyPath(self):
+        year = self.__getYear()
+
+        simulation = simulateYear(
+            year,
+            self.__getRemainingSchedule(year),
+            numberOfPlayoffTeams=2,
+            numberOfSimulations=20_000,
+            seed=1,
+            maxWorkers=1,
+        )
+
+        self.assertIsInstance(simulation, SeasonSimulation)
+        self.assertEqual(20_000, simulation.numberOfSimulations)
+        self.assertEqual([team.id for team in year.teams], simulation.teamIds)
+        for seedIndex in range(4):
+            self.assertEqual(
+                Deci(1),
+                sum(
+                    probabilities[seedIndex]
+                    for probabilities in simulation.seedProbabilities.values()
+                ),
+            )
+        self.assertEqual(Deci(2), sum(simulation.playoffProbabilities.values()))
+        self.assertEqual(Deci(1), sum(simulation.championshipProbabilities.values()))
+        # 4 games played and 2 more Weeks of 2 games
+        self.assertAlmostEqual(8, float(sum(simulation.averageWAL.values())), places=9)
+        # Team 1 is already 2-0 and outscores everyone
+        team1Id = year.teams[0].id
+        self.assertGreater(simulation.getSeedProbability(team1Id, 1), Deci("0.99"))
+        self.assertGreater(simulation.championshipProbabilities[team1Id], Deci("0.99"))
+        # Team 4 is 0-2 and the worst team
+        self.assertLess(simulation.playoffProbabilities[year.teams[3].id], Deci("0.05"))
+
+    def test_simulateYear_noRemainingWeeks_standingsAreFinal(self):
+        year = self.__getYear()
+
+        simulation = simulateYear(
+            year,
+            list(),
+            numberOfPlayoffTeams=2,
+            numberOfSimulations=1_000,
+            seed=1,
+            maxWorkers=1,
+        )
+
+        t1, t2, t3, t4 = [team.id for team in year.teams]
+        # Team 2 and Team 3 are both 1-1, Team 2 has more points
+        self.assertEqual(
+            [Deci(1), Deci(0), Deci(0), Deci(0)], simulation.seedProbabilities[t1]
+        )
+        self.assertEqual(Deci(1), simulation.getSeedProbability(t2, 2))
+        self.assertEqual(Deci(1), simulation.getSeedProbability(t3, 3))
+        self.assertEqual(Deci(1), simulation.getSeedProbability(t4, 4))
+        self.assertEqual(Deci(0), simulation.playoffProbabilities[t3])
+        self.assertEqual(Deci(0), simulation.championshipProbabilities[t3])
+        self.assertEqual(Deci(2), simulation.averageWAL[t1])
+
+    def test_simulateYear_sameSeedGivesSameResult(self):
+        league = generateLeague(numberOfTeams=8, numberOfPlayoffTeams=4)
+        year = league.years[0]
+        remainingSchedule = [
+            [(matchup.teamAId, matchup.teamBId) for matchup in week.matchups]
+            for week in year.weeks[:3]
+        ]
+        kwargs = dict(
+            numberOfPlayoffTeams=4, numberOfSimulations=5_000, chunkSize=1_000
+        )
+
+        simulationA = simulateYear(
+            year, remainingSchedule, seed=7, maxWorkers=1, **kwargs
+        )
+        simulationB = simulateYear(
+            year, remainingSchedule, seed=7, maxWorkers=2, **kwargs
+        )
+        simulationC = simulateYear(
+            year, remainingSchedule, seed=8, maxWorkers=1, **kwargs
+        )
+
+        self.assertEqual(simulationA, simulationB)
+        self.assertNotEqual(simulationA, simulationC)
+
+    def test_simulateYear_numberOfSimulationsNotAMultipleOfChunkSize(self):
+        year = self.__getYear()
+
+        simulation = simulateYear(
+            year,
+            self.__getRemainingSchedule(year),
+            numberOfPlayoffTeams=4,
+            numberOfSimulations=1_001,
+            chunkSize=500,
+            seed=1,
+            maxWorkers=1,
+        )
+
+        self.assertEqual(Deci(4), sum(simulation.playoffProbabilities.values()))
+        self.assertEqual(Deci(1), sum(simulation.championshipProbabilities.values()))
+
+    def test_simulateYear_onePlayoffTeam_championIsFirstSeed(self):
+        year = self.__getYear()
+
+        simulation = simulateYear(
+            year,
+            self.__getRemainingSchedule(year),
+            numberOfPlayoffTeams=1,
+            numberOfSimulations=2_000,
+            seed=3,
+            maxWorkers=1,
+        )
+
+        for teamId in simulation.teamIds:
+            self.assertEqual(
+                simulation.getSeedProbability(teamId, 1),
+                simulation.championshipProbabilities[teamId],
+            )
+
+    def test_simulateYear_leagueMedianGames_addsAWinPerWeek(self):
+        year = self.__getYear(leagueMedianGames=True)
+
+        simulation = simulateYear(
+            year,
+            self.__getRemainingSchedule(year),
+            numberOfPlayoffTeams=2,
+            numberOfSimulations=2_000,
+            seed=1,
+            maxWorkers=1,
+        )
+
+        # 4 games played with 4 league median wins so far, then 2 Weeks of 2 games and 2 league median wins each
+        self.assertAlmostEqual(16, float(sum(simulation.averageWAL.values())), places=9)
+
+    def test_simulateYear_invalidArguments_raisesException(self):
+        year = self.__getYear()
+        t1, t2, _, _ = [team.id for team in year.teams]
+
+        with self.assertRaises(ValueError) as context:
+            simulateYear(year, [[(t1, "badId")]], numberOfPlayoffTeams=2)
+        self.assertEqual(
+            "Team with ID 'badId' in remaining Week 1 is not in the Year.",
+            str(context.exception),
+        )
+        with self.assertRaises(ValueError) as context:
+            simulateYear(year, [[(t1, t2), (t1, t2)]], numberOfPlayoffTeams=2)
+        self.assertEqual(
+            "A Team plays more than once in remaining Week 1.", str(context.exception)
+        )
+        for numberOfPlayoffTeams in (0, 3, 8):
+            with self.assertRaises(ValueError):
+                simulateYear(year, list(), numberOfPlayoffTeams=numberOfPlayoffTeams)
+        with self.assertRaises(ValueError):
+            simulateYear(year, list(), numberOfPlayoffTeams=2, numberOfSimulations=0)
+        with self.assertRaises(ValueError):
+            simulateYear(year, list(), numberOfPlayoffTeams=2, chunkSize=0)
@@ -0,0 +1,215 @@
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pyarrow.parquet
+
+from leeger.model.league import YearSettings
+from leeger.model.league.Division import Division
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.table_export import (
+    TABLE_COLUMNS,
+    leaguesToCsv,
+    leaguesToParquet,
+    leagueToCsv,
+    leagueToParquet,
+)
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class TestTableExport(unittest.TestCase):
+    def __getLeague(self, name: str = "LEAGUE") -> League:
+        owners, teams1 = getNDefaultOwnersAndTeams(2)
+        division = Division(name="d1")
+        for team in teams1:
+            team.divisionId = division.id
+        matchup1 = Matchup(
+            teamAId=teams1[0].id, teamBId=teams1[1].id, teamAScore=1.5, teamBScore=2
+        )
+        year1 = Year(
+            yearNumber=2000,
+            teams=teams1,
+            weeks=[Week(weekNumber=1, matchups=[matchup1])],
+            divisions=[division],
+        )
+
+        teams2 = getTeamsFromOwners(owners)
+        matchup2 = Matchup(
+            teamAId=teams2[0].id, teamBId=teams2[1].id, teamAScore=3, teamBScore=2
+        )
+        year2 = Year(
+            yearNumber=2001,
+            teams=teams2,
+            weeks=[Week(weekNumber=1, matchups=[matchup2])],
+            yearSettings=YearSettings(leagueMedianGames=True),
+        )
+
+        return League(name=name, owners=owners, years=[year1, year2])
+
+    def __readCsv(self, filePath: str) -> list[dict]:
+        with open(filePath, newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    def test_leagueToCsv_happyPath(self):
+        league = self.__getLeague()
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            leagueToCsv(league, tempDir)
+
+            self.assertEqual(
+                sorted(f"{tableName}.csv" for tableName in TABLE_COLUMNS.keys()),
+                sorted(os.listdir(tempDir)),
+            )
+            for tableName, columns in TABLE_COLUMNS.items():
+                with open(os.path.join(tempDir, f"{tableName}.csv")) as f:
+                    self.assertEqual(
+                        [title for title, _ in columns], next(csv.reader(f))
+                    )
+
+            yearTeams = self.__readCsv(os.path.join(tempDir, "yearTeams.csv"))
+            self.assertEqual(4, len(yearTeams))
+            self.assertEqual("2000", yearTeams[0]["Year"])
+            self.assertEqual("d1", yearTeams[0]["Division"])
+            self.assertEqual("0", yearTeams[0]["Wins"])
+            self.assertEqual("1.5", yearTeams[0]["Points Scored"])
+            self.assertEqual("0.0", yearTeams[0]["Win Percentage"])
+            # optional stats are empty when not used for a year
+            self.assertEqual("", yearTeams[0]["League Median Wins"])
+            self.assertEqual("", yearTeams[2]["Division"])
+            self.assertEqual("1.0", yearTeams[2]["League Median Wins"])
+
+            yearMatchups = self.__readCsv(os.path.join(tempDir, "yearMatchups.csv"))
+            self.assertEqual(4, len(yearMatchups))
+            self.assertEqual(
+                league.years[0].weeks[0].matchups[0].id, yearMatchups[0]["Matchup ID"]
+            )
+            self.assertEqual(
+                yearMatchups[0]["Matchup ID"], yearMatchups[1]["Matchup ID"]
+            )
+            self.assertEqual("1.5", yearMatchups[0]["Points For"])
+            self.assertEqual("2.0", yearMatchups[0]["Points Against"])
+            self.assertEqual("REGULAR_SEASON", yearMatchups[0]["Matchup Type"])
+
+            allTimeOwners = self.__readCsv(os.path.join(tempDir, "allTimeOwners.csv"))
+            self.assertEqual(2, len(allTimeOwners))
+            self.assertEqual(league.owners[0].id, allTimeOwners[0]["Owner ID"])
+            self.assertEqual("2", allTimeOwners[0]["Games Played"])
+
+            allTimeMatchups = self.__readCsv(
+                os.path.join(tempDir, "allTimeMatchups.csv")
+            )
+            self.assertEqual(4, len(allTimeMatchups))
+            self.assertEqual(league.owners[0].name, allTimeMatchups[0]["Owner For"])
+
+    def test_leaguesToCsv_multipleLeagues_rowsForEachLeague(self):
+        league1 = self.__getLeague("l1")
+        league2 = self.__getLeague("l2")
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            leaguesToCsv((league for league in [league1, league2]), tempDir)
+
+            allTimeOwners = self.__readCsv(os.path.join(tempDir, "allTimeOwners.csv"))
+            self.assertEqual(
+                ["l1", "l1", "l2", "l2"],
+                [row["League Name"] for row in allTimeOwners],
+            )
+
+    def test_leaguesToCsv_noLeagues_writesHeadersOnly(self):
+        with tempfile.TemporaryDirectory() as tempDir:
+            leaguesToCsv([], tempDir)
+
+            for tableName in TABLE_COLUMNS.keys():
+                with open(os.path.join(tempDir, f"{tableName}.csv")) as f:
+                    self.assertEqual(1, len(f.readlines()))
+
+    def test_leagueToCsv_fileExists_raisesException(self):
+        league = self.__getLeague()
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            leagueToCsv(league, tempDir)
+            with self.assertRaises(FileExistsError) as context:
+                leagueToCsv(league, tempDir)
+            self.assertEqual(
+                f"Cannot create file at path: '{os.path.join(tempDir, 'yearTeams.csv')}' because there is already a file there.",
+                str(context.exception),
+            )
+            # overwrite
+            leagueToCsv(league, tempDir, overwrite=True)
+
+    def test_leagueToCsv_filtersGiven(self):
+        league = self.__getLeague()
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            leagueToCsv(league, tempDir, yearNumberStart=2001, yearNumberEnd=2001)
+
+            allTimeMatchups = self.__readCsv(
+                os.path.join(tempDir, "allTimeMatchups.csv")
+            )
+            self.assertEqual(["2001", "2001"], [row["Year"] for row in allTimeMatchups])
+
+    def test_leagueToParquet_happyPath(self):
+        league = self.__getLeague()
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            leagueToParquet(league, tempDir)
+
+            yearTeams = pyarrow.parquet.read_table(
+                os.path.join(tempDir, "yearTeams.parquet")
+            )
+            self.assertEqual(
+                [title for title, _ in TABLE_COLUMNS["yearTeams"]],
+                yearTeams.schema.names,
+            )
+            self.assertEqual("int64", str(yearTeams.schema.field("Wins").type))
+            self.assertEqual(
+                "double", str(yearTeams.schema.field("Points Scored").type)
+            )
+            self.assertEqual("string", str(yearTeams.schema.field("Team").type))
+            self.assertEqual(
+                [1.5, 2.0, 3.0, 2.0], yearTeams["Points Scored"].to_pylist()
+            )
+            self.assertEqual(
+                [None, None, 1.0, 0.0], yearTeams["League Median Wins"].to_pylist()
+            )
+
+            yearMatchups = pyarrow.parquet.read_table(
+                os.path.join(tempDir, "yearMatchups.parquet")
+            )
+            self.assertEqual(
+                [1.5, 2.0, 3.0, 2.0], yearMatchups["Points For"].to_pylist()
+            )
+            self.assertEqual([2000, 2000, 2001, 2001], yearMatchups["Year"].to_pylist())
+
+    def test_leaguesToParquet_multipleLeagues_rowGroupForEachLeague(self):
+        league1 = self.__getLeague("l1")
+        league2 = self.__getLeague("l2")
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            leaguesToParquet(iter([league1, league2]), tempDir)
+
+            parquetFile = pyarrow.parquet.ParquetFile(
+                os.path.join(tempDir, "allTimeMatchups.parquet")
+            )
+            self.assertEqual(2, parquetFile.num_row_groups)
+            self.assertEqual(
+                ["l1"] * 4 + ["l2"] * 4,
+                parquetFile.read()["League Name"].to_pylist(),
+            )
+
+    def test_leagueToParquet_pyarrowNotInstalled_raisesException(self):
+        league = self.__getLeague()
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            with patch.dict("sys.modules", {"pyarrow": None}):
+                with self.assertRaises(ImportError) as context:
+                    leagueToParquet(league, tempDir)
+            self.assertEqual(
+                "'pyarrow' is required to export to Parquet. Install it with 'pip install pyarrow'.",
+                str(context.exception),
+            )
+            self.assertEqual([], os.listdir(tempDir))
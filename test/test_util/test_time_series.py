@@ -0,0 +1,329 @@
+import math
+import unittest
+
+from leeger.calculator.all_time_calculator import (
+    AWALAllTimeCalculator,
+    GameOutcomeAllTimeCalculator,
+    SmartWinsAllTimeCalculator,
+)
+from leeger.calculator.year_calculator import (
+    AWALYearCalculator,
+    GameOutcomeYearCalculator,
+    PointsScoredYearCalculator,
+    SmartWinsYearCalculator,
+)
+from leeger.enum.MatchupType import MatchupType
+from leeger.enum.TimeSeriesStat import TimeSeriesStat
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.model.league.YearSettings import YearSettings
+from leeger.model.time_series import TimeSeries
+from leeger.util.league_generator import generateLeague
+from leeger.util.time_series import getLeagueTimeSeries, getYearTimeSeries
+from test.helper.prototypes import getNDefaultOwnersAndTeams
+
+
+class TestTimeSeries(unittest.TestCase):
+    @staticmethod
+    def __getYear(*, leagueMedianGames: bool = False) -> Year:
+        """
+        Week 1: Team 1 100 - Team 2 90, Team 3 80 - Team 4 70
+        Week 2: Team 1 60 - Team 3 110, Team 2 95 - Team 4 95
+        Week 3: Team 1 120 - Team 4 50, Team 2 85 - Team 3 100
+        """
+        _, teams = getNDefaultOwnersAndTeams(4)
+        t1, t2, t3, t4 = [team.id for team in teams]
+        weeks = list()
+        for weekNumber, games in enumerate(
+            (
+                ((t1, t2, 100, 90), (t3, t4, 80, 70)),
+                ((t1, t3, 60, 110), (t2, t4, 95, 95)),
+                ((t1, t4, 120, 50), (t2, t3, 85, 100)),
+            ),
+            start=1,
+        ):
+            weeks.append(
+                Week(
+                    weekNumber=weekNumber,
+                    matchups=[
+                        Matchup(
+                            teamAId=teamAId,
+                            teamBId=teamBId,
+                            teamAScore=teamAScore,
+                            teamBScore=teamBScore,
+                        )
+                        for teamAId, teamBId, teamAScore, teamBScore in games
+                    ],
+                )
+            )
+        return Year(
+            yearNumber=2000,
+            teams=teams,
+            weeks=weeks,
+            yearSettings=YearSettings(leagueMedianGames=leagueMedianGames),
+        )
+
+    def __assertSeriesAlmostEqual(self, expected: list[float], actual: list[float]):
+        self.assertEqual(len(expected), len(actual))
+        for expectedValue, actualValue in zip(expected, actual):
+            if math.isnan(expectedValue):
+                self.assertTrue(math.isnan(actualValue))
+            else:
+                self.assertAlmostEqual(expectedValue, actualValue, places=9)
+
+    def test_getYearTimeSeries_happyPath(self):
+        year = self.__getYear()
+        t1, t2, _, _ = [team.id for team in year.teams]
+
+        timeSeries = getYearTimeSeries(year, window=2)
+
+        self.assertIsInstance(timeSeries, TimeSeries)
+        self.assertEqual([(2000, 1), (2000, 2), (2000, 3)], timeSeries.weeks)
+        self.assertEqual([team.id for team in year.teams], timeSeries.ids)
+        self.assertEqual(2, timeSeries.window)
+        self.assertEqual(set(TimeSeriesStat), set(timeSeries.values.keys()))
+        self.assertEqual(
+            [100, 80, 90],
+            timeSeries.getSeries(TimeSeriesStat.MOVING_AVERAGE_POINTS, t1),
+        )
+        self.assertEqual(
+            [1, 0.5, 0.5],
+            timeSeries.getSeries(TimeSeriesStat.ROLLING_WIN_PERCENTAGE, t1),
+        )
+        self.assertEqual(
+            [0, 0.25, 0.25],
+            timeSeries.getSeries(TimeSeriesStat.ROLLING_WIN_PERCENTAGE, t2),
+        )
+        self.assertEqual(
+            [100, 160, 280], timeSeries.getSeries(TimeSeriesStat.CUMULATIVE_POINTS, t1)
+        )
+        self.assertEqual(
+            [0, 0.5, 0.5], timeSeries.getSeries(TimeSeriesStat.CUMULATIVE_WAL, t2)
+        )
+        self.__assertSeriesAlmostEqual(
+            [2 / 3, 7 / 6, 1.5],
+            timeSeries.getSeries(TimeSeriesStat.CUMULATIVE_AWAL, t2),
+        )
+        # every score in the Year: 50, 60, 70, 80, 85, 90, 95, 95, 100, 100, 110, 120
+        self.__assertSeriesAlmostEqual(
+            [8.5 / 11, 9.5 / 11, 20.5 / 11],
+            timeSeries.getSeries(TimeSeriesStat.CUMULATIVE_SMART_WINS, t1),
+        )
+
+    def test_getYearTimeSeries_someStats(self):
+        year = self.__getYear()
+
+        timeSeries = getYearTimeSeries(
+            year, [TimeSeriesStat.CUMULATIVE_AWAL], weekNumberStart=2
+        )
+
+        self.assertEqual([TimeSeriesStat.CUMULATIVE_AWAL], list(timeSeries.values))
+        self.assertEqual([(2000, 2), (2000, 3)], timeSeries.weeks)
+        self.assertEqual(
+            (2, 4), timeSeries.values[TimeSeriesStat.CUMULATIVE_AWAL].shape
+        )
+        with self.assertRaises(ValueError) as context:
+            timeSeries.getSeries(TimeSeriesStat.CUMULATIVE_WAL, year.teams[0].id)
+        self.assertEqual(
+            "Stat 'CUMULATIVE_WAL' is not in this TimeSeries.", str(context.exception)
+        )
+
+    def test_getYearTimeSeries_leagueMedianGames(self):
+        year = self.__getYear(leagueMedianGames=True)
+        t1 = year.teams[0].id
+
+        timeSeries = getYearTimeSeries(year, window=1)
+
+        # Team 1 is above the median in Week 1 and Week 3
+        self.assertEqual(
+            [2, 2, 4], timeSeries.getSeries(TimeSeriesStat.CUMULATIVE_WAL, t1)
+        )
+        self.assertEqual(
+            [1, 0, 1], timeSeries.getSeries(TimeSeriesStat.ROLLING_WIN_PERCENTAGE, t1)
+        )
+
+    def test_getYearTimeSeries_multiWeekMatchupIsAGameInItsLastWeek(self):
+        year = self.__getYear()
+        t1, t2, t3, t4 = [team.id for team in year.teams]
+        year.weeks.append(
+            Week(
+                weekNumber=4,
+                matchups=[
+                    Matchup(
+                        teamAId=t1,
+                        teamBId=t2,
+                        teamAScore=100,
+                        teamBScore=120,
+                        matchupType=MatchupType.PLAYOFF,
+                        multiWeekMatchupId="1",
+                    )
+                ],
+            )
+        )
+        year.weeks.append(
+            Week(
+                weekNumber=5,
+                matchups=[
+                    Matchup(
+                        teamAId=t1,
+                        teamBId=t2,
+                        teamAScore=130,
+                        teamBScore=100,
+                        matchupType=MatchupType.PLAYOFF,
+                        multiWeekMatchupId="1",
+                    )
+                ],
+            )
+        )
+
+        timeSeries = getYearTimeSeries(year, window=2)
+
+        # Team 1 wins the multi-week matchup 230 - 220
+        self.assertEqual(
+            [1, 1, 2, 2, 3], timeSeries.getSeries(TimeSeriesStat.CUMULATIVE_WAL, t1)
+        )
+        self.assertEqual(
+            [100, 160, 280, 380, 510],
+            timeSeries.getSeries(TimeSeriesStat.CUMULATIVE_POINTS, t1),
+        )
+        # Team 3 and Team 4 don't play in the playoffs
+        self.assertEqual(
+            [1, 2, 3, 3, 3], timeSeries.getSeries(TimeSeriesStat.CUMULATIVE_WAL, t3)
+        )
+        self.assertTrue(
+            math.isnan(
+                timeSeries.getSeries(TimeSeriesStat.MOVING_AVERAGE_POINTS, t4)[-1]
+            )
+        )
+        # playoff Matchups can be filtered out, their Weeks add nothing
+        self.assertEqual(
+            [1, 1, 2, 2, 2],
+            getYearTimeSeries(year, onlyRegularSeason=True).getSeries(
+                TimeSeriesStat.CUMULATIVE_WAL, t1
+            ),
+        )
+
+    def test_getYearTimeSeries_sameAsCalculators(self):
+        year = generateLeague(numberOfTeams=8, numberOfPlayoffTeams=4).years[0]
+
+        timeSeries = getYearTimeSeries(year)
+
+        for stat, calculatorMethod in (
+            (
+                TimeSeriesStat.CUMULATIVE_POINTS,
+                PointsScoredYearCalculator.getPointsScored,
+            ),
+            (TimeSeriesStat.CUMULATIVE_WAL, GameOutcomeYearCalculator.getWAL),
+            (TimeSeriesStat.CUMULATIVE_AWAL, AWALYearCalculator.getAWAL),
+            (
+                TimeSeriesStat.CUMULATIVE_SMART_WINS,
+                SmartWinsYearCalculator.getSmartWins,
+            ),
+        ):
+            for row, (_, weekNumber) in enumerate(timeSeries.weeks):
+                expected = calculatorMethod(year, weekNumberEnd=weekNumber)
+                for j, teamId in enumerate(timeSeries.ids):
+                    self.assertAlmostEqual(
+                        float(expected[teamId]),
+                        timeSeries.values[stat][row, j],
+                        places=9,
+                    )
+        winPercentages = GameOutcomeYearCalculator.getWinPercentage(
+            year, weekNumberStart=4, weekNumberEnd=6
+        )
+        for j, teamId in enumerate(timeSeries.ids):
+            self.assertAlmostEqual(
+                float(winPercentages[teamId]),
+                timeSeries.values[TimeSeriesStat.ROLLING_WIN_PERCENTAGE][5, j],
+                places=9,
+            )
+
+    def test_getYearTimeSeries_weekInsideMultiWeekMatchup_sameAsCalculators(self):
+        for seed in range(3):
+            year = generateLeague(
+                seed=seed, numberOfTeams=6, numberOfChampionshipWeeks=3
+            ).years[0]
+
+            timeSeries = getYearTimeSeries(year)
+
+            for stat, calculatorMethod in (
+                (TimeSeriesStat.CUMULATIVE_WAL, GameOutcomeYearCalculator.getWAL),
+                (
+                    TimeSeriesStat.CUMULATIVE_SMART_WINS,
+                    SmartWinsYearCalculator.getSmartWins,
+                ),
+            ):
+                # the championship is the last 3 Weeks
+                for row in range(len(timeSeries.weeks) - 3, len(timeSeries.weeks)):
+                    expected = calculatorMethod(
+                        year, weekNumberEnd=timeSeries.weeks[row][1]
+                    )
+                    for j, teamId in enumerate(timeSeries.ids):
+                        if expected[teamId] is None:
+                            continue
+                        self.assertAlmostEqual(
+                            float(expected[teamId]),
+                            timeSeries.values[stat][row, j],
+                            places=9,
+                        )
+
+    def test_getLeagueTimeSeries_sameAsCalculators(self):
+        league = generateLeague(numberOfYears=3, numberOfTeams=6)
+
+        timeSeries = getLeagueTimeSeries(league, yearNumberStart=2001)
+
+        self.assertEqual([owner.id for owner in league.owners], timeSeries.ids)
+        self.assertEqual(
+            sum(len(year.weeks) for year in league.years[1:]), len(timeSeries.weeks)
+        )
+        self.assertEqual((2001, 1), timeSeries.weeks[0])
+        for stat, calculatorMethod in (
+            (TimeSeriesStat.CUMULATIVE_WAL, GameOutcomeAllTimeCalculator.getWAL),
+            (TimeSeriesStat.CUMULATIVE_AWAL, AWALAllTimeCalculator.getAWAL),
+            (
+                TimeSeriesStat.CUMULATIVE_SMART_WINS,
+                SmartWinsAllTimeCalculator.getSmartWins,
+            ),
+        ):
+            expected = calculatorMethod(league, yearNumberStart=2001)
+            for ownerId in timeSeries.ids:
+                self.assertAlmostEqual(
+                    float(expected[ownerId]),
+                    timeSeries.getSeries(stat, ownerId)[-1],
+                    places=9,
+                )
+
+    def test_getLeagueTimeSeries_rollingWindowCarriesOnAcrossYears(self):
+        league = generateLeague(numberOfYears=2, numberOfTeams=4)
+        ownerId = league.owners[0].id
+        scores = list()
+        for year in league.years:
+            team = [team for team in year.teams if team.ownerId == ownerId][0]
+            for week in year.weeks:
+                matchup = week.getMatchupWithTeamId(team.id)
+                scores.append(
+                    matchup.teamAScore
+                    if matchup.teamAId == team.id
+                    else matchup.teamBScore
+                )
+
+        timeSeries = getLeagueTimeSeries(league, window=4)
+
+        firstWeekIndex = len(league.years[0].weeks)
+        self.assertAlmostEqual(
+            sum(scores[firstWeekIndex - 2 : firstWeekIndex + 2]) / 4,
+            timeSeries.getSeries(TimeSeriesStat.MOVING_AVERAGE_POINTS, ownerId)[
+                firstWeekIndex + 1
+            ],
+            places=9,
+        )
+
+    def test_getTimeSeries_invalidWindow_raisesException(self):
+        year = self.__getYear()
+
+        with self.assertRaises(ValueError) as context:
+            getYearTimeSeries(year, window=0)
+        self.assertEqual("'window' must be at least 1.", str(context.exception))
+        with self.assertRaises(ValueError):
+            getLeagueTimeSeries(generateLeague(numberOfYears=1), window=0)
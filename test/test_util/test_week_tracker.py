@@ -0,0 +1,166 @@
+import unittest
+
+from leeger.enum.MatchupType import MatchupType
+from leeger.model.league.League import League
+from leeger.model.league.Matchup import Matchup
+from leeger.model.league.Week import Week
+from leeger.model.league.Year import Year
+from leeger.util.week_tracker import WeekTracker
+from test.helper.prototypes import getNDefaultOwnersAndTeams, getTeamsFromOwners
+
+
+class _CallRecordingTracker(WeekTracker):
+    def __init__(self):
+        super().__init__()
+        self.calls = list()
+
+    def _startYear(self, year: Year) -> None:
+        self.calls.append(("startYear", year.yearNumber))
+
+    def _addMatchup(self, year, week, matchup, teamIdToOwnerId) -> None:
+        self.calls.append(("matchup", week.weekNumber, matchup.teamAScore))
+
+    def _addGame(self, year, week, matchup, teamIdToOwnerId) -> None:
+        self.calls.append(("game", week.weekNumber, matchup.teamAScore))
+
+    def _endWeek(self, year: Year, week: Week) -> None:
+        self.calls.append(("endWeek", year.yearNumber, week.weekNumber))
+
+
+class TestWeekTracker(unittest.TestCase):
+    @staticmethod
+    def __getLeague() -> League:
+        """
+        2000: a regular season Week, then a 2 Week playoff matchup.
+        2001: a single regular season Week.
+        """
+        owners, teams2000 = getNDefaultOwnersAndTeams(2)
+        teams2001 = getTeamsFromOwners(owners)
+
+        def getMatchup(teams, teamAScore, **kwargs) -> Matchup:
+            return Matchup(
+                teamAId=teams[0].id,
+                teamBId=teams[1].id,
+                teamAScore=teamAScore,
+                teamBScore=90,
+                **kwargs,
+            )
+
+        year2000 = Year(
+            yearNumber=2000,
+            teams=teams2000,
+            weeks=[
+                Week(weekNumber=1, matchups=[getMatchup(teams2000, 100)]),
+                Week(
+                    weekNumber=2,
+                    matchups=[
+                        getMatchup(
+                            teams2000,
+                            80,
+                            matchupType=MatchupType.PLAYOFF,
+                            multiWeekMatchupId="1",
+                        )
+                    ],
+                ),
+                Week(
+                    weekNumber=3,
+                    matchups=[
+                        getMatchup(
+                            teams2000,
+                            70,
+                            matchupType=MatchupType.PLAYOFF,
+                            multiWeekMatchupId="1",
+                        )
+                    ],
+                ),
+            ],
+        )
+        year2001 = Year(
+            yearNumber=2001,
+            teams=teams2001,
+            weeks=[Week(weekNumber=1, matchups=[getMatchup(teams2001, 110)])],
+        )
+        return League(name="TEST", owners=owners, years=[year2000, year2001])
+
+    def test_addLeague_callsHooksInChronologicalOrder(self):
+        tracker = _CallRecordingTracker()
+
+        tracker._addLeague(self.__getLeague())
+
+        self.assertEqual(
+            [
+                ("startYear", 2000),
+                ("matchup", 1, 100),
+                ("game", 1, 100),
+                ("endWeek", 2000, 1),
+                ("matchup", 2, 80),
+                ("endWeek", 2000, 2),
+                ("matchup", 3, 70),
+                # the multi-week matchup is one game, in its last Week
+                ("game", 3, 150),
+                ("endWeek", 2000, 3),
+                ("startYear", 2001),
+                ("matchup", 1, 110),
+                ("game", 1, 110),
+                ("endWeek", 2001, 1),
+            ],
+            tracker.calls,
+        )
+
+    def test_addYear_withFilters_skipsFilteredMatchups(self):
+        tracker = _CallRecordingTracker()
+
+        tracker.addYear(self.__getLeague().years[0], onlyRegularSeason=True)
+
+        self.assertEqual(
+            [
+                ("startYear", 2000),
+                ("matchup", 1, 100),
+                ("game", 1, 100),
+                ("endWeek", 2000, 1),
+                # Weeks in the range are still added, without their filtered out Matchups
+                ("endWeek", 2000, 2),
+                ("endWeek", 2000, 3),
+            ],
+            tracker.calls,
+        )
+
+    def test_addWeek_weeksAddedAsPlayed_multiWeekMatchupIsReplaced(self):
+        league = self.__getLeague()
+        tracker = _CallRecordingTracker()
+
+        for year in league.years:
+            yearSoFar = Year(yearNumber=year.yearNumber, teams=year.teams, weeks=[])
+            for week in year.weeks:
+                yearSoFar.weeks.append(week)
+                tracker.addWeek(yearSoFar, week.weekNumber)
+                if (year.yearNumber, week.weekNumber) == (2000, 2):
+                    # the multi-week matchup is complete as far as anyone can tell so far
+                    self.assertEqual(("game", 2, 80), tracker.calls[-2])
+
+        # the game counted in Week 2 is replaced once Week 3 is added
+        oneShotTracker = _CallRecordingTracker()
+        oneShotTracker._addLeague(league)
+        self.assertEqual(oneShotTracker.calls, tracker.calls)
+
+    def test_addWeek_notInChronologicalOrder_raisesException(self):
+        league = self.__getLeague()
+        tracker = _CallRecordingTracker()
+        tracker.addYear(league.years[1])
+
+        with self.assertRaises(ValueError) as context:
+            tracker.addWeek(league.years[0], 3)
+        self.assertEqual(
+            "Week 3 of Year 2000 can't be added after Week 1 of Year 2001, Weeks must be added in chronological order.",
+            str(context.exception),
+        )
+
+    def test_getLastWeekNumbersOfMultiWeekMatchups(self):
+        year = self.__getLeague().years[0]
+
+        self.assertEqual(
+            {"1": 3}, WeekTracker.getLastWeekNumbersOfMultiWeekMatchups(year, 3)
+        )
+        self.assertEqual(
+            {"1": 2}, WeekTracker.getLastWeekNumbersOfMultiWeekMatchups(year, 2)
+        )